@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 
-from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.core.event_engine import EVENT_POOL, Event, EventEngine
+from foxtrot.util.batch import BarBatch
 from foxtrot.util.event_type import (
     EVENT_ACCOUNT,
     EVENT_CONTRACT,
+    EVENT_DEPTH,
     EVENT_LOG,
     EVENT_ORDER,
     EVENT_POSITION,
@@ -28,6 +30,7 @@ from foxtrot.util.object import (
     TickData,
     TradeData,
 )
+from foxtrot.util.order_book import OrderBook
 
 
 class BaseAdapter(ABC):
@@ -93,50 +96,58 @@ class BaseAdapter(ABC):
     def on_tick(self, tick: TickData) -> None:
         """
         Tick event push.
-        Tick event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol are reached by keyed subscription.
         """
-        self.on_event(EVENT_TICK, tick)
-        self.on_event(EVENT_TICK + tick.vt_symbol, tick)
+        self.event_engine.put(EVENT_POOL.acquire(EVENT_TICK, tick))
+
+    def on_ticks(self, ticks: list[TickData]) -> None:
+        """
+        Tick event push of several ticks received at once.
+        Events are put into event engine with a single queue operation.
+        """
+        self.event_engine.put_many([EVENT_POOL.acquire(EVENT_TICK, tick) for tick in ticks])
+
+    def on_depth(self, book: OrderBook) -> None:
+        """
+        Order book event push.
+        Handlers of a specific vt_symbol are reached by keyed subscription.
+        """
+        self.event_engine.put(EVENT_POOL.acquire(EVENT_DEPTH, book))
 
     def on_trade(self, trade: TradeData) -> None:
         """
         Trade event push.
-        Trade event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol are reached by keyed subscription.
         """
         self.on_event(EVENT_TRADE, trade)
-        self.on_event(EVENT_TRADE + trade.vt_symbol, trade)
 
     def on_order(self, order: OrderData) -> None:
         """
         Order event push.
-        Order event of a specific vt_orderid is also pushed.
+        Handlers of a specific vt_orderid are reached by keyed subscription.
         """
         self.on_event(EVENT_ORDER, order)
-        self.on_event(EVENT_ORDER + order.vt_orderid, order)
 
     def on_position(self, position: PositionData) -> None:
         """
         Position event push.
-        Position event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol are reached by keyed subscription.
         """
         self.on_event(EVENT_POSITION, position)
-        self.on_event(EVENT_POSITION + position.vt_symbol, position)
 
     def on_account(self, account: AccountData) -> None:
         """
         Account event push.
-        Account event of a specific vt_accountid is also pushed.
+        Handlers of a specific vt_accountid are reached by keyed subscription.
         """
         self.on_event(EVENT_ACCOUNT, account)
-        self.on_event(EVENT_ACCOUNT + account.vt_accountid, account)
 
     def on_quote(self, quote: QuoteData) -> None:
         """
         Quote event push.
-        Quote event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol are reached by keyed subscription.
         """
         self.on_event(EVENT_QUOTE, quote)
-        self.on_event(EVENT_QUOTE + quote.vt_symbol, quote)
 
     def on_log(self, log: LogData) -> None:
         """
@@ -258,6 +269,18 @@ class BaseAdapter(ABC):
         """
         return []
 
+    def query_history_batch(self, req: HistoryRequest) -> BarBatch:
+        """
+        Query bar history data as a columnar batch.
+        """
+        return BarBatch.from_bars(
+            self.query_history(req),
+            adapter_name=self.adapter_name,
+            symbol=req.symbol,
+            exchange=req.exchange,
+            interval=req.interval,
+        )
+
     def get_default_setting(self) -> dict[str, str | int | float | bool]:
         """
         Return default setting dict.
@@ -18,6 +18,8 @@ from foxtrot.core.event_engine import EventEngine
 from foxtrot.util.logger import get_adapter_logger
 
 if TYPE_CHECKING:
+    from foxtrot.adapter.base_adapter import BaseAdapter
+
     from .account_manager import BinanceAccountManager
     from .contract_manager import BinanceContractManager
     from .historical_data import BinanceHistoricalData
@@ -37,6 +39,7 @@ class BinanceApiClient:
         """Initialize the API client."""
         self.event_engine = event_engine
         self.adapter_name = adapter_name
+        self.adapter: Optional["BaseAdapter"] = None
 
         # CCXT exchange instances
         self.exchange: ccxt.binance | None = None
@@ -45,6 +48,7 @@ class BinanceApiClient:
         # WebSocket configuration
         self.use_websocket = False
         self.websocket_enabled_symbols: set[str] = set()
+        self.depth_levels: int = 0
 
         # Manager instances (initialized later)
         self.account_manager: BinanceAccountManager | None = None
@@ -100,6 +104,7 @@ class BinanceApiClient:
             websocket_symbols = settings.get("websocket.binance.symbols", [])
             if websocket_symbols:
                 self.websocket_enabled_symbols = set(websocket_symbols)
+            self.depth_levels = settings.get("websocket.binance.depth", 0)
 
             if not api_key or not secret:
                 self._log_error("Missing API credentials")
@@ -177,6 +182,10 @@ class BinanceApiClient:
             # Always set connected to False regardless of cleanup success
             self.connected = False
 
+    def set_adapter(self, adapter: "BaseAdapter") -> None:
+        """Set adapter reference for pushing data events."""
+        self.adapter = adapter
+
     def _log_info(self, message: str) -> None:
         """Log info message."""
         # MIGRATION: Replace print with INFO logging
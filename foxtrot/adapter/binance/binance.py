@@ -9,6 +9,7 @@ from typing import Any
 
 from foxtrot.adapter.base_adapter import BaseAdapter
 from foxtrot.core.event_engine import EventEngine
+from foxtrot.util.batch import BarBatch
 from foxtrot.util.constants import Exchange
 from foxtrot.util.object import (
     BarData,
@@ -48,6 +49,7 @@ class BinanceAdapter(BaseAdapter):
 
         # Create the API client that coordinates all operations
         self.api_client = BinanceApiClient(event_engine, adapter_name)
+        self.api_client.set_adapter(self)
 
     def connect(self, setting: dict[str, Any]) -> bool:
         """
@@ -148,6 +150,20 @@ class BinanceAdapter(BaseAdapter):
             return []
         return self.api_client.historical_data.query_history(req)
 
+    def query_history_batch(self, req: HistoryRequest) -> BarBatch:
+        """
+        Query historical data as a columnar batch.
+
+        Args:
+            req: History request
+
+        Returns:
+            Batch of historical bar data
+        """
+        if not self.api_client.historical_data:
+            return super().query_history_batch(req)
+        return self.api_client.historical_data.query_history_batch(req)
+
     def query_contract(self, symbol: str) -> ContractData:
         """
         Query contract information.
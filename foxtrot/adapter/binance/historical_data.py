@@ -8,8 +8,12 @@ for specified symbols and timeframes.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from foxtrot.util.batch import BarBatch, to_datetime64
 from foxtrot.util.constants import Exchange, Interval
 from foxtrot.util.object import BarData, HistoryRequest
+from foxtrot.util.timestamp import NS_PER_MS, datetime_to_timestamp
 
 # datetime import removed - using datetime.now() directly
 
@@ -41,53 +45,26 @@ class BinanceHistoricalData:
         bars = []
 
         try:
-            if not self.api_client.exchange:
-                return bars
-
-            # Convert symbol format
-            ccxt_symbol = self._convert_symbol_to_ccxt(req.symbol)
-            if not ccxt_symbol:
-                self.api_client._log_error(f"Invalid symbol: {req.symbol}")
-                return bars
-
-            # Convert interval format
-            timeframe = self._convert_interval_to_ccxt(req.interval)
-            if not timeframe:
-                self.api_client._log_error(f"Invalid interval: {req.interval}")
-                return bars
-
-            # Calculate time range
-            since = None
-            if req.start:
-                since = int(req.start.timestamp() * 1000)  # Convert to milliseconds
-
-            # Fetch OHLCV data
-            ohlcv_data = self.api_client.exchange.fetch_ohlcv(
-                ccxt_symbol,
-                timeframe,
-                since=since,
-                limit=1000,  # Binance limit
-            )
-
+            ohlcv_data = self._fetch_ohlcv(req)
             if not ohlcv_data:
                 return bars
 
+            end = datetime_to_timestamp(req.end) if req.end else 0
+
             # Convert to BarData objects
             for ohlcv in ohlcv_data:
                 timestamp, open_price, high_price, low_price, close_price, volume = ohlcv
-
-                # Convert timestamp to datetime
-                dt = datetime.fromtimestamp(timestamp / 1000)
+                timestamp = int(timestamp) * NS_PER_MS
 
                 # Filter by end time if specified
-                if req.end and dt > req.end:
+                if end and timestamp > end:
                     break
 
                 bar = BarData(
                     adapter_name=self.api_client.adapter_name,
                     symbol=req.symbol,
                     exchange=Exchange.BINANCE,
-                    datetime=dt,
+                    timestamp=timestamp,
                     interval=req.interval,
                     volume=volume,
                     turnover=volume * close_price,  # Approximate turnover
@@ -106,6 +83,94 @@ class BinanceHistoricalData:
 
         return bars
 
+    def query_history_batch(self, req: HistoryRequest) -> BarBatch:
+        """
+        Query historical bar data as a columnar batch, filled directly
+        from the OHLCV rows without creating BarData objects.
+
+        Args:
+            req: History request object
+
+        Returns:
+            BarBatch with the same bars as query_history
+        """
+        batch = BarBatch.from_bars(
+            [],
+            adapter_name=self.api_client.adapter_name,
+            symbol=req.symbol,
+            exchange=Exchange.BINANCE,
+            interval=req.interval,
+        )
+
+        try:
+            ohlcv_data = self._fetch_ohlcv(req)
+            if not ohlcv_data:
+                return batch
+
+            values = np.asarray(ohlcv_data, dtype=np.float64)
+            datetimes = [datetime.fromtimestamp(timestamp / 1000) for timestamp in values[:, 0]]
+
+            # Filter by end time if specified
+            if req.end:
+                count = next((i for i, dt in enumerate(datetimes) if dt > req.end), len(datetimes))
+                values = values[:count]
+                datetimes = datetimes[:count]
+
+            data = np.zeros(len(values), dtype=BarBatch.dtype)
+            data["datetime"] = to_datetime64(datetimes, None)
+            data["open_price"] = values[:, 1]
+            data["high_price"] = values[:, 2]
+            data["low_price"] = values[:, 3]
+            data["close_price"] = values[:, 4]
+            data["volume"] = values[:, 5]
+            data["turnover"] = values[:, 5] * values[:, 4]  # Approximate turnover
+
+            batch = BarBatch(data, None, **batch.meta)
+            self.api_client._log_info(f"Retrieved {len(batch)} bars for {req.symbol}")
+
+        except Exception as e:
+            self.api_client._log_error(f"Failed to query history for {req.symbol}: {str(e)}")
+
+        return batch
+
+    def _fetch_ohlcv(self, req: HistoryRequest) -> list:
+        """
+        Fetch OHLCV rows of a history request.
+
+        Args:
+            req: History request object
+
+        Returns:
+            List of [timestamp, open, high, low, close, volume] rows
+        """
+        if not self.api_client.exchange:
+            return []
+
+        # Convert symbol format
+        ccxt_symbol = self._convert_symbol_to_ccxt(req.symbol)
+        if not ccxt_symbol:
+            self.api_client._log_error(f"Invalid symbol: {req.symbol}")
+            return []
+
+        # Convert interval format
+        timeframe = self._convert_interval_to_ccxt(req.interval)
+        if not timeframe:
+            self.api_client._log_error(f"Invalid interval: {req.interval}")
+            return []
+
+        # Calculate time range
+        since = None
+        if req.start:
+            since = int(req.start.timestamp() * 1000)  # Convert to milliseconds
+
+        # Fetch OHLCV data
+        return self.api_client.exchange.fetch_ohlcv(
+            ccxt_symbol,
+            timeframe,
+            since=since,
+            limit=1000,  # Binance limit
+        )
+
     def _convert_symbol_to_ccxt(self, vt_symbol: str) -> str:
         """
         Convert VT symbol format to CCXT format.
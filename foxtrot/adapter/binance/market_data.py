@@ -15,6 +15,8 @@ from foxtrot.core.event import Event
 from foxtrot.util.constants import Exchange
 from foxtrot.util.event_type import EVENT_TICK
 from foxtrot.util.object import SubscribeRequest, TickData
+from foxtrot.util.order_book import OrderBook
+from foxtrot.util.timestamp import NS_PER_MS, now_timestamp
 from foxtrot.util.websocket_utils import AsyncThreadBridge
 
 if TYPE_CHECKING:
@@ -227,7 +229,7 @@ class BinanceMarketData:
                 adapter_name=self.api_client.adapter_name,
                 symbol=symbol,
                 exchange=Exchange.BINANCE,
-                datetime=datetime.now(),
+                timestamp=now_timestamp(),
                 name=ccxt_symbol,
                 volume=ticker.get("baseVolume", 0),
                 turnover=ticker.get("quoteVolume", 0),
@@ -374,6 +376,11 @@ class BinanceMarketData:
                         task = asyncio.create_task(self._watch_symbol(symbol))
                         watch_tasks.append(task)
                         self._websocket_tasks[symbol] = task
+
+                        if self.api_client.depth_levels:
+                            task = asyncio.create_task(self._watch_depth(symbol))
+                            watch_tasks.append(task)
+                            self._websocket_tasks[f"{symbol}.depth"] = task
                         
                     if not watch_tasks:
                         # No symbols to watch, wait briefly
@@ -441,14 +448,55 @@ class BinanceMarketData:
             # Remove from WebSocket tasks
             self._websocket_tasks.pop(symbol, None)
             
+    async def _watch_depth(self, symbol: str) -> None:
+        """
+        Watch order book of individual symbol. CCXT Pro keeps the book
+        from the diff stream, checking update ids and resyncing from a
+        REST snapshot on gaps, and only hands out the merged book. Its
+        top levels are therefore copied into an OrderBook kept per
+        symbol as snapshot and pushed through the adapter's on_depth.
+        """
+        ccxt_symbol = self._convert_symbol_to_ccxt(symbol)
+        if not ccxt_symbol:
+            return
+
+        depth = self.api_client.depth_levels
+        book = OrderBook(self.api_client.adapter_name, symbol, Exchange.BINANCE, depth)
+
+        try:
+            while self._active and symbol in self._subscribed_symbols and not self._shutdown_event.is_set():
+                orderbook = await self.api_client.exchange_pro.watchOrderBook(ccxt_symbol, depth)
+
+                if self.websocket_manager:
+                    self.websocket_manager.update_heartbeat()
+
+                timestamp = orderbook.get("timestamp")
+                book.apply_snapshot(
+                    orderbook["bids"],
+                    orderbook["asks"],
+                    orderbook.get("nonce") or 0,
+                    datetime.fromtimestamp(timestamp / 1000) if timestamp else None,
+                )
+                adapter = self.api_client.adapter
+                if adapter:
+                    adapter.on_depth(book.copy())
+
+        except asyncio.CancelledError:
+            # Task was cancelled, normal shutdown
+            pass
+        except Exception as e:
+            self.api_client._log_error(f"Error watching depth of {symbol}: {e}")
+            self._websocket_tasks.pop(f"{symbol}.depth", None)
+
     def _convert_ticker_to_tick(self, ticker: dict, vt_symbol: str) -> Optional[TickData]:
         """Convert CCXT ticker data to TickData object."""
         try:
+            exchange_time = ticker.get("timestamp")
             return TickData(
                 adapter_name=self.api_client.adapter_name,
                 symbol=vt_symbol,
                 exchange=Exchange.BINANCE,
-                datetime=datetime.fromtimestamp(ticker.get("timestamp", 0) / 1000),
+                timestamp=int(exchange_time) * NS_PER_MS if exchange_time else now_timestamp(),
                 name=ticker.get("symbol", ""),
                 volume=ticker.get("baseVolume", 0) or 0,
                 turnover=ticker.get("quoteVolume", 0) or 0,
@@ -2,7 +2,6 @@
 Crypto Market Data Manager - Handles real-time market data streaming.
 """
 
-from datetime import datetime
 import threading
 import time
 from typing import TYPE_CHECKING
@@ -10,6 +9,7 @@ from typing import TYPE_CHECKING
 from foxtrot.util.constants import Exchange
 from foxtrot.util.object import BarData, HistoryRequest, SubscribeRequest, TickData
 from foxtrot.util.logger import get_adapter_logger
+from foxtrot.util.timestamp import now_timestamp
 
 if TYPE_CHECKING:
     from .crypto_adapter import CryptoAdapter
@@ -222,7 +222,7 @@ class MarketData:
                 adapter_name=self.adapter.adapter_name,
                 symbol=symbol,
                 exchange=Exchange(self.adapter.default_name),
-                datetime=datetime.now(),
+                timestamp=now_timestamp(),
                 name=ccxt_symbol,
                 volume=ticker.get("baseVolume", 0),
                 turnover=ticker.get("quoteVolume", 0),
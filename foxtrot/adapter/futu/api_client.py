@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 from foxtrot.core.event_engine import EventEngine
 import futu as ft
 
-from .futu_callbacks import FutuQuoteHandler, FutuTradeHandler
+from .futu_callbacks import FutuOrderBookHandler, FutuQuoteHandler, FutuTradeHandler
 
 if TYPE_CHECKING:
     from .account_manager import FutuAccountManager
@@ -50,6 +50,7 @@ class FutuApiClient:
 
         # Callback handlers
         self.quote_handler: FutuQuoteHandler | None = None
+        self.order_book_handler: FutuOrderBookHandler | None = None
         self.trade_handler: FutuTradeHandler | None = None
 
         # Manager instances (initialized later)
@@ -429,11 +430,13 @@ class FutuApiClient:
         try:
             # Create callback handlers
             self.quote_handler = FutuQuoteHandler(self)
+            self.order_book_handler = FutuOrderBookHandler(self)
             self.trade_handler = FutuTradeHandler(self)
 
-            # Register quote handler
+            # Register quote and order book handlers
             if self.quote_ctx:
                 self.quote_ctx.set_handler(self.quote_handler)
+                self.quote_ctx.set_handler(self.order_book_handler)
                 self._log_info("Quote callback handler registered")
 
             # Register trade handlers
@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, Any
 
 from foxtrot.util.constants import Exchange
 from foxtrot.util.object import OrderData, TickData, TradeData
+from foxtrot.util.order_book import OrderBook
+from foxtrot.util.timestamp import now_timestamp
 import futu as ft
 
 from .futu_mappings import (
@@ -23,6 +25,36 @@ if TYPE_CHECKING:
     from .api_client import FutuApiClient
 
 
+def convert_code_to_symbol(code: str) -> tuple[str, Exchange]:
+    """
+    Convert SDK code of a quote callback to symbol and exchange.
+
+    Args:
+        code: SDK code (e.g., "HK.00700")
+
+    Returns:
+        Tuple of (symbol, exchange)
+    """
+    # Determine market from code format
+    if code.startswith("HK."):
+        market = "HK"
+    elif code.startswith("US."):
+        market = "US"
+    elif code.startswith("CN."):
+        market = "CN"
+    else:
+        # Try to infer from code format
+        if len(code) == 5 and code.isdigit():
+            market = "HK"  # Hong Kong stock
+        else:
+            market = "US"  # Default to US
+
+    # Convert to VT symbol format
+    vt_symbol = convert_futu_to_vt_symbol(market, code)
+    symbol, exchange_str = vt_symbol.split(".")
+    return symbol, Exchange(exchange_str)
+
+
 class FutuQuoteHandler(ft.StockQuoteHandlerBase):
     """
     SDK callback handler for market data quotes.
@@ -53,12 +85,15 @@ class FutuQuoteHandler(ft.StockQuoteHandlerBase):
 
             # Process each quote data item
             if isinstance(content, list):
+                ticks = []
                 for quote_data in content:
                     tick = self._convert_to_tick_data(quote_data)
                     if tick:
-                        # Fire tick event through adapter
-                        if hasattr(self.api_client, 'adapter') and self.api_client.adapter:
-                            self.api_client.adapter.on_tick(tick)
+                        ticks.append(tick)
+
+                # Fire all tick events through adapter at once
+                if ticks and hasattr(self.api_client, 'adapter') and self.api_client.adapter:
+                    self.api_client.adapter.on_ticks(ticks)
             else:
                 # Single quote data item
                 tick = self._convert_to_tick_data(content)
@@ -89,30 +124,13 @@ class FutuQuoteHandler(ft.StockQuoteHandlerBase):
             if not code:
                 return None
 
-            # Determine market from code format
-            if code.startswith("HK."):
-                market = "HK"
-            elif code.startswith("US."):
-                market = "US"
-            elif code.startswith("CN."):
-                market = "CN"
-            else:
-                # Try to infer from code format
-                if len(code) == 5 and code.isdigit():
-                    market = "HK"  # Hong Kong stock
-                else:
-                    market = "US"  # Default to US
-
-            # Convert to VT symbol format
-            vt_symbol = convert_futu_to_vt_symbol(market, code)
-            symbol, exchange_str = vt_symbol.split(".")
-            exchange = Exchange(exchange_str)
+            symbol, exchange = convert_code_to_symbol(code)
 
             # Create TickData object
             return TickData(
                 symbol=symbol,
                 exchange=exchange,
-                datetime=datetime.now(),  # Use current time as SDK may not provide timestamp
+                timestamp=now_timestamp(),  # Use current time as SDK may not provide timestamp
                 name=quote_data.get("name", ""),
 
                 # Price data
@@ -163,6 +181,70 @@ class FutuQuoteHandler(ft.StockQuoteHandlerBase):
             return None
 
 
+class FutuOrderBookHandler(ft.OrderBookHandlerBase):
+    """
+    SDK callback handler for order book updates.
+
+    Every callback carries all subscribed levels of one code, applied as
+    snapshot to an OrderBook kept per code and published as EVENT_DEPTH.
+    """
+
+    def __init__(self, api_client: "FutuApiClient"):
+        """Initialize the order book handler."""
+        super().__init__()
+        self.api_client = api_client
+        self.books: dict[str, OrderBook] = {}
+
+    def on_recv_rsp(self, rsp_pb) -> tuple[int, Any]:
+        """
+        Handle real-time order book callbacks from SDK.
+
+        Args:
+            rsp_pb: Protobuf response from SDK
+
+        Returns:
+            Tuple of (return_code, content)
+        """
+        try:
+            ret_code, content = super().on_recv_rsp(rsp_pb)
+            if ret_code != ft.RET_OK:
+                return ft.RET_ERROR, content
+
+            book = self._update_book(content)
+            if book and hasattr(self.api_client, 'adapter') and self.api_client.adapter:
+                self.api_client.adapter.on_depth(book.copy())
+
+            return ft.RET_OK, content
+
+        except Exception as e:
+            if hasattr(self.api_client, 'adapter') and self.api_client.adapter:
+                self.api_client.adapter.write_log(f"Order book handler error: {e}")
+            return ft.RET_ERROR, str(e)
+
+    def _update_book(self, data: dict) -> OrderBook | None:
+        """
+        Apply SDK order book data to the book of its code.
+
+        Args:
+            data: Order book data from SDK, levels as (price, volume, order count, details)
+
+        Returns:
+            Updated OrderBook or None if code missing
+        """
+        code = data.get("code", "")
+        if not code:
+            return None
+
+        book = self.books.get(code)
+        if not book:
+            symbol, exchange = convert_code_to_symbol(code)
+            book = OrderBook(self.api_client.adapter_name, symbol, exchange)
+            self.books[code] = book
+
+        book.apply_snapshot(data.get("Bid", []), data.get("Ask", []), datetime=datetime.now())
+        return book
+
+
 class FutuTradeHandler(ft.TradeOrderHandlerBase):
     """
     SDK callback handler for trade and order updates.
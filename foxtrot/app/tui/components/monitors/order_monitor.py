@@ -437,16 +437,15 @@ class TUIOrderMonitor(TUIDataMonitor):
             symbol: Optional symbol filter for cancellation
         """
         try:
+            if symbol:
+                orders = self.main_engine.get_active_orders_by_symbol(symbol)
+            else:
+                orders = self.main_engine.get_all_active_orders()
 
-            for _order_id in list(self.active_orders):
-                # Get order data from storage (implementation depends on data management)
-                # For now, we'll use the main engine's cancel all functionality
-                pass
+            for order in orders:
+                self.main_engine.cancel_order(order.create_cancel_request(), order.adapter_name)
 
-            # Use main engine's cancel all functionality
-            self.main_engine.cancel_all(None)  # Cancel all orders across all gateways
-
-            await self._add_system_message("Cancel all orders requested")
+            await self._add_system_message(f"Cancel requested for {len(orders)} orders")
 
             # Emit custom message
             self.post_message(self.AllOrdersCancelRequested(symbol))
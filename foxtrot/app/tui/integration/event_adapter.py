@@ -17,6 +17,7 @@ from typing import Any
 import uuid
 import weakref
 
+from foxtrot.core.async_event_engine import get_running_loop
 from foxtrot.core.event_engine import Event, EventEngine
 from foxtrot.util.event_type import *
 from foxtrot.util.object import CancelRequest, OrderData
@@ -229,9 +230,15 @@ class EventEngineAdapter:
         if not self.is_started or not self.loop:
             return
 
-        # Handle specific order events for command responses
-        if event.type.startswith(EVENT_ORDER) and event.type != EVENT_ORDER:
-            self._handle_command_response(event)
+        # Keyed registrations (e.g. "eOrder.BINANCE.1") receive events of
+        # the base type, relabel them so that their handlers are found.
+        # Always copied since the engine may reuse pooled event objects.
+        event = Event(event_type, event.data)
+
+        # AsyncEventEngine sharing the loop calls back on the loop thread
+        if get_running_loop() is self.loop:
+            self._schedule_event_processing(event)
+            return
 
         # Thread-safe call to asyncio
         if not self.loop.is_closed():
@@ -0,0 +1,383 @@
+"""
+Event-driven framework running on an asyncio event loop.
+"""
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from threading import get_ident
+from time import perf_counter
+from typing import Any
+
+from .event_engine import EVENT_KEY_FIELDS, BatchHandlerType, Event, EventEngine, HandlerType
+from .event_profiler import EventProfiler
+from .timer_wheel import TimerHandle, TimerWheel
+
+
+def get_running_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Get event loop running in the current thread, or None.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class AsyncEventEngine(EventEngine):
+    """
+    Event engine dispatching events on an asyncio event loop instead of
+    worker threads, with the same register/put API as EventEngine.
+
+    Handlers can be plain functions or coroutine functions, coroutines
+    are awaited in registration order, so events are still processed one
+    after another. Batch handlers may be coroutine functions as well. The engine can share its loop with adapters and the
+    TUI: events put on the loop thread are queued without any thread hop,
+    events put from other threads are handed over with
+    call_soon_threadsafe.
+
+    Timer events and callbacks scheduled with call_later, call_at and
+    call_every are driven by a task on the same loop.
+    """
+
+    def __init__(self, interval: float = 1.0, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """
+        The running loop at start is used by default, if loop not
+        specified.
+        """
+        super().__init__(interval)
+
+        self._loop: asyncio.AbstractEventLoop | None = loop
+        self._loop_thread: int | None = None
+        self._pending: deque[Event] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._timer_wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+
+        self._scheduler = TimerWheel(self._deliver_timer, waker=self._wake_timer)
+
+    def start(self) -> None:
+        """
+        Start processing events on the loop. Can be called from the loop
+        thread or, if loop was specified, from any other thread.
+        """
+        if self._active:
+            return
+
+        if not self._loop:
+            self._loop = asyncio.get_running_loop()
+
+        self._active = True
+
+        if self._timer_handle:
+            self._timer_handle.cancel()
+        self._timer_handle = self._scheduler.call_every(self._interval, self._put_timer)
+
+        for executor in self._executors.values():
+            executor.start()
+
+        if get_running_loop() is self._loop:
+            self._create_tasks()
+        else:
+            self._loop.call_soon_threadsafe(self._create_tasks)
+
+    def _create_tasks(self) -> None:
+        """
+        Create dispatch and timer tasks, must be run on the loop thread.
+        """
+        self._wakeup = asyncio.Event()
+        self._timer_wakeup = asyncio.Event()
+
+        # Events buffered before are seen here, or by put after this
+        self._loop_thread = get_ident()
+        if self._pending:
+            self._wakeup.set()
+
+        self._tasks = [
+            asyncio.ensure_future(self._run_async()),
+            asyncio.ensure_future(self._run_scheduler()),
+        ]
+
+    def stop(self) -> None:
+        """
+        Stop processing events. Events still pending are kept and will be
+        processed after start is called again.
+        """
+        if not self._active:
+            return
+
+        self._active = False
+
+        if self._timer_handle:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+
+        for executor in self._executors.values():
+            executor.stop()
+
+        if not self._loop or self._loop.is_closed():
+            return
+
+        if get_running_loop() is self._loop:
+            self._cancel_tasks()
+        else:
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+
+    def _cancel_tasks(self) -> None:
+        """
+        Cancel dispatch and timer tasks, must be run on the loop thread.
+        """
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._loop_thread = None
+
+    async def _run_async(self) -> None:
+        """
+        Take all pending events at once and process them one by one, then
+        yield to other tasks of the loop.
+        """
+        while self._active:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            events: list[Event] = list(self._pending)
+            self._pending.clear()
+
+            for event in events:
+                await self._process_async(event)
+
+            if self._batch_handlers:
+                await self._process_batch(events)
+
+            if self._pool_types:
+                self._release(events)
+
+            await asyncio.sleep(0)
+
+    async def _process_async(self, event: Event) -> None:
+        """
+        Distribute event to the precomputed handlers of its type, awaiting
+        handlers which return a coroutine. If profiling, queue wait time
+        and the latency of every handler call are recorded.
+        """
+        profiler: EventProfiler | None = self._profiler
+        if profiler:
+            put_time: float | None = getattr(event, "_put_time", None)
+            if put_time is not None:
+                profiler.record_queue_wait(event.type, perf_counter() - put_time)
+
+        dispatch, general_handlers = self._dispatch
+        wrappers: frozenset[HandlerType] = self._wrappers
+
+        for handler in dispatch.get(event.type, general_handlers):
+            # Keyed, filtered and executor handlers are timed where they are called
+            if handler in wrappers:
+                result: Any = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+                continue
+
+            start: float = perf_counter() if profiler else 0.0
+            try:
+                result = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self._logger.error(
+                    "Event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown')
+                    }
+                )
+            if profiler:
+                self._record_latency(handler, event, perf_counter() - start)
+
+    async def _process_batch(self, events: list[Event]) -> None:
+        """
+        Distribute events processed in one pass to batch handlers, as one
+        list per event type, awaiting handlers which return a coroutine.
+        """
+        batch_handlers: dict[str, tuple[BatchHandlerType, ...]] = self._batch_handlers
+        batches: defaultdict[str, list[Event]] = defaultdict(list)
+
+        for event in events:
+            if event.type in batch_handlers:
+                batches[event.type].append(event)
+
+        for event_type, batch in batches.items():
+            for handler in batch_handlers.get(event_type, ()):
+                try:
+                    result: Any = handler(batch)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    self._logger.error(
+                        "Batch event handler failed",
+                        extra={
+                            "event_type": event_type,
+                            "batch_size": len(batch),
+                            "error_type": type(e).__name__,
+                            "error_msg": str(e),
+                            "handler_name": getattr(handler, '__name__', 'unknown'),
+                            "handler_type": "batch"
+                        }
+                    )
+
+    async def _process_keyed(self, event: Event) -> None:
+        """
+        Distribute event to those keyed handlers registered listening
+        to the key of event data.
+        """
+        keyed_handlers: dict[str, tuple[HandlerType, ...]] = self._keyed_handlers.get(event.type, {})
+        key: str | None = getattr(event.data, EVENT_KEY_FIELDS[event.type], None)
+        profiled: bool = self._profiler is not None
+
+        for handler in keyed_handlers.get(key, ()):
+            if profiled:
+                start: float = perf_counter()
+            try:
+                result: Any = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self._logger.error(
+                    "Keyed event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "event_key": key,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown'),
+                        "handler_type": "keyed"
+                    }
+                )
+            if profiled:
+                self._record_latency(handler, event, perf_counter() - start)
+
+    async def _process_filtered(self, event: Event) -> None:
+        """
+        Distribute event to those filtered handlers accepting its data.
+        """
+        profiled: bool = self._profiler is not None
+
+        for handler in self._match_filtered(event):
+            if profiled:
+                start: float = perf_counter()
+            try:
+                result: Any = handler(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self._logger.error(
+                    "Filtered event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown'),
+                        "handler_type": "filtered"
+                    }
+                )
+            if profiled:
+                self._record_latency(handler, event, perf_counter() - start)
+
+    def _process_scheduled(self, event: Event) -> Any:
+        """
+        Run callback of a timer which was due, returning the coroutine of
+        coroutine function callbacks to be awaited.
+        """
+        handle: TimerHandle = event.data
+        if not handle.cancelled:
+            return handle.callback(*handle.args)
+        return None
+
+    async def _run_scheduler(self) -> None:
+        """
+        Deliver due timers and then sleep until the next one is due.
+        """
+        while self._active:
+            self._scheduler.advance()
+
+            self._timer_wakeup.clear()
+            timeout: float = self._scheduler.get_timeout(1.0)
+
+            try:
+                await asyncio.wait_for(self._timer_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _wake_timer(self) -> None:
+        """
+        Wake up timer task after an earlier timer was scheduled.
+        """
+        if self._loop and self._timer_wakeup and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._timer_wakeup.set)
+
+    def put(self, event: Event) -> None:
+        """
+        Put an event object into event queue. Thread-safe, events put from
+        other threads are handed over to the loop thread.
+        """
+        if self._profiler:
+            event._put_time = perf_counter()
+
+        loop_thread: int | None = self._loop_thread
+        if loop_thread == get_ident():
+            self._put_local(event)
+        elif loop_thread is None:
+            self._put_buffered(event)
+        else:
+            self._loop.call_soon_threadsafe(self._put_local, event)
+
+    def put_many(self, events: Iterable[Event]) -> None:
+        """
+        Put several event objects into event queue with one hand over.
+        """
+        events = list(events)
+
+        if self._profiler:
+            put_time: float = perf_counter()
+            for event in events:
+                event._put_time = put_time
+
+        loop_thread: int | None = self._loop_thread
+        if loop_thread == get_ident():
+            self._put_local(*events)
+        elif loop_thread is None:
+            self._put_buffered(*events)
+        else:
+            self._loop.call_soon_threadsafe(self._put_local, *events)
+
+    def _put_buffered(self, *events: Event) -> None:
+        """
+        Queue events put before the dispatch task was created, from any
+        thread. Only the deque is touched, which is thread-safe, not the
+        asyncio wakeup event. If the task was created meanwhile and may
+        have missed the events, it is woken up on the loop thread.
+        """
+        self._pending.extend(events)
+
+        if self._loop_thread is not None:
+            self._loop.call_soon_threadsafe(self._put_local)
+
+    def _put_local(self, *events: Event) -> None:
+        """
+        Queue events and wake up dispatch task, must be run on the loop
+        thread once started.
+        """
+        self._pending.extend(events)
+
+        if self._wakeup and not self._wakeup.is_set():
+            self._wakeup.set()
+
+    def get_queue_stats(self) -> dict[str, Any]:
+        """
+        Get number of pending events.
+        """
+        return {"pending": len(self._pending)}
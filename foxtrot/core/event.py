@@ -1,162 +1,17 @@
-from collections import defaultdict
-from collections.abc import Callable
-from queue import Empty, Queue
-from threading import Thread
-from time import sleep
-from typing import Any
-
-EVENT_TIMER = "eTimer"
-
-# Event type constants
-EVENT_TICK = "eTick."
-EVENT_TRADE = "eTrade."
-EVENT_ORDER = "eOrder."
-EVENT_POSITION = "ePosition."
-EVENT_ACCOUNT = "eAccount."
-EVENT_QUOTE = "eQuote."
-EVENT_CONTRACT = "eContract."
-EVENT_LOG = "eLog"
-
-
-class Event:
-    """
-    Event object consists of a type string which is used
-    by event engine for distributing event, and a data
-    object which contains the real data.
-    """
-
-    def __init__(self, type: str, data: Any = None) -> None:
-        """"""
-        self.type: str = type
-        self.data: Any = data
-
-
-# Defines handler function to be used in event engine.
-HandlerType = Callable[[Event], None]
-
-
-class EventEngine:
-    """
-    Event engine distributes event object based on its type
-    to those handlers registered.
-
-    It also generates timer event by every interval seconds,
-    which can be used for timing purpose.
-    """
-
-    def __init__(self, interval: int = 1) -> None:
-        """
-        Timer event is generated every 1 second by default, if
-        interval not specified.
-        """
-        self._interval: int = interval
-        self._queue: Queue[Event] = Queue()
-        self._active: bool = False
-        self._thread: Thread = Thread(target=self._run)
-        self._timer: Thread = Thread(target=self._run_timer)
-        self._handlers: defaultdict[str, list[Callable[[Event], None]]] = defaultdict(list)
-        self._general_handlers: list[HandlerType] = []
-
-    def _run(self) -> None:
-        """
-        Get event from queue and then process it.
-        """
-        while self._active:
-            try:
-                event: Event = self._queue.get(block=True, timeout=1)
-                self._process(event)
-            except Empty:
-                pass
-
-    def _process(self, event: Event) -> None:
-        """
-        First distribute event to those handlers registered listening
-        to this type.
-
-        Then distribute event to those general handlers which listens
-        to all types.
-        """
-        if event.type in self._handlers:
-            for handler in self._handlers[event.type]:
-                try:
-                    handler(event)
-                except Exception:
-                    # Silently ignore handler exceptions to prevent
-                    # stopping the event engine
-                    pass
-
-        if self._general_handlers:
-            for handler in self._general_handlers:
-                try:
-                    handler(event)
-                except Exception:
-                    # Silently ignore handler exceptions to prevent
-                    # stopping the event engine
-                    pass
-
-    def _run_timer(self) -> None:
-        """
-        Sleep by interval second(s) and then generate a timer event.
-        """
-        while self._active:
-            sleep(self._interval)
-            event: Event = Event(EVENT_TIMER)
-            self.put(event)
-
-    def start(self) -> None:
-        """
-        Start event engine to process events and generate timer events.
-        """
-        self._active = True
-        self._thread.start()
-        self._timer.start()
-
-    def stop(self) -> None:
-        """
-        Stop event engine.
-        """
-        self._active = False
-        self._timer.join()
-        self._thread.join()
-
-    def put(self, event: Event) -> None:
-        """
-        Put an event object into event queue.
-        """
-        self._queue.put(event)
-
-    def register(self, type: str, handler: HandlerType) -> None:
-        """
-        Register a new handler function for a specific event type. Every
-        function can only be registered once for each event type.
-        """
-        handler_list: list[HandlerType] = self._handlers[type]
-        if handler not in handler_list:
-            handler_list.append(handler)
-
-    def unregister(self, type: str, handler: HandlerType) -> None:
-        """
-        Unregister an existing handler function from event engine.
-        """
-        handler_list: list[HandlerType] = self._handlers[type]
-
-        if handler in handler_list:
-            handler_list.remove(handler)
-
-        if not handler_list:
-            self._handlers.pop(type)
-
-    def register_general(self, handler: HandlerType) -> None:
-        """
-        Register a new handler function for all event types. Every
-        function can only be registered once for each event type.
-        """
-        if handler not in self._general_handlers:
-            self._general_handlers.append(handler)
-
-    def unregister_general(self, handler: HandlerType) -> None:
-        """
-        Unregister an existing general handler function.
-        """
-        if handler in self._general_handlers:
-            self._general_handlers.remove(handler)
+"""
+Compatibility module, events are defined in event_engine and event type
+strings in foxtrot.util.event_type.
+"""
+
+from ..util.event_type import (  # noqa: F401
+    EVENT_ACCOUNT,
+    EVENT_CONTRACT,
+    EVENT_LOG,
+    EVENT_ORDER,
+    EVENT_POSITION,
+    EVENT_QUOTE,
+    EVENT_TICK,
+    EVENT_TIMER,
+    EVENT_TRADE,
+)
+from .event_engine import Event, EventEngine, HandlerType  # noqa: F401
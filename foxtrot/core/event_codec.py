@@ -0,0 +1,45 @@
+"""
+Binary encoding of events for passing them between processes and
+storing them in journals.
+"""
+
+from struct import Struct
+from typing import Any
+
+from ..util.codec import DATA_CODECS, decode_data, encode_data
+from .event_engine import Event
+
+TYPE_LENGTH: Struct = Struct("<H")
+
+
+def can_encode(event: Event) -> bool:
+    """
+    Check if event data is None or of a class with registered codec.
+    """
+    return event.data is None or type(event.data) in DATA_CODECS
+
+
+def encode_event(event: Event) -> bytes:
+    """
+    Encode event type and data into a record.
+    """
+    type_bytes: bytes = event.type.encode()
+    record: bytes = TYPE_LENGTH.pack(len(type_bytes)) + type_bytes
+
+    if event.data is not None:
+        record += encode_data(event.data)
+    return record
+
+
+def decode_event(record: bytes | memoryview) -> Event:
+    """
+    Decode event from a record.
+    """
+    length: int = TYPE_LENGTH.unpack_from(record)[0]
+    type: str = bytes(record[2:2 + length]).decode()
+
+    data: Any = None
+    if len(record) > 2 + length:
+        data = decode_data(memoryview(record)[2 + length:])
+
+    return Event(type, data)
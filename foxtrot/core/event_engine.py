@@ -2,16 +2,37 @@
 Event-driven framework of Silvertine framework.
 """
 
-from collections import defaultdict
-from collections.abc import Callable
-from queue import Empty, Queue
-from threading import Thread
-from time import sleep
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from queue import Empty
+from threading import Lock, Thread, current_thread
+from time import perf_counter
 from typing import Any
 
+from ..util.event_type import (
+    EVENT_ACCOUNT,
+    EVENT_DEPTH,
+    EVENT_ORDER,
+    EVENT_POSITION,
+    EVENT_QUOTE,
+    EVENT_TICK,
+    EVENT_TRADE,
+)
 from ..util.logger import get_performance_logger
+from .event_profiler import EventProfiler, get_handler_name
+from .event_queue import (
+    EventPriority,
+    EventQueue,
+    LanePolicy,
+    OverflowPolicy,
+    WatermarkCallback,
+    merge_queue_stats,
+)
+from .handler_executor import HandlerExecutor
+from .timer_wheel import TimerHandle, TimerWheel
 
 EVENT_TIMER = "eTimer"
+EVENT_SCHEDULE = "eSchedule"
 
 
 class Event:
@@ -21,15 +42,163 @@ class Event:
     object which contains the real data.
     """
 
+    __slots__ = ("type", "data", "_put_time")
+
     def __init__(self, type: str, data: Any = None) -> None:
         """"""
         self.type: str = type
         self.data: Any = data
 
 
+class EventPool:
+    """
+    Free list of event objects, so that events of hot types (e.g. ticks)
+    are reused after being processed instead of allocated per update.
+
+    Events are only given back by engines created with the type in
+    pool_types, handlers of those types must not keep the event object
+    after returning (keeping its data is fine).
+    """
+
+    def __init__(self, size: int = 4096) -> None:
+        """"""
+        self.size: int = size
+        self._free: deque[Event] = deque()
+
+    def acquire(self, type: str, data: Any = None) -> Event:
+        """
+        Get a free event object, or a new one if none is free.
+        """
+        free: deque[Event] = self._free
+        if free:
+            try:
+                event: Event = free.pop()
+            except IndexError:
+                return Event(type, data)
+
+            event.type = type
+            event.data = data
+            return event
+
+        return Event(type, data)
+
+    def release(self, event: Event) -> None:
+        """
+        Give back a processed event object.
+        """
+        if len(self._free) < self.size:
+            event.data = None
+            event._put_time = None
+            self._free.append(event)
+
+    def __len__(self) -> int:
+        """
+        Number of free event objects.
+        """
+        return len(self._free)
+
+
+# Pool shared by adapters creating and engines processing hot events.
+EVENT_POOL: EventPool = EventPool()
+
+
 # Defines handler function to be used in event engine.
 HandlerType = Callable[[Event], None]
 
+# Defines handler function receiving all events of a type drained at once.
+BatchHandlerType = Callable[[list[Event]], None]
+
+# Defines function returning the ordering key of an event in sharded mode.
+ShardKeyType = Callable[[Event], str | None]
+
+# Defines conditions of a filtered handler, pairs of data attribute and
+# values accepted, e.g. (("exchange", frozenset({Exchange.BINANCE})),).
+FilterType = tuple[tuple[str, frozenset], ...]
+
+# Data attribute used as ordering key for each event type in sharded mode.
+# Fills are keyed by order id so that they stay behind their order update.
+SHARD_KEY_FIELDS: dict[str, str] = {
+    EVENT_TICK: "vt_symbol",
+    EVENT_DEPTH: "vt_symbol",
+    EVENT_ORDER: "vt_orderid",
+    EVENT_TRADE: "vt_orderid",
+    EVENT_POSITION: "vt_symbol",
+    EVENT_ACCOUNT: "vt_accountid",
+    EVENT_QUOTE: "vt_quoteid",
+}
+
+
+# Priority classes letting orders and fills overtake pending market data,
+# e.g. EventEngine(priorities=EXECUTION_PRIORITIES).
+EXECUTION_PRIORITIES: dict[str, EventPriority] = {
+    EVENT_ORDER: EventPriority.HIGH,
+    EVENT_TRADE: EventPriority.HIGH,
+    EVENT_TICK: EventPriority.LOW,
+    EVENT_DEPTH: EventPriority.LOW,
+    EVENT_QUOTE: EventPriority.LOW,
+}
+
+# Maximum number of events drained at once with priorities configured,
+# so that newly arrived high priority events are taken up quickly.
+PRIORITY_DRAIN_LIMIT: int = 64
+
+
+# Data attribute matched against the key of keyed subscriptions for each
+# event type, e.g. register(EVENT_TICK, handler, key="BTCUSDT.BINANCE").
+EVENT_KEY_FIELDS: dict[str, str] = {
+    EVENT_TICK: "vt_symbol",
+    EVENT_DEPTH: "vt_symbol",
+    EVENT_TRADE: "vt_symbol",
+    EVENT_ORDER: "vt_orderid",
+    EVENT_POSITION: "vt_symbol",
+    EVENT_ACCOUNT: "vt_accountid",
+    EVENT_QUOTE: "vt_symbol",
+}
+
+
+def split_keyed_type(type: str) -> tuple[str, str | None]:
+    """
+    Split legacy keyed event type (e.g. "eTick.BTCUSDT.BINANCE") into
+    base event type and subscription key.
+    """
+    for base in EVENT_KEY_FIELDS:
+        if type.startswith(base) and type != base:
+            return base, type[len(base):]
+    return type, None
+
+
+def normalize_filters(filters: dict[str, Any]) -> FilterType:
+    """
+    Convert filters of register, mapping data attribute to a value or a
+    collection of values accepted, into hashable conditions.
+    """
+    if not filters:
+        raise ValueError("Filters must not be empty")
+
+    conditions: list[tuple[str, frozenset]] = []
+    for field, value in filters.items():
+        if isinstance(value, (set, frozenset, list, tuple)):
+            values: frozenset = frozenset(value)
+        else:
+            values = frozenset((value,))
+
+        if not values:
+            raise ValueError(f"Filter on {field} accepts no value")
+        conditions.append((field, values))
+
+    return tuple(conditions)
+
+
+def default_shard_key(event: Event) -> str | None:
+    """
+    Return the ordering key of an event, or None if the event
+    type has no key field.
+    """
+    field: str | None = SHARD_KEY_FIELDS.get(event.type, None)
+    if not field:
+        return None
+    return getattr(event.data, field, None)
+
 
 class EventEngine:
     """
@@ -38,86 +207,467 @@ class EventEngine:
 
     It also generates timer event by every interval seconds,
     which can be used for timing purpose.
+
+    Callbacks scheduled with call_later, call_at and call_every are kept
+    in a timing wheel with millisecond resolution, and run by the worker
+    thread through the event queue once due, in order with other events.
+
+    In sharded mode (shards > 1) events are distributed over several
+    worker threads by their ordering key, so that events with the same
+    key (e.g. ticks of one vt_symbol) are processed strictly in order,
+    while events of unrelated keys are processed in parallel. Handlers
+    registered in sharded mode must therefore be thread-safe.
+
+    Handler tables are immutable tuples replaced as a whole under a lock
+    when handlers are registered or unregistered, so worker threads read
+    a consistent snapshot without locking. Type-specific and general
+    handlers are merged into one precomputed tuple per event type.
+
+    Handlers can subscribe to the events of a single key only, e.g. ticks
+    of one vt_symbol, with register(type, handler, key). Keyed handlers
+    are looked up in a dict index, so events are published only once
+    and keys without subscribers cost nothing.
+
+    Handlers can also be registered with filters on any data attribute,
+    e.g. register(EVENT_TICK, handler, filters={"exchange":
+    Exchange.BINANCE}). The first filter is indexed by value, so events
+    filtered out cost a dict lookup instead of a handler call.
+
+    Event types passed as conflate_types (e.g. EVENT_TICK) are conflated
+    by the same ordering key: a newer event overwrites the pending one
+    in place, so handlers never process superseded market data.
+
+    With capacity > 0 the queue of each shard is bounded, and overflow
+    policies decide per event type whether a producer blocks or events
+    are dropped or conflated once the queue is full. Events put by
+    handlers on worker threads bypass the bound of any shard instead, so
+    workers never wait on each other.
+
+    With priorities configured, events of each priority class are queued
+    in their own lane, and the lane policy (strict or weighted round
+    robin) decides the order events of different lanes are processed in.
+
+    Slow handlers (e.g. database writes) can be registered on a named
+    executor added with add_executor, register(type, handler,
+    executor=name). The dispatch thread then only puts events into the
+    bounded queue of the executor, whose own worker threads run them.
+
+    With spin_time > 0 an idle worker busy-waits up to spin_time seconds
+    for the next event before blocking on the queue condition, trading
+    CPU for lower wakeup latency in latency-critical deployments.
+
+    With profile enabled every handler call is timed, and queue wait time
+    is recorded per event type, see get_handler_stats. Handler calls
+    slower than slow_threshold seconds are logged as warnings. Wakeup
+    latency of idle workers is recorded per wait mode, see
+    get_wakeup_stats.
+
+    Events of pool_types are given back to EVENT_POOL once processed, so
+    that adapters creating them with EVENT_POOL.acquire reuse the same
+    event objects. Handlers of those types must not keep the event.
     """
 
-    def __init__(self, interval: float = 1.0) -> None:
+    def __init__(
+        self,
+        interval: float = 1.0,
+        shards: int = 1,
+        shard_key: ShardKeyType | None = None,
+        conflate_types: Iterable[str] = (),
+        capacity: int = 0,
+        overflow_policies: dict[str, OverflowPolicy] | None = None,
+        default_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        high_water: int = 0,
+        priorities: dict[str, EventPriority] | None = None,
+        lane_policy: LanePolicy = LanePolicy.WEIGHTED,
+        lane_weights: dict[EventPriority, int] | None = None,
+        profile: bool = False,
+        slow_threshold: float = 0.01,
+        pool_types: Iterable[str] = (),
+        spin_time: float = 0.0,
+    ) -> None:
         """
         Timer event is generated every 1 second by default, if
         interval not specified.
+
+        Events are processed by a single worker thread by default, if
+        shards not specified. Events without ordering key are routed by
+        their type, so each of those types is still processed in order.
+
+        Queue is unbounded by default, if capacity not specified.
+
+        All events share one FIFO lane by default, if priorities not specified.
+
+        Handlers are not profiled by default, if profile not specified.
+
+        Event objects are not reused by default, if pool_types not
+        specified.
+
+        Idle workers block on the queue without spinning by default, if
+        spin_time not specified.
         """
         self._interval: float = interval
-        self._queue: Queue[Event] = Queue()
+        self._shards: int = max(shards, 1)
+        self._shard_key: ShardKeyType = shard_key or default_shard_key
+
+        self._queues: list[EventQueue] = [
+            EventQueue(
+                maxsize=capacity,
+                conflate_types=conflate_types,
+                key=self._shard_key,
+                policies=overflow_policies,
+                default_policy=default_policy,
+                high_water=high_water,
+                priorities=priorities,
+                lane_policy=lane_policy,
+                lane_weights=lane_weights,
+            )
+            for _ in range(self._shards)
+        ]
+        self._drain_limit: int = PRIORITY_DRAIN_LIMIT if priorities else 0
+        self._spin_time: float = max(spin_time, 0.0)
+        self._queue: EventQueue = self._queues[0]
         self._active: bool = False
-        self._thread: Thread = Thread(target=self._run)
+        self._workers: list[Thread] = [self._create_worker(i) for i in range(self._shards)]
+        self._thread: Thread = self._workers[0]
         self._timer: Thread = Thread(target=self._run_timer)
-        self._handlers: defaultdict[str, list[HandlerType]] = defaultdict(list)
-        self._general_handlers: list[HandlerType] = []
-        
+        # Handler tables are copied on write and never mutated in place
+        self._lock: Lock = Lock()
+        self._handlers: dict[str, tuple[HandlerType, ...]] = {}
+        self._general_handlers: tuple[HandlerType, ...] = ()
+        self._batch_handlers: dict[str, tuple[BatchHandlerType, ...]] = {}
+        self._keyed_handlers: dict[str, dict[str, tuple[HandlerType, ...]]] = {}
+        # Filtered handlers by type, indexed field and value of the field
+        self._filtered_handlers: dict[
+            str, dict[str, dict[Any, tuple[tuple[HandlerType, FilterType], ...]]]
+        ] = {}
+        self._executors: dict[str, HandlerExecutor] = {}
+        self._dispatch: tuple[dict[str, tuple[HandlerType, ...]], tuple[HandlerType, ...]] = ({}, ())
+        # Internal handlers calling registered ones, not profiled themselves
+        self._wrappers: frozenset[HandlerType] = frozenset()
+        self._update_dispatch()
+
+        # Timer events and scheduled callbacks are driven by the timer thread
+        self._scheduler: TimerWheel = TimerWheel(self._deliver_timer)
+        self._timer_handle: TimerHandle | None = None
+
+        # Profiler is None while profiling is disabled
+        self._profiler: EventProfiler | None = None
+        if profile:
+            self.enable_profiling(slow_threshold)
+
+        # Processed events of these types are given back to EVENT_POOL
+        self._pool_types: frozenset[str] = frozenset(pool_types)
+
         # Performance-optimized logger for hot path
         self._logger = get_performance_logger("EventEngine")
 
-    def _run(self) -> None:
+    def _create_worker(self, index: int) -> Thread:
         """
-        Get event from queue and then process it.
+        Create worker thread for the queue of a specific shard.
         """
+        if not index:
+            return Thread(target=self._run)
+        return Thread(target=self._run, args=(index,), name=f"EventEngine-shard-{index}")
+
+    def _run(self, index: int = 0) -> None:
+        """
+        Get all pending events from queue of the shard at once and then
+        process them one by one.
+
+        If the queue is empty, spin for spin_time seconds before blocking.
+        """
+        queue: EventQueue = self._queues[index]
+        spin_time: float = self._spin_time
+
         while self._active:
+            idle: bool = not queue.has_pending()
+            spun: bool = idle and bool(spin_time) and queue.spin_wait(spin_time)
+
             try:
-                event: Event = self._queue.get(block=True, timeout=1)
-                self._process(event)
+                events: list[Event] = queue.get_many(block=True, timeout=1, limit=self._drain_limit)
             except Empty:
-                pass
+                continue
 
-    def _process(self, event: Event) -> None:
+            if idle and self._profiler:
+                self._record_wakeup(events[0], spun)
+
+            if self._profiler:
+                for event in events:
+                    self._process_profiled(event)
+            else:
+                for event in events:
+                    self._process(event)
+
+            if self._batch_handlers:
+                self._process_batch(events)
+
+            if self._pool_types:
+                self._release(events)
+
+    def _release(self, events: list[Event]) -> None:
+        """
+        Give processed events of pooled types back to the event pool.
         """
-        First distribute event to those handlers registered listening
-        to this type.
+        pool_types: frozenset[str] = self._pool_types
+
+        for event in events:
+            if event.type in pool_types:
+                EVENT_POOL.release(event)
 
-        Then distribute event to those general handlers which listens
-        to all types.
+    def _process_batch(self, events: list[Event]) -> None:
         """
-        if event.type in self._handlers:
-            for handler in self._handlers[event.type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    # Don't hold reference to exception object to prevent memory leaks  
-                    # MIGRATION: Replace print with structured logging
-                    self._logger.error(
-                        "Event handler failed",
-                        extra={
-                            "event_type": event.type,
-                            "error_type": type(e).__name__,
-                            "error_msg": str(e),
-                            "handler_name": getattr(handler, '__name__', 'unknown')
-                        }
-                    )
+        Distribute events drained in one wakeup to batch handlers, as
+        one list per event type.
+        """
+        batch_handlers: dict[str, tuple[BatchHandlerType, ...]] = self._batch_handlers
+        batches: defaultdict[str, list[Event]] = defaultdict(list)
 
-        if self._general_handlers:
-            for handler in self._general_handlers:
+        for event in events:
+            if event.type in batch_handlers:
+                batches[event.type].append(event)
+
+        for event_type, batch in batches.items():
+            for handler in batch_handlers.get(event_type, ()):
                 try:
-                    handler(event)
+                    handler(batch)
                 except Exception as e:
-                    # Don't hold reference to exception object to prevent memory leaks
-                    # MIGRATION: Replace print with structured logging
                     self._logger.error(
-                        "General event handler failed", 
+                        "Batch event handler failed",
                         extra={
-                            "event_type": event.type,
+                            "event_type": event_type,
+                            "batch_size": len(batch),
                             "error_type": type(e).__name__,
                             "error_msg": str(e),
                             "handler_name": getattr(handler, '__name__', 'unknown'),
-                            "handler_type": "general"
+                            "handler_type": "batch"
                         }
                     )
 
+    def _process(self, event: Event) -> None:
+        """
+        Distribute event to the precomputed handlers of its type: first
+        those handlers registered listening to this type, then those
+        keyed handlers listening to the key of event data, and finally
+        those general handlers which listens to all types.
+        """
+        dispatch, general_handlers = self._dispatch
+
+        for handler in dispatch.get(event.type, general_handlers):
+            try:
+                handler(event)
+            except Exception as e:
+                # Don't hold reference to exception object to prevent memory leaks
+                # MIGRATION: Replace print with structured logging
+                self._logger.error(
+                    "Event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown')
+                    }
+                )
+
+    def _process_profiled(self, event: Event) -> None:
+        """
+        Distribute event same as _process, while recording its queue
+        wait time and the latency of every handler call.
+        """
+        profiler: EventProfiler | None = self._profiler
+        if not profiler:
+            self._process(event)
+            return
+
+        put_time: float | None = getattr(event, "_put_time", None)
+        if put_time is not None:
+            profiler.record_queue_wait(event.type, perf_counter() - put_time)
+
+        dispatch, general_handlers = self._dispatch
+        wrappers: frozenset[HandlerType] = self._wrappers
+
+        for handler in dispatch.get(event.type, general_handlers):
+            # Keyed, filtered and executor handlers are timed where they are called
+            if handler in wrappers:
+                handler(event)
+                continue
+
+            start: float = perf_counter()
+            try:
+                handler(event)
+            except Exception as e:
+                self._logger.error(
+                    "Event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown')
+                    }
+                )
+            self._record_latency(handler, event, perf_counter() - start)
+
+    def _record_latency(self, handler: HandlerType, event: Event, latency: float) -> None:
+        """
+        Record latency of one handler call, logging it if slow.
+        """
+        profiler: EventProfiler | None = self._profiler
+        if profiler and profiler.record_handler(handler, latency):
+            self._logger.warning(
+                "Slow event handler",
+                extra={
+                    "event_type": event.type,
+                    "handler_name": get_handler_name(handler),
+                    "latency_ms": round(latency * 1000, 3),
+                    "threshold_ms": round(profiler.slow_threshold * 1000, 3)
+                }
+            )
+
+    def _record_wakeup(self, event: Event, spun: bool) -> None:
+        """
+        Record time since the first event was put into the empty queue
+        of a waiting worker.
+        """
+        profiler: EventProfiler | None = self._profiler
+        put_time: float | None = getattr(event, "_put_time", None)
+
+        if profiler and put_time is not None:
+            profiler.record_wakeup("spin" if spun else "block", perf_counter() - put_time)
+
+    def _process_keyed(self, event: Event) -> None:
+        """
+        Distribute event to those keyed handlers registered listening
+        to the key of event data.
+        """
+        keyed_handlers: dict[str, tuple[HandlerType, ...]] = self._keyed_handlers.get(event.type, {})
+        key: str | None = getattr(event.data, EVENT_KEY_FIELDS[event.type], None)
+        profiled: bool = self._profiler is not None
+
+        for handler in keyed_handlers.get(key, ()):
+            if profiled:
+                start: float = perf_counter()
+            try:
+                handler(event)
+            except Exception as e:
+                self._logger.error(
+                    "Keyed event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "event_key": key,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown'),
+                        "handler_type": "keyed"
+                    }
+                )
+            if profiled:
+                self._record_latency(handler, event, perf_counter() - start)
+
+    def _match_filtered(self, event: Event) -> list[HandlerType]:
+        """
+        Get filtered handlers whose filters all accept the event data.
+        """
+        data: Any = event.data
+        matched: list[HandlerType] = []
+
+        for field, index in self._filtered_handlers.get(event.type, {}).items():
+            for handler, conditions in index.get(getattr(data, field, None), ()):
+                for name, values in conditions:
+                    if getattr(data, name, None) not in values:
+                        break
+                else:
+                    matched.append(handler)
+
+        return matched
+
+    def _process_filtered(self, event: Event) -> None:
+        """
+        Distribute event to those filtered handlers accepting its data.
+        """
+        profiled: bool = self._profiler is not None
+
+        for handler in self._match_filtered(event):
+            if profiled:
+                start: float = perf_counter()
+            try:
+                handler(event)
+            except Exception as e:
+                self._logger.error(
+                    "Filtered event handler failed",
+                    extra={
+                        "event_type": event.type,
+                        "error_type": type(e).__name__,
+                        "error_msg": str(e),
+                        "handler_name": getattr(handler, '__name__', 'unknown'),
+                        "handler_type": "filtered"
+                    }
+                )
+            if profiled:
+                self._record_latency(handler, event, perf_counter() - start)
+
+    def _update_dispatch(self) -> None:
+        """
+        Precompute the handler tuple of every event type from the current
+        handler tables. Must be called with the lock held.
+        """
+        general_handlers: tuple[HandlerType, ...] = self._general_handlers
+        dispatch: dict[str, tuple[HandlerType, ...]] = {}
+
+        types: set[str] = self._handlers.keys() | self._keyed_handlers.keys() | self._filtered_handlers.keys()
+        for executor in self._executors.values():
+            types.update(executor.handlers)
+
+        for type in types:
+            handlers: tuple[HandlerType, ...] = self._handlers.get(type, ())
+            if type in self._keyed_handlers:
+                handlers += (self._process_keyed,)
+            if type in self._filtered_handlers:
+                handlers += (self._process_filtered,)
+            for executor in self._executors.values():
+                if type in executor.handlers:
+                    handlers += (executor.submit,)
+            dispatch[type] = handlers + general_handlers
+
+        # Scheduled callbacks are internal and not seen by general handlers
+        dispatch[EVENT_SCHEDULE] = (self._process_scheduled,)
+
+        self._dispatch = (dispatch, general_handlers)
+        self._wrappers = frozenset(
+            (self._process_keyed, self._process_filtered)
+            + tuple(executor.submit for executor in self._executors.values())
+        )
+
+    def _process_scheduled(self, event: Event) -> None:
+        """
+        Run callback of a timer which was due, unless it was cancelled
+        after being put into the queue.
+        """
+        handle: TimerHandle = event.data
+        if not handle.cancelled:
+            handle.callback(*handle.args)
+
+    def _deliver_timer(self, handle: TimerHandle) -> None:
+        """
+        Put due timer into event queue. Timer event generation is run
+        directly by the timer thread.
+        """
+        if handle is self._timer_handle:
+            handle.callback(*handle.args)
+        else:
+            self.put(Event(EVENT_SCHEDULE, handle))
+
+    def _put_timer(self) -> None:
+        """
+        Generate a timer event.
+        """
+        self.put(Event(EVENT_TIMER))
+
     def _run_timer(self) -> None:
         """
-        Sleep by interval second(s) and then generate a timer event.
+        Deliver due timers and then sleep until the next one is due.
         """
         while self._active:
-            sleep(self._interval)
-            event: Event = Event(EVENT_TIMER)
-            self.put(event)
+            self._scheduler.advance()
+            self._scheduler.wait(1.0)
 
     def start(self) -> None:
         """
@@ -127,8 +677,7 @@ class EventEngine:
         # If already active and threads are alive, do nothing
         if (
             self._active
-            and hasattr(self, "_thread")
-            and self._thread.is_alive()
+            and all(worker.is_alive() for worker in self._workers)
             and hasattr(self, "_timer")
             and self._timer.is_alive()
         ):
@@ -137,15 +686,25 @@ class EventEngine:
         self._active = True
 
         # Create new threads only if needed (not alive or don't exist)
-        if not hasattr(self, "_thread") or not self._thread.is_alive():
-            self._thread = Thread(target=self._run)
+        for i, worker in enumerate(self._workers):
+            if not worker.is_alive():
+                self._workers[i] = self._create_worker(i)
+        self._thread = self._workers[0]
 
         if not hasattr(self, "_timer") or not self._timer.is_alive():
             self._timer = Thread(target=self._run_timer)
 
+            if self._timer_handle:
+                self._timer_handle.cancel()
+            self._timer_handle = self._scheduler.call_every(self._interval, self._put_timer)
+
+        for executor in self._executors.values():
+            executor.start()
+
         # Start threads only if they're not already running
-        if not self._thread.is_alive():
-            self._thread.start()
+        for worker in self._workers:
+            if not worker.is_alive():
+                worker.start()
         if not self._timer.is_alive():
             self._timer.start()
 
@@ -158,6 +717,9 @@ class EventEngine:
             return  # Already stopped
 
         self._active = False
+        self._scheduler.wakeup()
+        for queue in self._queues:
+            queue.wakeup()
 
         # Join threads with timeout to prevent hanging in test environments
         if hasattr(self, "_timer") and self._timer.is_alive():
@@ -169,61 +731,521 @@ class EventEngine:
                     extra={"thread_type": "timer", "timeout_seconds": 5.0}
                 )
 
-        if hasattr(self, "_thread") and self._thread.is_alive():
-            self._thread.join(timeout=5.0)
-            if self._thread.is_alive():
+        for i, worker in enumerate(self._workers):
+            if not worker.is_alive():
+                continue
+
+            worker.join(timeout=5.0)
+            if worker.is_alive():
                 # MIGRATION: Replace print with WARNING logging
                 self._logger.warning(
                     "Main thread didn't terminate within timeout",
-                    extra={"thread_type": "main", "timeout_seconds": 5.0}
+                    extra={"thread_type": "main", "shard": i, "timeout_seconds": 5.0}
                 )
 
+        for executor in self._executors.values():
+            executor.stop()
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule callback to be called with args after delay seconds.
+        """
+        return self._scheduler.call_later(delay, callback, *args)
+
+    def call_at(self, when: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule callback to be called with args at time when, in seconds
+        of time.monotonic.
+        """
+        return self._scheduler.call_at(when, callback, *args)
+
+    def call_every(self, interval: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule callback to be called with args every interval seconds
+        until the returned handle is cancelled.
+        """
+        return self._scheduler.call_every(interval, callback, *args)
+
     def put(self, event: Event) -> None:
         """
         Put an event object into event queue.
+
+        In sharded mode the event is put into the queue of the shard
+        its ordering key maps to.
         """
-        self._queue.put(event)
+        if self._shards == 1:
+            index: int = 0
+        else:
+            key: str | None = self._shard_key(event)
+            if key is None:
+                key = event.type
+            index = hash(key) % self._shards
+
+        queue: EventQueue = self._queues[index]
+
+        if self._profiler:
+            event._put_time = perf_counter()
+
+        # Handlers must not block on a full queue: a worker putting into its
+        # own shard, or two workers putting into each other's, would deadlock.
+        if queue.maxsize and current_thread() in self._workers:
+            queue.force_put(event)
+        else:
+            queue.put(event)
 
-    def register(self, type: str, handler: HandlerType) -> None:
+    def put_many(self, events: Iterable[Event]) -> None:
+        """
+        Put several event objects into event queue with one queue
+        operation per shard.
+        """
+        if self._profiler:
+            events = list(events)
+            put_time: float = perf_counter()
+            for event in events:
+                event._put_time = put_time
+
+        if self._shards == 1:
+            batches: dict[int, list[Event]] = {0: list(events)}
+        else:
+            batches = defaultdict(list)
+            for event in events:
+                key: str | None = self._shard_key(event)
+                if key is None:
+                    key = event.type
+                batches[hash(key) % self._shards].append(event)
+
+        for index, batch in batches.items():
+            queue: EventQueue = self._queues[index]
+
+            if queue.maxsize and current_thread() in self._workers:
+                for event in batch:
+                    queue.force_put(event)
+            else:
+                queue.put_many(batch)
+
+    @property
+    def shards(self) -> int:
+        """
+        Number of worker threads processing events.
+        """
+        return self._shards
+
+    def get_shard_sizes(self) -> list[int]:
+        """
+        Get number of pending events in the queue of each shard.
+        """
+        return [queue.qsize() for queue in self._queues]
+
+    def get_queue_stats(self) -> dict[str, Any]:
+        """
+        Get queue depth and counters of conflated, delivered and dropped
+        (by event type) events summed over all shards, and of each lane
+        if priorities are configured.
+        """
+        return merge_queue_stats(self._queues)
+
+    def add_watermark_callback(self, callback: WatermarkCallback) -> None:
+        """
+        Add callback invoked with queue depth when the queue of a shard
+        reaches the high water mark (True), and when it is drained back
+        below the low water mark (False).
+        """
+        for queue in self._queues:
+            queue.add_watermark_callback(callback)
+
+    def enable_profiling(self, slow_threshold: float = 0.01) -> None:
+        """
+        Start recording handler latency and queue wait time. Samples
+        recorded before are kept.
+        """
+        if self._profiler:
+            self._profiler.slow_threshold = slow_threshold
+        else:
+            self._profiler = EventProfiler(slow_threshold)
+
+        for executor in self._executors.values():
+            executor.record_latency = self._record_latency
+
+    def disable_profiling(self) -> None:
+        """
+        Stop recording and discard all samples.
+        """
+        self._profiler = None
+
+        for executor in self._executors.values():
+            executor.record_latency = None
+
+    def get_handler_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get call count, mean/p50/p99/max latency in seconds and slow call
+        count of every handler, keyed by handler name. Empty if profiling
+        is disabled.
+        """
+        if not self._profiler:
+            return {}
+        return self._profiler.get_handler_stats()
+
+    def get_queue_wait_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get count and mean/p50/p99/max time in seconds events spent in
+        queue, keyed by event type. Empty if profiling is disabled.
+        """
+        if not self._profiler:
+            return {}
+        return self._profiler.get_queue_wait_stats()
+
+    def get_wakeup_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get count and mean/p50/p99/max time in seconds from an event put
+        into an empty queue until its worker woke up, keyed by wait mode
+        ("spin" if the event arrived while spinning, else "block"). Empty
+        if profiling is disabled.
+        """
+        if not self._profiler:
+            return {}
+        return self._profiler.get_wakeup_stats()
+
+    def reset_handler_stats(self) -> None:
+        """
+        Clear samples recorded by the profiler.
+        """
+        if self._profiler:
+            self._profiler.reset()
+
+    def register(
+        self,
+        type: str,
+        handler: HandlerType,
+        key: str | None = None,
+        executor: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> None:
         """
         Register a new handler function for a specific event type. Every
         function can only be registered once for each event type.
+
+        If key is specified, the handler only receives events whose data
+        matches the key (see EVENT_KEY_FIELDS). Legacy keyed types such as
+        "eTick.BTCUSDT.BINANCE" are converted to keyed registrations.
+
+        If executor is specified, the handler is run by the worker threads
+        of the executor added with add_executor instead of the dispatch
+        thread.
+
+        If filters are specified, the handler only receives events whose
+        data attributes all match, each filter mapping an attribute name
+        to the value or collection of values accepted, e.g.
+        {"vt_symbol": {"BTCUSDT.BINANCE", "ETHUSDT.BINANCE"}}. Values are
+        compared by equality, so enum attributes must be filtered by enum
+        members. The same handler registered with different filters is
+        called once per matching registration.
+        """
+        if key is None:
+            type, key = split_keyed_type(type)
+
+        if filters is not None:
+            if key is not None or executor is not None:
+                raise ValueError("Filtered handlers can not be keyed or run by an executor")
+            self._register_filtered(type, handler, normalize_filters(filters))
+            return
+
+        if executor is not None:
+            if key is not None:
+                raise ValueError("Keyed handlers can not be run by an executor")
+            self._register_executor(type, handler, executor)
+            return
+
+        if key is not None:
+            self._register_keyed(type, handler, key)
+            return
+
+        with self._lock:
+            handlers: tuple[HandlerType, ...] = self._handlers.get(type, ())
+            if handler in handlers:
+                return
+
+            self._handlers = {**self._handlers, type: handlers + (handler,)}
+            self._update_dispatch()
+
+    def unregister(
+        self,
+        type: str,
+        handler: HandlerType,
+        key: str | None = None,
+        executor: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> None:
         """
-        handler_list: list[HandlerType] = self._handlers[type]
-        if handler not in handler_list:
-            handler_list.append(handler)
+        Unregister an existing handler function from event engine. Keyed,
+        executor and filtered handlers are unregistered with the same
+        arguments they were registered with.
+        """
+        if key is None:
+            type, key = split_keyed_type(type)
+
+        if filters is not None:
+            self._unregister_filtered(type, handler, normalize_filters(filters))
+            return
+
+        if executor is not None:
+            self._unregister_executor(type, handler, executor)
+            return
+
+        if key is not None:
+            self._unregister_keyed(type, handler, key)
+            return
+
+        with self._lock:
+            handlers: tuple[HandlerType, ...] = self._handlers.get(type, ())
+            if handler not in handlers:
+                return
+
+            table: dict[str, tuple[HandlerType, ...]] = dict(self._handlers)
+            table[type] = tuple(h for h in handlers if h != handler)
+            if not table[type]:
+                table.pop(type)
 
-    def unregister(self, type: str, handler: HandlerType) -> None:
+            self._handlers = table
+            self._update_dispatch()
+
+    def add_executor(
+        self,
+        name: str,
+        workers: int = 1,
+        capacity: int = 10000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        policies: dict[str, OverflowPolicy] | None = None,
+    ) -> HandlerExecutor:
+        """
+        Add a named executor with its own bounded queue and worker
+        threads, which handlers can be registered on to keep slow work
+        off the dispatch thread. See HandlerExecutor for ordering and
+        overflow behaviour.
+        """
+        with self._lock:
+            if name in self._executors:
+                raise ValueError(f"Executor {name} already exists")
+
+            executor: HandlerExecutor = HandlerExecutor(
+                name,
+                self._logger,
+                default_shard_key,
+                workers=workers,
+                capacity=capacity,
+                policy=policy,
+                policies=policies,
+            )
+            if self._profiler:
+                executor.record_latency = self._record_latency
+            self._executors = {**self._executors, name: executor}
+
+        if self._active:
+            executor.start()
+        return executor
+
+    def get_executor_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get queue stats of every executor, keyed by executor name.
+        """
+        return {name: executor.get_stats() for name, executor in self._executors.items()}
+
+    def _register_executor(self, type: str, handler: HandlerType, name: str) -> None:
         """
-        Unregister an existing handler function from event engine.
+        Register a new handler function to be run by an executor.
         """
-        handler_list: list[HandlerType] = self._handlers[type]
+        with self._lock:
+            executor: HandlerExecutor | None = self._executors.get(name)
+            if not executor:
+                raise ValueError(f"Executor {name} does not exist")
 
-        if handler in handler_list:
-            handler_list.remove(handler)
+            handlers: tuple[HandlerType, ...] = executor.handlers.get(type, ())
+            if handler in handlers:
+                return
 
-        if not handler_list:
-            self._handlers.pop(type)
+            executor.handlers = {**executor.handlers, type: handlers + (handler,)}
+            self._update_dispatch()
+
+    def _unregister_executor(self, type: str, handler: HandlerType, name: str) -> None:
+        """
+        Unregister an existing handler function run by an executor.
+        """
+        with self._lock:
+            executor: HandlerExecutor | None = self._executors.get(name)
+            if not executor:
+                return
+
+            handlers: tuple[HandlerType, ...] = executor.handlers.get(type, ())
+            if handler not in handlers:
+                return
+
+            table: dict[str, tuple[HandlerType, ...]] = dict(executor.handlers)
+            table[type] = tuple(h for h in handlers if h != handler)
+            if not table[type]:
+                table.pop(type)
+
+            executor.handlers = table
+            self._update_dispatch()
+
+    def _register_keyed(self, type: str, handler: HandlerType, key: str) -> None:
+        """
+        Register a new handler function for events of a specific key.
+        """
+        if type not in EVENT_KEY_FIELDS:
+            raise ValueError(f"Event type {type} does not support keyed subscription")
+
+        with self._lock:
+            keyed_handlers: dict[str, tuple[HandlerType, ...]] = self._keyed_handlers.get(type, {})
+            handlers: tuple[HandlerType, ...] = keyed_handlers.get(key, ())
+            if handler in handlers:
+                return
+
+            self._keyed_handlers = {
+                **self._keyed_handlers,
+                type: {**keyed_handlers, key: handlers + (handler,)},
+            }
+            self._update_dispatch()
+
+    def _unregister_keyed(self, type: str, handler: HandlerType, key: str) -> None:
+        """
+        Unregister an existing handler function for events of a specific key.
+        """
+        with self._lock:
+            keyed_handlers: dict[str, tuple[HandlerType, ...]] = dict(self._keyed_handlers.get(type, {}))
+            handlers: tuple[HandlerType, ...] = keyed_handlers.get(key, ())
+            if handler not in handlers:
+                return
+
+            keyed_handlers[key] = tuple(h for h in handlers if h != handler)
+            if not keyed_handlers[key]:
+                keyed_handlers.pop(key)
+
+            table: dict[str, dict[str, tuple[HandlerType, ...]]] = dict(self._keyed_handlers)
+            table[type] = keyed_handlers
+            if not keyed_handlers:
+                table.pop(type)
+
+            self._keyed_handlers = table
+            self._update_dispatch()
+
+    def _register_filtered(self, type: str, handler: HandlerType, conditions: FilterType) -> None:
+        """
+        Register a new handler function for events passing filters. The
+        handler is indexed by every value accepted by its first filter.
+        """
+        (field, values), *rest = conditions
+        entry: tuple[HandlerType, FilterType] = (handler, tuple(rest))
+
+        with self._lock:
+            fields: dict[str, dict[Any, tuple]] = self._filtered_handlers.get(type, {})
+            index: dict[Any, tuple] = dict(fields.get(field, {}))
+            added: list[Any] = [value for value in values if entry not in index.get(value, ())]
+            if not added:
+                return
+
+            for value in added:
+                index[value] = index.get(value, ()) + (entry,)
+
+            self._filtered_handlers = {
+                **self._filtered_handlers,
+                type: {**fields, field: index},
+            }
+            self._update_dispatch()
+
+    def _unregister_filtered(self, type: str, handler: HandlerType, conditions: FilterType) -> None:
+        """
+        Unregister an existing handler function registered with filters.
+        """
+        (field, values), *rest = conditions
+        entry: tuple[HandlerType, FilterType] = (handler, tuple(rest))
+
+        with self._lock:
+            fields: dict[str, dict[Any, tuple]] = dict(self._filtered_handlers.get(type, {}))
+            index: dict[Any, tuple] = dict(fields.get(field, {}))
+            removed: list[Any] = [value for value in values if entry in index.get(value, ())]
+            if not removed:
+                return
+
+            for value in removed:
+                index[value] = tuple(e for e in index[value] if e != entry)
+                if not index[value]:
+                    index.pop(value)
+
+            fields[field] = index
+            if not index:
+                fields.pop(field)
+
+            table: dict[str, dict[str, dict[Any, tuple]]] = dict(self._filtered_handlers)
+            table[type] = fields
+            if not fields:
+                table.pop(type)
+
+            self._filtered_handlers = table
+            self._update_dispatch()
 
     def register_general(self, handler: HandlerType) -> None:
         """
         Register a new handler function for all event types. Every
         function can only be registered once for each event type.
         """
-        if handler not in self._general_handlers:
-            self._general_handlers.append(handler)
+        with self._lock:
+            if handler in self._general_handlers:
+                return
+
+            self._general_handlers += (handler,)
+            self._update_dispatch()
 
     def unregister_general(self, handler: HandlerType) -> None:
         """
         Unregister an existing general handler function.
         """
-        if handler in self._general_handlers:
-            self._general_handlers.remove(handler)
+        with self._lock:
+            if handler not in self._general_handlers:
+                return
+
+            self._general_handlers = tuple(h for h in self._general_handlers if h != handler)
+            self._update_dispatch()
+
+    def register_batch(self, type: str, handler: BatchHandlerType) -> None:
+        """
+        Register a new handler function receiving a list of all events of
+        a specific type drained from the queue in one wakeup. Batches are
+        delivered after the events were distributed to normal handlers.
+        """
+        with self._lock:
+            handlers: tuple[BatchHandlerType, ...] = self._batch_handlers.get(type, ())
+            if handler in handlers:
+                return
+
+            self._batch_handlers = {**self._batch_handlers, type: handlers + (handler,)}
+
+    def unregister_batch(self, type: str, handler: BatchHandlerType) -> None:
+        """
+        Unregister an existing batch handler function.
+        """
+        with self._lock:
+            handlers: tuple[BatchHandlerType, ...] = self._batch_handlers.get(type, ())
+            if handler not in handlers:
+                return
+
+            table: dict[str, tuple[BatchHandlerType, ...]] = dict(self._batch_handlers)
+            table[type] = tuple(h for h in handlers if h != handler)
+            if not table[type]:
+                table.pop(type)
+
+            self._batch_handlers = table
 
     def clear_handlers(self) -> None:
         """
         Clear all registered handlers - useful for testing and cleanup.
-        This removes all type-specific and general handlers.
+        This removes all type-specific, keyed, filtered, general, batch
+        and executor handlers.
         """
-        self._handlers.clear()
-        self._general_handlers.clear()
+        with self._lock:
+            self._handlers = {}
+            self._keyed_handlers = {}
+            self._filtered_handlers = {}
+            self._general_handlers = ()
+            self._batch_handlers = {}
+            for executor in self._executors.values():
+                executor.handlers = {}
+            self._update_dispatch()
@@ -0,0 +1,182 @@
+"""
+Latency profiler used by event engine for instrumenting handlers.
+"""
+
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+# Latency histogram buckets are powers of two of microseconds, the last
+# bucket collects everything above 2**(BUCKET_COUNT - 2) us (about 67s).
+BUCKET_COUNT: int = 28
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log2 histogram of latencies in seconds.
+
+    Percentiles are estimated by the upper bound of the bucket they fall
+    in, capped by the exact maximum latency recorded.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.buckets: list[int] = [0] * BUCKET_COUNT
+
+    def record(self, latency: float) -> None:
+        """
+        Add one latency sample.
+        """
+        self.count += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+        index: int = min(int(latency * 1_000_000).bit_length(), BUCKET_COUNT - 1)
+        self.buckets[index] += 1
+
+    def percentile(self, q: float) -> float:
+        """
+        Get estimated latency below which q (0-1) of samples fall.
+        """
+        if not self.count:
+            return 0.0
+
+        threshold: float = q * self.count
+        cumulative: int = 0
+
+        for index, count in enumerate(self.buckets):
+            cumulative += count
+            if cumulative >= threshold:
+                return min((1 << index) / 1_000_000, self.max)
+
+        return self.max
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get sample count and mean/p50/p99/max latency in seconds.
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+
+def get_handler_name(handler: Callable) -> str:
+    """
+    Get readable name of a handler, e.g. "OmsEngine.process_tick_event".
+    """
+    name: str | None = getattr(handler, "__qualname__", None)
+    if name:
+        return name
+
+    func: Callable | None = getattr(handler, "func", None)
+    if func:
+        return f"partial({get_handler_name(func)})"
+    return repr(handler)
+
+
+class EventProfiler:
+    """
+    Collects per-handler call latency, per-type queue wait time and
+    wakeup latency of worker threads per wait mode.
+
+    Handlers are identified by their qualified name, so the same method
+    of several instances is reported as one entry. Recording is guarded
+    by a lock, since workers of a sharded engine record concurrently.
+    """
+
+    def __init__(self, slow_threshold: float = 0.01) -> None:
+        """
+        Handler calls taking longer than slow_threshold seconds are
+        counted as slow.
+        """
+        self.slow_threshold: float = slow_threshold
+
+        self._lock: Lock = Lock()
+        self._handler_latency: dict[str, LatencyHistogram] = {}
+        self._handler_slow: dict[str, int] = {}
+        self._queue_wait: dict[str, LatencyHistogram] = {}
+        self._wakeup: dict[str, LatencyHistogram] = {}
+
+    def record_handler(self, handler: Callable, latency: float) -> bool:
+        """
+        Record latency of one handler call. Return True if it was slow.
+        """
+        name: str = get_handler_name(handler)
+        slow: bool = latency > self.slow_threshold
+
+        with self._lock:
+            histogram: LatencyHistogram | None = self._handler_latency.get(name, None)
+            if not histogram:
+                histogram = self._handler_latency[name] = LatencyHistogram()
+                self._handler_slow[name] = 0
+
+            histogram.record(latency)
+            if slow:
+                self._handler_slow[name] += 1
+
+        return slow
+
+    def record_queue_wait(self, type: str, wait: float) -> None:
+        """
+        Record time an event of the type spent pending in the queue.
+        """
+        with self._lock:
+            histogram: LatencyHistogram | None = self._queue_wait.get(type, None)
+            if not histogram:
+                histogram = self._queue_wait[type] = LatencyHistogram()
+
+            histogram.record(wait)
+
+    def record_wakeup(self, mode: str, latency: float) -> None:
+        """
+        Record time from an event being put into an empty queue until
+        the waiting worker got it, mode is either "spin" or "block".
+        """
+        with self._lock:
+            histogram: LatencyHistogram | None = self._wakeup.get(mode, None)
+            if not histogram:
+                histogram = self._wakeup[mode] = LatencyHistogram()
+
+            histogram.record(latency)
+
+    def get_handler_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get latency stats and slow call count of every handler.
+        """
+        with self._lock:
+            return {
+                name: {**histogram.get_stats(), "slow": self._handler_slow[name]}
+                for name, histogram in self._handler_latency.items()
+            }
+
+    def get_queue_wait_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get queue wait time stats of every event type.
+        """
+        with self._lock:
+            return {type: histogram.get_stats() for type, histogram in self._queue_wait.items()}
+
+    def get_wakeup_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get wakeup latency stats of every wait mode.
+        """
+        with self._lock:
+            return {mode: histogram.get_stats() for mode, histogram in self._wakeup.items()}
+
+    def reset(self) -> None:
+        """
+        Clear all recorded samples.
+        """
+        with self._lock:
+            self._handler_latency.clear()
+            self._handler_slow.clear()
+            self._queue_wait.clear()
+            self._wakeup.clear()
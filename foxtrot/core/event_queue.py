@@ -0,0 +1,553 @@
+"""
+Event queue used by event engine for buffering events before dispatch.
+"""
+
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from enum import Enum, IntEnum
+from queue import Empty, Full, Queue
+from time import monotonic, perf_counter, sleep
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .event_engine import Event
+
+
+class OverflowPolicy(Enum):
+    """
+    Policy applied to an event put into a full event queue.
+    """
+
+    BLOCK = "block"                 # Block producer until space is available
+    DROP_OLDEST = "drop_oldest"     # Drop the oldest pending event of the same type
+    DROP_NEWEST = "drop_newest"     # Drop the event being put
+    CONFLATE = "conflate"           # Conflate by key, drop the event if key not pending
+
+
+class EventPriority(IntEnum):
+    """
+    Priority class of an event type, each served from its own lane.
+    """
+
+    HIGH = 0        # Execution critical events, e.g. orders and trades
+    NORMAL = 1      # Event types without priority configured
+    LOW = 2         # Bulk market data
+
+
+class LanePolicy(Enum):
+    """
+    Policy deciding which priority lane the next event is taken from.
+    """
+
+    STRICT = "strict"           # Always take from the highest non-empty lane
+    WEIGHTED = "weighted"       # Take from lanes round robin in proportion to weights
+
+
+# Number of events taken from a lane per round of weighted scheduling.
+DEFAULT_LANE_WEIGHTS: dict[EventPriority, int] = {
+    EventPriority.HIGH: 8,
+    EventPriority.NORMAL: 4,
+    EventPriority.LOW: 1,
+}
+
+
+# Defines callback invoked with queue depth when crossing the high water
+# mark (True) and when drained back below the low water mark (False).
+WatermarkCallback = Callable[[int, bool], None]
+
+
+class EventQueue(Queue):
+    """
+    FIFO queue of events with an optional conflation lane and capacity.
+
+    Events of a conflated type (e.g. EVENT_TICK) are only kept once per
+    key while pending: a newer event with the same key overwrites the
+    queued one in place, so the latest data keeps the queue position of
+    the first pending event. Events of all other types stay lossless FIFO.
+
+    With maxsize > 0 the queue is bounded and the overflow policy of the
+    event type decides what happens to an event put into a full queue.
+
+    With priorities configured, events are kept FIFO in one lane per
+    priority class and the lane policy decides which lane is served next.
+    Weighted scheduling lets execution critical events overtake market
+    data without starving it. Capacity is shared by all lanes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        conflate_types: Iterable[str] = (),
+        key: Callable[["Event"], str | None] | None = None,
+        policies: dict[str, OverflowPolicy] | None = None,
+        default_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        high_water: int = 0,
+        priorities: dict[str, EventPriority] | None = None,
+        lane_policy: LanePolicy = LanePolicy.WEIGHTED,
+        lane_weights: dict[EventPriority, int] | None = None,
+    ) -> None:
+        """
+        High water mark is 80% of maxsize by default, if not specified.
+
+        All events share the single NORMAL lane, if priorities not specified.
+        """
+        self.policies: dict[str, OverflowPolicy] = dict(policies or {})
+        self.default_policy: OverflowPolicy = default_policy
+
+        conflated: set[str] = set(conflate_types)
+        conflated.update(t for t, p in self.policies.items() if p is OverflowPolicy.CONFLATE)
+        self.conflate_types: frozenset[str] = frozenset(conflated)
+        self.key: Callable[[Event], str | None] | None = key
+
+        self.high_water: int = high_water or int(maxsize * 0.8)
+        self.low_water: int = self.high_water // 2
+        self.above_high_water: bool = False
+        self.watermark_callbacks: list[WatermarkCallback] = []
+
+        self.conflated: int = 0
+        self.delivered: int = 0
+        self.max_depth: int = 0
+        self.dropped: defaultdict[str, int] = defaultdict(int)
+
+        self.priorities: dict[str, EventPriority] = dict(priorities or {})
+        self.lane_policy: LanePolicy = lane_policy
+        weights: dict[EventPriority, int] = {**DEFAULT_LANE_WEIGHTS, **(lane_weights or {})}
+        self.lane_weights: list[int] = [max(weights[p], 1) for p in EventPriority]
+        self.lane_delivered: list[int] = [0] * len(EventPriority)
+        self.lane_max_depth: list[int] = [0] * len(EventPriority)
+        self._turn: int = 0
+        self._credit: int = self.lane_weights[0]
+
+        self._woken: bool = False
+
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        """"""
+        # Conflated events are queued as [event, key] slots, so that
+        # they can be overwritten in place while still pending.
+        self._lanes: list[deque[Any]] = [deque() for _ in EventPriority]
+        self.queue: deque[Any] = self._lanes[EventPriority.NORMAL]
+        self._pending: dict[str, list] = {}
+        self._size: int = 0
+
+    def _qsize(self) -> int:
+        """"""
+        return self._size
+
+    def _put(self, item: Any) -> None:
+        """"""
+        if self.priorities:
+            self._put_lane(item)
+        else:
+            self.queue.append(item)
+
+        self._size += 1
+        if self._size > self.max_depth:
+            self.max_depth = self._size
+
+    def _put_lane(self, item: Any) -> None:
+        """
+        Append item to the lane of its event priority.
+        """
+        event: Event = item[0] if type(item) is list else item
+        index: int = self.priorities.get(event.type, EventPriority.NORMAL)
+
+        lane: deque[Any] = self._lanes[index]
+        lane.append(item)
+
+        if len(lane) > self.lane_max_depth[index]:
+            self.lane_max_depth[index] = len(lane)
+
+    def _get(self) -> "Event":
+        """"""
+        if self.priorities:
+            item: Any = self._get_lane()
+        else:
+            item = self.queue.popleft()
+
+        self._size -= 1
+        self.delivered += 1
+
+        if type(item) is list:
+            self._release_slot(item)
+            return item[0]
+        return item
+
+    def _get_lane(self) -> Any:
+        """
+        Remove and return the next item according to lane policy, must
+        be called with at least one item pending.
+        """
+        lanes: list[deque[Any]] = self._lanes
+
+        if self.lane_policy is LanePolicy.STRICT:
+            for index, lane in enumerate(lanes):
+                if lane:
+                    self.lane_delivered[index] += 1
+                    return lane.popleft()
+
+        # Serve the current lane until its credit is used up or it is
+        # empty, then move on to the next lane with fresh credit.
+        while True:
+            lane = lanes[self._turn]
+            if lane and self._credit > 0:
+                self._credit -= 1
+                self.lane_delivered[self._turn] += 1
+                return lane.popleft()
+
+            self._turn = (self._turn + 1) % len(lanes)
+            self._credit = self.lane_weights[self._turn]
+
+    def _get_key(self, event: "Event") -> str | None:
+        """
+        Get conflation key of the event, None if it is not conflated.
+        """
+        if event.type not in self.conflate_types or not self.key:
+            return None
+        return self.key(event)
+
+    def _conflate(self, event: "Event", key: str) -> bool:
+        """
+        Overwrite pending event with the same key. Return False if no
+        event with the key is pending.
+        """
+        slot: list | None = self._pending.get(key, None)
+        if not slot:
+            return False
+
+        slot[0] = event
+        self.conflated += 1
+        return True
+
+    def _append(self, event: "Event", key: str | None) -> None:
+        """
+        Append event as new item and wake up consumer.
+        """
+        if key is None:
+            self._put(event)
+        else:
+            slot: list = [event, key]
+            self._pending[key] = slot
+            self._put(slot)
+
+        self.unfinished_tasks += 1
+        self.not_empty.notify()
+
+    def _release_slot(self, slot: list) -> None:
+        """
+        Stop conflating into a slot which left the queue.
+        """
+        if self._pending.get(slot[1], None) is slot:
+            self._pending.pop(slot[1])
+
+    def _drop_oldest(self, event_type: str) -> bool:
+        """
+        Remove the oldest pending event of the given type.
+        """
+        lane: deque[Any] = self._lanes[self.priorities.get(event_type, EventPriority.NORMAL)]
+
+        for i, item in enumerate(lane):
+            is_slot: bool = type(item) is list
+            event: Event = item[0] if is_slot else item
+            if event.type != event_type:
+                continue
+
+            del lane[i]
+            self._size -= 1
+            if is_slot:
+                self._release_slot(item)
+            return True
+        return False
+
+    def _check_high_water(self) -> bool:
+        """
+        Update watermark state after put. Return True if high water
+        mark was just crossed.
+        """
+        if self.above_high_water or not self.high_water:
+            return False
+
+        if self._qsize() >= self.high_water:
+            self.above_high_water = True
+            return True
+        return False
+
+    def _check_low_water(self) -> bool:
+        """
+        Update watermark state after get. Return True if queue was just
+        drained below low water mark.
+        """
+        if not self.above_high_water:
+            return False
+
+        if self._qsize() <= self.low_water:
+            self.above_high_water = False
+            return True
+        return False
+
+    def _notify_watermark(self, depth: int, high: bool) -> None:
+        """
+        Invoke watermark callbacks outside the queue lock.
+        """
+        for callback in self.watermark_callbacks:
+            try:
+                callback(depth, high)
+            except Exception:
+                pass
+
+    def put(self, item: "Event", block: bool = True, timeout: float | None = None) -> None:
+        """
+        Put an event into the queue.
+
+        If the queue is full, the overflow policy of the event type is
+        applied. Events conflated into a pending slot need no free space.
+        """
+        with self.not_full:
+            self._put_event(item, block, timeout)
+            crossed: bool = self._check_high_water()
+            depth: int = self._qsize()
+
+        if crossed:
+            self._notify_watermark(depth, True)
+
+    def put_many(self, items: Iterable["Event"], block: bool = True, timeout: float | None = None) -> None:
+        """
+        Put several events into the queue with a single lock round trip.
+
+        Each event is subject to conflation and overflow policy as in put.
+        """
+        with self.not_full:
+            for item in items:
+                self._put_event(item, block, timeout)
+            crossed: bool = self._check_high_water()
+            depth: int = self._qsize()
+
+        if crossed:
+            self._notify_watermark(depth, True)
+
+    def _put_event(self, item: "Event", block: bool, timeout: float | None) -> None:
+        """
+        Put an event into the queue, must be called with lock held.
+        """
+        key: str | None = self._get_key(item)
+        if key is not None and self._conflate(item, key):
+            return
+
+        if self.maxsize > 0 and self._qsize() >= self.maxsize:
+            policy: OverflowPolicy = self.policies.get(item.type, self.default_policy)
+
+            if policy is OverflowPolicy.BLOCK:
+                self._wait_not_full(block, timeout)
+            elif policy is OverflowPolicy.DROP_OLDEST and self._drop_oldest(item.type):
+                self.dropped[item.type] += 1
+            else:
+                self.dropped[item.type] += 1
+                return
+
+        self._append(item, key)
+
+    def force_put(self, item: "Event") -> None:
+        """
+        Put an event into the queue regardless of capacity.
+
+        Used when the consumer thread of the queue puts events itself,
+        which would otherwise deadlock on a full queue.
+        """
+        with self.mutex:
+            key: str | None = self._get_key(item)
+            if key is not None and self._conflate(item, key):
+                return
+
+            self._append(item, key)
+            crossed: bool = self._check_high_water()
+            depth: int = self._qsize()
+
+        if crossed:
+            self._notify_watermark(depth, True)
+
+    def _wait_not_full(self, block: bool, timeout: float | None) -> None:
+        """
+        Wait until queue has free space, with the semantics of Queue.put.
+        """
+        if not block:
+            raise Full
+        elif timeout is None:
+            while self._qsize() >= self.maxsize:
+                self.not_full.wait()
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            endtime: float = monotonic() + timeout
+            while self._qsize() >= self.maxsize:
+                remaining: float = endtime - monotonic()
+                if remaining <= 0.0:
+                    raise Full
+                self.not_full.wait(remaining)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> "Event":
+        """
+        Remove and return the oldest event from the queue.
+        """
+        with self.not_empty:
+            self._wait_not_empty(block, timeout)
+
+            event: Event = self._get()
+            self.not_full.notify()
+            drained: bool = self._check_low_water()
+            depth: int = self._qsize()
+
+        if drained:
+            self._notify_watermark(depth, False)
+        return event
+
+    def get_many(self, block: bool = True, timeout: float | None = None, limit: int = 0) -> list["Event"]:
+        """
+        Remove and return all pending events (at most limit if specified)
+        with a single lock round trip.
+        """
+        with self.not_empty:
+            self._wait_not_empty(block, timeout)
+
+            count: int = self._qsize()
+            if limit:
+                count = min(count, limit)
+            events: list[Event] = [self._get() for _ in range(count)]
+
+            self.not_full.notify(count)
+            drained: bool = self._check_low_water()
+            depth: int = self._qsize()
+
+        if drained:
+            self._notify_watermark(depth, False)
+        return events
+
+    def _wait_not_empty(self, block: bool, timeout: float | None) -> None:
+        """
+        Wait until queue has pending event, with the semantics of Queue.get.
+        """
+        if not block:
+            if not self._qsize():
+                raise Empty
+        elif timeout is None:
+            while not self._qsize():
+                self._check_woken()
+                self.not_empty.wait()
+        elif timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        else:
+            endtime: float = monotonic() + timeout
+            while not self._qsize():
+                self._check_woken()
+                remaining: float = endtime - monotonic()
+                if remaining <= 0.0:
+                    raise Empty
+                self.not_empty.wait(remaining)
+
+    def has_pending(self) -> bool:
+        """
+        Check for pending events without taking the lock, so a consumer
+        can poll the queue cheaply. The result may be stale by the time
+        the caller acts on it.
+        """
+        return self._size > 0
+
+    def spin_wait(self, duration: float) -> bool:
+        """
+        Busy-wait up to duration seconds for an event to be put. Return
+        True if events are pending, False once duration has elapsed.
+
+        Each iteration yields the GIL with sleep(0), otherwise producer
+        threads could not run while the consumer is spinning.
+        """
+        if self._size:
+            return True
+
+        deadline: float = perf_counter() + duration
+        while not self._size:
+            if perf_counter() >= deadline:
+                return False
+            sleep(0)
+        return True
+
+    def _check_woken(self) -> None:
+        """
+        Raise Empty once after wakeup, must be called with lock held.
+        """
+        if self._woken:
+            self._woken = False
+            raise Empty
+
+    def wakeup(self) -> None:
+        """
+        Wake up consumer waiting for events, which gets Empty raised if
+        no event is pending. Used for stopping the consumer thread.
+        """
+        with self.mutex:
+            self._woken = True
+            self.not_empty.notify_all()
+
+    def add_watermark_callback(self, callback: WatermarkCallback) -> None:
+        """
+        Add callback invoked when queue depth crosses the watermarks.
+        """
+        if callback not in self.watermark_callbacks:
+            self.watermark_callbacks.append(callback)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get queue depth and counters of conflated, delivered and
+        dropped (by event type) events, and of each lane if priorities
+        are configured.
+        """
+        with self.mutex:
+            stats: dict[str, Any] = {
+                "conflated": self.conflated,
+                "delivered": self.delivered,
+                "pending": self._qsize(),
+                "max_depth": self.max_depth,
+                "dropped": dict(self.dropped),
+            }
+
+            if self.priorities:
+                stats["lanes"] = {
+                    priority.name: {
+                        "pending": len(self._lanes[priority]),
+                        "delivered": self.lane_delivered[priority],
+                        "max_depth": self.lane_max_depth[priority],
+                    }
+                    for priority in EventPriority
+                }
+
+            return stats
+
+
+def merge_queue_stats(queues: Iterable[EventQueue]) -> dict[str, Any]:
+    """
+    Sum stats of several queues, max_depth is the maximum of all queues.
+    """
+    stats: dict[str, Any] = defaultdict(int)
+    dropped: defaultdict[str, int] = defaultdict(int)
+    lanes: defaultdict[str, defaultdict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    for queue in queues:
+        for name, value in queue.get_stats().items():
+            if name == "dropped":
+                for event_type, count in value.items():
+                    dropped[event_type] += count
+            elif name == "lanes":
+                for lane, lane_stats in value.items():
+                    for lane_name, lane_value in lane_stats.items():
+                        if lane_name == "max_depth":
+                            lanes[lane][lane_name] = max(lanes[lane][lane_name], lane_value)
+                        else:
+                            lanes[lane][lane_name] += lane_value
+            elif name == "max_depth":
+                stats[name] = max(stats[name], value)
+            else:
+                stats[name] += value
+
+    stats["dropped"] = dict(dropped)
+    if lanes:
+        stats["lanes"] = {lane: dict(lane_stats) for lane, lane_stats in lanes.items()}
+    return dict(stats)
@@ -0,0 +1,156 @@
+"""
+Executor running slow event handlers off the dispatch thread of event engine.
+"""
+
+from collections.abc import Callable
+from queue import Empty
+from threading import Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from .event_queue import EventQueue, OverflowPolicy, merge_queue_stats
+
+if TYPE_CHECKING:
+    from .event_engine import Event, HandlerType
+
+
+class HandlerExecutor:
+    """
+    Named executor with its own bounded queue and worker threads, running
+    the handlers registered on it (e.g. email sending, database writes)
+    instead of the dispatch thread of event engine.
+
+    The dispatch thread only puts events into the queue of the executor.
+    Once the queue holds capacity events, the overflow policy of the
+    event type decides whether the oldest or the new event is dropped or
+    the dispatch thread blocks.
+
+    With a single worker events are processed in the order they were
+    dispatched. With several workers events are distributed by their
+    ordering key (see SHARD_KEY_FIELDS), so that events with the same key
+    are still processed in order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        logger: Any,
+        key: Callable[["Event"], str | None],
+        workers: int = 1,
+        capacity: int = 10000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        policies: dict[str, OverflowPolicy] | None = None,
+    ) -> None:
+        """
+        Oldest pending events are dropped from a full queue by default,
+        if policy not specified, so the dispatch thread is never blocked.
+        """
+        self.name: str = name
+
+        self._logger: Any = logger
+        self._key: Callable[[Event], str | None] = key
+        self._workers: int = max(workers, 1)
+        self._queues: list[EventQueue] = [
+            EventQueue(maxsize=capacity, key=key, policies=policies, default_policy=policy)
+            for _ in range(self._workers)
+        ]
+        self._threads: list[Thread] = []
+        self._active: bool = False
+
+        # Replaced as a whole by event engine under its lock
+        self.handlers: dict[str, tuple[HandlerType, ...]] = {}
+
+        # Set by event engine while profiling, called with latency of each handler call
+        self.record_latency: Callable[[HandlerType, Event, float], None] | None = None
+
+    def submit(self, event: "Event") -> None:
+        """
+        Put event into the queue of the worker its ordering key maps to.
+        Event is copied since the dispatch thread may reuse pooled events.
+        """
+        if self._workers == 1:
+            index: int = 0
+        else:
+            key: str | None = self._key(event)
+            if key is None:
+                key = event.type
+            index = hash(key) % self._workers
+
+        self._queues[index].put(type(event)(event.type, event.data))
+
+    def start(self) -> None:
+        """
+        Start worker threads.
+        """
+        if self._active:
+            return
+
+        self._active = True
+        self._threads = [
+            Thread(target=self._run, args=(i,), name=f"HandlerExecutor-{self.name}-{i}", daemon=True)
+            for i in range(self._workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop worker threads. Pending events are kept and processed after
+        start is called again.
+        """
+        if not self._active:
+            return
+
+        self._active = False
+        for queue in self._queues:
+            queue.wakeup()
+
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+            if thread.is_alive():
+                self._logger.warning(
+                    "Executor thread didn't terminate within timeout",
+                    extra={"thread_type": "executor", "executor": self.name, "timeout_seconds": 5.0}
+                )
+
+    def _run(self, index: int) -> None:
+        """
+        Get all pending events from queue of the worker at once and run
+        the handlers of their type.
+        """
+        queue: EventQueue = self._queues[index]
+
+        while self._active:
+            try:
+                events: list[Event] = queue.get_many(block=True, timeout=1)
+            except Empty:
+                continue
+
+            for event in events:
+                record_latency: Callable[[HandlerType, Event, float], None] | None = self.record_latency
+
+                for handler in self.handlers.get(event.type, ()):
+                    if record_latency:
+                        start: float = perf_counter()
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        self._logger.error(
+                            "Event handler failed",
+                            extra={
+                                "event_type": event.type,
+                                "error_type": type(e).__name__,
+                                "error_msg": str(e),
+                                "handler_name": getattr(handler, '__name__', 'unknown'),
+                                "executor": self.name
+                            }
+                        )
+                    if record_latency:
+                        record_latency(handler, event, perf_counter() - start)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get queue depth and counters of delivered and dropped (by event
+        type) events summed over all workers.
+        """
+        return merge_queue_stats(self._queues)
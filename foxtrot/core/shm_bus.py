@@ -0,0 +1,311 @@
+"""
+Shared memory event bus for distributing events to other processes.
+"""
+
+from collections.abc import Iterable
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from threading import Lock, Thread
+from time import sleep
+
+from ..util.event_type import EVENT_ORDER, EVENT_TICK, EVENT_TRADE
+from .event_codec import decode_event, encode_event
+from .event_engine import Event, EventEngine
+
+# Header: magic, capacity, slot size and sequence of the last written
+# event. Slots follow the header, each starting with the sequence of the
+# event it holds and the length of its record.
+MAGIC: int = 0x46585342
+HEADER: Struct = Struct("<IIIxxxxQ")
+HEADER_SIZE: int = 64
+SEQ_OFFSET: int = 16
+SLOT_HEADER: Struct = Struct("<QIxxxx")
+SEQ: Struct = Struct("<Q")
+
+DEFAULT_CAPACITY: int = 65536
+DEFAULT_SLOT_SIZE: int = 512
+
+
+class ShmRingWriter:
+    """
+    Single writer of a sequence numbered ring of fixed size slots in
+    shared memory.
+
+    Records are written without any lock: a slot is marked invalid while
+    being overwritten and stamped with its sequence afterwards, so that
+    readers can detect records overwritten during a copy. Readers which
+    fall more than capacity records behind lose the oldest records.
+    """
+
+    def __init__(
+        self,
+        name: str | None = None,
+        capacity: int = DEFAULT_CAPACITY,
+        slot_size: int = DEFAULT_SLOT_SIZE
+    ) -> None:
+        """
+        A random name is generated by default, if name not specified.
+        """
+        if slot_size <= SLOT_HEADER.size or slot_size % 8:
+            raise ValueError(f"Slot size must be a multiple of 8 larger than {SLOT_HEADER.size}")
+
+        self.capacity: int = capacity
+        self.slot_size: int = slot_size
+        self.max_record: int = slot_size - SLOT_HEADER.size
+
+        self._shm: SharedMemory = create_shared_memory(name, HEADER_SIZE + capacity * slot_size)
+        self._buf: memoryview = self._shm.buf
+        self._seq: int = 0
+
+        HEADER.pack_into(self._buf, 0, MAGIC, capacity, slot_size, 0)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared memory, used by readers to attach.
+        """
+        return self._shm.name
+
+    def write(self, record: bytes) -> int:
+        """
+        Write a record into the next slot and return its sequence.
+        """
+        length: int = len(record)
+        if length > self.max_record:
+            raise ValueError(f"Record of {length} bytes exceeds slot size {self.slot_size}")
+
+        seq: int = self._seq + 1
+        offset: int = HEADER_SIZE + (seq % self.capacity) * self.slot_size
+        buf: memoryview = self._buf
+
+        SLOT_HEADER.pack_into(buf, offset, 0, length)
+        start: int = offset + SLOT_HEADER.size
+        buf[start:start + length] = record
+        SEQ.pack_into(buf, offset, seq)
+        SEQ.pack_into(buf, SEQ_OFFSET, seq)
+
+        self._seq = seq
+        return seq
+
+    def close(self) -> None:
+        """
+        Release and remove the shared memory.
+        """
+        self._shm.close()
+        remove_shared_memory(self._shm)
+
+
+class ShmRingReader:
+    """
+    One of many readers of a ring written by ShmRingWriter, possibly in
+    another process. Starts with records written after attaching.
+    """
+
+    def __init__(self, name: str) -> None:
+        """"""
+        self._shm: SharedMemory = attach_shared_memory(name)
+        self._buf: memoryview = self._shm.buf
+
+        magic, capacity, slot_size, seq = HEADER.unpack_from(self._buf)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Shared memory {name} is not an event ring")
+
+        self.capacity: int = capacity
+        self.slot_size: int = slot_size
+        self.lost: int = 0
+
+        self._next: int = seq + 1
+
+    def read(self, limit: int = 1024) -> list[bytes]:
+        """
+        Read at most limit records written since last read.
+        """
+        buf: memoryview = self._buf
+        head: int = SEQ.unpack_from(buf, SEQ_OFFSET)[0]
+        seq: int = self._next
+
+        if head < seq:
+            return []
+
+        # Skip records already overwritten by the writer
+        oldest: int = head - self.capacity + 1
+        if seq < oldest:
+            self.lost += oldest - seq
+            seq = oldest
+
+        end: int = min(head, seq + limit - 1)
+        records: list[bytes] = []
+
+        while seq <= end:
+            offset: int = HEADER_SIZE + (seq % self.capacity) * self.slot_size
+            slot_seq, length = SLOT_HEADER.unpack_from(buf, offset)
+
+            if slot_seq == seq:
+                start: int = offset + SLOT_HEADER.size
+                record: bytes = bytes(buf[start:start + length])
+
+                # Check slot was not overwritten while copying
+                if SEQ.unpack_from(buf, offset)[0] == seq:
+                    records.append(record)
+                else:
+                    self.lost += 1
+            else:
+                self.lost += 1
+
+            seq += 1
+
+        self._next = seq
+        return records
+
+    def close(self) -> None:
+        """
+        Detach from the shared memory.
+        """
+        self._shm.close()
+
+
+def create_shared_memory(name: str | None, size: int) -> SharedMemory:
+    """
+    Create shared memory without handing it over to the resource tracker.
+    Rings are removed by their writer on close, a tracker shared with
+    reader processes would otherwise remove them when any reader exits.
+    """
+    try:
+        return SharedMemory(name, create=True, size=size, track=False)
+    except TypeError:
+        shm: SharedMemory = SharedMemory(name, create=True, size=size)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """
+    Attach to existing shared memory without handing it over to the
+    resource tracker.
+    """
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        shm: SharedMemory = SharedMemory(name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def remove_shared_memory(shm: SharedMemory) -> None:
+    """
+    Remove shared memory created by create_shared_memory.
+    """
+    # Versions without track argument always unregister on unlink
+    if getattr(shm, "_track", True):
+        resource_tracker.register(shm._name, "shared_memory")
+    shm.unlink()
+
+
+class ShmEventPublisher:
+    """
+    Publish events of selected types from an event engine into a shared
+    memory ring. Runs as a handler on the dispatch threads, writes are
+    serialized so that the ring has a single writer also in sharded mode.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        name: str | None = None,
+        types: Iterable[str] = (EVENT_TICK, EVENT_ORDER, EVENT_TRADE),
+        capacity: int = DEFAULT_CAPACITY,
+        slot_size: int = DEFAULT_SLOT_SIZE
+    ) -> None:
+        """
+        Ticks, orders and trades are published by default, if types not
+        specified.
+        """
+        self.event_engine: EventEngine = event_engine
+        self.types: tuple[str, ...] = tuple(types)
+        self.writer: ShmRingWriter = ShmRingWriter(name, capacity, slot_size)
+
+        self._lock: Lock = Lock()
+
+        for type in self.types:
+            self.event_engine.register(type, self.publish)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared memory, used by subscribers to attach.
+        """
+        return self.writer.name
+
+    def publish(self, event: Event) -> None:
+        """
+        Write event into the ring.
+        """
+        record: bytes = encode_event(event)
+
+        with self._lock:
+            self.writer.write(record)
+
+    def close(self) -> None:
+        """
+        Stop publishing and remove the ring.
+        """
+        for type in self.types:
+            self.event_engine.unregister(type, self.publish)
+
+        self.writer.close()
+
+
+class ShmEventSubscriber:
+    """
+    Poll a shared memory ring written by ShmEventPublisher and put the
+    events into a local event engine.
+
+    There is no cross-process wakeup, the polling thread sleeps for
+    poll_interval seconds whenever the ring is empty.
+    """
+
+    def __init__(self, event_engine: EventEngine, name: str, poll_interval: float = 0.0005) -> None:
+        """"""
+        self.event_engine: EventEngine = event_engine
+        self.poll_interval: float = poll_interval
+        self.reader: ShmRingReader = ShmRingReader(name)
+
+        self._active: bool = False
+        self._thread: Thread = Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        """
+        Start polling thread.
+        """
+        self._active = True
+        self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Read new records and put them into event engine at once.
+        """
+        while self._active:
+            records: list[bytes] = self.reader.read()
+
+            if records:
+                self.event_engine.put_many([decode_event(record) for record in records])
+            else:
+                sleep(self.poll_interval)
+
+    def get_lost(self) -> int:
+        """
+        Number of events overwritten before being read.
+        """
+        return self.reader.lost
+
+    def close(self) -> None:
+        """
+        Stop polling and detach from the ring.
+        """
+        if self._active:
+            self._active = False
+            self._thread.join()
+
+        self.reader.close()
@@ -0,0 +1,356 @@
+"""
+Hierarchical timing wheel used by event engine for scheduling callbacks.
+"""
+
+from collections.abc import Callable
+from math import ceil
+from threading import Condition
+from time import monotonic
+from typing import Any
+
+# Each level of the wheel has 2**SLOT_BITS slots. With 1ms resolution the
+# levels span 256ms, 65s, 4.6h and 49.7 days, later timers are parked in
+# the last level until they come into range.
+SLOT_BITS: int = 8
+SLOT_COUNT: int = 1 << SLOT_BITS
+SLOT_MASK: int = SLOT_COUNT - 1
+LEVEL_COUNT: int = 4
+
+
+class TimerHandle:
+    """
+    Handle of a scheduled callback, which can be used to cancel it.
+    """
+
+    __slots__ = ("expire", "interval", "callback", "args", "cancelled", "_wheel", "_slot", "_level")
+
+    def __init__(
+        self,
+        wheel: "TimerWheel",
+        expire: int,
+        interval: int,
+        callback: Callable[..., Any],
+        args: tuple,
+    ) -> None:
+        """"""
+        self.expire: int = expire
+        self.interval: int = interval
+        self.callback: Callable[..., Any] = callback
+        self.args: tuple = args
+        self.cancelled: bool = False
+
+        self._wheel: TimerWheel = wheel
+        self._slot: dict[TimerHandle, None] | None = None
+        self._level: int = 0
+
+    @property
+    def when(self) -> float:
+        """
+        Time (time.monotonic) the callback is scheduled at next.
+        """
+        return self._wheel.tick_to_time(self.expire)
+
+    def cancel(self) -> None:
+        """
+        Cancel the callback. A callback already delivered but not yet
+        run is skipped.
+        """
+        self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel with O(1) insert and cancel.
+
+    Time is counted in ticks of resolution seconds since creation. Timers
+    due within 256 ticks are kept in the slot of their tick on the first
+    level, later timers in coarser levels, and are cascaded down when the
+    wheel reaches their range. Expired timers are passed to the deliver
+    callback, which is responsible for running them on a suitable thread.
+
+    The wheel is driven by a single thread calling advance and wait in a
+    loop, timers can be scheduled and cancelled from any thread. Drivers
+    which cannot block in wait (e.g. an asyncio task) sleep for the time
+    returned by get_timeout instead, and are woken up through the waker
+    callback when an earlier timer is scheduled meanwhile.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[TimerHandle], None],
+        resolution: float = 0.001,
+        waker: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Timers have 1 millisecond resolution by default, if resolution
+        not specified.
+        """
+        self.resolution: float = resolution
+
+        self._deliver: Callable[[TimerHandle], None] = deliver
+        self._waker: Callable[[], None] | None = waker
+        self._start: float = monotonic()
+        self._tick: int = 0
+        self._wheels: list[list[dict[TimerHandle, None]]] = [
+            [{} for _ in range(SLOT_COUNT)] for _ in range(LEVEL_COUNT)
+        ]
+        self._counts: list[int] = [0] * LEVEL_COUNT
+
+        self._condition: Condition = Condition()
+        self._wake_tick: int | None = None
+        self._woken: bool = False
+
+    def time_to_tick(self, when: float) -> int:
+        """
+        Convert time (time.monotonic) to the first tick not before it.
+        """
+        return ceil((when - self._start) / self.resolution)
+
+    def tick_to_time(self, tick: int) -> float:
+        """
+        Convert tick to time (time.monotonic).
+        """
+        return self._start + tick * self.resolution
+
+    def call_at(self, when: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule callback to be called at time when (time.monotonic).
+        """
+        return self._schedule(self.time_to_tick(when), 0, callback, args)
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule callback to be called after delay seconds.
+        """
+        return self.call_at(monotonic() + delay, callback, *args)
+
+    def call_every(self, interval: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """
+        Schedule callback to be called every interval seconds, first
+        time after one interval. Intervals are rounded to whole ticks.
+        """
+        ticks: int = max(round(interval / self.resolution), 1)
+        return self._schedule(self.time_to_tick(monotonic()) + ticks, ticks, callback, args)
+
+    def cancel(self, handle: TimerHandle) -> None:
+        """
+        Cancel a scheduled timer.
+        """
+        with self._condition:
+            handle.cancelled = True
+            self._remove(handle)
+
+    def _schedule(self, expire: int, interval: int, callback: Callable[..., Any], args: tuple) -> TimerHandle:
+        """
+        Create timer and wake up driver if it is due earlier than the
+        driver is waiting for.
+        """
+        handle: TimerHandle = TimerHandle(self, expire, interval, callback, args)
+
+        with self._condition:
+            self._insert(handle)
+
+            wake: bool = self._wake_tick is not None and expire < self._wake_tick
+            if wake:
+                self._wake_tick = None
+                self._condition.notify()
+
+        if wake and self._waker:
+            self._waker()
+
+        return handle
+
+    def _insert(self, handle: TimerHandle) -> None:
+        """
+        Put timer into the slot of the finest level covering its expiry.
+        Must be called with lock held.
+        """
+        base: int = self._tick + 1
+        target: int = max(handle.expire, base)
+        delta: int = target - base
+
+        level: int = 0
+        while level < LEVEL_COUNT - 1 and delta >= 1 << (SLOT_BITS * (level + 1)):
+            level += 1
+
+        if delta >= 1 << (SLOT_BITS * LEVEL_COUNT):
+            target = base + (1 << (SLOT_BITS * LEVEL_COUNT)) - 1
+
+        slot: dict[TimerHandle, None] = self._wheels[level][(target >> (SLOT_BITS * level)) & SLOT_MASK]
+        slot[handle] = None
+        handle._slot = slot
+        handle._level = level
+        self._counts[level] += 1
+
+    def _remove(self, handle: TimerHandle) -> None:
+        """
+        Take timer out of its slot. Must be called with lock held.
+        """
+        if handle._slot is None:
+            return
+
+        del handle._slot[handle]
+        handle._slot = None
+        self._counts[handle._level] -= 1
+
+    def _cascade(self, level: int, index: int) -> None:
+        """
+        Move timers of a coarse slot which came into range down to finer
+        levels. Must be called with lock held.
+        """
+        slot: dict[TimerHandle, None] = self._wheels[level][index]
+        if not slot:
+            return
+
+        self._wheels[level][index] = {}
+        self._counts[level] -= len(slot)
+
+        for handle in slot:
+            self._insert(handle)
+
+    def _expire(self, tick: int) -> list[TimerHandle]:
+        """
+        Move wheel forward until tick and return timers expired on the
+        way. Stretches without timers on finer levels are skipped at once.
+        Must be called with lock held.
+        """
+        expired: list[TimerHandle] = []
+
+        while self._tick < tick:
+            if not self._counts[0]:
+                level: int = 1
+                while level < LEVEL_COUNT and not self._counts[level]:
+                    level += 1
+
+                if level == LEVEL_COUNT:
+                    self._tick = tick
+                    break
+
+                shift: int = SLOT_BITS * level
+                boundary: int = ((self._tick >> shift) + 1) << shift
+                if boundary > tick:
+                    self._tick = tick
+                    break
+                self._tick = boundary - 1
+
+            # Cascade before moving on, so that timers due at the current
+            # tick are put into its slot and expire right away
+            current: int = self._tick + 1
+
+            for level in range(1, LEVEL_COUNT):
+                shift = SLOT_BITS * level
+                if current & ((1 << shift) - 1):
+                    break
+                self._cascade(level, (current >> shift) & SLOT_MASK)
+
+            self._tick = current
+            index: int = current & SLOT_MASK
+            slot: dict[TimerHandle, None] = self._wheels[0][index]
+            if not slot:
+                continue
+
+            self._wheels[0][index] = {}
+            self._counts[0] -= len(slot)
+
+            for handle in slot:
+                handle._slot = None
+                expired.append(handle)
+
+                if handle.interval:
+                    handle.expire += handle.interval
+                    if handle.expire <= current:
+                        handle.expire = current + handle.interval
+                    self._insert(handle)
+
+        return expired
+
+    def _next_tick(self) -> int | None:
+        """
+        Get the next tick the wheel has work to do at, either expiring
+        or cascading timers. Must be called with lock held.
+        """
+        next_tick: int | None = None
+
+        for level in range(1, LEVEL_COUNT):
+            if self._counts[level]:
+                shift: int = SLOT_BITS * level
+                next_tick = ((self._tick >> shift) + 1) << shift
+                break
+
+        if self._counts[0]:
+            for offset in range(1, SLOT_COUNT):
+                tick: int = self._tick + offset
+                if next_tick is not None and tick >= next_tick:
+                    break
+                if self._wheels[0][tick & SLOT_MASK]:
+                    return tick
+
+        return next_tick
+
+    def advance(self) -> None:
+        """
+        Deliver all timers which are due by now.
+        """
+        with self._condition:
+            expired: list[TimerHandle] = self._expire(int((monotonic() - self._start) / self.resolution))
+
+        for handle in expired:
+            if not handle.cancelled:
+                self._deliver(handle)
+
+    def wait(self, timeout: float) -> None:
+        """
+        Block until the next timer is due, an earlier timer is scheduled,
+        wakeup is called or timeout seconds passed.
+        """
+        with self._condition:
+            # Wakeup called while the thread was not waiting yet
+            if self._woken:
+                self._woken = False
+                return
+
+            remaining: float = self._prepare_wait(timeout)
+            if remaining <= 0:
+                self._wake_tick = None
+                return
+
+            self._condition.wait(remaining)
+            self._wake_tick = None
+            self._woken = False
+
+    def get_timeout(self, timeout: float) -> float:
+        """
+        Get seconds until the next timer is due, at most timeout. Waker is
+        called if an earlier timer is scheduled before advance is called.
+        """
+        with self._condition:
+            return max(self._prepare_wait(timeout), 0.0)
+
+    def _prepare_wait(self, timeout: float) -> float:
+        """
+        Record the tick the driver is going to wait until and return the
+        seconds left until then. Must be called with lock held.
+        """
+        wake_tick: int = self.time_to_tick(monotonic() + timeout)
+
+        next_tick: int | None = self._next_tick()
+        if next_tick is not None:
+            wake_tick = min(wake_tick, next_tick)
+
+        self._wake_tick = wake_tick
+        return self.tick_to_time(wake_tick) - monotonic()
+
+    def wakeup(self) -> None:
+        """
+        Wake up driving thread blocked in wait.
+        """
+        with self._condition:
+            self._woken = True
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        """
+        Number of scheduled timers.
+        """
+        with self._condition:
+            return sum(self._counts)
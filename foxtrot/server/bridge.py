@@ -0,0 +1,476 @@
+"""
+Event bridge distributing events to event engines of other processes or
+hosts over TCP or Unix domain sockets.
+"""
+
+from collections.abc import Callable, Iterable
+import os
+from queue import Empty
+import socket
+from struct import Struct
+from threading import Lock, Thread
+from time import sleep
+from typing import Any
+
+from foxtrot.core.event_codec import can_encode, decode_event, encode_event
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.core.event_queue import EventQueue, OverflowPolicy
+from foxtrot.util.event_type import (
+    EVENT_ACCOUNT,
+    EVENT_LOG,
+    EVENT_ORDER,
+    EVENT_POSITION,
+    EVENT_TICK,
+    EVENT_TRADE,
+)
+from foxtrot.util.logger import get_component_logger
+
+# Stream of frames, each one the length of the record followed by the
+# record of an encoded event (see event_codec).
+FRAME_HEADER: Struct = Struct("<I")
+
+DEFAULT_TYPES: tuple[str, ...] = (
+    EVENT_TICK,
+    EVENT_ORDER,
+    EVENT_TRADE,
+    EVENT_POSITION,
+    EVENT_ACCOUNT,
+    EVENT_LOG,
+)
+DEFAULT_CAPACITY: int = 10000
+RECV_SIZE: int = 65536
+
+
+def parse_address(address: str) -> tuple[int, Any]:
+    """
+    Parse bridge address "tcp://host:port" or "unix:///path/to/socket"
+    into socket family and socket address.
+    """
+    if address.startswith("tcp://"):
+        host, _, port = address[6:].rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Invalid TCP bridge address {address}")
+        return socket.AF_INET, (host, int(port))
+
+    if address.startswith("unix://"):
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix domain sockets are not supported on this platform")
+        return socket.AF_UNIX, address[7:]
+
+    raise ValueError(f"Unsupported bridge address {address}")
+
+
+def create_socket(family: int) -> socket.socket:
+    """
+    Create stream socket, with Nagle's algorithm disabled for TCP since
+    writes are already batched.
+    """
+    sock: socket.socket = socket.socket(family, socket.SOCK_STREAM)
+    if family == socket.AF_INET:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def encode_frames(records: Iterable[bytes]) -> bytes:
+    """
+    Join records into one buffer of length prefixed frames.
+    """
+    parts: list[bytes] = []
+    for record in records:
+        parts.append(FRAME_HEADER.pack(len(record)))
+        parts.append(record)
+    return b"".join(parts)
+
+
+def decode_frames(buffer: bytearray) -> list[Event]:
+    """
+    Decode all complete frames at the start of buffer and remove them,
+    a trailing partial frame is kept for the next read.
+
+    Raises ValueError if a frame can not be decoded, e.g. one of an
+    unknown codec tag or schema version sent by a peer of another
+    version. Frames before it are removed from buffer all the same.
+    """
+    events: list[Event] = []
+    view: memoryview = memoryview(buffer)
+    offset: int = 0
+    size: int = len(buffer)
+    error: str = ""
+
+    try:
+        while size - offset >= FRAME_HEADER.size:
+            length: int = FRAME_HEADER.unpack_from(view, offset)[0]
+            end: int = offset + FRAME_HEADER.size + length
+            if end > size:
+                break
+
+            # Only the message is kept, the traceback would keep views of buffer alive
+            try:
+                events.append(decode_event(view[offset + FRAME_HEADER.size:end]))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                break
+            offset = end
+    finally:
+        view.release()
+        del buffer[:offset]
+
+    if error:
+        raise ValueError(f"Invalid bridge frame: {error}")
+    return events
+
+
+class BridgeSession:
+    """
+    Connection to one subscriber of an event bridge server.
+
+    Records are queued in a bounded queue of the session and written by
+    its own thread, all records pending at once with a single sendall.
+    A slow subscriber therefore never blocks the publishing dispatch
+    thread or other subscribers: once its queue is full, the overflow
+    policy of the event type drops the oldest or the new record.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        peer: str,
+        capacity: int,
+        policies: dict[str, OverflowPolicy] | None,
+        on_close: Callable[["BridgeSession"], None],
+    ) -> None:
+        """"""
+        self.peer: str = peer
+
+        self._sock: socket.socket = sock
+        self._on_close: Callable[[BridgeSession], None] = on_close
+        # Records are queued as events carrying the encoded record, so
+        # overflow policies and stats apply per event type
+        self._queue: EventQueue = EventQueue(
+            maxsize=capacity,
+            policies=policies,
+            default_policy=OverflowPolicy.DROP_OLDEST,
+        )
+        self._active: bool = True
+        self._thread: Thread = Thread(target=self._run, name=f"BridgeSession-{peer}", daemon=True)
+
+    def start(self) -> None:
+        """
+        Start sending thread.
+        """
+        self._thread.start()
+
+    def send(self, type: str, record: bytes) -> None:
+        """
+        Queue encoded event for sending.
+        """
+        self._queue.put(Event(type, record))
+
+    def _run(self) -> None:
+        """
+        Send all pending records at once until the subscriber disconnects.
+        """
+        while self._active:
+            try:
+                events: list[Event] = self._queue.get_many(block=True, timeout=1)
+            except Empty:
+                continue
+
+            try:
+                self._sock.sendall(encode_frames([event.data for event in events]))
+            except OSError:
+                break
+
+        self._shutdown()
+
+    def _shutdown(self) -> None:
+        """
+        Close the connection and remove session from server.
+        """
+        self._active = False
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+        self._on_close(self)
+
+    def close(self) -> None:
+        """
+        Stop sending thread and close the connection.
+        """
+        self._active = False
+        self._queue.wakeup()
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._thread.join(timeout=5.0)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get queue depth and counters of delivered and dropped (by event
+        type) events of the subscriber.
+        """
+        return self._queue.get_stats()
+
+
+class EventBridgeServer:
+    """
+    Publish events of selected types from an event engine to all
+    subscribers connected over TCP or a Unix domain socket.
+
+    Every event is encoded once on the dispatch thread and queued for
+    each subscriber, see BridgeSession for batching and backpressure.
+    Events whose data has no registered codec are not published.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        address: str,
+        types: Iterable[str] = DEFAULT_TYPES,
+        capacity: int = DEFAULT_CAPACITY,
+        policies: dict[str, OverflowPolicy] | None = None,
+    ) -> None:
+        """
+        Oldest pending events of a subscriber are dropped once capacity
+        events are queued for it, if policies not specified.
+        """
+        self.event_engine: EventEngine = event_engine
+        self.address: str = address
+        self.types: tuple[str, ...] = tuple(types)
+        self.capacity: int = capacity
+        self.policies: dict[str, OverflowPolicy] | None = policies
+
+        self._family, self._sockaddr = parse_address(address)
+        self._listener: socket.socket | None = None
+        self._thread: Thread | None = None
+        self._active: bool = False
+
+        # Sessions are replaced as a whole, publish reads them without lock
+        self._lock: Lock = Lock()
+        self._sessions: tuple[BridgeSession, ...] = ()
+
+        self._logger = get_component_logger("EventBridge")
+
+    def start(self) -> None:
+        """
+        Listen for subscribers and start publishing.
+        """
+        if self._active:
+            return
+
+        listener: socket.socket = create_socket(self._family)
+        if self._family == socket.AF_INET:
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        else:
+            self._remove_socket_file()
+        listener.bind(self._sockaddr)
+        listener.listen()
+        listener.settimeout(0.5)
+
+        self._listener = listener
+        self._active = True
+        self._thread = Thread(target=self._run, name="EventBridgeServer", daemon=True)
+        self._thread.start()
+
+        for type in self.types:
+            self.event_engine.register(type, self.publish)
+
+    @property
+    def port(self) -> int:
+        """
+        TCP port listened on, useful if address was given with port 0.
+        """
+        if not self._listener or self._family != socket.AF_INET:
+            return 0
+        return self._listener.getsockname()[1]
+
+    def _run(self) -> None:
+        """
+        Accept subscriber connections.
+        """
+        while self._active:
+            try:
+                sock, sockaddr = self._listener.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                break
+
+            sock.settimeout(None)
+            if self._family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                peer: str = f"{sockaddr[0]}:{sockaddr[1]}"
+            else:
+                peer = f"unix-{sock.fileno()}"
+
+            session: BridgeSession = BridgeSession(sock, peer, self.capacity, self.policies, self._remove_session)
+            with self._lock:
+                self._sessions += (session,)
+            session.start()
+
+            self._logger.info("Bridge subscriber connected", extra={"peer": peer})
+
+    def _remove_session(self, session: BridgeSession) -> None:
+        """
+        Remove session of a disconnected subscriber.
+        """
+        with self._lock:
+            if session not in self._sessions:
+                return
+            self._sessions = tuple(s for s in self._sessions if s is not session)
+
+        self._logger.info("Bridge subscriber disconnected", extra={"peer": session.peer})
+
+    def publish(self, event: Event) -> None:
+        """
+        Encode event and queue it for every subscriber.
+        """
+        sessions: tuple[BridgeSession, ...] = self._sessions
+        if not sessions or not can_encode(event):
+            return
+
+        record: bytes = encode_event(event)
+        for session in sessions:
+            session.send(event.type, record)
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get queue stats of every connected subscriber, keyed by peer.
+        """
+        return {session.peer: session.get_stats() for session in self._sessions}
+
+    def close(self) -> None:
+        """
+        Stop publishing and disconnect all subscribers.
+        """
+        if not self._active:
+            return
+
+        for type in self.types:
+            self.event_engine.unregister(type, self.publish)
+
+        self._active = False
+        self._listener.close()
+        self._thread.join(timeout=5.0)
+
+        for session in self._sessions:
+            session.close()
+
+        if self._family != socket.AF_INET:
+            self._remove_socket_file()
+
+    def _remove_socket_file(self) -> None:
+        """
+        Remove socket file of a Unix domain socket address, left behind
+        by a server not closed properly.
+        """
+        try:
+            os.unlink(self._sockaddr)
+        except FileNotFoundError:
+            pass
+
+
+class EventBridgeClient:
+    """
+    Connect to an event bridge server and put the events received into a
+    local event engine, reconnecting automatically once the connection
+    is lost. Events published while disconnected are not received.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        address: str,
+        reconnect_interval: float = 1.0,
+    ) -> None:
+        """
+        Connecting is retried every 1 second by default, if
+        reconnect_interval not specified.
+        """
+        self.event_engine: EventEngine = event_engine
+        self.address: str = address
+        self.reconnect_interval: float = reconnect_interval
+        self.connected: bool = False
+        self.received: int = 0
+
+        self._family, self._sockaddr = parse_address(address)
+        self._sock: socket.socket | None = None
+        self._active: bool = False
+        self._thread: Thread = Thread(target=self._run, name="EventBridgeClient", daemon=True)
+
+        self._logger = get_component_logger("EventBridge")
+
+    def start(self) -> None:
+        """
+        Start receiving thread.
+        """
+        self._active = True
+        self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Keep connected to the server while active.
+        """
+        while self._active:
+            sock: socket.socket = create_socket(self._family)
+            try:
+                sock.connect(self._sockaddr)
+            except OSError:
+                sock.close()
+                sleep(self.reconnect_interval)
+                continue
+
+            self._sock = sock
+            self.connected = True
+            self._logger.info("Bridge connected", extra={"address": self.address})
+
+            try:
+                self._receive(sock)
+            except OSError:
+                pass
+            except ValueError as e:
+                self._logger.error("Bridge frame decoding failed", extra={"address": self.address, "error": str(e)})
+            finally:
+                self.connected = False
+                self._sock = None
+                sock.close()
+
+            if self._active:
+                self._logger.warning("Bridge disconnected", extra={"address": self.address})
+                sleep(self.reconnect_interval)
+
+    def _receive(self, sock: socket.socket) -> None:
+        """
+        Read frames until the connection is closed and put all events
+        decoded from one read into event engine at once.
+        """
+        buffer: bytearray = bytearray()
+
+        while self._active:
+            data: bytes = sock.recv(RECV_SIZE)
+            if not data:
+                return
+
+            buffer += data
+            events: list[Event] = decode_frames(buffer)
+            if events:
+                self.received += len(events)
+                self.event_engine.put_many(events)
+
+    def close(self) -> None:
+        """
+        Stop receiving and disconnect.
+        """
+        if not self._active:
+            return
+
+        self._active = False
+        sock: socket.socket | None = self._sock
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._thread.join(timeout=5.0)
@@ -4,6 +4,7 @@ from datetime import datetime
 from importlib import import_module
 from types import ModuleType
 
+from util.batch import BarBatch, TickBatch
 from util.constants import Exchange, Interval
 from util.object import BarData, TickData
 from util.settings import SETTINGS
@@ -81,6 +82,26 @@ class BaseDatabase(ABC):
         Load tick data from database.
         """
 
+    def load_bar_batch(
+        self, symbol: str, exchange: Exchange, interval: Interval, start: datetime, end: datetime
+    ) -> BarBatch:
+        """
+        Load bar data from database as a columnar batch. Drivers able to
+        fill the columns directly from query results should override it.
+        """
+        bars: list[BarData] = self.load_bar_data(symbol, exchange, interval, start, end)
+        return BarBatch.from_bars(bars, adapter_name="DB", symbol=symbol, exchange=exchange, interval=interval)
+
+    def load_tick_batch(
+        self, symbol: str, exchange: Exchange, start: datetime, end: datetime
+    ) -> TickBatch:
+        """
+        Load tick data from database as a columnar batch. Drivers able to
+        fill the columns directly from query results should override it.
+        """
+        ticks: list[TickData] = self.load_tick_data(symbol, exchange, start, end)
+        return TickBatch.from_ticks(ticks, adapter_name="DB", symbol=symbol, exchange=exchange, name="")
+
     @abstractmethod
     def delete_bar_data(self, symbol: str, exchange: Exchange, interval: Interval) -> int:
         """
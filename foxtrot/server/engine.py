@@ -1,16 +1,21 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from datetime import datetime
 from email.message import EmailMessage
 import os
-from queue import Empty, Queue
+from queue import Empty, Queue, SimpleQueue
 import smtplib
 from threading import Thread
 import traceback
-from typing import TypeVar
+from time import monotonic_ns
+from typing import Any, TypeVar
 
 from foxtrot.adapter.base_adapter import BaseAdapter
 from foxtrot.app.app import BaseApp
-from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.core.event_codec import can_encode, encode_event
+from foxtrot.core.event_engine import EVENT_TIMER, Event, EventEngine
+from foxtrot.util.batch import BarBatch
+from foxtrot.util.constants import Status
 from foxtrot.util.converter import OffsetConverter
 from foxtrot.util.event_type import (
     EVENT_ACCOUNT,
@@ -22,7 +27,7 @@ from foxtrot.util.event_type import (
     EVENT_TICK,
     EVENT_TRADE,
 )
-from foxtrot.util.logger import CRITICAL, DEBUG, ERROR, INFO, WARNING, logger
+from foxtrot.util.logger import CRITICAL, DEBUG, ERROR, INFO, WARNING, get_component_logger, logger
 from foxtrot.util.object import (
     AccountData,
     BarData,
@@ -41,10 +46,17 @@ from foxtrot.util.object import (
     TradeData,
 )
 from foxtrot.util.settings import SETTINGS
-from foxtrot.util.utility import TRADER_DIR
+from foxtrot.util.utility import TRADER_DIR, get_folder_path
+
+from .bridge import EventBridgeServer
+from .index import DataIndex
+from .journal import JournalWriter, get_journal_filename
 
 EngineType = TypeVar("EngineType", bound="BaseEngine")
 
+# Data created anew by adapters for every event, encoded by the journal writer thread
+DEFERRED_CLASSES: frozenset[type] = frozenset((TickData, BarData, LogData))
+
 
 class BaseEngine(ABC):
     """
@@ -78,7 +90,7 @@ class MainEngine:
         if event_engine:
             self.event_engine: EventEngine = event_engine
         else:
-            self.event_engine = EventEngine()
+            self.event_engine = EventEngine(shards=SETTINGS["event.shards"])
         self.event_engine.start()
 
         self.adapters: dict[str, BaseAdapter] = {}
@@ -148,6 +160,21 @@ class MainEngine:
         self.get_all_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_quotes
         self.get_all_active_orders: Callable[[], list[OrderData]] = oms_engine.get_all_active_orders
         self.get_all_active_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_active_quotes
+        self.get_orders_by_symbol: Callable[[str], list[OrderData]] = oms_engine.get_orders_by_symbol
+        self.get_active_orders_by_symbol: Callable[[str], list[OrderData]] = oms_engine.get_active_orders_by_symbol
+        self.get_orders_by_adapter: Callable[[str], list[OrderData]] = oms_engine.get_orders_by_adapter
+        self.get_orders_by_reference: Callable[[str], list[OrderData]] = oms_engine.get_orders_by_reference
+        self.get_orders_by_status: Callable[[Status], list[OrderData]] = oms_engine.get_orders_by_status
+        self.get_trades_by_symbol: Callable[[str], list[TradeData]] = oms_engine.get_trades_by_symbol
+        self.get_trades_by_adapter: Callable[[str], list[TradeData]] = oms_engine.get_trades_by_adapter
+        self.get_trades_by_order: Callable[[str], list[TradeData]] = oms_engine.get_trades_by_order
+        self.get_trades_by_reference: Callable[[str], list[TradeData]] = oms_engine.get_trades_by_reference
+        self.get_positions_by_symbol: Callable[[str], list[PositionData]] = oms_engine.get_positions_by_symbol
+        self.get_positions_by_adapter: Callable[[str], list[PositionData]] = oms_engine.get_positions_by_adapter
+        self.get_ticks_by_adapter: Callable[[str], list[TickData]] = oms_engine.get_ticks_by_adapter
+        self.get_accounts_by_adapter: Callable[[str], list[AccountData]] = oms_engine.get_accounts_by_adapter
+        self.get_contracts_by_adapter: Callable[[str], list[ContractData]] = oms_engine.get_contracts_by_adapter
+        self.get_quotes_by_adapter: Callable[[str], list[QuoteData]] = oms_engine.get_quotes_by_adapter
         self.update_order_request: Callable[[OrderRequest, str, str], None] = (
             oms_engine.update_order_request
         )
@@ -159,6 +186,12 @@ class MainEngine:
         email_engine: EmailEngine = self.add_engine(EmailEngine)
         self.send_email: Callable[[str, str, str | None], None] = email_engine.send_email
 
+        if SETTINGS["journal.active"]:
+            self.add_engine(JournalEngine)
+
+        if SETTINGS["bridge.active"]:
+            self.add_engine(BridgeEngine)
+
     def write_log(self, msg: str, source: str = "") -> None:
         """
         Put log event with specific message.
@@ -271,6 +304,15 @@ class MainEngine:
             return adapter.query_history(req)  # type: ignore
         return []
 
+    def query_history_batch(self, req: HistoryRequest, adapter_name: str) -> BarBatch | None:
+        """
+        Query bar history data from a specific gateway as a columnar batch.
+        """
+        adapter: BaseAdapter | None = self.get_adapter(adapter_name)
+        if adapter:
+            return adapter.query_history_batch(req)
+        return None
+
     def close(self) -> None:
         """
         Make sure every gateway and app is closed properly before
@@ -341,6 +383,23 @@ class OmsEngine(BaseEngine):
         self.active_orders: dict[str, OrderData] = {}
         self.active_quotes: dict[str, QuoteData] = {}
 
+        # Secondary indexes, updated with the dicts above
+        self.ticks_by_adapter: DataIndex[TickData] = DataIndex()
+        self.orders_by_symbol: DataIndex[OrderData] = DataIndex()
+        self.orders_by_adapter: DataIndex[OrderData] = DataIndex()
+        self.orders_by_reference: DataIndex[OrderData] = DataIndex()
+        self.orders_by_status: DataIndex[OrderData] = DataIndex()
+        self.active_orders_by_symbol: DataIndex[OrderData] = DataIndex()
+        self.trades_by_symbol: DataIndex[TradeData] = DataIndex()
+        self.trades_by_adapter: DataIndex[TradeData] = DataIndex()
+        self.trades_by_order: DataIndex[TradeData] = DataIndex()
+        self.trades_by_reference: DataIndex[TradeData] = DataIndex()
+        self.positions_by_symbol: DataIndex[PositionData] = DataIndex()
+        self.positions_by_adapter: DataIndex[PositionData] = DataIndex()
+        self.accounts_by_adapter: DataIndex[AccountData] = DataIndex()
+        self.contracts_by_adapter: DataIndex[ContractData] = DataIndex()
+        self.quotes_by_adapter: DataIndex[QuoteData] = DataIndex()
+
         self.offset_converters: dict[str, OffsetConverter] = {}
 
         self.register_event()
@@ -359,18 +418,32 @@ class OmsEngine(BaseEngine):
         """"""
         tick: TickData = event.data
         self.ticks[tick.vt_symbol] = tick
+        self.ticks_by_adapter.update(tick.vt_symbol, tick.adapter_name, tick)
 
     def process_order_event(self, event: Event) -> None:
         """"""
         order: OrderData = event.data
-        self.orders[order.vt_orderid] = order
+        vt_orderid: str = order.vt_orderid
+        self.orders[vt_orderid] = order
 
         # If order is active, then update data in dict.
         if order.is_active():
-            self.active_orders[order.vt_orderid] = order
+            self.active_orders[vt_orderid] = order
+            self.active_orders_by_symbol.update(vt_orderid, order.vt_symbol, order)
         # Otherwise, pop inactive order from in dict
-        elif order.vt_orderid in self.active_orders:
-            self.active_orders.pop(order.vt_orderid)
+        elif vt_orderid in self.active_orders:
+            self.active_orders.pop(vt_orderid)
+            self.active_orders_by_symbol.remove(vt_orderid)
+
+        # Trades arrived before the order, or before its reference was set
+        if self.orders_by_reference.get_key(vt_orderid) != order.reference:
+            for trade in self.trades_by_order.get(vt_orderid):
+                self.trades_by_reference.update(trade.vt_tradeid, order.reference, trade)
+
+        self.orders_by_symbol.update(vt_orderid, order.vt_symbol, order)
+        self.orders_by_adapter.update(vt_orderid, order.adapter_name, order)
+        self.orders_by_reference.update(vt_orderid, order.reference, order)
+        self.orders_by_status.update(vt_orderid, order.status, order)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(order.adapter_name, None)
@@ -380,7 +453,16 @@ class OmsEngine(BaseEngine):
     def process_trade_event(self, event: Event) -> None:
         """"""
         trade: TradeData = event.data
-        self.trades[trade.vt_tradeid] = trade
+        vt_tradeid: str = trade.vt_tradeid
+        self.trades[vt_tradeid] = trade
+
+        self.trades_by_symbol.update(vt_tradeid, trade.vt_symbol, trade)
+        self.trades_by_adapter.update(vt_tradeid, trade.adapter_name, trade)
+        self.trades_by_order.update(vt_tradeid, trade.vt_orderid, trade)
+
+        order: OrderData | None = self.orders.get(trade.vt_orderid, None)
+        if order:
+            self.trades_by_reference.update(vt_tradeid, order.reference, trade)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(trade.adapter_name, None)
@@ -391,6 +473,8 @@ class OmsEngine(BaseEngine):
         """"""
         position: PositionData = event.data
         self.positions[position.vt_positionid] = position
+        self.positions_by_symbol.update(position.vt_positionid, position.vt_symbol, position)
+        self.positions_by_adapter.update(position.vt_positionid, position.adapter_name, position)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(position.adapter_name, None)
@@ -401,11 +485,13 @@ class OmsEngine(BaseEngine):
         """"""
         account: AccountData = event.data
         self.accounts[account.vt_accountid] = account
+        self.accounts_by_adapter.update(account.vt_accountid, account.adapter_name, account)
 
     def process_contract_event(self, event: Event) -> None:
         """"""
         contract: ContractData = event.data
         self.contracts[contract.vt_symbol] = contract
+        self.contracts_by_adapter.update(contract.vt_symbol, contract.adapter_name, contract)
 
         # Initialize offset converter for each gateway
         if contract.adapter_name not in self.offset_converters:
@@ -415,6 +501,7 @@ class OmsEngine(BaseEngine):
         """"""
         quote: QuoteData = event.data
         self.quotes[quote.vt_quoteid] = quote
+        self.quotes_by_adapter.update(quote.vt_quoteid, quote.adapter_name, quote)
 
         # If quote is active, then update data in dict.
         if quote.is_active():
@@ -519,6 +606,96 @@ class OmsEngine(BaseEngine):
         """
         return list(self.active_quotes.values())
 
+    def get_orders_by_symbol(self, vt_symbol: str) -> list[OrderData]:
+        """
+        Get all orders of vt_symbol.
+        """
+        return self.orders_by_symbol.get(vt_symbol)
+
+    def get_active_orders_by_symbol(self, vt_symbol: str) -> list[OrderData]:
+        """
+        Get active orders of vt_symbol.
+        """
+        return self.active_orders_by_symbol.get(vt_symbol)
+
+    def get_orders_by_adapter(self, adapter_name: str) -> list[OrderData]:
+        """
+        Get all orders of adapter.
+        """
+        return self.orders_by_adapter.get(adapter_name)
+
+    def get_orders_by_reference(self, reference: str) -> list[OrderData]:
+        """
+        Get all orders sent with reference.
+        """
+        return self.orders_by_reference.get(reference)
+
+    def get_orders_by_status(self, status: Status) -> list[OrderData]:
+        """
+        Get all orders in status.
+        """
+        return self.orders_by_status.get(status)
+
+    def get_trades_by_symbol(self, vt_symbol: str) -> list[TradeData]:
+        """
+        Get all trades of vt_symbol.
+        """
+        return self.trades_by_symbol.get(vt_symbol)
+
+    def get_trades_by_adapter(self, adapter_name: str) -> list[TradeData]:
+        """
+        Get all trades of adapter.
+        """
+        return self.trades_by_adapter.get(adapter_name)
+
+    def get_trades_by_order(self, vt_orderid: str) -> list[TradeData]:
+        """
+        Get all trades of order.
+        """
+        return self.trades_by_order.get(vt_orderid)
+
+    def get_trades_by_reference(self, reference: str) -> list[TradeData]:
+        """
+        Get all trades of orders sent with reference.
+        """
+        return self.trades_by_reference.get(reference)
+
+    def get_positions_by_symbol(self, vt_symbol: str) -> list[PositionData]:
+        """
+        Get all positions of vt_symbol.
+        """
+        return self.positions_by_symbol.get(vt_symbol)
+
+    def get_positions_by_adapter(self, adapter_name: str) -> list[PositionData]:
+        """
+        Get all positions of adapter.
+        """
+        return self.positions_by_adapter.get(adapter_name)
+
+    def get_ticks_by_adapter(self, adapter_name: str) -> list[TickData]:
+        """
+        Get latest ticks of adapter.
+        """
+        return self.ticks_by_adapter.get(adapter_name)
+
+    def get_accounts_by_adapter(self, adapter_name: str) -> list[AccountData]:
+        """
+        Get all accounts of adapter.
+        """
+        return self.accounts_by_adapter.get(adapter_name)
+
+    def get_contracts_by_adapter(self, adapter_name: str) -> list[ContractData]:
+        """
+        Get all contracts of adapter.
+        """
+        return self.contracts_by_adapter.get(adapter_name)
+
+    def get_quotes_by_adapter(self, adapter_name: str) -> list[QuoteData]:
+        """
+        Get all quotes of adapter.
+        """
+        return self.quotes_by_adapter.get(adapter_name)
+
     def update_order_request(self, req: OrderRequest, vt_orderid: str, adapter_name: str) -> None:
         """
         Update order request to offset converter.
@@ -612,3 +789,117 @@ class EmailEngine(BaseEngine):
 
         self.active = False
         self.thread.join()
+
+
+class JournalEngine(BaseEngine):
+    """
+    Records events of data objects into a binary journal, one file per
+    session, which can be replayed with replay_journal.
+
+    Events are timestamped on the dispatch thread and written by a writer
+    thread of the engine, so other handlers do not wait for the journal.
+    Market data and logs are encoded by the writer thread as well, since
+    adapters create them anew for every event. Orders, positions and
+    other data objects adapters keep and update in place are encoded on
+    the dispatch thread, so that the journal records their state at the
+    time of the event.
+
+    Once writing fails the journal is disabled: the failure is reported
+    through the logger rather than a log event, which would itself be
+    queued for the journal, and further events are dropped.
+    """
+
+    def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
+        """"""
+        super().__init__(main_engine, event_engine, "journal")
+
+        self._logger = get_component_logger("JournalEngine")
+        self.failed: bool = False
+
+        filename: str = get_journal_filename(datetime.now())
+        self.writer: JournalWriter = JournalWriter(get_folder_path("journal").joinpath(filename))
+
+        # Items of monotonic timestamp, record encoded on dispatch, event type and data, None flushes
+        self.queue: SimpleQueue[tuple[int, bytes | None, str, Any] | None] = SimpleQueue()
+        self.active: bool = True
+        self.thread: Thread = Thread(target=self.run, name="JournalEngine", daemon=True)
+        self.thread.start()
+
+        self.event_engine.register_general(self.process_event)
+
+    def process_event(self, event: Event) -> None:
+        """
+        Queue event to be appended to journal, timer events only flush it.
+        """
+        if self.failed:
+            return
+
+        if event.type == EVENT_TIMER:
+            self.queue.put(None)
+            return
+
+        data: Any = event.data
+        if data is None or not can_encode(event):
+            return
+
+        if type(data) in DEFERRED_CLASSES:
+            self.queue.put((monotonic_ns(), None, event.type, data))
+        else:
+            self.queue.put((monotonic_ns(), encode_event(event), event.type, data))
+
+    def run(self) -> None:
+        """
+        Write queued events to journal until closed and drained.
+        """
+        while self.active or not self.queue.empty():
+            try:
+                item: tuple[int, bytes | None, str, Any] | None = self.queue.get(block=True, timeout=1)
+            except Empty:
+                continue
+
+            if self.failed:
+                continue
+
+            try:
+                if item is None:
+                    self.writer.flush()
+                    continue
+
+                timestamp, record, event_type, data = item
+                if record is None:
+                    self.writer.write(Event(event_type, data), timestamp)
+                else:
+                    self.writer.write_record(record, timestamp)
+            except Exception:
+                self.failed = True
+                self._logger.error(
+                    "Journal writing failed, journal disabled",
+                    extra={"path": str(self.writer.path), "error": traceback.format_exc()},
+                )
+
+    def close(self) -> None:
+        """"""
+        self.event_engine.unregister_general(self.process_event)
+
+        self.active = False
+        self.queue.put(None)
+        self.thread.join()
+        self.writer.close()
+
+
+class BridgeEngine(BaseEngine):
+    """
+    Publishes events to event engines of other processes or hosts, e.g.
+    a UI and strategy process connected with EventBridgeClient.
+    """
+
+    def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
+        """"""
+        super().__init__(main_engine, event_engine, "bridge")
+
+        self.server: EventBridgeServer = EventBridgeServer(event_engine, SETTINGS["bridge.address"])
+        self.server.start()
+
+    def close(self) -> None:
+        """"""
+        self.server.close()
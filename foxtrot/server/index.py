@@ -0,0 +1,89 @@
+"""
+Secondary indexes of order management data.
+"""
+
+from collections.abc import Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class DataIndex(Generic[T]):
+    """
+    Groups data objects by one key, such as vt_symbol or status.
+
+    The key each object was filed under is kept, so an object updated
+    in place by the adapter is still moved out of its old bucket.
+    Lookups cost the size of the result, not of all data.
+
+    Updates may come from several handler threads of a sharded event
+    engine while other threads query, so buckets are only accessed under
+    a lock and lookups return copies.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.buckets: dict[Hashable, dict[str, T]] = {}
+        self.keys: dict[str, Hashable] = {}
+        self.lock: Lock = Lock()
+
+    def update(self, vt_id: str, key: Hashable, data: T) -> None:
+        """
+        Put latest data into bucket of key, moving it out of previous one.
+        """
+        with self.lock:
+            old_key: Hashable | None = self.keys.get(vt_id, None)
+            if old_key is not None and old_key != key:
+                self._discard(old_key, vt_id)
+            self.keys[vt_id] = key
+
+            bucket: dict[str, T] | None = self.buckets.get(key, None)
+            if bucket is None:
+                self.buckets[key] = {vt_id: data}
+            else:
+                bucket[vt_id] = data
+
+    def remove(self, vt_id: str) -> None:
+        """
+        Remove data from the index.
+        """
+        with self.lock:
+            key: Hashable | None = self.keys.pop(vt_id, None)
+            if key is not None:
+                self._discard(key, vt_id)
+
+    def _discard(self, key: Hashable, vt_id: str) -> None:
+        """
+        Remove data from bucket of key, dropping the bucket once empty.
+        Must be called with the lock held.
+        """
+        bucket: dict[str, T] | None = self.buckets.get(key, None)
+        if bucket is None:
+            return
+
+        bucket.pop(vt_id, None)
+        if not bucket:
+            del self.buckets[key]
+
+    def get(self, key: Hashable) -> list[T]:
+        """
+        Get all data under key.
+        """
+        with self.lock:
+            bucket: dict[str, T] | None = self.buckets.get(key, None)
+            if not bucket:
+                return []
+            return list(bucket.values())
+
+    def get_key(self, vt_id: str) -> Hashable | None:
+        """
+        Get key data is filed under.
+        """
+        with self.lock:
+            return self.keys.get(vt_id, None)
+
+    def __len__(self) -> int:
+        """"""
+        with self.lock:
+            return len(self.keys)
@@ -0,0 +1,178 @@
+"""
+Binary event journal for post-mortem analysis and replay.
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+import mmap
+from pathlib import Path
+from struct import Struct
+from threading import Lock
+from time import monotonic_ns, sleep
+from typing import BinaryIO
+
+from foxtrot.core.event_codec import decode_event, encode_event
+from foxtrot.core.event_engine import Event, EventEngine
+
+# File starts with magic and wall clock time (epoch ns) of the session
+# start, followed by records of length, monotonic timestamp (ns) and
+# encoded event.
+MAGIC: bytes = b"FXJ2"
+FILE_HEADER: Struct = Struct("<4sq")
+RECORD_HEADER: Struct = Struct("<Iq")
+
+REPLAY_BATCH: int = 1000
+
+
+def get_journal_filename(start: datetime) -> str:
+    """
+    Get journal filename of a session started at start.
+    """
+    return start.strftime("journal_%Y%m%d_%H%M%S_%f.fxj")
+
+
+class JournalWriter:
+    """
+    Append events to a journal file. Can be used from several dispatch
+    threads.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """"""
+        self.path: Path = path
+        self.count: int = 0
+
+        self._file: BinaryIO = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(MAGIC, int(datetime.now().timestamp() * 1e9)))
+        self._lock: Lock = Lock()
+
+    def write(self, event: Event, timestamp: int | None = None) -> None:
+        """
+        Append event with timestamp (time.monotonic_ns), the current time
+        is used by default.
+        """
+        if timestamp is None:
+            timestamp = monotonic_ns()
+
+        self.write_record(encode_event(event), timestamp)
+
+    def write_record(self, record: bytes, timestamp: int) -> None:
+        """
+        Append event already encoded with encode_event.
+        """
+        with self._lock:
+            self._file.write(RECORD_HEADER.pack(len(record), timestamp))
+            self._file.write(record)
+            self.count += 1
+
+    def flush(self) -> None:
+        """
+        Flush buffered records to the file.
+        """
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+        with self._lock:
+            self._file.close()
+
+
+class JournalReader:
+    """
+    Read events from a memory mapped journal file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """"""
+        self.path: Path = path
+
+        with open(path, "rb") as f:
+            self._mmap: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, start = FILE_HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not an event journal")
+
+        self.start: datetime = datetime.fromtimestamp(start / 1e9)
+
+    def __iter__(self) -> Iterator[tuple[int, Event]]:
+        """
+        Iterate (timestamp, event) of all complete records. A record cut
+        off by a crash of the writer ends the journal.
+        """
+        buf: memoryview = memoryview(self._mmap)
+        size: int = len(buf)
+        offset: int = FILE_HEADER.size
+
+        try:
+            while offset + RECORD_HEADER.size <= size:
+                length, timestamp = RECORD_HEADER.unpack_from(buf, offset)
+                offset += RECORD_HEADER.size
+
+                if offset + length > size:
+                    break
+
+                yield timestamp, decode_event(buf[offset:offset + length])
+                offset += length
+        finally:
+            buf.release()
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+        self._mmap.close()
+
+    def __enter__(self) -> "JournalReader":
+        """"""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """"""
+        self.close()
+
+
+def replay_journal(path: Path, event_engine: EventEngine, speed: float = 0) -> int:
+    """
+    Put events of a journal into event engine and return their number.
+
+    Events are replayed as fast as possible by default, if speed not
+    specified. Otherwise the recorded gaps between events are kept,
+    scaled down by speed (e.g. 10 replays 10 times faster).
+    """
+    count: int = 0
+
+    with JournalReader(path) as reader:
+        if not speed:
+            batch: list[Event] = []
+
+            for _, event in reader:
+                batch.append(event)
+
+                if len(batch) == REPLAY_BATCH:
+                    event_engine.put_many(batch)
+                    count += len(batch)
+                    batch = []
+
+            event_engine.put_many(batch)
+            return count + len(batch)
+
+        first: int | None = None
+        replay_start: int = monotonic_ns()
+
+        for timestamp, event in reader:
+            if first is None:
+                first = timestamp
+
+            delay: float = ((timestamp - first) / speed - (monotonic_ns() - replay_start)) / 1e9
+            if delay > 0:
+                sleep(delay)
+
+            event_engine.put(event)
+            count += 1
+
+    return count
@@ -0,0 +1,220 @@
+"""
+Columnar batches of bar and tick data backed by NumPy structured arrays,
+for history and database queries returning many rows of one instrument.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone, tzinfo
+from typing import Any
+
+import numpy as np
+
+from .codec import get_init_schema
+from .object import BarData, TickData
+
+# NumPy column type of each supported field annotation, fields of other
+# types are kept once per batch and must be equal in all rows.
+COLUMN_TYPES: dict[str, str] = {
+    "float": "f8",
+    "int": "i8",
+    "datetime": "M8[ns]",
+    "datetime | None": "M8[ns]",
+}
+
+# Fields not stored as columns, epoch timestamps and timezones of rows
+# are taken from their datetime when read.
+SKIPPED_FIELDS: tuple[str, ...] = ("timestamp", "tz")
+
+
+def create_dtype(data_class: type, meta_fields: Sequence[str]) -> np.dtype:
+    """
+    Create structured dtype of the row fields of a data class.
+    """
+    columns: list[tuple[str, str]] = []
+    for name, type_ in get_init_schema(data_class):
+        if name in meta_fields or name in SKIPPED_FIELDS:
+            continue
+
+        if type_ not in COLUMN_TYPES:
+            raise TypeError(f"Field {name} of {data_class.__name__} of type {type_} can not be a column")
+        columns.append((name, COLUMN_TYPES[type_]))
+
+    return np.dtype(columns)
+
+
+def to_datetime64(values: list[datetime | None], tz: tzinfo | None) -> np.ndarray:
+    """
+    Convert datetimes to datetime64, as UTC if tz specified, otherwise as
+    naive wall clock time. None becomes NaT.
+    """
+    if tz is not None:
+        values = [v.astimezone(timezone.utc).replace(tzinfo=None) if v is not None else None for v in values]
+    return np.array(values, dtype="M8[us]").astype("M8[ns]")
+
+
+def from_datetime64(column: np.ndarray, tz: tzinfo | None) -> list[datetime | None]:
+    """
+    Convert datetime64 column back to datetimes in timezone tz.
+    """
+    values: list[datetime | None] = column.astype("M8[us]").tolist()
+    if tz is None:
+        return values
+
+    utc: tzinfo = timezone.utc
+    return [v.replace(tzinfo=utc).astimezone(tz) if v is not None else None for v in values]
+
+
+class DataBatch:
+    """
+    Rows of data objects of one instrument stored column by column.
+
+    Numeric and datetime fields are columns of a structured array, read
+    as zero-copy views by field name (batch.close_price). Other fields
+    (symbol, exchange, ...) are equal for all rows and kept once. Aware
+    datetimes are stored as UTC and converted back to the timezone of
+    the batch, which is the timezone of the first row.
+
+    Slicing returns a batch viewing the same array, indexing with an
+    int returns a data object.
+    """
+
+    data_class: type
+    meta_fields: tuple[str, ...]
+    dtype: np.dtype
+
+    def __init__(self, data: np.ndarray, tz: tzinfo | None = None, **meta: Any) -> None:
+        """"""
+        self.data: np.ndarray = data
+        self.tz: tzinfo | None = tz
+        self.meta: dict[str, Any] = meta
+
+        self._datetime_fields: tuple[str, ...] = tuple(
+            name for name in self.dtype.names if self.dtype[name].kind == "M"
+        )
+
+    @classmethod
+    def from_list(cls, objects: Sequence[Any], **meta: Any) -> DataBatch:
+        """
+        Create batch from data objects of one instrument. Meta fields are
+        taken from the objects, or from meta if objects is empty.
+        """
+        if not objects:
+            return cls(np.empty(0, dtype=cls.dtype), **meta)
+
+        first: Any = objects[0]
+        meta = {name: getattr(first, name) for name in cls.meta_fields}
+        for name, value in meta.items():
+            if any(getattr(obj, name) != value for obj in objects):
+                raise ValueError(f"Field {name} differs between objects of one batch")
+
+        tz: tzinfo | None = first.tz
+        data: np.ndarray = np.empty(len(objects), dtype=cls.dtype)
+
+        for name in cls.dtype.names:
+            values: list = [getattr(obj, name) for obj in objects]
+            if cls.dtype[name].kind == "M":
+                data[name] = to_datetime64(values, tz)
+            else:
+                data[name] = values
+
+        return cls(data, tz, **meta)
+
+    def to_list(self) -> list[Any]:
+        """
+        Convert rows back to data objects.
+        """
+        names: tuple[str, ...] = self.dtype.names
+        columns: list[list] = []
+        for name in names:
+            column: np.ndarray = self.data[name]
+            if name in self._datetime_fields:
+                columns.append(from_datetime64(column, self.tz))
+            else:
+                columns.append(column.tolist())
+
+        data_class: type = self.data_class
+        meta: dict[str, Any] = self.meta
+        return [data_class(**meta, **dict(zip(names, values))) for values in zip(*columns)]
+
+    @classmethod
+    def concat(cls, batches: Sequence[DataBatch]) -> DataBatch:
+        """
+        Join batches of the same instrument into one, copying the rows.
+        """
+        first: DataBatch = batches[0]
+        for batch in batches[1:]:
+            if batch.meta != first.meta or batch.tz != first.tz:
+                raise ValueError("Only batches of the same instrument and timezone can be joined")
+
+        data: np.ndarray = np.concatenate([batch.data for batch in batches])
+        return cls(data, first.tz, **first.meta)
+
+    def __len__(self) -> int:
+        """"""
+        return len(self.data)
+
+    def __getitem__(self, key: int | slice | np.ndarray) -> Any:
+        """
+        Get data object of a row, or batch of the rows selected.
+        """
+        if isinstance(key, (int, np.integer)):
+            return type(self)(self.data[key:key + 1 or None], self.tz, **self.meta).to_list()[0]
+        return type(self)(self.data[key], self.tz, **self.meta)
+
+    def __iter__(self) -> Iterator[Any]:
+        """"""
+        return iter(self.to_list())
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get column view or meta field by name.
+        """
+        # Guard against lookups before __init__ completed (e.g. copy)
+        if name in ("data", "meta"):
+            raise AttributeError(name)
+
+        if name in self.dtype.names:
+            return self.data[name]
+        if name in self.meta:
+            return self.meta[name]
+        raise AttributeError(f"{type(self).__name__} has no attribute {name}")
+
+
+class BarBatch(DataBatch):
+    """
+    Batch of bar data of one instrument and interval.
+    """
+
+    data_class = BarData
+    meta_fields = ("adapter_name", "symbol", "exchange", "interval")
+    dtype = create_dtype(BarData, meta_fields)
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[BarData], **meta: Any) -> BarBatch:
+        """"""
+        return cls.from_list(bars, **meta)
+
+    def to_bars(self) -> list[BarData]:
+        """"""
+        return self.to_list()
+
+
+class TickBatch(DataBatch):
+    """
+    Batch of tick data of one instrument.
+    """
+
+    data_class = TickData
+    meta_fields = ("adapter_name", "symbol", "exchange", "name")
+    dtype = create_dtype(TickData, meta_fields)
+
+    @classmethod
+    def from_ticks(cls, ticks: Sequence[TickData], **meta: Any) -> TickBatch:
+        """"""
+        return cls.from_list(ticks, **meta)
+
+    def to_ticks(self) -> list[TickData]:
+        """"""
+        return self.to_list()
@@ -0,0 +1,804 @@
+"""
+Compact binary encoding of data objects for passing them between
+processes, journaling and caching.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone, tzinfo
+from enum import Enum
+from operator import attrgetter
+from struct import Struct
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from . import constants
+from .object import (
+    AccountData,
+    BarData,
+    CancelRequest,
+    ContractData,
+    HistoryRequest,
+    LogData,
+    OrderData,
+    OrderRequest,
+    PositionData,
+    QuoteData,
+    QuoteRequest,
+    SubscribeRequest,
+    TickData,
+    TradeData,
+)
+
+EPOCH: datetime = datetime(1970, 1, 1)
+EPOCH_UTC: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Kinds of field values supported by the codec
+FLOAT: int = 0
+INT: int = 1
+BOOL: int = 2
+ENUM: int = 3
+DATETIME: int = 4
+STR: int = 5
+JSON: int = 6
+TZ: int = 7
+
+KIND_NAMES: dict[str, int] = {
+    "float": FLOAT,
+    "int": INT,
+    "bool": BOOL,
+    "datetime": DATETIME,
+    "str": STR,
+    "dict[str, Any]": JSON,
+    "tzinfo": TZ,
+}
+
+# Kinds encoded as length prefixed utf-8 text after the struct
+TEXT_KINDS: set[int] = {STR, JSON, TZ}
+
+# Struct format of each kind in the fixed part of the record, optional
+# numbers are preceded by a presence flag.
+KIND_FORMATS: dict[int, str] = {
+    FLOAT: "d",
+    INT: "q",
+    BOOL: "?",
+    ENUM: "B",
+    DATETIME: "Bqi",
+}
+
+# Marks None in enum indexes
+NONE_INDEX: int = 0xFF
+
+# Datetime flags
+DT_NONE: int = 0
+DT_NAIVE: int = 1
+DT_AWARE: int = 2
+
+# Length of strings, the largest length marks None. Records are limited
+# by their 32-bit length, so no string can reach it.
+STR_LENGTH: Struct = Struct("<I")
+
+# Length of strings in records of the first schema versions
+SHORT_STR_LENGTH: Struct = Struct("<H")
+
+# Fixed offset timezones of decoded aware datetimes by utc offset seconds
+TIMEZONES: dict[int, timezone] = {}
+
+# Batch of records, count followed by length prefixed records
+BATCH_COUNT: Struct = Struct("<I")
+RECORD_LENGTH: Struct = Struct("<I")
+
+# Defines schema of a data class, pairs of field name and annotation.
+SchemaType = list[tuple[str, str]]
+
+
+def get_schema(data_class: type) -> SchemaType:
+    """
+    Get current schema of a data class from its fields, including state
+    not passed to __init__ such as extra.
+    """
+    return [(f.name, f.type) for f in fields(data_class)]
+
+
+def get_init_schema(data_class: type) -> SchemaType:
+    """
+    Get schema of the init fields of a data class.
+    """
+    return [(f.name, f.type) for f in fields(data_class) if f.init]
+
+
+def get_lazy_schema(data_class: type) -> SchemaType:
+    """
+    Get current schema of a data class with lazy datetime, which encodes
+    the epoch nanosecond timestamp and timezone instead of the datetime,
+    so that the datetime is neither built to encode nor when decoded.
+    """
+    return [item for item in get_schema(data_class) if item[0] != "datetime"]
+
+
+def get_timezone(offset: int) -> timezone:
+    """
+    Get fixed offset timezone of utc offset seconds.
+    """
+    tz: timezone | None = TIMEZONES.get(offset, None)
+    if not tz:
+        tz = TIMEZONES[offset] = timezone(timedelta(seconds=offset))
+    return tz
+
+
+def tz_to_name(tz: tzinfo) -> str:
+    """
+    Get name of timezone, the key of zoneinfo timezones, or utc offset
+    seconds with sign of fixed offset timezones.
+    """
+    key: str | None = getattr(tz, "key", None)
+    if key:
+        return key
+
+    offset: timedelta | None = tz.utcoffset(None)
+    if offset is None:
+        raise ValueError(f"Timezone {tz} has neither key nor fixed offset")
+    return f"{int(offset.total_seconds()):+d}"
+
+
+def name_to_tz(name: str) -> tzinfo:
+    """
+    Get timezone from name returned by tz_to_name.
+    """
+    if name[0] in "+-":
+        return get_timezone(int(name))
+    return ZoneInfo(name)
+
+
+def datetime_to_ns(dt: datetime) -> tuple[int, int, int]:
+    """
+    Convert datetime to (flag, epoch nanoseconds, utc offset seconds).
+    Naive datetimes are counted from naive epoch.
+    """
+    if dt.tzinfo is None:
+        delta: timedelta = dt - EPOCH
+        flag: int = DT_NAIVE
+        offset: int = 0
+    else:
+        delta = dt - EPOCH_UTC
+        flag = DT_AWARE
+        offset = int(dt.utcoffset().total_seconds())
+
+    ns: int = ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+    return flag, ns, offset
+
+
+def ns_to_datetime(flag: int, ns: int, offset: int) -> datetime | None:
+    """
+    Convert (flag, epoch nanoseconds, utc offset seconds) back to datetime.
+    Aware datetimes keep their utc offset but not their zone name.
+    """
+    if flag == DT_NONE:
+        return None
+
+    delta: timedelta = timedelta(microseconds=ns // 1000)
+    if flag == DT_NAIVE:
+        return EPOCH + delta
+    return (EPOCH_UTC + delta).astimezone(get_timezone(offset))
+
+
+def parse_annotation(annotation: str) -> tuple[int, bool, type[Enum] | None]:
+    """
+    Get (kind, optional, enum class) of a dataclass field from its
+    annotation string.
+    """
+    names: list[str] = [name.strip() for name in annotation.split("|")]
+    optional: bool = "None" in names
+    names = [name for name in names if name != "None"]
+
+    if len(names) != 1:
+        raise TypeError(f"Unsupported field annotation: {annotation}")
+
+    name: str = names[0]
+    if name in KIND_NAMES:
+        return KIND_NAMES[name], optional, None
+
+    enum_class: Any = getattr(constants, name, None)
+    if isinstance(enum_class, type) and issubclass(enum_class, Enum):
+        return ENUM, optional, enum_class
+
+    raise TypeError(f"Unsupported field annotation: {annotation}")
+
+
+def get_attributes(names: list[str]) -> Callable[[Any], tuple]:
+    """
+    Get function returning a tuple of the named attributes of an object.
+    """
+    if not names:
+        return lambda data: ()
+    if len(names) == 1:
+        name: str = names[0]
+        return lambda data: (getattr(data, name),)
+    return attrgetter(*names)
+
+
+class DataCodec:
+    """
+    Encoder and decoder of one schema version of a data class, built
+    from its field annotations.
+
+    A record consists of the class tag and schema version, one struct
+    with all numbers, enum indexes and datetimes (as epoch nanoseconds),
+    followed by length prefixed utf-8 strings, json dicts and timezone
+    names. Plain
+    numbers lead the struct, so they are read and written at once instead
+    of field by field. Fields not passed to __init__ are set on the
+    decoded object afterwards. Dict values not supported by json are
+    stored as strings.
+
+    Enum members are interned as their index in definition order, so
+    new members must be appended to keep records of the schema version
+    decodable. Any other change of fields or enums needs a new version.
+    """
+
+    def __init__(
+        self,
+        tag: int,
+        data_class: type,
+        version: int = 1,
+        schema: SchemaType | None = None,
+        str_length: Struct = STR_LENGTH
+    ) -> None:
+        """
+        Current schema of data class is used by default, if schema not
+        specified. Fields of an older schema no longer defined by the
+        data class are dropped when decoding.
+        """
+        self.tag: int = tag
+        self.version: int = version
+        self.data_class: type = data_class
+        self.str_length: Struct = str_length
+        self.none_length: int = (1 << (8 * str_length.size)) - 1
+
+        # Plain fields are not optional numbers, other fields need conversion
+        self.plain_fields: list[str] = []
+        self.fields: list[tuple[str, int, bool, tuple[Enum, ...] | None]] = []
+        self.enum_indexes: dict[str, dict[Enum, int]] = {}
+
+        if schema is None:
+            schema = get_schema(data_class)
+        class_fields: set[str] = {name for name, _ in get_schema(data_class)}
+        self.init_fields: set[str] = {name for name, _ in get_init_schema(data_class)}
+        self.state_fields: list[str] = [
+            name for name, _ in schema if name in class_fields and name not in self.init_fields
+        ]
+        self.complete: bool = all(name in class_fields for name, _ in schema)
+
+        plain_fmt: str = "<BB"
+        fmt: str = ""
+        for name, annotation in schema:
+            kind, optional, enum_class = parse_annotation(annotation)
+            members: tuple[Enum, ...] | None = None
+
+            if kind in (FLOAT, INT, BOOL) and not optional:
+                self.plain_fields.append(name)
+                plain_fmt += KIND_FORMATS[kind]
+                continue
+
+            if enum_class:
+                members = tuple(enum_class)
+                self.enum_indexes[name] = {member: i for i, member in enumerate(members)}
+
+            if kind in (FLOAT, INT, BOOL):
+                fmt += "?"
+            fmt += KIND_FORMATS.get(kind, "")
+
+            self.fields.append((name, kind, optional, members))
+
+        self.struct: Struct = Struct(plain_fmt + fmt)
+        self.plain_end: int = 2 + len(self.plain_fields)
+        self.get_plain: Callable[[Any], tuple] = get_attributes(self.plain_fields)
+
+    def encode(self, data: Any) -> bytes:
+        """
+        Encode data object into a record.
+        """
+        values: list[Any] = [self.tag, self.version, *self.get_plain(data)]
+        strings: list[bytes] = []
+
+        for name, kind, optional, _ in self.fields:
+            value: Any = getattr(data, name)
+
+            if kind in TEXT_KINDS:
+                if value is None:
+                    strings.append(self.str_length.pack(self.none_length))
+                else:
+                    if kind == JSON:
+                        value = json.dumps(value, ensure_ascii=False, default=str)
+                    elif kind == TZ:
+                        value = tz_to_name(value)
+                    encoded: bytes = value.encode()
+                    if len(encoded) >= self.none_length:
+                        raise ValueError(f"Field {name} of {len(encoded)} bytes is too long to encode")
+                    strings.append(self.str_length.pack(len(encoded)))
+                    strings.append(encoded)
+            elif kind == ENUM:
+                values.append(NONE_INDEX if value is None else self.enum_indexes[name][value])
+            elif kind == DATETIME:
+                if value is None:
+                    values.extend((DT_NONE, 0, 0))
+                else:
+                    values.extend(datetime_to_ns(value))
+            elif optional:
+                values.append(value is not None)
+                values.append(0 if value is None else value)
+            else:
+                values.append(value)
+
+        return self.struct.pack(*values) + b"".join(strings)
+
+    def decode(self, buffer: bytes | memoryview) -> Any:
+        """
+        Decode data object from a record.
+        """
+        values: tuple = self.struct.unpack_from(buffer)
+        offset: int = self.struct.size
+        index: int = self.plain_end
+        kwargs: dict[str, Any] = dict(zip(self.plain_fields, values[2:index]))
+
+        for name, kind, optional, members in self.fields:
+            if kind in TEXT_KINDS:
+                length: int = self.str_length.unpack_from(buffer, offset)[0]
+                offset += self.str_length.size
+
+                if length == self.none_length:
+                    kwargs[name] = None
+                else:
+                    text: str = bytes(buffer[offset:offset + length]).decode()
+                    if kind == JSON:
+                        kwargs[name] = json.loads(text)
+                    elif kind == TZ:
+                        kwargs[name] = name_to_tz(text)
+                    else:
+                        kwargs[name] = text
+                    offset += length
+            elif kind == ENUM:
+                value: int = values[index]
+                kwargs[name] = None if value == NONE_INDEX else members[value]
+                index += 1
+            elif kind == DATETIME:
+                kwargs[name] = ns_to_datetime(*values[index:index + 3])
+                index += 3
+            elif optional:
+                kwargs[name] = values[index + 1] if values[index] else None
+                index += 2
+            else:
+                kwargs[name] = values[index]
+                index += 1
+
+        state: list[tuple[str, Any]] = [(name, kwargs.pop(name)) for name in self.state_fields]
+        if not self.complete:
+            kwargs = {name: value for name, value in kwargs.items() if name in self.init_fields}
+
+        data: Any = self.data_class(**kwargs)
+        for name, value in state:
+            setattr(data, name, value)
+        return data
+
+
+# Codecs encoding the current schema of each class, and codecs decoding
+# each (tag, version) including older schemas.
+DATA_CODECS: dict[type, DataCodec] = {}
+TAG_CODECS: dict[tuple[int, int], DataCodec] = {}
+
+
+def register_codec(tag: int, data_class: type, version: int = 1, schema: SchemaType | None = None) -> None:
+    """
+    Register codec of the current schema of a data class under a unique
+    tag. Version must be increased whenever the schema is changed.
+    """
+    for (registered_tag, _), codec in TAG_CODECS.items():
+        if registered_tag == tag and codec.data_class is not data_class:
+            raise ValueError(f"Codec tag {tag} is already used by {codec.data_class.__name__}")
+
+    if (tag, version) in TAG_CODECS or data_class in DATA_CODECS:
+        raise ValueError(f"Codec of {data_class.__name__} is already registered")
+
+    codec: DataCodec = DataCodec(tag, data_class, version, schema)
+    DATA_CODECS[data_class] = codec
+    TAG_CODECS[(tag, version)] = codec
+
+
+def register_schema(
+    tag: int,
+    data_class: type,
+    version: int,
+    schema: SchemaType,
+    str_length: Struct = STR_LENGTH
+) -> None:
+    """
+    Register codec of an older schema version of a data class, so that
+    records written before the schema was changed can still be decoded.
+    Fields added since are set to their defaults.
+    """
+    if (tag, version) in TAG_CODECS:
+        raise ValueError(f"Schema version {version} of tag {tag} is already registered")
+
+    TAG_CODECS[(tag, version)] = DataCodec(tag, data_class, version, schema, str_length)
+
+
+def encode_data(data: Any) -> bytes:
+    """
+    Encode data object of a registered class.
+    """
+    codec: DataCodec | None = DATA_CODECS.get(type(data))
+    if not codec:
+        raise TypeError(f"No codec registered for {type(data).__name__}")
+    return codec.encode(data)
+
+
+def decode_data(buffer: bytes | memoryview) -> Any:
+    """
+    Decode data object encoded by encode_data.
+    """
+    codec: DataCodec | None = TAG_CODECS.get((buffer[0], buffer[1]))
+    if not codec:
+        raise ValueError(f"Unknown codec tag {buffer[0]} version {buffer[1]}")
+    return codec.decode(buffer)
+
+
+def encode_batch(objects: Iterable[Any]) -> bytes:
+    """
+    Encode data objects of registered classes into one buffer.
+    """
+    codecs: dict[type, DataCodec] = DATA_CODECS
+    parts: list[bytes] = []
+    count: int = 0
+
+    for data in objects:
+        codec: DataCodec | None = codecs.get(type(data))
+        if not codec:
+            raise TypeError(f"No codec registered for {type(data).__name__}")
+
+        record: bytes = codec.encode(data)
+        parts.append(RECORD_LENGTH.pack(len(record)))
+        parts.append(record)
+        count += 1
+
+    return BATCH_COUNT.pack(count) + b"".join(parts)
+
+
+def decode_batch(buffer: bytes | memoryview) -> list[Any]:
+    """
+    Decode data objects encoded by encode_batch.
+    """
+    view: memoryview = memoryview(buffer)
+    count: int = BATCH_COUNT.unpack_from(view)[0]
+    offset: int = BATCH_COUNT.size
+    objects: list[Any] = []
+
+    for _ in range(count):
+        length: int = RECORD_LENGTH.unpack_from(view, offset)[0]
+        offset += RECORD_LENGTH.size
+
+        record: memoryview = view[offset:offset + length]
+        codec: DataCodec | None = TAG_CODECS.get((record[0], record[1]))
+        if not codec:
+            raise ValueError(f"Unknown codec tag {record[0]} version {record[1]}")
+
+        objects.append(codec.decode(record))
+        offset += length
+
+    return objects
+
+
+register_codec(1, TickData, 4, get_lazy_schema(TickData))
+register_codec(2, OrderData, 2)
+register_codec(3, TradeData, 2)
+register_codec(4, PositionData, 2)
+register_codec(5, AccountData, 2)
+register_codec(6, LogData, 2)
+register_codec(7, BarData, 4, get_lazy_schema(BarData))
+register_codec(8, ContractData, 2)
+register_codec(9, QuoteData, 2)
+register_codec(10, SubscribeRequest, 2)
+register_codec(11, OrderRequest, 2)
+register_codec(12, CancelRequest, 2)
+register_codec(13, HistoryRequest, 2)
+register_codec(14, QuoteRequest, 2)
+
+# Schemas before state not passed to __init__ was encoded and strings got
+# 32-bit lengths. Historical schemas are written out, so that changing a
+# data class does not change how its old records are decoded.
+register_schema(2, OrderData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("orderid", "str"),
+    ("type", "OrderType"),
+    ("direction", "Direction | None"),
+    ("offset", "Offset"),
+    ("price", "float"),
+    ("volume", "float"),
+    ("traded", "float"),
+    ("status", "Status"),
+    ("datetime", "datetime | None"),
+    ("reference", "str"),
+], SHORT_STR_LENGTH)
+register_schema(3, TradeData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("orderid", "str"),
+    ("tradeid", "str"),
+    ("direction", "Direction | None"),
+    ("offset", "Offset"),
+    ("price", "float"),
+    ("volume", "float"),
+    ("datetime", "datetime | None"),
+], SHORT_STR_LENGTH)
+register_schema(4, PositionData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("direction", "Direction"),
+    ("volume", "float"),
+    ("frozen", "float"),
+    ("price", "float"),
+    ("pnl", "float"),
+    ("yd_volume", "float"),
+], SHORT_STR_LENGTH)
+register_schema(5, AccountData, 1, [
+    ("adapter_name", "str"),
+    ("accountid", "str"),
+    ("balance", "float"),
+    ("frozen", "float"),
+], SHORT_STR_LENGTH)
+register_schema(6, LogData, 1, [
+    ("adapter_name", "str"),
+    ("msg", "str"),
+    ("level", "int"),
+], SHORT_STR_LENGTH)
+register_schema(8, ContractData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("name", "str"),
+    ("product", "Product"),
+    ("size", "float"),
+    ("pricetick", "float"),
+    ("min_volume", "float"),
+    ("max_volume", "float | None"),
+    ("stop_supported", "bool"),
+    ("net_position", "bool"),
+    ("history_data", "bool"),
+    ("option_strike", "float | None"),
+    ("option_underlying", "str | None"),
+    ("option_type", "OptionType | None"),
+    ("option_listed", "datetime | None"),
+    ("option_expiry", "datetime | None"),
+    ("option_portfolio", "str | None"),
+    ("option_index", "str | None"),
+], SHORT_STR_LENGTH)
+register_schema(9, QuoteData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("quoteid", "str"),
+    ("bid_price", "float"),
+    ("bid_volume", "int"),
+    ("ask_price", "float"),
+    ("ask_volume", "int"),
+    ("bid_offset", "Offset"),
+    ("ask_offset", "Offset"),
+    ("status", "Status"),
+    ("datetime", "datetime | None"),
+    ("reference", "str"),
+], SHORT_STR_LENGTH)
+register_schema(10, SubscribeRequest, 1, [
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+], SHORT_STR_LENGTH)
+register_schema(11, OrderRequest, 1, [
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("direction", "Direction"),
+    ("type", "OrderType"),
+    ("volume", "float"),
+    ("price", "float"),
+    ("offset", "Offset"),
+    ("reference", "str"),
+], SHORT_STR_LENGTH)
+register_schema(12, CancelRequest, 1, [
+    ("orderid", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+], SHORT_STR_LENGTH)
+register_schema(13, HistoryRequest, 1, [
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("start", "datetime"),
+    ("end", "datetime | None"),
+    ("interval", "Interval | None"),
+], SHORT_STR_LENGTH)
+register_schema(14, QuoteRequest, 1, [
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("bid_price", "float"),
+    ("bid_volume", "int"),
+    ("ask_price", "float"),
+    ("ask_volume", "int"),
+    ("bid_offset", "Offset"),
+    ("ask_offset", "Offset"),
+    ("reference", "str"),
+], SHORT_STR_LENGTH)
+
+# Tick and bar schemas of version 1, before the epoch nanosecond timestamp
+# was added.
+register_schema(1, TickData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("datetime", "datetime"),
+    ("name", "str"),
+    ("volume", "float"),
+    ("turnover", "float"),
+    ("open_interest", "float"),
+    ("last_price", "float"),
+    ("last_volume", "float"),
+    ("limit_up", "float"),
+    ("limit_down", "float"),
+    ("open_price", "float"),
+    ("high_price", "float"),
+    ("low_price", "float"),
+    ("pre_close", "float"),
+    ("bid_price_1", "float"),
+    ("bid_price_2", "float"),
+    ("bid_price_3", "float"),
+    ("bid_price_4", "float"),
+    ("bid_price_5", "float"),
+    ("ask_price_1", "float"),
+    ("ask_price_2", "float"),
+    ("ask_price_3", "float"),
+    ("ask_price_4", "float"),
+    ("ask_price_5", "float"),
+    ("bid_volume_1", "float"),
+    ("bid_volume_2", "float"),
+    ("bid_volume_3", "float"),
+    ("bid_volume_4", "float"),
+    ("bid_volume_5", "float"),
+    ("ask_volume_1", "float"),
+    ("ask_volume_2", "float"),
+    ("ask_volume_3", "float"),
+    ("ask_volume_4", "float"),
+    ("ask_volume_5", "float"),
+    ("localtime", "datetime | None"),
+], SHORT_STR_LENGTH)
+register_schema(7, BarData, 1, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("datetime", "datetime"),
+    ("interval", "Interval | None"),
+    ("volume", "float"),
+    ("turnover", "float"),
+    ("open_interest", "float"),
+    ("open_price", "float"),
+    ("high_price", "float"),
+    ("low_price", "float"),
+    ("close_price", "float"),
+], SHORT_STR_LENGTH)
+
+# Tick and bar schemas of version 2, with the epoch nanosecond timestamp
+# next to the datetime.
+register_schema(1, TickData, 2, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("timestamp", "int"),
+    ("datetime", "datetime | None"),
+    ("name", "str"),
+    ("volume", "float"),
+    ("turnover", "float"),
+    ("open_interest", "float"),
+    ("last_price", "float"),
+    ("last_volume", "float"),
+    ("limit_up", "float"),
+    ("limit_down", "float"),
+    ("open_price", "float"),
+    ("high_price", "float"),
+    ("low_price", "float"),
+    ("pre_close", "float"),
+    ("bid_price_1", "float"),
+    ("bid_price_2", "float"),
+    ("bid_price_3", "float"),
+    ("bid_price_4", "float"),
+    ("bid_price_5", "float"),
+    ("ask_price_1", "float"),
+    ("ask_price_2", "float"),
+    ("ask_price_3", "float"),
+    ("ask_price_4", "float"),
+    ("ask_price_5", "float"),
+    ("bid_volume_1", "float"),
+    ("bid_volume_2", "float"),
+    ("bid_volume_3", "float"),
+    ("bid_volume_4", "float"),
+    ("bid_volume_5", "float"),
+    ("ask_volume_1", "float"),
+    ("ask_volume_2", "float"),
+    ("ask_volume_3", "float"),
+    ("ask_volume_4", "float"),
+    ("ask_volume_5", "float"),
+    ("localtime", "datetime | None"),
+], SHORT_STR_LENGTH)
+register_schema(7, BarData, 2, [
+    ("adapter_name", "str"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("timestamp", "int"),
+    ("datetime", "datetime | None"),
+    ("interval", "Interval | None"),
+    ("volume", "float"),
+    ("turnover", "float"),
+    ("open_interest", "float"),
+    ("open_price", "float"),
+    ("high_price", "float"),
+    ("low_price", "float"),
+    ("close_price", "float"),
+], SHORT_STR_LENGTH)
+
+# Tick and bar schemas of version 3, which encoded extra and the datetime
+# instead of the timezone.
+register_schema(1, TickData, 3, [
+    ("adapter_name", "str"),
+    ("extra", "dict[str, Any] | None"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("timestamp", "int"),
+    ("datetime", "datetime | None"),
+    ("name", "str"),
+    ("volume", "float"),
+    ("turnover", "float"),
+    ("open_interest", "float"),
+    ("last_price", "float"),
+    ("last_volume", "float"),
+    ("limit_up", "float"),
+    ("limit_down", "float"),
+    ("open_price", "float"),
+    ("high_price", "float"),
+    ("low_price", "float"),
+    ("pre_close", "float"),
+    ("bid_price_1", "float"),
+    ("bid_price_2", "float"),
+    ("bid_price_3", "float"),
+    ("bid_price_4", "float"),
+    ("bid_price_5", "float"),
+    ("ask_price_1", "float"),
+    ("ask_price_2", "float"),
+    ("ask_price_3", "float"),
+    ("ask_price_4", "float"),
+    ("ask_price_5", "float"),
+    ("bid_volume_1", "float"),
+    ("bid_volume_2", "float"),
+    ("bid_volume_3", "float"),
+    ("bid_volume_4", "float"),
+    ("bid_volume_5", "float"),
+    ("ask_volume_1", "float"),
+    ("ask_volume_2", "float"),
+    ("ask_volume_3", "float"),
+    ("ask_volume_4", "float"),
+    ("ask_volume_5", "float"),
+    ("localtime", "datetime | None"),
+])
+register_schema(7, BarData, 3, [
+    ("adapter_name", "str"),
+    ("extra", "dict[str, Any] | None"),
+    ("symbol", "str"),
+    ("exchange", "Exchange"),
+    ("timestamp", "int"),
+    ("datetime", "datetime | None"),
+    ("interval", "Interval | None"),
+    ("volume", "float"),
+    ("turnover", "float"),
+    ("open_interest", "float"),
+    ("open_price", "float"),
+    ("high_price", "float"),
+    ("low_price", "float"),
+    ("close_price", "float"),
+])
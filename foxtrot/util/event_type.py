@@ -3,6 +3,7 @@ Event type string used in the trading platform.
 """
 
 EVENT_TICK = "eTick."
+EVENT_DEPTH = "eDepth."
 EVENT_TRADE = "eTrade."
 EVENT_ORDER = "eOrder."
 EVENT_POSITION = "ePosition."
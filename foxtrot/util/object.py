@@ -4,19 +4,133 @@ Basic data structure used for general trading function in the trading platform.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import lru_cache
 from typing import Any
 
 from .constants import Direction, Exchange, Interval, Offset, OptionType, OrderType, Product, Status
+from .symbol_registry import SYMBOL_REGISTRY
+from .timestamp import datetime_to_timestamp, timestamp_to_datetime
 
 INFO: int = 20
 
 
 ACTIVE_STATUSES = {Status.SUBMITTING, Status.NOTTRADED, Status.PARTTRADED}
 
+@lru_cache(maxsize=65536)
+def get_vt_id(adapter_name: str, id: str) -> str:
+    """
+    Get vt id (e.g. vt_orderid) of an id of an adapter. Recently used ids
+    are cached, so updates of the same order share one string.
+    """
+    return f"{adapter_name}.{id}"
+
+
+def derived() -> Any:
+    """
+    Declare attribute set in __post_init__, not passed to __init__ and
+    not compared, so that it has a slot of its own. See slotted.
+    """
+    return field(init=False, repr=False, compare=False, metadata={"derived": True})
+
+
+def slotted(data_class: type) -> type:
+    """
+    Create slotted dataclass. Attributes declared with derived() keep
+    their slots but are removed from the dataclass fields afterwards, so
+    that fields(), asdict() and replace() only see the data itself, as
+    before slots were added.
+    """
+    data_class = dataclass(slots=True)(data_class)
+
+    data_fields: dict[str, Any] = data_class.__dataclass_fields__
+    for name in [name for name, f in data_fields.items() if f.metadata.get("derived")]:
+        del data_fields[name]
+
+    return data_class
 
-@dataclass
+
+def lazy_datetime(data_class: type) -> type:
+    """
+    Make datetime and epoch nanosecond timestamp fields of a slotted data
+    class two views of one time.
+
+    Either may be passed to the constructor, the other is computed on
+    first access and cached in its slot. Adapters pass the timestamp, so
+    the datetime is only built for consumers reading it. Assigning one
+    after construction resets the other, assigning datetime None keeps
+    the time of the timestamp.
+
+    The tz field is the timezone of the time, passed along with the
+    timestamp. Assigning a datetime sets it to the tzinfo of the datetime,
+    assigning tz makes the datetime be built from the timestamp in the
+    new timezone, assigning timestamp keeps it. Datetimes built from the
+    timestamp without tz are naive local time.
+
+    The timestamp field must precede the tz field, which must precede
+    the datetime field: if both timestamp and datetime are passed to the
+    constructor, the datetime (which may be timezone aware) is kept and
+    the timestamp computed from it. Constructing data with neither raises
+    ValueError.
+    """
+    datetime_slot: Any = data_class.datetime
+    timestamp_slot: Any = data_class.timestamp
+    tz_slot: Any = data_class.tz
+    post_init: Callable[[Any], None] = data_class.__post_init__
+
+    def check_time(self: Any) -> None:
+        if not timestamp_slot.__get__(self) and datetime_slot.__get__(self) is None:
+            raise ValueError(f"{data_class.__name__} of {self.symbol} needs a timestamp or datetime")
+        post_init(self)
+
+    def get_datetime(self: Any) -> datetime | None:
+        value: datetime | None = datetime_slot.__get__(self)
+        if value is None:
+            timestamp: int = timestamp_slot.__get__(self)
+            if timestamp:
+                value = timestamp_to_datetime(timestamp, tz_slot.__get__(self))
+                datetime_slot.__set__(self, value)
+        return value
+
+    def set_datetime(self: Any, value: datetime | None) -> None:
+        datetime_slot.__set__(self, value)
+        if value is not None:
+            timestamp_slot.__set__(self, 0)
+            tz_slot.__set__(self, value.tzinfo)
+
+    def get_timestamp(self: Any) -> int:
+        value: int = timestamp_slot.__get__(self)
+        if not value:
+            dt: datetime | None = datetime_slot.__get__(self)
+            if dt is not None:
+                value = datetime_to_timestamp(dt)
+                timestamp_slot.__set__(self, value)
+        return value
+
+    def set_timestamp(self: Any, value: int) -> None:
+        timestamp_slot.__set__(self, value)
+        datetime_slot.__set__(self, None)
+
+    def get_tz(self: Any) -> tzinfo | None:
+        return tz_slot.__get__(self)
+
+    def set_tz(self: Any, value: tzinfo | None) -> None:
+        dt: datetime | None = datetime_slot.__get__(self)
+        if dt is not None and dt.tzinfo is not value:
+            get_timestamp(self)
+            datetime_slot.__set__(self, None)
+        tz_slot.__set__(self, value)
+
+    data_class.__post_init__ = check_time
+    data_class.datetime = property(get_datetime, set_datetime)
+    data_class.timestamp = property(get_timestamp, set_timestamp)
+    data_class.tz = property(get_tz, set_tz)
+    return data_class
+
+
+@slotted
 class BaseData:
     """
     Any data object needs a adaper_name as source
@@ -28,7 +142,8 @@ class BaseData:
     extra: dict[str, Any] | None = field(default=None, init=False)
 
 
-@dataclass
+@lazy_datetime
+@slotted
 class TickData(BaseData):
     """
     Tick data contains information about:
@@ -39,7 +154,11 @@ class TickData(BaseData):
 
     symbol: str
     exchange: Exchange
-    datetime: datetime
+    # Epoch nanoseconds of datetime
+    timestamp: int = 0
+    # Timezone of datetime, also of datetime built from timestamp
+    tz: tzinfo | None = field(default=None, repr=False, compare=False)
+    datetime: datetime | None = None
 
     name: str = ""
     volume: float = 0
@@ -81,12 +200,16 @@ class TickData(BaseData):
 
     localtime: datetime | None = None
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
 
-@dataclass
+@lazy_datetime
+@slotted
 class BarData(BaseData):
     """
     Candlestick bar data of a certain trading period.
@@ -94,7 +217,11 @@ class BarData(BaseData):
 
     symbol: str
     exchange: Exchange
-    datetime: datetime
+    # Epoch nanoseconds of datetime
+    timestamp: int = 0
+    # Timezone of datetime, also of datetime built from timestamp
+    tz: tzinfo | None = field(default=None, repr=False, compare=False)
+    datetime: datetime | None = None
 
     interval: Interval | None = None
     volume: float = 0
@@ -105,12 +232,15 @@ class BarData(BaseData):
     low_price: float = 0
     close_price: float = 0
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
 
-@dataclass
+@slotted
 class OrderData(BaseData):
     """
     Order data contains information for tracking lastest status
@@ -131,10 +261,14 @@ class OrderData(BaseData):
     datetime: datetime | None = None
     reference: str = ""
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+    vt_orderid: str = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_orderid: str = f"{self.adapter_name}.{self.orderid}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
+        self.vt_orderid = get_vt_id(self.adapter_name, self.orderid)
 
     def is_active(self) -> bool:
         """
@@ -152,7 +286,7 @@ class OrderData(BaseData):
         return req
 
 
-@dataclass
+@slotted
 class TradeData(BaseData):
     """
     Trade data contains information of a fill of an order. One order
@@ -170,14 +304,19 @@ class TradeData(BaseData):
     volume: float = 0
     datetime: datetime | None = None
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+    vt_orderid: str = derived()
+    vt_tradeid: str = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_orderid: str = f"{self.adapter_name}.{self.orderid}"
-        self.vt_tradeid: str = f"{self.adapter_name}.{self.tradeid}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
+        self.vt_orderid = get_vt_id(self.adapter_name, self.orderid)
+        self.vt_tradeid = get_vt_id(self.adapter_name, self.tradeid)
 
 
-@dataclass
+@slotted
 class PositionData(BaseData):
     """
     Position data is used for tracking each individual position holding.
@@ -193,13 +332,17 @@ class PositionData(BaseData):
     pnl: float = 0
     yd_volume: float = 0
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+    vt_positionid: str = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_positionid: str = f"{self.adapter_name}.{self.vt_symbol}.{self.direction.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
+        self.vt_positionid = get_vt_id(self.adapter_name, f"{self.vt_symbol}.{self.direction.value}")
 
 
-@dataclass
+@slotted
 class AccountData(BaseData):
     """
     Account data contains information about balance, frozen and
@@ -211,13 +354,16 @@ class AccountData(BaseData):
     balance: float = 0
     frozen: float = 0
 
+    available: float = derived()
+    vt_accountid: str = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.available: float = self.balance - self.frozen
-        self.vt_accountid: str = f"{self.adapter_name}.{self.accountid}"
+        self.available = self.balance - self.frozen
+        self.vt_accountid = get_vt_id(self.adapter_name, self.accountid)
 
 
-@dataclass
+@slotted
 class LogData(BaseData):
     """
     Log data is used for recording log messages on GUI or in log files.
@@ -226,12 +372,14 @@ class LogData(BaseData):
     msg: str
     level: int = INFO
 
+    time: datetime = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """"""
-        self.time: datetime = datetime.now()
+        self.time = datetime.now()
 
 
-@dataclass
+@slotted
 class ContractData(BaseData):
     """
     Contract data contains basic information about each contract traded.
@@ -258,12 +406,15 @@ class ContractData(BaseData):
     option_portfolio: str | None = None
     option_index: str | None = None  # for identifying options with same strike price
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
 
-@dataclass
+@slotted
 class QuoteData(BaseData):
     """
     Quote data contains information for tracking lastest status
@@ -284,10 +435,14 @@ class QuoteData(BaseData):
     datetime: datetime | None = None
     reference: str = ""
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+    vt_quoteid: str = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_quoteid: str = f"{self.adapter_name}.{self.quoteid}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
+        self.vt_quoteid = get_vt_id(self.adapter_name, self.quoteid)
 
     def is_active(self) -> bool:
         """
@@ -305,7 +460,7 @@ class QuoteData(BaseData):
         return req
 
 
-@dataclass
+@slotted
 class SubscribeRequest:
     """
     Request sending to specific adaper for subscribing tick data update.
@@ -314,12 +469,15 @@ class SubscribeRequest:
     symbol: str
     exchange: Exchange
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
 
-@dataclass
+@slotted
 class OrderRequest:
     """
     Request sending to specific adaper for creating a new order.
@@ -334,9 +492,12 @@ class OrderRequest:
     offset: Offset = Offset.NONE
     reference: str = ""
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
     def create_order_data(self, orderid: str, adapter_name: str) -> OrderData:
         """
@@ -357,7 +518,7 @@ class OrderRequest:
         return order
 
 
-@dataclass
+@slotted
 class CancelRequest:
     """
     Request sending to specific adaper for canceling an existing order.
@@ -367,12 +528,15 @@ class CancelRequest:
     symbol: str
     exchange: Exchange
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
 
-@dataclass
+@slotted
 class HistoryRequest:
     """
     Request sending to specific adaper for querying history data.
@@ -384,12 +548,15 @@ class HistoryRequest:
     end: datetime | None = None
     interval: Interval | None = None
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
 
-@dataclass
+@slotted
 class QuoteRequest:
     """
     Request sending to specific adaper for creating a new quote.
@@ -405,9 +572,12 @@ class QuoteRequest:
     ask_offset: Offset = Offset.NONE
     reference: str = ""
 
+    vt_symbol: str = derived()
+    symbol_id: int = derived()
+
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(self.symbol, self.exchange)
 
     def create_quote_data(self, quoteid: str, adapter_name: str) -> QuoteData:
         """
@@ -0,0 +1,251 @@
+"""
+Full depth L2 order book maintained from snapshots and incremental diffs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+
+from .constants import Exchange
+from .object import TickData
+from .symbol_registry import SYMBOL_REGISTRY
+
+DEFAULT_DEPTH: int = 20
+
+# Price level as sent by exchanges, price and volume first
+LevelType = Sequence[float]
+
+TICK_LEVELS: int = 5
+BID_PRICE_FIELDS: list[str] = [f"bid_price_{i}" for i in range(1, TICK_LEVELS + 1)]
+BID_VOLUME_FIELDS: list[str] = [f"bid_volume_{i}" for i in range(1, TICK_LEVELS + 1)]
+ASK_PRICE_FIELDS: list[str] = [f"ask_price_{i}" for i in range(1, TICK_LEVELS + 1)]
+ASK_VOLUME_FIELDS: list[str] = [f"ask_volume_{i}" for i in range(1, TICK_LEVELS + 1)]
+
+
+class BookSide:
+    """
+    One side of an order book, price levels sorted best first in arrays
+    of fixed capacity.
+
+    A level is found by binary search, inserting or removing one shifts
+    the worse levels by one. Once full, the worst level is dropped for a
+    better new one and levels worse than all kept are ignored, so after
+    removals the tail may miss levels until the next snapshot.
+    """
+
+    def __init__(self, depth: int, descending: bool) -> None:
+        """
+        Bid side is descending (highest price best), ask side ascending.
+        """
+        self.depth: int = depth
+        self.count: int = 0
+
+        self._sign: float = -1.0 if descending else 1.0
+        # Sort keys, price negated on descending side
+        self._keys: np.ndarray = np.zeros(depth)
+        self._prices: np.ndarray = np.zeros(depth)
+        self._volumes: np.ndarray = np.zeros(depth)
+
+    @property
+    def prices(self) -> np.ndarray:
+        """
+        Get view of prices of the levels, best first.
+        """
+        return self._prices[:self.count]
+
+    @property
+    def volumes(self) -> np.ndarray:
+        """
+        Get view of volumes of the levels, best first.
+        """
+        return self._volumes[:self.count]
+
+    def update(self, price: float, volume: float) -> None:
+        """
+        Set volume of a price level, removing the level if volume is 0.
+        """
+        count: int = self.count
+        keys: np.ndarray = self._keys
+        key: float = self._sign * price
+        i: int = int(keys[:count].searchsorted(key))
+
+        if i < count and keys[i] == key:
+            if volume:
+                self._volumes[i] = volume
+                return
+
+            for array in (keys, self._prices, self._volumes):
+                array[i:count - 1] = array[i + 1:count]
+            self.count = count - 1
+            return
+
+        if not volume or i >= self.depth:
+            return
+
+        # Worst level falls off a full side
+        if count == self.depth:
+            count -= 1
+
+        for array, value in ((keys, key), (self._prices, price), (self._volumes, volume)):
+            array[i + 1:count + 1] = array[i:count]
+            array[i] = value
+        self.count = count + 1
+
+    def set(self, levels: Sequence[LevelType]) -> None:
+        """
+        Replace all levels with levels given best first.
+        """
+        count: int = min(len(levels), self.depth)
+        if count:
+            values: np.ndarray = np.array([level[:2] for level in levels[:count]], dtype=np.float64)
+            self._prices[:count] = values[:, 0]
+            self._volumes[:count] = values[:, 1]
+            self._keys[:count] = values[:, 0] * self._sign
+        self.count = count
+
+    def clear(self) -> None:
+        """
+        Remove all levels.
+        """
+        self.count = 0
+
+    def copy(self) -> BookSide:
+        """
+        Get copy of side with levels of its own.
+        """
+        side: BookSide = BookSide.__new__(BookSide)
+        side.depth = self.depth
+        side.count = self.count
+        side._sign = self._sign
+        side._keys = self._keys.copy()
+        side._prices = self._prices.copy()
+        side._volumes = self._volumes.copy()
+        return side
+
+
+class OrderBook:
+    """
+    L2 order book of one instrument with bid and ask ladders of
+    configurable depth.
+
+    Maintained by an adapter from a depth feed: apply_snapshot on
+    (re)subscription and resync, apply_delta for every diff message.
+    Books are mutated in place by the adapter, so a copy is published
+    with EVENT_DEPTH for handlers on other threads.
+    """
+
+    def __init__(self, adapter_name: str, symbol: str, exchange: Exchange, depth: int = DEFAULT_DEPTH) -> None:
+        """"""
+        self.adapter_name: str = adapter_name
+        self.symbol: str = symbol
+        self.exchange: Exchange = exchange
+        self.symbol_id, self.vt_symbol = SYMBOL_REGISTRY.register(symbol, exchange)
+
+        self.depth: int = depth
+        self.bids: BookSide = BookSide(depth, descending=True)
+        self.asks: BookSide = BookSide(depth, descending=False)
+
+        self.datetime: datetime | None = None
+        # Sequence number (update id) of the last update applied
+        self.sequence: int = 0
+
+    def apply_snapshot(
+        self,
+        bids: Sequence[LevelType],
+        asks: Sequence[LevelType],
+        sequence: int = 0,
+        datetime: datetime | None = None,
+    ) -> None:
+        """
+        Replace the book with levels given best first.
+        """
+        self.bids.set(bids)
+        self.asks.set(asks)
+        self.sequence = sequence
+        self.datetime = datetime
+
+    def apply_delta(
+        self,
+        bids: Sequence[LevelType],
+        asks: Sequence[LevelType],
+        sequence: int = 0,
+        datetime: datetime | None = None,
+    ) -> bool:
+        """
+        Apply changed levels, volume 0 removes a level. A delta with a
+        sequence not after the one of the book is stale and not applied.
+        """
+        if sequence:
+            if sequence <= self.sequence:
+                return False
+            self.sequence = sequence
+
+        for price, volume, *_ in bids:
+            self.bids.update(price, volume)
+        for price, volume, *_ in asks:
+            self.asks.update(price, volume)
+
+        if datetime:
+            self.datetime = datetime
+        return True
+
+    @property
+    def best_bid(self) -> float:
+        """
+        Get best bid price, 0 if no bids.
+        """
+        return float(self.bids._prices[0]) if self.bids.count else 0
+
+    @property
+    def best_ask(self) -> float:
+        """
+        Get best ask price, 0 if no asks.
+        """
+        return float(self.asks._prices[0]) if self.asks.count else 0
+
+    def fill_tick(self, tick: TickData) -> None:
+        """
+        Set the five level fields of tick from the book.
+        """
+        for side, price_fields, volume_fields in (
+            (self.bids, BID_PRICE_FIELDS, BID_VOLUME_FIELDS),
+            (self.asks, ASK_PRICE_FIELDS, ASK_VOLUME_FIELDS),
+        ):
+            count: int = min(side.count, TICK_LEVELS)
+            prices: list[float] = side._prices[:count].tolist()
+            volumes: list[float] = side._volumes[:count].tolist()
+
+            for i in range(TICK_LEVELS):
+                if i < count:
+                    setattr(tick, price_fields[i], prices[i])
+                    setattr(tick, volume_fields[i], volumes[i])
+                else:
+                    setattr(tick, price_fields[i], 0)
+                    setattr(tick, volume_fields[i], 0)
+
+    def to_tick(self) -> TickData:
+        """
+        Create tick data with the five levels of the book. A book not
+        given the time of its updates is stamped with the current time.
+        """
+        tick: TickData = TickData(
+            adapter_name=self.adapter_name,
+            symbol=self.symbol,
+            exchange=self.exchange,
+            datetime=self.datetime or datetime.now(),
+        )
+        self.fill_tick(tick)
+        return tick
+
+    def copy(self) -> OrderBook:
+        """
+        Get copy of book for publishing.
+        """
+        book: OrderBook = OrderBook.__new__(OrderBook)
+        book.__dict__.update(self.__dict__)
+        book.bids = self.bids.copy()
+        book.asks = self.asks.copy()
+        return book
@@ -0,0 +1,187 @@
+"""
+Price arithmetic on integer multiples of a price tick.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from functools import lru_cache
+from math import ceil, floor
+
+import numpy as np
+
+# Decimal places kept beyond those of the price tick when scaling prices
+# to integers, enough to decide rounding direction and exact halves.
+EXTRA_DIGITS: int = 6
+
+# Scaled prices must stay exact in float64 and int64
+MAX_SCALED: float = float(2**53)
+
+# Below this, the float error of a price and of scaling it stays within
+# half a unit of the scaled decimal value, so rounding recovers it.
+MAX_PRICE_SCALED: float = float(2**51)
+
+
+def get_digits(value: float) -> int:
+    """
+    Get number of digits after decimal point of the shortest repr of
+    value, also in scientific notation such as 2.5e-05.
+    """
+    exponent: int = Decimal(str(value)).as_tuple().exponent
+    return max(-exponent, 0)
+
+
+class PriceTick:
+    """
+    Converts prices to and from integer numbers of a price tick.
+
+    Prices are scaled to integers with EXTRA_DIGITS decimal places more
+    than the tick, so rounding gives the same result as computing on the
+    decimal values of the prices: ties go to the even tick like Decimal,
+    0.3 floors to 3 ticks of 0.1. Prices too large to scale exactly fall
+    back to Decimal.
+
+    Get instances with get_price_tick(contract.pricetick), cached per
+    tick value and shared by contracts of the same tick.
+    """
+
+    def __init__(self, pricetick: float) -> None:
+        """"""
+        self.pricetick: float = pricetick
+        self.digits: int = get_digits(pricetick)
+
+        self._scale: int = 10 ** (self.digits + EXTRA_DIGITS)
+        # Tick in scaled units
+        self._units: int = round(pricetick * self._scale)
+        # Ticks to price in tick digits units
+        self._tick_units: int = round(pricetick * 10**self.digits)
+        self._tick_scale: int = 10**self.digits
+        self._limit: float = MAX_PRICE_SCALED / self._scale
+
+    def to_ticks(self, price: float) -> int:
+        """
+        Get price as nearest number of ticks, ties to even.
+        """
+        if not -self._limit < price < self._limit:
+            return int(round(Decimal(str(price)) / Decimal(str(self.pricetick))))
+
+        ticks, remainder = divmod(round(price * self._scale), self._units)
+        double: int = 2 * remainder
+        if double > self._units or (double == self._units and ticks & 1):
+            ticks += 1
+        return ticks
+
+    def floor_ticks(self, price: float) -> int:
+        """
+        Get price as number of ticks rounded down.
+        """
+        if not -self._limit < price < self._limit:
+            return int(floor(Decimal(str(price)) / Decimal(str(self.pricetick))))
+        return round(price * self._scale) // self._units
+
+    def ceil_ticks(self, price: float) -> int:
+        """
+        Get price as number of ticks rounded up.
+        """
+        if not -self._limit < price < self._limit:
+            return int(ceil(Decimal(str(price)) / Decimal(str(self.pricetick))))
+        return -(-round(price * self._scale) // self._units)
+
+    def from_ticks(self, ticks: int) -> float:
+        """
+        Get price of a number of ticks, the float nearest to its decimal value.
+        """
+        value: int = ticks * self._tick_units
+        if -MAX_SCALED < value < MAX_SCALED:
+            return value / self._tick_scale
+        return float(ticks * Decimal(str(self.pricetick)))
+
+    # Rounding below repeats the tick conversions inline, as these are
+    # called per order and per bar on the hot path. Prices in the exact
+    # range always give ticks in the exact range of from_ticks.
+
+    def round(self, price: float) -> float:
+        """
+        Round price to nearest tick.
+        """
+        if not -self._limit < price < self._limit:
+            return self.from_ticks(self.to_ticks(price))
+
+        ticks, remainder = divmod(round(price * self._scale), self._units)
+        double: int = 2 * remainder
+        if double > self._units or (double == self._units and ticks & 1):
+            ticks += 1
+        return ticks * self._tick_units / self._tick_scale
+
+    def floor(self, price: float) -> float:
+        """
+        Round price down to tick.
+        """
+        if not -self._limit < price < self._limit:
+            return self.from_ticks(self.floor_ticks(price))
+        return round(price * self._scale) // self._units * self._tick_units / self._tick_scale
+
+    def ceil(self, price: float) -> float:
+        """
+        Round price up to tick.
+        """
+        if not -self._limit < price < self._limit:
+            return self.from_ticks(self.ceil_ticks(price))
+        return -(-round(price * self._scale) // self._units) * self._tick_units / self._tick_scale
+
+    def to_ticks_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Get prices as nearest numbers of ticks, ties to even.
+        Prices must be small enough to scale exactly.
+        """
+        scaled: np.ndarray = np.rint(np.asarray(prices, dtype=np.float64) * self._scale).astype(np.int64)
+        ticks, remainder = np.divmod(scaled, self._units)
+        double: np.ndarray = 2 * remainder
+        ticks += (double > self._units) | ((double == self._units) & (ticks & 1 == 1))
+        return ticks
+
+    def floor_ticks_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Get prices as numbers of ticks rounded down.
+        """
+        scaled: np.ndarray = np.rint(np.asarray(prices, dtype=np.float64) * self._scale).astype(np.int64)
+        return scaled // self._units
+
+    def ceil_ticks_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Get prices as numbers of ticks rounded up.
+        """
+        scaled: np.ndarray = np.rint(np.asarray(prices, dtype=np.float64) * self._scale).astype(np.int64)
+        return -(-scaled // self._units)
+
+    def from_ticks_array(self, ticks: np.ndarray) -> np.ndarray:
+        """
+        Get prices of numbers of ticks.
+        """
+        return (np.asarray(ticks, dtype=np.int64) * self._tick_units) / self._tick_scale
+
+    def round_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Round prices to nearest tick.
+        """
+        return self.from_ticks_array(self.to_ticks_array(prices))
+
+    def floor_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Round prices down to tick.
+        """
+        return self.from_ticks_array(self.floor_ticks_array(prices))
+
+    def ceil_array(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Round prices up to tick.
+        """
+        return self.from_ticks_array(self.ceil_ticks_array(prices))
+
+
+@lru_cache(maxsize=1024)
+def get_price_tick(pricetick: float) -> PriceTick:
+    """
+    Get price tick converter, shared by all contracts of the same tick.
+    """
+    return PriceTick(pricetick)
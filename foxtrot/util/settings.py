@@ -32,10 +32,16 @@ SETTINGS: dict[str, Any] = {
     "database.port": 0,
     "database.user": "",
     "database.password": "",
+    # Event engine settings
+    "event.shards": 1,  # Worker threads of the event engine, 1 keeps single-thread dispatch
+    "journal.active": False,  # Record events into a binary journal per session for replay
+    "bridge.active": False,  # Publish events to remote event engines over the event bridge
+    "bridge.address": "tcp://127.0.0.1:20250",  # Or "unix:///path/to/socket"
     # WebSocket settings
     "websocket.enabled": False,  # Global WebSocket enable/disable
     "websocket.binance.enabled": True,  # Per-adapter WebSocket settings
     "websocket.binance.symbols": [],  # Empty list means all symbols, or specify ["BTCUSDT", "ETHUSDT"]
+    "websocket.binance.depth": 0,  # Order book levels streamed as EVENT_DEPTH, 0 disables depth stream
     "websocket.reconnect.max_attempts": 50,
     "websocket.reconnect.base_delay": 1.0,
     "websocket.reconnect.max_delay": 60.0,
@@ -0,0 +1,106 @@
+"""
+Process-wide registry of instruments, assigning every symbol and exchange
+a dense integer id and one interned vt_symbol.
+"""
+
+from __future__ import annotations
+
+import sys
+from threading import Lock
+
+from .constants import Exchange
+
+
+class SymbolRegistry:
+    """
+    Map (symbol, exchange) to a dense integer symbol id and an interned
+    vt_symbol, and back.
+
+    Ids are assigned in order of first registration starting from 0 and
+    never reused, so per-instrument state can be kept in lists or arrays
+    indexed by symbol id instead of dicts keyed by vt_symbol. Ids are
+    only valid within the process, they must not be persisted or sent
+    to other processes (use symbol and exchange instead).
+
+    Lookups of registered instruments are plain dict reads without lock,
+    only registration of a new instrument is serialized.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self._lock: Lock = Lock()
+
+        self._entries: dict[tuple[str, Exchange], tuple[int, str]] = {}
+        self._vt_entries: dict[str, tuple[int, str, Exchange]] = {}
+
+        self._symbols: list[tuple[str, Exchange]] = []
+        self._vt_symbols: list[str] = []
+
+    def register(self, symbol: str, exchange: Exchange) -> tuple[int, str]:
+        """
+        Get symbol id and vt_symbol of symbol and exchange, registering
+        the instrument if it was not seen before.
+        """
+        entry: tuple[int, str] | None = self._entries.get((symbol, exchange), None)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get((symbol, exchange), None)
+            if entry is not None:
+                return entry
+
+            symbol_id: int = len(self._vt_symbols)
+            vt_symbol: str = sys.intern(f"{symbol}.{exchange.value}")
+
+            self._symbols.append((symbol, exchange))
+            self._vt_symbols.append(vt_symbol)
+            self._vt_entries[vt_symbol] = (symbol_id, symbol, exchange)
+
+            # Published last, readers without lock then see a complete entry
+            entry = self._entries[(symbol, exchange)] = (symbol_id, vt_symbol)
+            return entry
+
+    def get_id(self, vt_symbol: str) -> int | None:
+        """
+        Get symbol id of a registered vt_symbol.
+        """
+        entry: tuple[int, str, Exchange] | None = self._vt_entries.get(vt_symbol, None)
+        if entry is None:
+            return None
+        return entry[0]
+
+    def get_vt_symbol(self, symbol_id: int) -> str:
+        """
+        Get vt_symbol of a symbol id.
+        """
+        return self._vt_symbols[symbol_id]
+
+    def get_symbol(self, symbol_id: int) -> tuple[str, Exchange]:
+        """
+        Get symbol and exchange of a symbol id.
+        """
+        return self._symbols[symbol_id]
+
+    def extract(self, vt_symbol: str) -> tuple[str, Exchange]:
+        """
+        Get symbol and exchange of vt_symbol, parsing and registering it
+        if it was not seen before.
+        """
+        entry: tuple[int, str, Exchange] | None = self._vt_entries.get(vt_symbol, None)
+        if entry is not None:
+            return entry[1], entry[2]
+
+        symbol, exchange_str = vt_symbol.rsplit(".", 1)
+        exchange: Exchange = Exchange(exchange_str)
+        self.register(symbol, exchange)
+        return symbol, exchange
+
+    def __len__(self) -> int:
+        """
+        Number of instruments registered, also the next symbol id.
+        """
+        return len(self._vt_symbols)
+
+
+SYMBOL_REGISTRY: SymbolRegistry = SymbolRegistry()
@@ -0,0 +1,39 @@
+"""
+Epoch nanosecond timestamps of market data.
+"""
+
+from datetime import datetime, tzinfo
+import time
+
+NS_PER_US: int = 1_000
+NS_PER_MS: int = 1_000_000
+NS_PER_SECOND: int = 1_000_000_000
+NS_PER_MINUTE: int = 60 * NS_PER_SECOND
+NS_PER_HOUR: int = 60 * NS_PER_MINUTE
+
+
+def now_timestamp() -> int:
+    """
+    Get current time as epoch nanoseconds, truncated to microseconds
+    (the resolution of datetime) so that it converts to datetime and
+    back exactly.
+    """
+    return time.time_ns() // NS_PER_US * NS_PER_US
+
+
+def datetime_to_timestamp(dt: datetime) -> int:
+    """
+    Convert datetime to epoch nanoseconds. Naive datetimes are local
+    time, as returned by datetime.now.
+    """
+    seconds: int = int(dt.replace(microsecond=0).timestamp())
+    return (seconds * 1_000_000 + dt.microsecond) * NS_PER_US
+
+
+def timestamp_to_datetime(timestamp: int, tz: tzinfo | None = None) -> datetime:
+    """
+    Convert epoch nanoseconds to datetime in timezone tz, truncated to
+    microseconds. Without tz the datetime is naive local time, as
+    returned by datetime.now.
+    """
+    return datetime.fromtimestamp(timestamp // NS_PER_US / 1_000_000, tz)
@@ -4,9 +4,7 @@ General utility functions.
 
 from collections.abc import Callable
 from datetime import datetime, time
-from decimal import Decimal
 import json
-from math import ceil, floor
 from pathlib import Path
 import sys
 from typing import Any
@@ -18,23 +16,29 @@ from zoneinfo import (
 import numpy as np
 import talib
 
+from .batch import BarBatch
 from .constants import Exchange, Interval
 from .object import BarData, TickData
+from .price_math import (
+    get_digits,  # noqa
+    get_price_tick,
+)
+from .symbol_registry import SYMBOL_REGISTRY
+from .timestamp import NS_PER_MINUTE
 
 
 def extract_vt_symbol(vt_symbol: str) -> tuple[str, Exchange]:
     """
     :return: (symbol, exchange)
     """
-    symbol, exchange_str = vt_symbol.rsplit(".", 1)
-    return symbol, Exchange(exchange_str)
+    return SYMBOL_REGISTRY.extract(vt_symbol)
 
 
 def generate_vt_symbol(symbol: str, exchange: Exchange) -> str:
     """
     return vt_symbol
     """
-    return f"{symbol}.{exchange.value}"
+    return SYMBOL_REGISTRY.register(symbol, exchange)[1]
 
 
 def _get_trader_dir(temp_name: str) -> tuple[Path, Path]:
@@ -117,45 +121,21 @@ def round_to(value: float, target: float) -> float:
     """
     Round price to price tick value.
     """
-    decimal_value: Decimal = Decimal(str(value))
-    decimal_target: Decimal = Decimal(str(target))
-    rounded: float = float(int(round(decimal_value / decimal_target)) * decimal_target)
-    return rounded
+    return get_price_tick(target).round(value)
 
 
 def floor_to(value: float, target: float) -> float:
     """
     Similar to math.floor function, but to target float number.
     """
-    decimal_value: Decimal = Decimal(str(value))
-    decimal_target: Decimal = Decimal(str(target))
-    result: float = float(int(floor(decimal_value / decimal_target)) * decimal_target)
-    return result
+    return get_price_tick(target).floor(value)
 
 
 def ceil_to(value: float, target: float) -> float:
     """
     Similar to math.ceil function, but to target float number.
     """
-    decimal_value: Decimal = Decimal(str(value))
-    decimal_target: Decimal = Decimal(str(target))
-    result: float = float(int(ceil(decimal_value / decimal_target)) * decimal_target)
-    return result
-
-
-def get_digits(value: float) -> int:
-    """
-    Get number of digits after decimal point.
-    """
-    value_str: str = str(value)
-
-    if "e-" in value_str:
-        _, buf = value_str.split("e-")
-        return int(buf)
-    if "." in value_str:
-        _, buf = value_str.split(".")
-        return len(buf)
-    return 0
+    return get_price_tick(target).ceil(value)
 
 
 class BarGenerator:
@@ -179,6 +159,8 @@ class BarGenerator:
         """Constructor"""
         self.bar: BarData | None = None
         self.on_bar: Callable[[BarData], None] = on_bar
+        # Minute since epoch of bar
+        self.bar_minute: int = 0
 
         self.interval: Interval = interval
         self.interval_count: int = 0
@@ -206,22 +188,26 @@ class BarGenerator:
         if not tick.last_price:
             return
 
+        # Minutes since epoch, as utc offsets are whole minutes
+        timestamp: int = tick.timestamp
+        minute: int = timestamp // NS_PER_MINUTE
+
         if not self.bar:
             new_minute = True
-        elif (self.bar.datetime.minute != tick.datetime.minute) or (
-            self.bar.datetime.hour != tick.datetime.hour
-        ):
-            self.bar.datetime = self.bar.datetime.replace(second=0, microsecond=0)
+        elif minute != self.bar_minute:
+            self.bar.timestamp = self.bar_minute * NS_PER_MINUTE
             self.on_bar(self.bar)
 
             new_minute = True
 
         if new_minute:
+            self.bar_minute = minute
             self.bar = BarData(
                 symbol=tick.symbol,
                 exchange=tick.exchange,
                 interval=Interval.MINUTE,
-                datetime=tick.datetime,
+                timestamp=timestamp,
+                tz=tick.tz,
                 adapter_name=tick.adapter_name,
                 open_price=tick.last_price,
                 high_price=tick.last_price,
@@ -240,7 +226,7 @@ class BarGenerator:
 
             self.bar.close_price = tick.last_price
             self.bar.open_interest = tick.open_interest
-            self.bar.datetime = tick.datetime
+            self.bar.timestamp = timestamp
 
         if self.last_tick and self.bar:
             volume_change: float = tick.volume - self.last_tick.volume
@@ -437,7 +423,7 @@ class BarGenerator:
         bar: BarData | None = self.bar
 
         if bar:
-            bar.datetime = bar.datetime.replace(second=0, microsecond=0)
+            bar.timestamp = self.bar_minute * NS_PER_MINUTE
             self.on_bar(bar)
 
         self.bar = None
@@ -489,6 +475,31 @@ class ArrayManager:
         self.turnover_array[-1] = bar.turnover
         self.open_interest_array[-1] = bar.open_interest
 
+    def update_batch(self, batch: BarBatch) -> None:
+        """
+        Update all bars of a batch into array manager at once.
+        """
+        n: int = min(len(batch), self.size)
+        self.count += len(batch)
+        if not self.inited and self.count >= self.size:
+            self.inited = True
+
+        if not n:
+            return
+
+        data: np.ndarray = batch.data[-n:]
+        for array, name in (
+            (self.open_array, "open_price"),
+            (self.high_array, "high_price"),
+            (self.low_array, "low_price"),
+            (self.close_array, "close_price"),
+            (self.volume_array, "volume"),
+            (self.turnover_array, "turnover"),
+            (self.open_interest_array, "open_interest"),
+        ):
+            array[:-n] = array[n:]
+            array[-n:] = data[name]
+
     @property
     def open(self) -> np.ndarray:
         """
@@ -0,0 +1,96 @@
+"""
+Socket to screen latency benchmark.
+
+Compares the latency of an event from an adapter to a handler on the UI
+loop: through the thread-based EventEngine and a hand over to the UI
+loop with call_soon_threadsafe, as before, and through AsyncEventEngine
+sharing one loop with adapter and UI, without any thread hop.
+"""
+
+import asyncio
+import statistics
+import threading
+from time import perf_counter
+
+import pytest
+
+from foxtrot.core.async_event_engine import AsyncEventEngine
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.util.event_type import EVENT_LOG
+
+EVENT_COUNT = 2000
+
+
+def run_threaded() -> list[float]:
+    """Get latencies of events passed from adapter thread to UI loop through EventEngine."""
+    ui_loop = asyncio.new_event_loop()
+    ui_thread = threading.Thread(target=ui_loop.run_forever)
+    ui_thread.start()
+
+    engine = EventEngine(interval=60)
+    latencies: list[float] = []
+    received = threading.Event()
+
+    def on_screen(sent: float) -> None:
+        latencies.append(perf_counter() - sent)
+        received.set()
+
+    engine.register(EVENT_LOG, lambda event: ui_loop.call_soon_threadsafe(on_screen, event.data))
+    engine.start()
+
+    try:
+        for _ in range(EVENT_COUNT):
+            received.clear()
+            engine.put(Event(EVENT_LOG, perf_counter()))
+            received.wait(5)
+    finally:
+        engine.stop()
+        ui_loop.call_soon_threadsafe(ui_loop.stop)
+        ui_thread.join()
+        ui_loop.close()
+
+    return latencies
+
+
+def run_async() -> list[float]:
+    """Get latencies of events passed from adapter to UI handler on one loop."""
+    latencies: list[float] = []
+
+    async def main() -> None:
+        engine = AsyncEventEngine(interval=60)
+        received = asyncio.Event()
+
+        def on_screen(event: Event) -> None:
+            latencies.append(perf_counter() - event.data)
+            received.set()
+
+        engine.register(EVENT_LOG, on_screen)
+        engine.start()
+
+        try:
+            for _ in range(EVENT_COUNT):
+                received.clear()
+                engine.put(Event(EVENT_LOG, perf_counter()))
+                await received.wait()
+        finally:
+            engine.stop()
+
+    asyncio.run(main())
+    return latencies
+
+
+class TestAsyncEngineLatency:
+    """Benchmark event latency with and without thread hops."""
+
+    @pytest.mark.timeout(120)
+    def test_threaded_vs_shared_loop(self):
+        """Compare median and p99 latency from adapter to UI handler."""
+        results = {"threaded": run_threaded(), "shared loop": run_async()}
+
+        print(f"\nAdapter to UI handler latency ({EVENT_COUNT} events):")
+        for name, latencies in results.items():
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(f"  {name:11}: p50 {statistics.median(latencies) * 1e6:7.1f}us, p99 {p99 * 1e6:7.1f}us")
+
+        assert len(results["threaded"]) == len(results["shared loop"]) == EVENT_COUNT
+        assert statistics.median(results["shared loop"]) < statistics.median(results["threaded"])
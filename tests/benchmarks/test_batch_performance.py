@@ -0,0 +1,112 @@
+"""
+Columnar batch benchmark of history data.
+
+Compares loading a year of 1-minute bars of one instrument as a list of
+BarData with filling a BarBatch directly from the query columns (as a
+database driver overriding load_bar_batch would): load time and memory,
+extrapolated to 500 instruments.
+"""
+
+from datetime import datetime, timedelta
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from foxtrot.util.batch import BarBatch
+from foxtrot.util.constants import Exchange, Interval
+from foxtrot.util.object import BarData
+
+BAR_COUNT = 365 * 24 * 60
+SYMBOL_COUNT = 500
+
+
+def create_columns() -> dict[str, np.ndarray]:
+    """Create columns as returned by a history or database query."""
+    prices = 42000.0 + np.cumsum(np.random.default_rng(0).normal(size=BAR_COUNT))
+    return {
+        "datetime": np.datetime64("2024-01-01T00:00", "ns") + np.arange(BAR_COUNT) * np.timedelta64(1, "m"),
+        "open_price": prices,
+        "high_price": prices + 1,
+        "low_price": prices - 1,
+        "close_price": prices + 0.5,
+        "volume": np.full(BAR_COUNT, 2.0),
+    }
+
+
+def load_bars(columns: dict[str, np.ndarray]) -> list[BarData]:
+    """Load columns into one BarData per row."""
+    start = datetime(2024, 1, 1)
+    rows = zip(
+        columns["open_price"].tolist(),
+        columns["high_price"].tolist(),
+        columns["low_price"].tolist(),
+        columns["close_price"].tolist(),
+        columns["volume"].tolist(),
+    )
+    return [
+        BarData(
+            adapter_name="DB",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            datetime=start + timedelta(minutes=i),
+            interval=Interval.MINUTE,
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=close_price,
+            volume=volume,
+        )
+        for i, (open_price, high_price, low_price, close_price, volume) in enumerate(rows)
+    ]
+
+
+def load_batch(columns: dict[str, np.ndarray]) -> BarBatch:
+    """Load columns into a batch without creating objects."""
+    data = np.zeros(BAR_COUNT, dtype=BarBatch.dtype)
+    for name, column in columns.items():
+        data[name] = column
+    return BarBatch(data, None, adapter_name="DB", symbol="BTCUSDT", exchange=Exchange.BINANCE, interval=Interval.MINUTE)
+
+
+def measure(load, columns: dict[str, np.ndarray]) -> tuple[float, float]:
+    """Get seconds to load and bytes held by the result."""
+    gc.collect()
+    start = time.perf_counter()
+    result = load(columns)
+    elapsed = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = load(columns)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del result
+    return elapsed, size
+
+
+class TestBatchPerformance:
+    """Benchmark BarBatch against list of BarData."""
+
+    @pytest.mark.timeout(300)
+    def test_year_of_minute_bars(self):
+        """Compare load time and memory of a year of 1-minute bars."""
+        columns = create_columns()
+
+        list_time, list_size = measure(load_bars, columns)
+        batch_time, batch_size = measure(load_batch, columns)
+
+        print(f"\nLoading {BAR_COUNT} 1-minute bars:")
+        print(f"  list of BarData: {list_time * 1000:8.1f}ms, {list_size / 1e6:7.1f}MB")
+        print(f"  BarBatch:        {batch_time * 1000:8.1f}ms, {batch_size / 1e6:7.1f}MB")
+        print(
+            f"  {SYMBOL_COUNT} symbols: {list_size * SYMBOL_COUNT / 1e9:.1f}GB vs "
+            f"{batch_size * SYMBOL_COUNT / 1e9:.1f}GB"
+        )
+
+        assert batch_time < list_time
+        assert batch_size * 4 < list_size
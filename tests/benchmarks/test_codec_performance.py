@@ -0,0 +1,171 @@
+"""
+Serialization benchmark of data objects.
+
+Compares the binary codec with pickle and with JSON of hand-converted
+dicts (as done by the CSV exporters): encoded size and encode/decode
+throughput of single objects and batches.
+"""
+
+from dataclasses import fields
+from datetime import datetime
+from enum import Enum
+import json
+import pickle
+import time
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from foxtrot.util.codec import decode_batch, decode_data, encode_batch, encode_data
+from foxtrot.util.constants import Direction, Exchange, Offset, OrderType, Status
+from foxtrot.util.object import OrderData, TickData
+
+OBJECT_COUNT = 20_000
+
+
+def create_objects() -> list[Any]:
+    """Create ticks and orders with typical field values."""
+    tz = ZoneInfo("Asia/Shanghai")
+    objects: list[Any] = []
+
+    for i in range(OBJECT_COUNT):
+        if i % 4:
+            objects.append(TickData(
+                adapter_name="BINANCE",
+                symbol="BTCUSDT",
+                exchange=Exchange.BINANCE,
+                datetime=datetime(2024, 1, 1, 9, 30, tzinfo=tz),
+                last_price=42000.0 + i,
+                volume=1.5 * i,
+                bid_price_1=41999.5 + i,
+                ask_price_1=42000.5 + i,
+                bid_volume_1=2.0,
+                ask_volume_1=3.0,
+            ))
+        else:
+            objects.append(OrderData(
+                adapter_name="BINANCE",
+                symbol="BTCUSDT",
+                exchange=Exchange.BINANCE,
+                orderid=str(i),
+                type=OrderType.LIMIT,
+                direction=Direction.LONG,
+                offset=Offset.OPEN,
+                price=42000.0,
+                volume=1,
+                status=Status.NOTTRADED,
+                datetime=datetime(2024, 1, 1, 9, 30, tzinfo=tz),
+            ))
+
+    return objects
+
+
+def to_dict(data: Any) -> dict:
+    """Convert data object to JSON serializable dict."""
+    result: dict = {}
+    for f in fields(data):
+        if not f.init:
+            continue
+
+        value: Any = getattr(data, f.name)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        result[f.name] = value
+    return result
+
+
+def from_dict(data_class: type, values: dict) -> Any:
+    """Convert dict back to data object, as a JSON consumer would."""
+    kwargs: dict = dict(values)
+    kwargs["exchange"] = Exchange(kwargs["exchange"])
+    kwargs["datetime"] = datetime.fromisoformat(kwargs["datetime"])
+    if data_class is OrderData:
+        kwargs["type"] = OrderType(kwargs["type"])
+        kwargs["direction"] = Direction(kwargs["direction"])
+        kwargs["offset"] = Offset(kwargs["offset"])
+        kwargs["status"] = Status(kwargs["status"])
+    return data_class(**kwargs)
+
+
+def json_encode(data: Any) -> bytes:
+    """Encode data object as JSON."""
+    return json.dumps({"class": type(data).__name__, "data": to_dict(data)}).encode()
+
+
+def json_decode(buffer: bytes) -> Any:
+    """Decode data object from JSON."""
+    values: dict = json.loads(buffer)
+    data_class: type = TickData if values["class"] == "TickData" else OrderData
+    return from_dict(data_class, values["data"])
+
+
+def measure(encode, decode, objects: list[Any]) -> tuple[float, float, float]:
+    """Get bytes per object and encoded/decoded objects per second."""
+    start = time.perf_counter()
+    records = [encode(data) for data in objects]
+    encode_rate = len(objects) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    decoded = [decode(record) for record in records]
+    decode_rate = len(objects) / (time.perf_counter() - start)
+
+    assert decoded == objects
+    return sum(len(record) for record in records) / len(objects), encode_rate, decode_rate
+
+
+class TestCodecPerformance:
+    """Benchmark binary codec against pickle and JSON."""
+
+    @pytest.mark.timeout(120)
+    def test_codec_vs_pickle_and_json(self):
+        """Compare size and throughput of single object serialization."""
+        objects = create_objects()
+
+        results = {
+            "codec": measure(encode_data, decode_data, objects),
+            "pickle": measure(lambda data: pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads, objects),
+            "json": measure(json_encode, json_decode, objects),
+        }
+
+        print(f"\nSerialization of {OBJECT_COUNT} ticks and orders:")
+        for name, (size, encode_rate, decode_rate) in results.items():
+            print(
+                f"  {name:6}: {size:6.0f} bytes, "
+                f"encode {encode_rate / 1000:7.1f}K/s, decode {decode_rate / 1000:7.1f}K/s"
+            )
+
+        # Records do not repeat class and field names, unlike pickle and JSON
+        assert results["codec"][0] < results["pickle"][0]
+        assert results["codec"][0] < results["json"][0]
+
+    @pytest.mark.timeout(120)
+    def test_batch_vs_pickle(self):
+        """Compare size and throughput of batch serialization with a pickled list."""
+        objects = create_objects()
+
+        start = time.perf_counter()
+        buffer = encode_batch(objects)
+        codec_encode = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded = decode_batch(buffer)
+        codec_decode = time.perf_counter() - start
+        assert decoded == objects
+
+        start = time.perf_counter()
+        pickled = pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle_encode = time.perf_counter() - start
+        start = time.perf_counter()
+        unpickled = pickle.loads(pickled)
+        pickle_decode = time.perf_counter() - start
+        assert unpickled == objects
+
+        print(f"\nBatch of {OBJECT_COUNT} ticks and orders:")
+        print(f"  codec : {len(buffer)} bytes, encode {codec_encode * 1000:.1f}ms, decode {codec_decode * 1000:.1f}ms")
+        print(f"  pickle: {len(pickled)} bytes, encode {pickle_encode * 1000:.1f}ms, decode {pickle_decode * 1000:.1f}ms")
+
+        # Pickle memoizes class and repeated strings within one list, so
+        # large homogeneous batches are comparable in size
+        assert len(buffer) < 2 * len(pickled)
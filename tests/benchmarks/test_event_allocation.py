@@ -0,0 +1,115 @@
+"""
+Allocation benchmark of Event objects.
+
+Compares the former dict based Event with the slotted Event and pooled
+event objects: memory per event, allocation throughput and number of
+garbage collections while a tick stream is processed.
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventPool
+from foxtrot.util.event_type import EVENT_TICK
+
+EVENT_COUNT = 200_000
+# Backlog drained per wakeup under load, above the young generation
+# threshold (700) so that allocations trigger collections
+BATCH_SIZE = 1024
+
+
+class DictEvent:
+    """Event as defined before slots were added."""
+
+    def __init__(self, type: str, data: Any = None) -> None:
+        self.type: str = type
+        self.data: Any = data
+
+
+def measure_memory(event_class: type) -> float:
+    """Get bytes allocated per event held alive."""
+    tracemalloc.start()
+    events = [event_class(EVENT_TICK, i) for i in range(10_000)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del events
+    return current / 10_000
+
+
+def run_stream(create, release=None) -> tuple[float, int, float]:
+    """
+    Create events in batches as drained by a worker, keeping every
+    batch alive until processed. Return events per second, number of
+    collections and total collection pause in seconds.
+    """
+    collections = 0
+    pause = 0.0
+    started = 0.0
+
+    def on_gc(phase: str, info: dict) -> None:
+        nonlocal collections, pause, started
+        if phase == "start":
+            started = time.perf_counter()
+        else:
+            collections += 1
+            pause += time.perf_counter() - started
+
+    gc.collect()
+    gc.callbacks.append(on_gc)
+    start = time.perf_counter()
+
+    try:
+        for _ in range(EVENT_COUNT // BATCH_SIZE):
+            batch = [create(EVENT_TICK, i) for i in range(BATCH_SIZE)]
+
+            if release:
+                for event in batch:
+                    release(event)
+    finally:
+        elapsed = time.perf_counter() - start
+        gc.callbacks.remove(on_gc)
+
+    return EVENT_COUNT / elapsed, collections, pause
+
+
+class TestEventAllocation:
+    """Benchmark event allocation strategies."""
+
+    @pytest.mark.timeout(60)
+    def test_memory_per_event(self):
+        """Test slotted events use less memory than dict based ones."""
+        dict_size = measure_memory(DictEvent)
+        slot_size = measure_memory(Event)
+
+        print("\nMemory per event:")
+        print(f"  dict based: {dict_size:.0f} bytes")
+        print(f"  slotted:    {slot_size:.0f} bytes")
+
+        assert slot_size < dict_size
+
+    @pytest.mark.timeout(60)
+    def test_allocation_rate_and_gc(self):
+        """Compare throughput and collections of dict, slotted and pooled events."""
+        pool = EventPool(size=BATCH_SIZE)
+
+        results = {
+            "dict based": run_stream(DictEvent),
+            "slotted": run_stream(Event),
+            "pooled": run_stream(pool.acquire, pool.release),
+        }
+
+        print(f"\nEvent allocation ({EVENT_COUNT} events, batches of {BATCH_SIZE}):")
+        for name, (rate, collections, pause) in results.items():
+            print(
+                f"  {name:10}: {rate / 1e6:.2f}M events/s, "
+                f"{collections} collections, {pause * 1000:.2f}ms paused"
+            )
+
+        # Pooled events are not allocated once the pool is warm, so they
+        # never trigger a young generation collection
+        assert results["pooled"][1] <= results["slotted"][1]
@@ -0,0 +1,143 @@
+"""
+Allocation benchmark of data objects.
+
+Compares TickData as defined before slots were added, with a __dict__
+and a vt_symbol formatted per instance, with the slotted TickData using
+interned vt_symbol: memory and construction time of 1M ticks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from foxtrot.util.constants import Exchange
+from foxtrot.util.object import TickData
+
+TICK_COUNT = 1_000_000
+# Memory is measured on fewer ticks held alive at once and scaled up
+MEMORY_COUNT = 100_000
+CHUNK_SIZE = 10_000
+
+
+@dataclass
+class DictTickData:
+    """TickData as defined before slots were added."""
+
+    adapter_name: str
+    symbol: str
+    exchange: Exchange
+    datetime: datetime
+
+    name: str = ""
+    volume: float = 0
+    turnover: float = 0
+    open_interest: float = 0
+    last_price: float = 0
+    last_volume: float = 0
+    limit_up: float = 0
+    limit_down: float = 0
+
+    open_price: float = 0
+    high_price: float = 0
+    low_price: float = 0
+    pre_close: float = 0
+
+    bid_price_1: float = 0
+    bid_price_2: float = 0
+    bid_price_3: float = 0
+    bid_price_4: float = 0
+    bid_price_5: float = 0
+
+    ask_price_1: float = 0
+    ask_price_2: float = 0
+    ask_price_3: float = 0
+    ask_price_4: float = 0
+    ask_price_5: float = 0
+
+    bid_volume_1: float = 0
+    bid_volume_2: float = 0
+    bid_volume_3: float = 0
+    bid_volume_4: float = 0
+    bid_volume_5: float = 0
+
+    ask_volume_1: float = 0
+    ask_volume_2: float = 0
+    ask_volume_3: float = 0
+    ask_volume_4: float = 0
+    ask_volume_5: float = 0
+
+    localtime: datetime | None = None
+    extra: dict | None = None
+
+    def __post_init__(self) -> None:
+        """"""
+        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+
+
+def create_ticks(tick_class: type, count: int) -> list:
+    """Create ticks of a few symbols."""
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT"]
+    dt = datetime(2024, 1, 1)
+
+    return [
+        tick_class(
+            adapter_name="BINANCE",
+            symbol=symbols[i & 3],
+            exchange=Exchange.BINANCE,
+            datetime=dt,
+            last_price=42000.0,
+            bid_price_1=41999.5,
+            ask_price_1=42000.5,
+        )
+        for i in range(count)
+    ]
+
+
+def measure_memory(tick_class: type) -> float:
+    """Get bytes allocated per tick held alive."""
+    gc.collect()
+    tracemalloc.start()
+    ticks = create_ticks(tick_class, MEMORY_COUNT)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del ticks
+    return current / MEMORY_COUNT
+
+
+def measure_time(tick_class: type) -> float:
+    """Get seconds to construct TICK_COUNT ticks, created in chunks."""
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(TICK_COUNT // CHUNK_SIZE):
+        create_ticks(tick_class, CHUNK_SIZE)
+    return time.perf_counter() - start
+
+
+class TestObjectAllocation:
+    """Benchmark slotted data objects."""
+
+    @pytest.mark.timeout(300)
+    def test_slotted_tick_memory_and_construction(self):
+        """Compare memory and construction time of dict based and slotted ticks."""
+        dict_size = measure_memory(DictTickData)
+        slot_size = measure_memory(TickData)
+        dict_time = measure_time(DictTickData)
+        slot_time = measure_time(TickData)
+
+        print(f"\nConstruction of {TICK_COUNT} ticks:")
+        print(f"  dict based: {dict_size:6.0f} bytes/tick, {dict_time:.2f}s")
+        print(f"  slotted:    {slot_size:6.0f} bytes/tick, {slot_time:.2f}s")
+        print(f"  saved:      {(dict_size - slot_size) * TICK_COUNT / 1e6:.0f} MB per 1M ticks")
+
+        assert slot_size < dict_size
+
+        # vt_symbol strings are shared between ticks of the same symbol
+        ticks = create_ticks(TickData, 5)
+        assert ticks[0].vt_symbol is ticks[4].vt_symbol
@@ -0,0 +1,74 @@
+"""
+Order management index benchmark.
+
+Compares finding active orders of one symbol among many orders by
+scanning all active orders, as callers had to before, with the
+secondary index of OmsEngine, and measures the cost the indexes add to
+processing order events.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.server.engine import OmsEngine
+from foxtrot.util.constants import Exchange, Status
+from foxtrot.util.event_type import EVENT_ORDER
+from foxtrot.util.object import OrderData
+
+SYMBOL_COUNT = 200
+ORDER_COUNT = 20_000
+QUERY_COUNT = 2_000
+
+
+def create_events() -> list[Event]:
+    """Create order events over many symbols, half of them still active."""
+    events: list[Event] = []
+    for i in range(ORDER_COUNT):
+        order = OrderData(
+            adapter_name="BINANCE",
+            symbol=f"SYM{i % SYMBOL_COUNT}",
+            exchange=Exchange.BINANCE,
+            orderid=str(i),
+            status=Status.NOTTRADED if i % 2 else Status.ALLTRADED,
+        )
+        events.append(Event(EVENT_ORDER, order))
+    return events
+
+
+class TestOmsIndexPerformance:
+    """Benchmark OmsEngine index queries."""
+
+    @pytest.mark.timeout(300)
+    def test_scan_vs_index(self):
+        """Compare scanning active orders with indexed lookup by symbol."""
+        oms_engine = OmsEngine(MagicMock(), EventEngine())
+        events = create_events()
+
+        start = time.perf_counter()
+        for event in events:
+            oms_engine.process_order_event(event)
+        process_time = time.perf_counter() - start
+
+        symbols = [f"SYM{i % SYMBOL_COUNT}.BINANCE" for i in range(QUERY_COUNT)]
+
+        start = time.perf_counter()
+        scan_result = [
+            [order for order in oms_engine.get_all_active_orders() if order.vt_symbol == vt_symbol]
+            for vt_symbol in symbols
+        ]
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index_result = [oms_engine.get_active_orders_by_symbol(vt_symbol) for vt_symbol in symbols]
+        index_time = time.perf_counter() - start
+
+        print(f"\n{ORDER_COUNT} orders over {SYMBOL_COUNT} symbols:")
+        print(f"  process: {process_time / ORDER_COUNT * 1e6:8.2f}us/order")
+        print(f"  scan:    {scan_time / QUERY_COUNT * 1e6:8.2f}us/query")
+        print(f"  index:   {index_time / QUERY_COUNT * 1e6:8.2f}us/query")
+
+        assert index_result == scan_result
+        assert index_time * 10 < scan_time
@@ -0,0 +1,78 @@
+"""
+Order book update benchmark.
+
+Compares maintaining a 1000 level book incrementally from diff messages
+with rebuilding the sorted ladders from all levels on every message.
+"""
+
+import random
+import time
+
+import pytest
+
+from foxtrot.util.constants import Exchange
+from foxtrot.util.order_book import OrderBook
+
+MESSAGE_COUNT = 2000
+DEPTH = 1000
+
+
+def create_messages() -> list[tuple[list, list]]:
+    """Create diff messages changing a few levels around the touch."""
+    rng = random.Random(0)
+    messages: list[tuple[list, list]] = []
+    for _ in range(MESSAGE_COUNT):
+        bids = [[float(rng.randint(9000, 9999)), float(rng.randint(0, 5))] for _ in range(3)]
+        asks = [[float(rng.randint(10001, 11000)), float(rng.randint(0, 5))] for _ in range(3)]
+        messages.append((bids, asks))
+    return messages
+
+
+def create_book() -> OrderBook:
+    """Create book with full ladders on both sides."""
+    book = OrderBook("TEST", "BTCUSDT", Exchange.BINANCE, DEPTH)
+    book.apply_snapshot(
+        [[float(9999 - i), 1.0] for i in range(DEPTH)],
+        [[float(10001 + i), 1.0] for i in range(DEPTH)],
+    )
+    return book
+
+
+class TestOrderBookPerformance:
+    """Benchmark incremental order book updates."""
+
+    @pytest.mark.timeout(300)
+    def test_delta_vs_rebuild(self):
+        """Compare apply_delta with rebuilding the book per message."""
+        messages = create_messages()
+
+        book = create_book()
+        start = time.perf_counter()
+        for bids, asks in messages:
+            book.apply_delta(bids, asks)
+        delta_time = time.perf_counter() - start
+
+        rebuilt = create_book()
+        bid_levels = {float(9999 - i): 1.0 for i in range(DEPTH)}
+        ask_levels = {float(10001 + i): 1.0 for i in range(DEPTH)}
+        start = time.perf_counter()
+        for bids, asks in messages:
+            for levels, changes in ((bid_levels, bids), (ask_levels, asks)):
+                for price, volume in changes:
+                    if volume:
+                        levels[price] = volume
+                    else:
+                        levels.pop(price, None)
+            rebuilt.apply_snapshot(
+                sorted(bid_levels.items(), reverse=True)[:DEPTH],
+                sorted(ask_levels.items())[:DEPTH],
+            )
+        rebuild_time = time.perf_counter() - start
+
+        print(f"\n{MESSAGE_COUNT} diff messages on a {DEPTH} level book:")
+        print(f"  apply_delta: {delta_time / MESSAGE_COUNT * 1e6:8.1f}us/message")
+        print(f"  rebuild:     {rebuild_time / MESSAGE_COUNT * 1e6:8.1f}us/message")
+
+        assert book.bids.prices.tolist() == rebuilt.bids.prices.tolist()
+        assert book.asks.volumes.tolist() == rebuilt.asks.volumes.tolist()
+        assert delta_time < rebuild_time
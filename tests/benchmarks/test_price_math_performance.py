@@ -0,0 +1,61 @@
+"""
+Price rounding benchmark.
+
+Compares rounding prices to the price tick with the previous Decimal
+implementation of round_to, the integer tick scalar path and the
+vectorized path for an array of prices.
+"""
+
+from decimal import Decimal
+import random
+import time
+
+import numpy as np
+import pytest
+
+from foxtrot.util.price_math import get_price_tick
+from foxtrot.util.utility import round_to
+
+PRICE_COUNT = 100_000
+PRICETICK = 0.01
+
+
+def decimal_round_to(value: float, target: float) -> float:
+    """Round price to tick on Decimal values, as round_to used to."""
+    decimal_value: Decimal = Decimal(str(value))
+    decimal_target: Decimal = Decimal(str(target))
+    return float(int(round(decimal_value / decimal_target)) * decimal_target)
+
+
+class TestPriceMathPerformance:
+    """Benchmark price rounding."""
+
+    @pytest.mark.timeout(300)
+    def test_decimal_vs_ticks(self):
+        """Compare Decimal rounding with scalar and vectorized tick rounding."""
+        rng = random.Random(0)
+        prices = [rng.uniform(1000, 50000) for _ in range(PRICE_COUNT)]
+        array = np.array(prices)
+
+        start = time.perf_counter()
+        decimal_result = [decimal_round_to(price, PRICETICK) for price in prices]
+        decimal_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scalar_result = [round_to(price, PRICETICK) for price in prices]
+        scalar_time = time.perf_counter() - start
+
+        price_tick = get_price_tick(PRICETICK)
+        start = time.perf_counter()
+        array_result = price_tick.round_array(array)
+        array_time = time.perf_counter() - start
+
+        print(f"\nRounding {PRICE_COUNT} prices to {PRICETICK}:")
+        print(f"  Decimal:    {decimal_time / PRICE_COUNT * 1e9:8.0f}ns/price")
+        print(f"  round_to:   {scalar_time / PRICE_COUNT * 1e9:8.0f}ns/price")
+        print(f"  vectorized: {array_time / PRICE_COUNT * 1e9:8.1f}ns/price")
+
+        assert scalar_result == decimal_result
+        assert array_result.tolist() == decimal_result
+        assert scalar_time < decimal_time
+        assert array_time < scalar_time
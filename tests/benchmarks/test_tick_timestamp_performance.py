@@ -0,0 +1,124 @@
+"""
+Tick timestamp benchmark.
+
+Compares the tick path of an adapter converting exchange millisecond
+times into ticks and a BarGenerator building minute bars from them:
+with a datetime built per tick and bar boundaries found from its minute
+and hour as before, and with epoch nanosecond timestamps and integer
+division.
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+import time
+
+import pytest
+
+from foxtrot.util.constants import Exchange, Interval
+from foxtrot.util.object import BarData, TickData
+from foxtrot.util.timestamp import NS_PER_MS
+from foxtrot.util.utility import BarGenerator
+
+TICK_COUNT = 100_000
+ROUNDS = 3
+# Exchange times of ticks, ten per second
+START_MS = 1_700_000_000_000
+TIMES = [START_MS + i * 100 for i in range(TICK_COUNT)]
+
+
+class DatetimeBarGenerator(BarGenerator):
+    """BarGenerator finding minute bars from tick datetimes, as before."""
+
+    def update_tick(self, tick: TickData) -> None:
+        """Update tick comparing minute and hour of datetimes."""
+        if not tick.last_price:
+            return
+
+        new_minute = False
+        if not self.bar:
+            new_minute = True
+        elif (self.bar.datetime.minute != tick.datetime.minute) or (
+            self.bar.datetime.hour != tick.datetime.hour
+        ):
+            self.bar.datetime = self.bar.datetime.replace(second=0, microsecond=0)
+            self.on_bar(self.bar)
+            new_minute = True
+
+        if new_minute:
+            self.bar = BarData(
+                symbol=tick.symbol,
+                exchange=tick.exchange,
+                interval=Interval.MINUTE,
+                datetime=tick.datetime,
+                adapter_name=tick.adapter_name,
+                open_price=tick.last_price,
+                high_price=tick.last_price,
+                low_price=tick.last_price,
+                close_price=tick.last_price,
+            )
+        else:
+            self.bar.high_price = max(self.bar.high_price, tick.last_price)
+            self.bar.low_price = min(self.bar.low_price, tick.last_price)
+            self.bar.close_price = tick.last_price
+            self.bar.datetime = tick.datetime
+
+        self.last_tick = tick
+
+
+def run_datetime_ticks(bars: list[BarData]) -> None:
+    """Convert exchange times into ticks with datetimes, as before."""
+    generator = DatetimeBarGenerator(bars.append)
+    for ms in TIMES:
+        tick = TickData(
+            adapter_name="BINANCE",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            datetime=datetime.fromtimestamp(ms / 1000),
+            last_price=42000.0,
+        )
+        generator.update_tick(tick)
+
+
+def run_timestamp_ticks(bars: list[BarData]) -> None:
+    """Convert exchange times into ticks with timestamps."""
+    generator = BarGenerator(bars.append)
+    for ms in TIMES:
+        tick = TickData(
+            adapter_name="BINANCE",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            timestamp=ms * NS_PER_MS,
+            last_price=42000.0,
+        )
+        generator.update_tick(tick)
+
+
+def best_time(run: Callable[[list[BarData]], None], bars: list[BarData]) -> float:
+    """Get best time of a few runs, filling bars of the last run."""
+    times: list[float] = []
+    for _ in range(ROUNDS):
+        bars.clear()
+        start = time.perf_counter()
+        run(bars)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+class TestTickTimestampPerformance:
+    """Benchmark tick path with datetimes and timestamps."""
+
+    @pytest.mark.timeout(300)
+    def test_datetime_vs_timestamp(self):
+        """Compare converting ticks and generating minute bars."""
+        datetime_bars: list[BarData] = []
+        datetime_time = best_time(run_datetime_ticks, datetime_bars)
+
+        timestamp_bars: list[BarData] = []
+        timestamp_time = best_time(run_timestamp_ticks, timestamp_bars)
+
+        print(f"\n{TICK_COUNT} ticks into minute bars:")
+        print(f"  datetime:  {datetime_time / TICK_COUNT * 1e9:8.0f}ns/tick")
+        print(f"  timestamp: {timestamp_time / TICK_COUNT * 1e9:8.0f}ns/tick")
+
+        assert [bar.datetime for bar in timestamp_bars] == [bar.datetime for bar in datetime_bars]
+        assert timestamp_time < datetime_time
@@ -0,0 +1,66 @@
+"""
+Wakeup latency benchmark of EventEngine wait modes.
+
+Puts events one at a time into the queue of an idle worker and reports
+wakeup latency percentiles of blocking only and of spinning before
+blocking, for choosing spin_time per deployment.
+"""
+
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.util.event_type import EVENT_LOG
+
+EVENT_COUNT = 500
+# Gap between events, long enough for the worker to be idle again
+EVENT_GAP = 0.001
+
+
+def run_engine(spin_time: float) -> dict[str, dict]:
+    """Put events into an idle engine and get its wakeup stats."""
+    engine = EventEngine(interval=60, profile=True, spin_time=spin_time)
+    received = []
+    engine.register(EVENT_LOG, received.append)
+    engine.start()
+
+    try:
+        for i in range(EVENT_COUNT):
+            time.sleep(EVENT_GAP)
+            engine.put(Event(EVENT_LOG, i))
+
+        deadline = time.time() + 5
+        while len(received) < EVENT_COUNT and time.time() < deadline:
+            time.sleep(0.001)
+
+        return engine.get_wakeup_stats()
+    finally:
+        engine.stop()
+
+
+class TestWakeupLatency:
+    """Benchmark wakeup latency of blocking and spinning workers."""
+
+    @pytest.mark.timeout(60)
+    def test_spin_vs_block(self):
+        """Compare wakeup latency percentiles with and without spinning."""
+        results = {
+            "block": run_engine(0.0),
+            "spin 5ms": run_engine(0.005),
+        }
+
+        print(f"\nWakeup latency ({EVENT_COUNT} events, {EVENT_GAP * 1000:.0f}ms apart):")
+        for name, stats in results.items():
+            for mode, mode_stats in stats.items():
+                print(
+                    f"  {name:9} [{mode:5}]: {mode_stats['count']} wakeups, "
+                    f"p50 {mode_stats['p50'] * 1e6:.0f}us, "
+                    f"p99 {mode_stats['p99'] * 1e6:.0f}us, "
+                    f"max {mode_stats['max'] * 1e6:.0f}us"
+                )
+
+        # Events arrive well within spin time, so the spinning worker
+        # should mostly be woken while spinning
+        spin_stats = results["spin 5ms"]
+        assert spin_stats["spin"]["count"] > spin_stats.get("block", {"count": 0})["count"]
@@ -280,6 +280,36 @@ class TestBinanceMarketDataWebSocket:
         assert emitted_events[0].type == EVENT_TICK
         assert isinstance(emitted_events[0].data, TickData)
 
+    @pytest.mark.asyncio
+    async def test_watch_depth_async(self, market_data, mock_api_client):
+        """Test order book updates are pushed as copies through adapter on_depth."""
+        market_data._subscribed_symbols.add("BTCUSDT.BINANCE")
+        market_data._active = True
+        mock_api_client.depth_levels = 5
+
+        books = []
+
+        def on_depth(book):
+            books.append(book)
+            if len(books) == 2:
+                market_data._active = False
+
+        mock_api_client.adapter = MagicMock()
+        mock_api_client.adapter.on_depth = on_depth
+
+        updates = iter([
+            {"bids": [[44999.0, 1.0]], "asks": [[45001.0, 2.0]], "nonce": 1, "timestamp": 1704067200000},
+            {"bids": [[44998.0, 3.0]], "asks": [[45001.0, 2.0]], "nonce": 2, "timestamp": 1704067200100},
+        ])
+        mock_api_client.exchange_pro.watchOrderBook = AsyncMock(side_effect=lambda *args: next(updates))
+
+        await market_data._watch_depth("BTCUSDT.BINANCE")
+
+        assert len(books) == 2
+        assert books[0] is not books[1]
+        assert books[0].best_bid == 44999.0
+        assert books[1].best_bid == 44998.0
+
     def test_multiple_subscriptions(self, market_data):
         """Test managing multiple subscriptions."""
         symbols = ["BTCUSDT.BINANCE", "ETHUSDT.BINANCE", "BNBUSDT.BINANCE"]
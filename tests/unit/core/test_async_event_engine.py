@@ -0,0 +1,251 @@
+"""
+Unit tests for AsyncEventEngine.
+
+Tests dispatch of sync and coroutine handlers on the loop, hand over of
+events put from other threads, scheduled callbacks and timer events.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from foxtrot.core.async_event_engine import AsyncEventEngine
+from foxtrot.core.event_engine import EVENT_TIMER, Event
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_LOG, EVENT_TICK
+from foxtrot.util.object import TickData
+from foxtrot.util.timestamp import now_timestamp
+
+
+async def wait_for(condition, timeout: float = 2) -> None:
+    """Wait on the loop until condition is true."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition() and loop.time() < deadline:
+        await asyncio.sleep(0.005)
+
+
+class TestAsyncEventEngine:
+    """Test event dispatch of AsyncEventEngine."""
+
+    def setup_method(self):
+        """Setup fresh AsyncEventEngine for each test."""
+        self.engine = AsyncEventEngine()
+        self.received = []
+
+    def teardown_method(self):
+        """Cleanup AsyncEventEngine after each test."""
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_sync_and_async_handlers(self):
+        """Test sync and coroutine handlers run in registration order."""
+        async def async_handler(event: Event) -> None:
+            await asyncio.sleep(0)
+            self.received.append(("async", event.data))
+
+        self.engine.register(EVENT_LOG, lambda event: self.received.append(("sync", event.data)))
+        self.engine.register(EVENT_LOG, async_handler)
+        self.engine.start()
+
+        self.engine.put(Event(EVENT_LOG, 1))
+        self.engine.put(Event(EVENT_LOG, 2))
+
+        await wait_for(lambda: len(self.received) == 4)
+        assert self.received == [("sync", 1), ("async", 1), ("sync", 2), ("async", 2)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_handlers_run_on_loop_thread(self):
+        """Test events put from other threads are processed on the loop thread."""
+        self.engine.register(EVENT_LOG, lambda event: self.received.append(threading.get_ident()))
+        self.engine.start()
+        await asyncio.sleep(0)
+
+        thread = threading.Thread(target=self.engine.put_many, args=([Event(EVENT_LOG), Event(EVENT_LOG)],))
+        thread.start()
+        thread.join()
+
+        await wait_for(lambda: len(self.received) == 2)
+        assert self.received == [threading.get_ident()] * 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_failing_handler_does_not_stop_dispatch(self):
+        """Test exception of a coroutine handler is logged and dispatch continues."""
+        async def failing_handler(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        self.engine.register(EVENT_LOG, failing_handler)
+        self.engine.register_general(self.received.append)
+        self.engine.start()
+
+        self.engine.put(Event(EVENT_LOG))
+
+        await wait_for(lambda: self.received)
+        assert len(self.received) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_keyed_async_handler(self):
+        """Test coroutine keyed handlers are awaited."""
+        async def keyed_handler(event: Event) -> None:
+            self.received.append(event.data.vt_symbol)
+
+        self.engine.register(EVENT_TICK, keyed_handler, key="BTCUSDT.BINANCE")
+        self.engine.start()
+
+        for symbol in ("ETHUSDT", "BTCUSDT"):
+            tick = TickData(adapter_name="TEST", symbol=symbol, exchange=Exchange.BINANCE, timestamp=now_timestamp())
+            self.engine.put(Event(EVENT_TICK, tick))
+
+        await wait_for(lambda: self.received)
+        await asyncio.sleep(0.01)
+        assert self.received == ["BTCUSDT.BINANCE"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_filtered_async_handler(self):
+        """Test coroutine filtered handlers are awaited."""
+        async def filtered_handler(event: Event) -> None:
+            self.received.append(event.data.vt_symbol)
+
+        self.engine.register(EVENT_TICK, filtered_handler, filters={"exchange": Exchange.OKX})
+        self.engine.start()
+
+        for exchange in (Exchange.BINANCE, Exchange.OKX):
+            tick = TickData(adapter_name="TEST", symbol="BTCUSDT", exchange=exchange, timestamp=now_timestamp())
+            self.engine.put(Event(EVENT_TICK, tick))
+
+        await wait_for(lambda: self.received)
+        await asyncio.sleep(0.01)
+        assert self.received == ["BTCUSDT.OKX"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_async_batch_handler(self):
+        """Test coroutine batch handlers are awaited with the events of one pass."""
+        async def batch_handler(events: list[Event]) -> None:
+            await asyncio.sleep(0)
+            self.received.append([event.data for event in events])
+
+        self.engine.register_batch(EVENT_LOG, batch_handler)
+        self.engine.put_many([Event(EVENT_LOG, 1), Event(EVENT_TIMER), Event(EVENT_LOG, 2)])
+        self.engine.start()
+
+        await wait_for(lambda: self.received)
+        assert self.received == [[1, 2]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_profiled_handlers_named(self):
+        """Test keyed and filtered handlers are profiled by their own name, not by the wrappers."""
+        async def keyed_handler(event: Event) -> None:
+            await asyncio.sleep(0.002)
+            self.received.append("keyed")
+
+        def filtered_handler(event: Event) -> None:
+            self.received.append("filtered")
+
+        tick = TickData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, timestamp=now_timestamp())
+        self.engine.enable_profiling(slow_threshold=0.001)
+        self.engine.register(EVENT_TICK, keyed_handler, key=tick.vt_symbol)
+        self.engine.register(EVENT_TICK, filtered_handler, filters={"exchange": Exchange.BINANCE})
+        self.engine.start()
+
+        self.engine.put(Event(EVENT_TICK, tick))
+
+        await wait_for(lambda: len(self.received) == 2)
+        stats = self.engine.get_handler_stats()
+        assert stats[keyed_handler.__qualname__]["count"] == 1
+        assert stats[keyed_handler.__qualname__]["slow"] == 1
+        assert stats[filtered_handler.__qualname__]["count"] == 1
+        assert "AsyncEventEngine._process_keyed" not in stats
+        assert "AsyncEventEngine._process_filtered" not in stats
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_events_put_before_start(self):
+        """Test events put before start are processed once started."""
+        self.engine.register(EVENT_LOG, self.received.append)
+        self.engine.put(Event(EVENT_LOG))
+
+        self.engine.start()
+
+        await wait_for(lambda: self.received)
+        assert len(self.received) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_scheduled_callbacks(self):
+        """Test call_later callbacks are run on the loop, coroutines awaited."""
+        async def async_callback(value: int) -> None:
+            self.received.append(value)
+
+        self.engine.start()
+        self.engine.call_later(0.02, self.received.append, 1)
+        self.engine.call_later(0.01, async_callback, 0)
+
+        await wait_for(lambda: len(self.received) == 2)
+        assert self.received == [0, 1]
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(10)
+    async def test_timer_events(self):
+        """Test timer events are generated every interval."""
+        self.engine = AsyncEventEngine(interval=0.01)
+        self.engine.register(EVENT_TIMER, self.received.append)
+        self.engine.start()
+
+        await wait_for(lambda: len(self.received) >= 3)
+        assert len(self.received) >= 3
+
+    @pytest.mark.timeout(10)
+    def test_start_from_other_thread(self):
+        """Test engine started from another thread runs on the given loop."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        try:
+            self.engine = AsyncEventEngine(loop=loop)
+            self.engine.register(EVENT_LOG, lambda event: self.received.append(threading.get_ident()))
+            self.engine.start()
+            self.engine.put(Event(EVENT_LOG))
+
+            asyncio.run_coroutine_threadsafe(
+                wait_for(lambda: self.received), loop
+            ).result(timeout=5)
+            assert self.received == [thread.ident]
+        finally:
+            self.engine.stop()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    @pytest.mark.timeout(10)
+    def test_put_from_other_thread_while_starting(self):
+        """Test events put from another thread around start are all processed."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        try:
+            self.engine = AsyncEventEngine(loop=loop)
+            self.engine.register(EVENT_LOG, lambda event: self.received.append(event.data))
+            self.engine.put(Event(EVENT_LOG, 0))
+            self.engine.start()
+            for i in range(1, 1000):
+                self.engine.put(Event(EVENT_LOG, i))
+
+            asyncio.run_coroutine_threadsafe(
+                wait_for(lambda: len(self.received) == 1000), loop
+            ).result(timeout=5)
+            assert self.received == list(range(1000))
+        finally:
+            self.engine.stop()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
@@ -0,0 +1,263 @@
+"""
+Unit tests for EventEngine keyed subscriptions.
+
+Tests registration of handlers for a single vt_symbol/vt_orderid,
+handlers filtered by data attributes, the compatibility shim for legacy
+keyed event types and single publishing from BaseAdapter.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from foxtrot.adapter.base_adapter import BaseAdapter
+from foxtrot.core.event_engine import Event, EventEngine, normalize_filters, split_keyed_type
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_LOG, EVENT_ORDER, EVENT_TICK
+from foxtrot.util.object import OrderData, TickData
+from foxtrot.util.timestamp import now_timestamp
+
+
+def create_tick(
+    symbol: str,
+    price: float = 1.0,
+    exchange: Exchange = Exchange.BINANCE,
+    adapter_name: str = "TEST",
+) -> TickData:
+    """Create tick data for testing."""
+    return TickData(
+        adapter_name=adapter_name,
+        symbol=symbol,
+        exchange=exchange,
+        timestamp=now_timestamp(),
+        last_price=price,
+    )
+
+
+class TestSplitKeyedType:
+    """Test parsing of legacy keyed event types."""
+
+    @pytest.mark.timeout(10)
+    def test_split_tick_type(self):
+        """Test keyed tick type is split into base type and vt_symbol."""
+        assert split_keyed_type("eTick.BTCUSDT.BINANCE") == (EVENT_TICK, "BTCUSDT.BINANCE")
+
+    @pytest.mark.timeout(10)
+    def test_split_order_type(self):
+        """Test keyed order type is split into base type and vt_orderid."""
+        assert split_keyed_type("eOrder.BINANCE.123") == (EVENT_ORDER, "BINANCE.123")
+
+    @pytest.mark.timeout(10)
+    def test_plain_types_unchanged(self):
+        """Test base and unrelated types are not split."""
+        assert split_keyed_type(EVENT_TICK) == (EVENT_TICK, None)
+        assert split_keyed_type(EVENT_LOG) == (EVENT_LOG, None)
+        assert split_keyed_type("eOrderCancel.") == ("eOrderCancel.", None)
+        assert split_keyed_type("custom") == ("custom", None)
+
+
+class TestKeyedSubscription:
+    """Test keyed handler dispatch of EventEngine."""
+
+    def setup_method(self):
+        """Setup fresh EventEngine for each test."""
+        self.engine = EventEngine()
+        self.received = []
+
+    def handler(self, event: Event) -> None:
+        """Record received event."""
+        self.received.append(event)
+
+    @pytest.mark.timeout(10)
+    def test_keyed_handler_receives_matching_events_only(self):
+        """Test keyed handler only receives events of its key."""
+        self.engine.register(EVENT_TICK, self.handler, key="BTCUSDT.BINANCE")
+
+        self.engine._process(Event(EVENT_TICK, create_tick("BTCUSDT")))
+        self.engine._process(Event(EVENT_TICK, create_tick("ETHUSDT")))
+
+        assert len(self.received) == 1
+        assert self.received[0].type == EVENT_TICK
+        assert self.received[0].data.symbol == "BTCUSDT"
+
+    @pytest.mark.timeout(10)
+    def test_legacy_keyed_type_registration(self):
+        """Test registration with legacy keyed type is converted."""
+        self.engine.register("eTick.BTCUSDT.BINANCE", self.handler)
+
+        assert "eTick.BTCUSDT.BINANCE" not in self.engine._handlers
+        assert self.engine._keyed_handlers[EVENT_TICK]["BTCUSDT.BINANCE"] == (self.handler,)
+
+        self.engine._process(Event(EVENT_TICK, create_tick("BTCUSDT")))
+        assert len(self.received) == 1
+
+    @pytest.mark.timeout(10)
+    def test_dispatch_order(self):
+        """Test type handlers run before keyed and general handlers."""
+        calls = []
+        self.engine.register_general(lambda event: calls.append("general"))
+        self.engine.register(EVENT_TICK, lambda event: calls.append("keyed"), key="BTCUSDT.BINANCE")
+        self.engine.register(EVENT_TICK, lambda event: calls.append("type"))
+
+        self.engine._process(Event(EVENT_TICK, create_tick("BTCUSDT")))
+        assert calls == ["type", "keyed", "general"]
+
+    @pytest.mark.timeout(10)
+    def test_unregister_keyed(self):
+        """Test unregistering keyed handler removes empty index entries."""
+        self.engine.register(EVENT_TICK, self.handler, key="BTCUSDT.BINANCE")
+        self.engine.register(EVENT_TICK, self.handler, key="BTCUSDT.BINANCE")
+        assert self.engine._keyed_handlers[EVENT_TICK]["BTCUSDT.BINANCE"] == (self.handler,)
+
+        self.engine.unregister("eTick.BTCUSDT.BINANCE", self.handler)
+        assert EVENT_TICK not in self.engine._keyed_handlers
+
+        self.engine._process(Event(EVENT_TICK, create_tick("BTCUSDT")))
+        assert self.received == []
+
+    @pytest.mark.timeout(10)
+    def test_unsupported_keyed_type(self):
+        """Test keyed registration of type without key field is rejected."""
+        with pytest.raises(ValueError):
+            self.engine.register(EVENT_LOG, self.handler, key="x")
+
+    @pytest.mark.timeout(10)
+    def test_keyed_handler_exception_isolated(self):
+        """Test failing keyed handler does not stop other handlers."""
+
+        def failing_handler(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        self.engine.register(EVENT_ORDER, failing_handler, key="TEST.1")
+        self.engine.register_general(self.handler)
+
+        order = OrderData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, orderid="1")
+        self.engine._process(Event(EVENT_ORDER, order))
+        assert len(self.received) == 1
+
+    @pytest.mark.timeout(10)
+    def test_clear_handlers_clears_keyed(self):
+        """Test clear_handlers removes keyed handlers."""
+        self.engine.register(EVENT_TICK, self.handler, key="BTCUSDT.BINANCE")
+        self.engine.clear_handlers()
+        assert self.engine._keyed_handlers == {}
+
+
+class TestFilteredSubscription:
+    """Test filtered handler dispatch of EventEngine."""
+
+    def setup_method(self):
+        """Setup fresh EventEngine for each test."""
+        self.engine = EventEngine()
+        self.received = []
+
+    def handler(self, event: Event) -> None:
+        """Record received event."""
+        self.received.append(event)
+
+    def process_ticks(self) -> list[str]:
+        """Process ticks of several symbols, exchanges and adapters, return received vt_symbols."""
+        for tick in (
+            create_tick("BTCUSDT"),
+            create_tick("ETHUSDT"),
+            create_tick("BTCUSDT", exchange=Exchange.OKX),
+            create_tick("ETHUSDT", adapter_name="OTHER"),
+        ):
+            self.engine._process(Event(EVENT_TICK, tick))
+
+        return [event.data.vt_symbol for event in self.received]
+
+    @pytest.mark.timeout(10)
+    def test_normalize_filters(self):
+        """Test single values and collections become value sets."""
+        assert normalize_filters({"exchange": Exchange.BINANCE, "symbol": ["A", "B"]}) == (
+            ("exchange", frozenset({Exchange.BINANCE})),
+            ("symbol", frozenset({"A", "B"})),
+        )
+
+        with pytest.raises(ValueError):
+            normalize_filters({})
+        with pytest.raises(ValueError):
+            normalize_filters({"symbol": set()})
+
+    @pytest.mark.timeout(10)
+    def test_value_set_filter(self):
+        """Test handler receives events of any accepted value."""
+        self.engine.register(EVENT_TICK, self.handler, filters={"vt_symbol": {"BTCUSDT.BINANCE", "BTCUSDT.OKX"}})
+        assert self.process_ticks() == ["BTCUSDT.BINANCE", "BTCUSDT.OKX"]
+
+    @pytest.mark.timeout(10)
+    def test_all_filters_must_match(self):
+        """Test handler only receives events passing every filter."""
+        self.engine.register(
+            EVENT_TICK,
+            self.handler,
+            filters={"exchange": Exchange.BINANCE, "adapter_name": "TEST"},
+        )
+        assert self.process_ticks() == ["BTCUSDT.BINANCE", "ETHUSDT.BINANCE"]
+
+    @pytest.mark.timeout(10)
+    def test_filtered_out_events_do_not_call_handler(self):
+        """Test events without matching value are not passed to the handler."""
+        handler = MagicMock()
+        self.engine.register(EVENT_TICK, handler, filters={"exchange": Exchange.OKX})
+        self.engine._process(Event(EVENT_TICK, create_tick("BTCUSDT")))
+        self.engine._process(Event(EVENT_TICK, object()))
+
+        handler.assert_not_called()
+
+    @pytest.mark.timeout(10)
+    def test_unregister_filtered(self):
+        """Test handler is removed with the filters it was registered with."""
+        filters = {"exchange": [Exchange.BINANCE, Exchange.OKX]}
+        self.engine.register(EVENT_TICK, self.handler, filters=filters)
+        self.engine.register(EVENT_TICK, self.handler, filters=filters)
+
+        self.engine.unregister(EVENT_TICK, self.handler, filters=filters)
+        assert self.engine._filtered_handlers == {}
+        assert EVENT_TICK not in self.engine._dispatch[0]
+
+        self.engine.register(EVENT_TICK, self.handler, filters=filters)
+        self.engine.clear_handlers()
+        assert self.engine._filtered_handlers == {}
+
+    @pytest.mark.timeout(10)
+    def test_filters_can_not_be_keyed(self):
+        """Test filters combined with key or executor are rejected."""
+        self.engine.add_executor("db")
+
+        with pytest.raises(ValueError):
+            self.engine.register(EVENT_TICK, self.handler, key="BTCUSDT.BINANCE", filters={"adapter_name": "TEST"})
+        with pytest.raises(ValueError):
+            self.engine.register(EVENT_TICK, self.handler, executor="db", filters={"adapter_name": "TEST"})
+
+
+class TestAdapterSinglePublish:
+    """Test BaseAdapter publishes each data object once."""
+
+    @pytest.mark.timeout(10)
+    def test_on_tick_puts_one_event(self):
+        """Test on_tick puts a single event of base type."""
+        event_engine = MagicMock()
+        adapter = MagicMock(spec=BaseAdapter)
+        adapter.event_engine = event_engine
+        adapter.on_event = lambda type, data=None: BaseAdapter.on_event(adapter, type, data)
+
+        BaseAdapter.on_tick(adapter, create_tick("BTCUSDT"))
+
+        assert event_engine.put.call_count == 1
+        event = event_engine.put.call_args[0][0]
+        assert event.type == EVENT_TICK
+
+    @pytest.mark.timeout(10)
+    def test_on_ticks_puts_batch(self):
+        """Test on_ticks puts all ticks with one put_many call."""
+        event_engine = MagicMock()
+        adapter = MagicMock(spec=BaseAdapter)
+        adapter.event_engine = event_engine
+
+        BaseAdapter.on_ticks(adapter, [create_tick("BTCUSDT"), create_tick("ETHUSDT")])
+
+        event_engine.put_many.assert_called_once()
+        events = event_engine.put_many.call_args[0][0]
+        assert [event.type for event in events] == [EVENT_TICK, EVENT_TICK]
@@ -0,0 +1,176 @@
+"""
+Unit tests for EventEngine sharded dispatch mode.
+
+Tests routing of events to shards by ordering key, per-key ordering
+guarantees and parallel processing of unrelated keys.
+"""
+
+import threading
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine, default_shard_key
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_LOG, EVENT_ORDER, EVENT_TICK, EVENT_TRADE
+from foxtrot.util.object import OrderData, TickData, TradeData
+from foxtrot.util.timestamp import now_timestamp
+
+
+def create_tick(symbol: str, price: float) -> TickData:
+    """Create tick data for testing."""
+    return TickData(
+        adapter_name="TEST",
+        symbol=symbol,
+        exchange=Exchange.BINANCE,
+        timestamp=now_timestamp(),
+        last_price=price,
+    )
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """Wait until condition is met or timeout expires."""
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestShardKey:
+    """Test default ordering key extraction."""
+
+    @pytest.mark.timeout(10)
+    def test_tick_keyed_by_vt_symbol(self):
+        """Test tick events are keyed by vt_symbol."""
+        tick = create_tick("BTCUSDT", 1.0)
+        assert default_shard_key(Event(EVENT_TICK, tick)) == "BTCUSDT.BINANCE"
+
+    @pytest.mark.timeout(10)
+    def test_order_and_trade_keyed_by_vt_orderid(self):
+        """Test order and trade events of the same order share a key."""
+        order = OrderData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, orderid="1")
+        trade = TradeData(
+            adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, orderid="1", tradeid="t1"
+        )
+        assert default_shard_key(Event(EVENT_ORDER, order)) == "TEST.1"
+        assert default_shard_key(Event(EVENT_TRADE, trade)) == "TEST.1"
+
+    @pytest.mark.timeout(10)
+    def test_unkeyed_event(self):
+        """Test events without key field return None."""
+        assert default_shard_key(Event(EVENT_LOG, "msg")) is None
+        assert default_shard_key(Event("custom", None)) is None
+
+
+class TestEventEngineSharding:
+    """Test EventEngine in sharded mode."""
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if hasattr(self, "engine") and self.engine._active:
+            self.engine.stop()
+
+    @pytest.mark.timeout(10)
+    def test_default_is_single_shard(self):
+        """Test default engine keeps a single worker thread."""
+        self.engine = EventEngine()
+        assert self.engine.shards == 1
+        assert len(self.engine._workers) == 1
+        assert self.engine._thread is self.engine._workers[0]
+
+    @pytest.mark.timeout(10)
+    def test_same_key_routed_to_same_shard(self):
+        """Test events with the same key always go to the same shard."""
+        self.engine = EventEngine(shards=4)
+
+        for i in range(10):
+            self.engine.put(Event(EVENT_TICK, create_tick("BTCUSDT", i)))
+
+        sizes = self.engine.get_shard_sizes()
+        assert sorted(sizes) == [0, 0, 0, 10]
+
+    @pytest.mark.timeout(10)
+    def test_custom_shard_key(self):
+        """Test custom ordering key function is used for routing."""
+        self.engine = EventEngine(shards=4, shard_key=lambda event: "same")
+
+        for i in range(8):
+            self.engine.put(Event(EVENT_TICK, create_tick(f"SYM{i}", i)))
+            self.engine.put(Event(EVENT_LOG, i))
+
+        assert sorted(self.engine.get_shard_sizes()) == [0, 0, 0, 16]
+
+    @pytest.mark.timeout(10)
+    def test_per_key_ordering(self):
+        """Test events of each key are processed strictly in order."""
+        self.engine = EventEngine(shards=4)
+        received: dict[str, list[float]] = {}
+        lock = threading.Lock()
+
+        def handler(event: Event) -> None:
+            tick: TickData = event.data
+            with lock:
+                received.setdefault(tick.vt_symbol, []).append(tick.last_price)
+
+        self.engine.register(EVENT_TICK, handler)
+        self.engine.start()
+
+        symbols = [f"SYM{i}" for i in range(20)]
+        for price in range(100):
+            for symbol in symbols:
+                self.engine.put(Event(EVENT_TICK, create_tick(symbol, price)))
+
+        assert wait_for(lambda: sum(len(v) for v in received.values()) == 2000)
+        for prices in received.values():
+            assert prices == list(range(100))
+
+    @pytest.mark.timeout(10)
+    def test_slow_handler_does_not_block_other_shards(self):
+        """Test a slow key does not stall events of unrelated keys."""
+        self.engine = EventEngine(shards=4)
+        processed: list[str] = []
+        release = threading.Event()
+
+        def handler(event: Event) -> None:
+            tick: TickData = event.data
+            if tick.symbol == "SLOW":
+                release.wait(timeout=5)
+            processed.append(tick.symbol)
+
+        self.engine.register(EVENT_TICK, handler)
+        self.engine.start()
+
+        slow_tick = create_tick("SLOW", 1)
+        slow_shard = hash(slow_tick.vt_symbol) % 4
+        others = [
+            f"FAST{i}" for i in range(100)
+            if hash(f"FAST{i}.BINANCE") % 4 != slow_shard
+        ][:5]
+
+        self.engine.put(Event(EVENT_TICK, slow_tick))
+        for symbol in others:
+            self.engine.put(Event(EVENT_TICK, create_tick(symbol, 1)))
+
+        assert wait_for(lambda: len(processed) == len(others))
+        assert "SLOW" not in processed
+
+        release.set()
+        assert wait_for(lambda: "SLOW" in processed)
+
+    @pytest.mark.timeout(15)
+    def test_start_stop_all_workers(self):
+        """Test start and stop manage all shard worker threads."""
+        self.engine = EventEngine(0.1, shards=3)
+        self.engine.start()
+        time.sleep(0.05)
+        assert all(worker.is_alive() for worker in self.engine._workers)
+
+        self.engine.stop()
+        assert not any(worker.is_alive() for worker in self.engine._workers)
+
+        self.engine.start()
+        time.sleep(0.05)
+        assert all(worker.is_alive() for worker in self.engine._workers)
+        self.engine.stop()
@@ -5,14 +5,14 @@ Tests individual classes and methods in isolation with comprehensive coverage
 of event handling, lifecycle management, and handler registration.
 """
 
-from collections import defaultdict
 from queue import Queue
 import threading
 import time
 
 import pytest
 
-from foxtrot.core.event_engine import EVENT_TIMER, Event, EventEngine
+from foxtrot.core.event import Event as CompatEvent
+from foxtrot.core.event_engine import EVENT_POOL, EVENT_TIMER, Event, EventEngine, EventPool
 
 
 class TestEvent:
@@ -75,6 +75,66 @@ class TestEvent:
             assert event.type == event_type
             assert event.data == data
 
+    @pytest.mark.timeout(10)
+    def test_event_slots(self):
+        """Test Event has no instance dict and a single definition."""
+        event = Event("test_type")
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.other = 1
+
+        assert CompatEvent is Event
+
+
+class TestEventPool:
+    """Test reuse of event objects."""
+
+    @pytest.mark.timeout(10)
+    def test_acquire_reuses_released_event(self):
+        """Test released event is handed out again with new type and data."""
+        pool = EventPool(size=1)
+        event = pool.acquire("a", 1)
+        pool.release(event)
+
+        assert event.data is None
+        assert pool.acquire("b", 2) is event
+        assert (event.type, event.data) == ("b", 2)
+        assert pool.acquire("c") is not event
+
+    @pytest.mark.timeout(10)
+    def test_release_bounded_by_size(self):
+        """Test pool keeps at most size free events."""
+        pool = EventPool(size=2)
+        for _ in range(5):
+            pool.release(Event("a"))
+
+        assert len(pool) == 2
+
+    @pytest.mark.timeout(10)
+    def test_engine_releases_pooled_types(self):
+        """Test engine gives back processed events of pool types only."""
+        engine = EventEngine(pool_types=("pooled",))
+        received = []
+        engine.register("pooled", lambda event: received.append(event.data))
+        engine.start()
+
+        try:
+            before = len(EVENT_POOL)
+            engine.put_many([EVENT_POOL.acquire("pooled", i) for i in range(3)] + [Event("other")])
+
+            deadline = time.time() + 2
+            while len(received) < 3 and time.time() < deadline:
+                time.sleep(0.005)
+            time.sleep(0.05)
+
+            assert received == [0, 1, 2]
+            assert len(EVENT_POOL) == before + 3
+        finally:
+            engine.stop()
+            while len(EVENT_POOL):
+                EVENT_POOL.acquire("")
+
 
 class TestEventEngineInitialization:
     """Test EventEngine initialization and configuration."""
@@ -90,8 +150,8 @@ class TestEventEngineInitialization:
         # Check initial state
         assert engine._active is False
         assert isinstance(engine._queue, Queue)
-        assert isinstance(engine._handlers, defaultdict)
-        assert isinstance(engine._general_handlers, list)
+        assert engine._handlers == {}
+        assert isinstance(engine._general_handlers, tuple)
         assert len(engine._general_handlers) == 0
 
         # Check threads are created but not started
@@ -134,18 +194,16 @@ class TestEventEngineInitialization:
 
     @pytest.mark.timeout(10)
     def test_handlers_structure(self):
-        """Test handlers data structure initialization."""
+        """Test handler tables are replaced, not mutated, on registration."""
         engine = EventEngine()
+        handlers = engine._handlers
 
-        # Test defaultdict behavior
         test_type = "test_event"
-        handler_list = engine._handlers[test_type]
-        assert isinstance(handler_list, list)
-        assert len(handler_list) == 0
+        engine.register(test_type, lambda event: None)
 
-        # Verify defaultdict creates empty list for new keys
-        assert test_type in engine._handlers
-        assert len(engine._handlers[test_type]) == 0
+        assert handlers == {}
+        assert isinstance(engine._handlers[test_type], tuple)
+        assert len(engine._handlers[test_type]) == 1
 
 
 class TestEventEngineLifecycle:
@@ -415,6 +473,38 @@ class TestEventEngineHandlerManagement:
 
         assert len(self.engine._general_handlers) == 0
 
+    @pytest.mark.timeout(10)
+    def test_dispatch_merges_type_and_general_handlers(self):
+        """Test dispatch table holds one merged tuple per event type."""
+        self.engine.register("test_event", self.test_handler)
+        self.engine.register_general(self.another_handler)
+
+        dispatch, general_handlers = self.engine._dispatch
+        assert dispatch["test_event"] == (self.test_handler, self.another_handler)
+        assert general_handlers == (self.another_handler,)
+
+        self.engine.unregister("test_event", self.test_handler)
+        dispatch, general_handlers = self.engine._dispatch
+        assert "test_event" not in dispatch
+
+    @pytest.mark.timeout(10)
+    def test_register_during_dispatch_uses_snapshot(self):
+        """Test handler registered while dispatching misses the current event."""
+        event_type = "test_event"
+
+        def registering_handler(event):
+            self.test_events.append("registering")
+            self.engine.register(event_type, self.test_handler)
+
+        self.engine.register(event_type, registering_handler)
+
+        self.engine._process(Event(event_type))
+        assert self.test_events == ["registering"]
+
+        self.engine._process(Event(event_type))
+        assert len(self.test_events) == 3
+        assert self.test_events[2].type == event_type
+
 
 class TestEventEngineEventProcessing:
     """Test event processing and distribution functionality."""
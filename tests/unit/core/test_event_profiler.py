@@ -0,0 +1,246 @@
+"""
+Unit tests for EventEngine handler profiling.
+
+Tests latency histogram percentiles, per-handler, queue wait and wakeup
+stats recorded by the engine and slow-handler counting.
+"""
+
+from functools import partial
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.core.event_profiler import EventProfiler, LatencyHistogram, get_handler_name
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_LOG, EVENT_TICK
+from foxtrot.util.object import TickData
+
+
+class TestLatencyHistogram:
+    """Test log2 latency histogram."""
+
+    @pytest.mark.timeout(10)
+    def test_empty_stats(self):
+        """Test stats of histogram without samples."""
+        stats = LatencyHistogram().get_stats()
+        assert stats == {"count": 0, "mean": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+
+    @pytest.mark.timeout(10)
+    def test_percentiles(self):
+        """Test percentiles are bucket upper bounds capped by max."""
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.000_010)
+        histogram.record(0.005)
+
+        stats = histogram.get_stats()
+        assert stats["count"] == 100
+        assert stats["max"] == 0.005
+        assert 0.000_010 <= stats["p50"] <= 0.000_016
+        assert stats["p99"] <= 0.000_016
+        assert histogram.percentile(1.0) == 0.005
+
+
+class TestHandlerName:
+    """Test readable handler names."""
+
+    @pytest.mark.timeout(10)
+    def test_method_and_partial_names(self):
+        """Test bound methods and partials are named by qualified name."""
+        assert get_handler_name(EventEngine.put) == "EventEngine.put"
+        assert get_handler_name(partial(EventEngine.put, None)) == "partial(EventEngine.put)"
+
+
+class TestEventEngineProfiling:
+    """Test profiling mode of EventEngine."""
+
+    def setup_method(self):
+        """Setup fresh EventEngine for each test."""
+        self.engine = EventEngine()
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if self.engine._active:
+            self.engine.stop()
+
+    @pytest.mark.timeout(10)
+    def test_disabled_by_default(self):
+        """Test no stats are recorded while profiling is disabled."""
+        self.engine.register(EVENT_LOG, lambda event: None)
+        self.engine.put(Event(EVENT_LOG))
+
+        assert self.engine._profiler is None
+        assert self.engine.get_handler_stats() == {}
+        assert self.engine.get_queue_wait_stats() == {}
+        assert self.engine.get_wakeup_stats() == {}
+
+    @pytest.mark.timeout(10)
+    def test_handler_and_queue_wait_stats(self):
+        """Test handler calls and queue wait are recorded per handler and type."""
+        self.engine.enable_profiling()
+
+        def fast_handler(event: Event) -> None:
+            pass
+
+        self.engine.register(EVENT_LOG, fast_handler)
+        self.engine.put_many([Event(EVENT_LOG), Event(EVENT_LOG)])
+        self.engine.put(Event(EVENT_LOG))
+
+        events = self.engine._queue.get_many(block=False)
+        for event in events:
+            self.engine._process_profiled(event)
+
+        handler_stats = self.engine.get_handler_stats()
+        name = fast_handler.__qualname__
+        assert handler_stats[name]["count"] == 3
+        assert handler_stats[name]["slow"] == 0
+
+        wait_stats = self.engine.get_queue_wait_stats()
+        assert wait_stats[EVENT_LOG]["count"] == 3
+
+        self.engine.reset_handler_stats()
+        assert self.engine.get_handler_stats() == {}
+
+    @pytest.mark.timeout(10)
+    def test_slow_handler_counted(self):
+        """Test handler calls above threshold are counted as slow."""
+        self.engine.enable_profiling(slow_threshold=0.001)
+
+        def slow_handler(event: Event) -> None:
+            time.sleep(0.005)
+
+        self.engine.register(EVENT_LOG, slow_handler)
+        self.engine._process_profiled(Event(EVENT_LOG))
+
+        stats = self.engine.get_handler_stats()[slow_handler.__qualname__]
+        assert stats["slow"] == 1
+        assert stats["max"] >= 0.005
+
+    @pytest.mark.timeout(10)
+    def test_failing_handler_still_recorded(self):
+        """Test failing handler is timed and does not stop dispatch."""
+        self.engine.enable_profiling()
+        received = []
+
+        def failing_handler(event: Event) -> None:
+            raise RuntimeError("boom")
+
+        self.engine.register(EVENT_LOG, failing_handler)
+        self.engine.register_general(received.append)
+        self.engine._process_profiled(Event(EVENT_LOG))
+
+        assert len(received) == 1
+        assert self.engine.get_handler_stats()[failing_handler.__qualname__]["count"] == 1
+
+    @pytest.mark.timeout(10)
+    def test_profiling_in_worker(self):
+        """Test worker thread uses profiled dispatch when enabled."""
+        engine = EventEngine(profile=True)
+        self.engine = engine
+        received = []
+
+        engine.register(EVENT_LOG, received.append)
+        engine.start()
+        engine.put(Event(EVENT_LOG))
+
+        deadline = time.time() + 2
+        while not received and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert received
+        assert engine.get_queue_wait_stats()[EVENT_LOG]["count"] >= 1
+
+    @pytest.mark.timeout(10)
+    def test_wakeup_stats_by_wait_mode(self):
+        """Test wakeup latency of idle worker is recorded as spin or block."""
+        self.engine = EventEngine(profile=True, spin_time=0.05)
+        received = []
+
+        self.engine.register(EVENT_LOG, received.append)
+        self.engine.start()
+
+        # Put while worker spins, then after it fell back to blocking
+        for delay, count in ((0.01, 1), (0.2, 2)):
+            time.sleep(delay)
+            self.engine.put(Event(EVENT_LOG))
+
+            deadline = time.time() + 2
+            while len(received) < count and time.time() < deadline:
+                time.sleep(0.001)
+
+        stats = self.engine.get_wakeup_stats()
+        assert stats["spin"]["count"] >= 1
+        assert stats["block"]["count"] >= 1
+
+        self.engine.reset_handler_stats()
+        assert self.engine.get_wakeup_stats() == {}
+
+    @pytest.mark.timeout(10)
+    def test_keyed_and_filtered_handlers_named(self):
+        """Test keyed and filtered handlers are recorded by their own name."""
+        self.engine.enable_profiling()
+
+        def keyed_handler(event: Event) -> None:
+            pass
+
+        def filtered_handler(event: Event) -> None:
+            pass
+
+        tick = TickData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, timestamp=1)
+        self.engine.register(EVENT_TICK, keyed_handler, key=tick.vt_symbol)
+        self.engine.register(EVENT_TICK, filtered_handler, filters={"exchange": Exchange.BINANCE})
+        self.engine._process_profiled(Event(EVENT_TICK, tick))
+
+        stats = self.engine.get_handler_stats()
+        assert stats[keyed_handler.__qualname__]["count"] == 1
+        assert stats[filtered_handler.__qualname__]["count"] == 1
+        assert "EventEngine._process_keyed" not in stats
+        assert "EventEngine._process_filtered" not in stats
+
+    @pytest.mark.timeout(10)
+    def test_executor_handler_timed_in_worker(self):
+        """Test executor handlers are timed when run, not when submitted."""
+        self.engine.enable_profiling(slow_threshold=0.001)
+        self.engine.add_executor("slow")
+        received = []
+
+        def slow_handler(event: Event) -> None:
+            time.sleep(0.005)
+            received.append(event)
+
+        self.engine.register(EVENT_LOG, slow_handler, executor="slow")
+        self.engine.start()
+        self.engine.put(Event(EVENT_LOG))
+
+        deadline = time.time() + 2
+        while not received and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        stats = self.engine.get_handler_stats()
+        assert stats[slow_handler.__qualname__]["slow"] == 1
+        assert "HandlerExecutor.submit" not in stats
+
+    @pytest.mark.timeout(10)
+    def test_disable_profiling(self):
+        """Test disabling profiling discards samples."""
+        self.engine.enable_profiling()
+        self.engine.register(EVENT_LOG, lambda event: None)
+        self.engine._process_profiled(Event(EVENT_LOG))
+
+        self.engine.disable_profiling()
+        assert self.engine.get_handler_stats() == {}
+
+
+class TestEventProfiler:
+    """Test EventProfiler directly."""
+
+    @pytest.mark.timeout(10)
+    def test_record_handler_returns_slow(self):
+        """Test record_handler reports calls above threshold."""
+        profiler = EventProfiler(slow_threshold=0.01)
+
+        assert profiler.record_handler(print, 0.001) is False
+        assert profiler.record_handler(print, 0.02) is True
+        assert profiler.get_handler_stats()["print"]["slow"] == 1
@@ -0,0 +1,598 @@
+"""
+Unit tests for EventQueue.
+
+Tests FIFO behaviour, conflation of pending market data and the
+conflated/delivered counters.
+"""
+
+from queue import Empty, Full, Queue
+import threading
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import EXECUTION_PRIORITIES, Event, EventEngine, default_shard_key
+from foxtrot.core.event_queue import EventPriority, EventQueue, LanePolicy, OverflowPolicy
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_LOG, EVENT_ORDER, EVENT_TICK
+from foxtrot.util.object import OrderData, TickData
+from foxtrot.util.timestamp import now_timestamp
+
+
+def create_tick(symbol: str, price: float) -> TickData:
+    """Create tick data for testing."""
+    return TickData(
+        adapter_name="TEST",
+        symbol=symbol,
+        exchange=Exchange.BINANCE,
+        timestamp=now_timestamp(),
+        last_price=price,
+    )
+
+
+def create_order(orderid: str) -> OrderData:
+    """Create order data for testing."""
+    return OrderData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, orderid=orderid)
+
+
+def drain(queue: EventQueue) -> list[Event]:
+    """Get all pending events from queue."""
+    events = []
+    while True:
+        try:
+            events.append(queue.get_nowait())
+        except Empty:
+            return events
+
+
+class TestEventQueue:
+    """Test EventQueue without conflation."""
+
+    @pytest.mark.timeout(10)
+    def test_is_queue(self):
+        """Test EventQueue keeps the Queue interface."""
+        queue = EventQueue()
+        assert isinstance(queue, Queue)
+        assert queue.empty()
+
+    @pytest.mark.timeout(10)
+    def test_fifo_order(self):
+        """Test events are returned in FIFO order."""
+        queue = EventQueue()
+        events = [Event(EVENT_LOG, i) for i in range(10)]
+        for event in events:
+            queue.put(event)
+
+        assert queue.qsize() == 10
+        assert drain(queue) == events
+        assert queue.get_stats()["delivered"] == 10
+
+    @pytest.mark.timeout(10)
+    def test_ticks_not_conflated_by_default(self):
+        """Test ticks are lossless when conflation is not enabled."""
+        queue = EventQueue(key=default_shard_key)
+        for i in range(5):
+            queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", i)))
+
+        assert queue.qsize() == 5
+        assert queue.get_stats()["conflated"] == 0
+
+
+class TestEventQueueConflation:
+    """Test conflation lane of EventQueue."""
+
+    def setup_method(self):
+        """Setup conflating queue for each test."""
+        self.queue = EventQueue(conflate_types=[EVENT_TICK], key=default_shard_key)
+
+    @pytest.mark.timeout(10)
+    def test_latest_tick_kept(self):
+        """Test only the latest pending tick per vt_symbol is delivered."""
+        for i in range(5):
+            self.queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", i)))
+
+        assert self.queue.qsize() == 1
+        events = drain(self.queue)
+        assert len(events) == 1
+        assert events[0].data.last_price == 4
+
+        stats = self.queue.get_stats()
+        assert stats["conflated"] == 4
+        assert stats["delivered"] == 1
+
+    @pytest.mark.timeout(10)
+    def test_conflated_tick_keeps_position(self):
+        """Test overwritten tick keeps the queue position of the first one."""
+        self.queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 1)))
+        self.queue.put(Event(EVENT_LOG, "log"))
+        self.queue.put(Event(EVENT_TICK, create_tick("ETHUSDT", 1)))
+        self.queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 2)))
+
+        events = drain(self.queue)
+        assert [event.type for event in events] == [EVENT_TICK, EVENT_LOG, EVENT_TICK]
+        assert events[0].data.vt_symbol == "BTCUSDT.BINANCE"
+        assert events[0].data.last_price == 2
+        assert events[2].data.vt_symbol == "ETHUSDT.BINANCE"
+
+    @pytest.mark.timeout(10)
+    def test_tick_after_delivery_queued_again(self):
+        """Test a tick is queued again once the pending one was delivered."""
+        self.queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 1)))
+        assert len(drain(self.queue)) == 1
+
+        self.queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 2)))
+        events = drain(self.queue)
+        assert len(events) == 1
+        assert events[0].data.last_price == 2
+
+    @pytest.mark.timeout(10)
+    def test_orders_stay_lossless(self):
+        """Test non-conflated event types are never dropped."""
+        for _ in range(3):
+            self.queue.put(Event(EVENT_ORDER, create_order("1")))
+
+        assert self.queue.qsize() == 3
+        assert self.queue.get_stats()["conflated"] == 0
+
+    @pytest.mark.timeout(10)
+    def test_conflation_into_full_queue(self):
+        """Test conflating into a pending slot does not need free space."""
+        queue = EventQueue(maxsize=1, conflate_types=[EVENT_TICK], key=default_shard_key)
+        queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 1)))
+        queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 2)), block=False)
+
+        assert queue.get_nowait().data.last_price == 2
+
+
+class TestEventQueueOverflow:
+    """Test bounded EventQueue and overflow policies."""
+
+    @pytest.mark.timeout(10)
+    def test_block_policy_nowait_raises_full(self):
+        """Test default block policy keeps Queue semantics when full."""
+        queue = EventQueue(maxsize=2)
+        queue.put(Event(EVENT_LOG, 1))
+        queue.put(Event(EVENT_LOG, 2))
+
+        with pytest.raises(Full):
+            queue.put(Event(EVENT_LOG, 3), block=False)
+        with pytest.raises(Full):
+            queue.put(Event(EVENT_LOG, 3), timeout=0.01)
+
+    @pytest.mark.timeout(10)
+    def test_block_policy_waits_for_space(self):
+        """Test blocked producer resumes once consumer frees space."""
+        queue = EventQueue(maxsize=1)
+        queue.put(Event(EVENT_LOG, 1))
+
+        producer = threading.Thread(target=queue.put, args=(Event(EVENT_LOG, 2),))
+        producer.start()
+        time.sleep(0.05)
+        assert producer.is_alive()
+
+        assert queue.get().data == 1
+        producer.join(timeout=1)
+        assert not producer.is_alive()
+        assert queue.get_nowait().data == 2
+
+    @pytest.mark.timeout(10)
+    def test_drop_newest_policy(self):
+        """Test drop newest policy discards the event being put."""
+        queue = EventQueue(maxsize=2, policies={EVENT_LOG: OverflowPolicy.DROP_NEWEST})
+        for i in range(5):
+            queue.put(Event(EVENT_LOG, i))
+
+        assert [event.data for event in drain(queue)] == [0, 1]
+        assert queue.get_stats()["dropped"] == {EVENT_LOG: 3}
+
+    @pytest.mark.timeout(10)
+    def test_drop_oldest_policy(self):
+        """Test drop oldest policy removes the oldest event of the same type."""
+        queue = EventQueue(maxsize=3, policies={EVENT_TICK: OverflowPolicy.DROP_OLDEST})
+        queue.put(Event(EVENT_ORDER, create_order("1")))
+        for i in range(4):
+            queue.put(Event(EVENT_TICK, create_tick(f"SYM{i}", i)))
+
+        events = drain(queue)
+        assert events[0].type == EVENT_ORDER
+        assert [event.data.last_price for event in events[1:]] == [2, 3]
+        assert queue.get_stats()["dropped"] == {EVENT_TICK: 2}
+
+    @pytest.mark.timeout(10)
+    def test_conflate_policy(self):
+        """Test conflate policy conflates by key and drops unknown keys when full."""
+        queue = EventQueue(
+            maxsize=2,
+            key=default_shard_key,
+            policies={EVENT_TICK: OverflowPolicy.CONFLATE},
+        )
+        queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 1)))
+        queue.put(Event(EVENT_TICK, create_tick("ETHUSDT", 1)))
+        queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", 2)))
+        queue.put(Event(EVENT_TICK, create_tick("SOLUSDT", 1)))
+
+        events = drain(queue)
+        assert [(event.data.symbol, event.data.last_price) for event in events] == [
+            ("BTCUSDT", 2),
+            ("ETHUSDT", 1),
+        ]
+        stats = queue.get_stats()
+        assert stats["conflated"] == 1
+        assert stats["dropped"] == {EVENT_TICK: 1}
+
+    @pytest.mark.timeout(10)
+    def test_force_put_ignores_capacity(self):
+        """Test force put enqueues events into a full queue."""
+        queue = EventQueue(maxsize=1)
+        queue.put(Event(EVENT_LOG, 1))
+        queue.force_put(Event(EVENT_LOG, 2))
+
+        assert queue.qsize() == 2
+        assert queue.get_stats()["max_depth"] == 2
+
+    @pytest.mark.timeout(10)
+    def test_watermark_callbacks(self):
+        """Test callbacks fire on crossing high and low water marks once."""
+        queue = EventQueue(maxsize=10, high_water=4)
+        calls = []
+        queue.add_watermark_callback(lambda depth, high: calls.append((depth, high)))
+
+        for i in range(6):
+            queue.put(Event(EVENT_LOG, i))
+        assert calls == [(4, True)]
+
+        drain(queue)
+        assert calls == [(4, True), (2, False)]
+
+
+class TestEventEngineConflation:
+    """Test conflation integrated in EventEngine."""
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if hasattr(self, "engine") and self.engine._active:
+            self.engine.stop()
+
+    @pytest.mark.timeout(10)
+    def test_engine_conflates_pending_ticks(self):
+        """Test engine delivers only the latest tick of a burst."""
+        self.engine = EventEngine(conflate_types=[EVENT_TICK])
+        received = []
+        self.engine.register(EVENT_TICK, lambda event: received.append(event.data.last_price))
+
+        for i in range(100):
+            self.engine.put(Event(EVENT_TICK, create_tick("BTCUSDT", i)))
+        self.engine.put(Event(EVENT_ORDER, create_order("1")))
+
+        self.engine.start()
+        end = time.time() + 2
+        while self.engine.get_queue_stats()["pending"] and time.time() < end:
+            time.sleep(0.01)
+
+        assert received == [99]
+        stats = self.engine.get_queue_stats()
+        assert stats["conflated"] == 99
+        assert stats["delivered"] == 2
+
+
+class TestEventEngineBackpressure:
+    """Test bounded queue integrated in EventEngine."""
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if hasattr(self, "engine") and self.engine._active:
+            self.engine.stop()
+
+    @pytest.mark.timeout(10)
+    def test_engine_drops_by_policy(self):
+        """Test engine applies overflow policy and reports drops."""
+        self.engine = EventEngine(capacity=5, default_policy=OverflowPolicy.DROP_NEWEST)
+        for i in range(8):
+            self.engine.put(Event(EVENT_LOG, i))
+
+        stats = self.engine.get_queue_stats()
+        assert stats["pending"] == 5
+        assert stats["dropped"] == {EVENT_LOG: 3}
+
+    @pytest.mark.timeout(10)
+    def test_handler_put_into_full_queue_does_not_deadlock(self):
+        """Test handler putting into its own full queue does not block."""
+        self.engine = EventEngine(capacity=1)
+        received = []
+
+        def handler(event: Event) -> None:
+            received.append(event.data)
+            if event.data < 3:
+                self.engine.put(Event(EVENT_LOG, event.data + 1))
+                self.engine.put(Event(EVENT_LOG, event.data + 10))
+
+        self.engine.register(EVENT_LOG, handler)
+        self.engine.start()
+        self.engine.put(Event(EVENT_LOG, 0))
+
+        end = time.time() + 2
+        while len(received) < 7 and time.time() < end:
+            time.sleep(0.01)
+        assert sorted(received) == [0, 1, 2, 3, 10, 11, 12]
+
+    @pytest.mark.timeout(10)
+    def test_handlers_put_into_each_others_full_queue(self):
+        """Test handlers of two shards putting into each other's full queue do not deadlock."""
+        self.engine = EventEngine(capacity=1, shards=2, shard_key=lambda event: event.data[0])
+        keys = [f"k{i}" for i in range(10)]
+        key_a = keys[0]
+        key_b = next(key for key in keys if hash(key) % 2 != hash(key_a) % 2)
+        other = {key_a: key_b, key_b: key_a}
+        received = []
+
+        def handler(event: Event) -> None:
+            key, n = event.data
+            received.append(event.data)
+            if n < 20:
+                time.sleep(0.001)
+                self.engine.put(Event(EVENT_LOG, (other[key], n + 1)))
+                self.engine.put(Event(EVENT_LOG, (other[key], 100)))
+                self.engine.put(Event(EVENT_LOG, (other[key], 100)))
+
+        self.engine.register(EVENT_LOG, handler)
+        self.engine.start()
+        self.engine.put(Event(EVENT_LOG, (key_a, 0)))
+        self.engine.put(Event(EVENT_LOG, (key_b, 0)))
+
+        end = time.time() + 5
+        while len(received) < 2 * 61 and time.time() < end:
+            time.sleep(0.01)
+        assert len(received) == 2 * 61
+
+
+class TestEventQueueBatch:
+    """Test batch put and drain of EventQueue."""
+
+    @pytest.mark.timeout(10)
+    def test_put_many_and_get_many(self):
+        """Test batch operations keep FIFO order."""
+        queue = EventQueue()
+        events = [Event(EVENT_LOG, i) for i in range(10)]
+        queue.put_many(events)
+
+        assert queue.qsize() == 10
+        assert queue.get_many() == events
+        assert queue.empty()
+
+    @pytest.mark.timeout(10)
+    def test_get_many_limit(self):
+        """Test get_many returns at most limit events."""
+        queue = EventQueue()
+        queue.put_many([Event(EVENT_LOG, i) for i in range(10)])
+
+        assert [event.data for event in queue.get_many(limit=3)] == [0, 1, 2]
+        assert queue.qsize() == 7
+
+    @pytest.mark.timeout(10)
+    def test_get_many_empty(self):
+        """Test get_many raises Empty like get."""
+        queue = EventQueue()
+        with pytest.raises(Empty):
+            queue.get_many(block=False)
+        with pytest.raises(Empty):
+            queue.get_many(timeout=0.01)
+
+    @pytest.mark.timeout(10)
+    def test_wakeup_interrupts_wait(self):
+        """Test wakeup makes a blocked consumer raise Empty at once."""
+        queue = EventQueue()
+        threading.Timer(0.05, queue.wakeup).start()
+
+        start = time.monotonic()
+        with pytest.raises(Empty):
+            queue.get_many(timeout=5)
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.timeout(10)
+    def test_put_many_conflates(self):
+        """Test put_many applies conflation to each event."""
+        queue = EventQueue(conflate_types=[EVENT_TICK], key=default_shard_key)
+        queue.put_many([Event(EVENT_TICK, create_tick("BTCUSDT", i)) for i in range(5)])
+
+        events = queue.get_many()
+        assert len(events) == 1
+        assert events[0].data.last_price == 4
+
+
+class TestEventEngineBatch:
+    """Test batch put and batch handlers of EventEngine."""
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if hasattr(self, "engine") and self.engine._active:
+            self.engine.stop()
+
+    def wait_until(self, condition, timeout: float = 2.0) -> None:
+        """Wait until condition is met or timeout expires."""
+        end = time.time() + timeout
+        while not condition() and time.time() < end:
+            time.sleep(0.01)
+
+    @pytest.mark.timeout(10)
+    def test_put_many_processed_in_order(self):
+        """Test events put in batch reach handlers in order."""
+        self.engine = EventEngine()
+        received = []
+        self.engine.register(EVENT_LOG, lambda event: received.append(event.data))
+        self.engine.start()
+
+        self.engine.put_many([Event(EVENT_LOG, i) for i in range(100)])
+        self.wait_until(lambda: len(received) == 100)
+        assert received == list(range(100))
+
+    @pytest.mark.timeout(10)
+    def test_put_many_sharded(self):
+        """Test put_many routes events to shards by key."""
+        self.engine = EventEngine(shards=4)
+        self.engine.put_many([Event(EVENT_TICK, create_tick("BTCUSDT", i)) for i in range(10)])
+
+        assert sorted(self.engine.get_shard_sizes()) == [0, 0, 0, 10]
+
+    @pytest.mark.timeout(10)
+    def test_batch_handler_receives_lists(self):
+        """Test batch handler receives all drained events of its type at once."""
+        self.engine = EventEngine()
+        batches = []
+        single = []
+        self.engine.register_batch(EVENT_TICK, lambda events: batches.append(events))
+        self.engine.register(EVENT_TICK, lambda event: single.append(event))
+
+        self.engine.put_many([Event(EVENT_TICK, create_tick("BTCUSDT", i)) for i in range(50)])
+        self.engine.put(Event(EVENT_LOG, "log"))
+        self.engine.start()
+
+        self.wait_until(lambda: sum(len(batch) for batch in batches) == 50)
+        assert len(batches) == 1
+        assert [event.data.last_price for event in batches[0]] == list(range(50))
+        assert len(single) == 50
+
+    @pytest.mark.timeout(10)
+    def test_unregister_batch_handler(self):
+        """Test unregistered batch handler no longer receives events."""
+        self.engine = EventEngine()
+        batches = []
+
+        def handler(events: list[Event]) -> None:
+            batches.append(events)
+
+        self.engine.register_batch(EVENT_LOG, handler)
+        self.engine.register_batch(EVENT_LOG, handler)
+        assert self.engine._batch_handlers[EVENT_LOG] == (handler,)
+
+        self.engine.unregister_batch(EVENT_LOG, handler)
+        assert EVENT_LOG not in self.engine._batch_handlers
+
+
+class TestEventQueuePriority:
+    """Test priority lanes of EventQueue."""
+
+    priorities = {EVENT_ORDER: EventPriority.HIGH, EVENT_TICK: EventPriority.LOW}
+
+    def fill(self, queue: EventQueue) -> None:
+        """Put ticks followed by orders and a log event."""
+        queue.put_many([Event(EVENT_TICK, create_tick("BTCUSDT", i)) for i in range(10)])
+        queue.put_many([Event(EVENT_ORDER, create_order(str(i))) for i in range(3)])
+        queue.put(Event(EVENT_LOG, "log"))
+
+    @pytest.mark.timeout(10)
+    def test_strict_policy(self):
+        """Test strict policy serves higher lanes first, FIFO within lane."""
+        queue = EventQueue(priorities=self.priorities, lane_policy=LanePolicy.STRICT)
+        self.fill(queue)
+
+        events = queue.get_many()
+        assert [event.type for event in events] == [EVENT_ORDER] * 3 + [EVENT_LOG] + [EVENT_TICK] * 10
+        assert [event.data.orderid for event in events[:3]] == ["0", "1", "2"]
+        assert [event.data.last_price for event in events[4:]] == list(range(10))
+
+    @pytest.mark.timeout(10)
+    def test_weighted_policy_does_not_starve(self):
+        """Test weighted policy interleaves lanes by weight."""
+        queue = EventQueue(
+            priorities=self.priorities,
+            lane_weights={EventPriority.HIGH: 2, EventPriority.NORMAL: 1, EventPriority.LOW: 1},
+        )
+        queue.put_many([Event(EVENT_TICK, create_tick("BTCUSDT", i)) for i in range(3)])
+        queue.put_many([Event(EVENT_ORDER, create_order(str(i))) for i in range(5)])
+
+        types = [event.type for event in queue.get_many()]
+        assert types == [
+            EVENT_ORDER, EVENT_ORDER, EVENT_TICK,
+            EVENT_ORDER, EVENT_ORDER, EVENT_TICK,
+            EVENT_ORDER, EVENT_TICK,
+        ]
+
+    @pytest.mark.timeout(10)
+    def test_lane_stats(self):
+        """Test per-lane depth and delivered counters."""
+        queue = EventQueue(priorities=self.priorities)
+        self.fill(queue)
+        queue.get_many(limit=2)
+
+        lanes = queue.get_stats()["lanes"]
+        assert lanes["HIGH"] == {"pending": 1, "delivered": 2, "max_depth": 3}
+        assert lanes["LOW"]["max_depth"] == 10
+        assert queue.qsize() == 12
+
+    @pytest.mark.timeout(10)
+    def test_drop_oldest_within_lane(self):
+        """Test drop oldest removes from the lane of the event type."""
+        queue = EventQueue(
+            maxsize=3,
+            priorities=self.priorities,
+            policies={EVENT_TICK: OverflowPolicy.DROP_OLDEST},
+        )
+        queue.put(Event(EVENT_ORDER, create_order("1")))
+        for i in range(3):
+            queue.put(Event(EVENT_TICK, create_tick("BTCUSDT", i)))
+
+        events = queue.get_many()
+        assert [event.type for event in events] == [EVENT_ORDER, EVENT_TICK, EVENT_TICK]
+        assert [event.data.last_price for event in events[1:]] == [1, 2]
+
+    @pytest.mark.timeout(10)
+    def test_no_lanes_stats_without_priorities(self):
+        """Test plain queue reports no lane stats."""
+        assert "lanes" not in EventQueue().get_stats()
+
+
+class TestEventEnginePriority:
+    """Test priority lanes in EventEngine."""
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if hasattr(self, "engine") and self.engine._active:
+            self.engine.stop()
+
+    @pytest.mark.timeout(10)
+    def test_orders_overtake_pending_ticks(self):
+        """Test orders put after a tick burst are processed early."""
+        self.engine = EventEngine(priorities=EXECUTION_PRIORITIES)
+        received = []
+        self.engine.register(EVENT_TICK, lambda event: received.append(event.type))
+        self.engine.register(EVENT_ORDER, lambda event: received.append(event.type))
+
+        self.engine.put_many([Event(EVENT_TICK, create_tick("BTCUSDT", i)) for i in range(1000)])
+        self.engine.put(Event(EVENT_ORDER, create_order("1")))
+        self.engine.start()
+
+        deadline = time.time() + 5
+        while len(received) < 1001 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert len(received) == 1001
+        assert received.index(EVENT_ORDER) < 10
+
+        lanes = self.engine.get_queue_stats()["lanes"]
+        assert lanes["HIGH"]["delivered"] == 1
+        assert lanes["LOW"]["delivered"] == 1000
+
+
+class TestEventQueueSpin:
+    """Test busy-waiting for events."""
+
+    @pytest.mark.timeout(10)
+    def test_spin_wait_times_out(self):
+        """Test spin_wait returns False once duration elapsed without events."""
+        queue = EventQueue()
+
+        start = time.perf_counter()
+        assert queue.spin_wait(0.01) is False
+        assert time.perf_counter() - start >= 0.01
+        assert queue.has_pending() is False
+
+    @pytest.mark.timeout(10)
+    def test_spin_wait_sees_put_from_other_thread(self):
+        """Test spinning consumer yields so a producer thread can put."""
+        queue = EventQueue()
+        producer = threading.Timer(0.01, queue.put, args=(Event(EVENT_LOG),))
+        producer.start()
+
+        assert queue.spin_wait(5) is True
+        assert queue.has_pending() is True
+        producer.join()
@@ -0,0 +1,125 @@
+"""
+Unit tests for EventEngine handler executors.
+
+Tests slow handlers running on executor threads without blocking the
+dispatch thread, ordering, overflow policies and registration errors.
+"""
+
+import threading
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.core.event_queue import OverflowPolicy
+from foxtrot.util.event_type import EVENT_LOG, EVENT_TICK
+
+
+class TestHandlerExecutor:
+    """Test handlers registered on executors."""
+
+    def setup_method(self):
+        """Setup fresh EventEngine for each test."""
+        self.engine = EventEngine()
+        self.received = []
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if self.engine._active:
+            self.engine.stop()
+
+    def wait_for(self, items: list, count: int, timeout: float = 2) -> None:
+        """Wait until items holds count entries."""
+        deadline = time.time() + timeout
+        while len(items) < count and time.time() < deadline:
+            time.sleep(0.005)
+
+    @pytest.mark.timeout(10)
+    def test_slow_handler_does_not_block_dispatch(self):
+        """Test dispatch thread keeps processing while executor handler is busy."""
+        release = threading.Event()
+        fast = []
+
+        self.engine.add_executor("slow")
+        self.engine.register(EVENT_LOG, lambda event: release.wait(5), executor="slow")
+        self.engine.register(EVENT_LOG, fast.append)
+        self.engine.start()
+
+        for _ in range(3):
+            self.engine.put(Event(EVENT_LOG))
+
+        self.wait_for(fast, 3)
+        assert len(fast) == 3
+        release.set()
+
+    @pytest.mark.timeout(10)
+    def test_handler_runs_on_executor_thread_in_order(self):
+        """Test executor handler receives events in dispatch order on its own thread."""
+        self.engine.add_executor("db")
+        self.engine.register(
+            EVENT_LOG,
+            lambda event: self.received.append((event.data, threading.current_thread().name)),
+            executor="db",
+        )
+        self.engine.start()
+
+        for i in range(20):
+            self.engine.put(Event(EVENT_LOG, i))
+
+        self.wait_for(self.received, 20)
+        assert [data for data, _ in self.received] == list(range(20))
+        assert all(name == "HandlerExecutor-db-0" for _, name in self.received)
+
+    @pytest.mark.timeout(10)
+    def test_drop_oldest_when_full(self):
+        """Test full executor queue drops oldest events instead of blocking."""
+        release = threading.Event()
+
+        def slow_handler(event: Event) -> None:
+            release.wait(5)
+            self.received.append(event.data)
+
+        executor = self.engine.add_executor("slow", capacity=2)
+        self.engine.register(EVENT_LOG, slow_handler, executor="slow")
+        self.engine.start()
+
+        self.engine.put(Event(EVENT_LOG, 0))
+        time.sleep(0.1)
+        for i in range(1, 6):
+            self.engine.put(Event(EVENT_LOG, i))
+
+        deadline = time.time() + 2
+        while executor.get_stats()["dropped"].get(EVENT_LOG, 0) < 3 and time.time() < deadline:
+            time.sleep(0.005)
+        release.set()
+
+        self.wait_for(self.received, 3)
+        assert self.received == [0, 4, 5]
+        assert self.engine.get_executor_stats()["slow"]["dropped"] == {EVENT_LOG: 3}
+
+    @pytest.mark.timeout(10)
+    def test_unregister_and_clear(self):
+        """Test executor handlers are removed from dispatch."""
+        self.engine.add_executor("db", policy=OverflowPolicy.DROP_NEWEST)
+        self.engine.register(EVENT_LOG, self.received.append, executor="db")
+        assert len(self.engine._dispatch[0][EVENT_LOG]) == 1
+
+        self.engine.unregister(EVENT_LOG, self.received.append, executor="db")
+        assert EVENT_LOG not in self.engine._dispatch[0]
+
+        self.engine.register(EVENT_LOG, self.received.append, executor="db")
+        self.engine.clear_handlers()
+        assert EVENT_LOG not in self.engine._dispatch[0]
+
+    @pytest.mark.timeout(10)
+    def test_registration_errors(self):
+        """Test unknown executors, duplicates and keyed handlers are rejected."""
+        with pytest.raises(ValueError):
+            self.engine.register(EVENT_LOG, self.received.append, executor="missing")
+
+        self.engine.add_executor("db")
+        with pytest.raises(ValueError):
+            self.engine.add_executor("db")
+
+        with pytest.raises(ValueError):
+            self.engine.register(EVENT_TICK, self.received.append, key="BTCUSDT.BINANCE", executor="db")
@@ -0,0 +1,168 @@
+"""
+Unit tests for shared memory event bus.
+
+Tests ring buffer sequencing and overrun detection, and delivery of
+events from a publishing engine to a subscribing engine, also across
+processes.
+"""
+
+import multiprocessing
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.core.shm_bus import (
+    ShmEventPublisher,
+    ShmEventSubscriber,
+    ShmRingReader,
+    ShmRingWriter,
+    decode_event,
+    encode_event,
+)
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_LOG, EVENT_TICK
+from foxtrot.util.object import TickData
+from foxtrot.util.timestamp import now_timestamp
+
+
+def create_tick(symbol: str, price: float = 1.0) -> TickData:
+    """Create tick data for testing."""
+    return TickData(
+        adapter_name="TEST",
+        symbol=symbol,
+        exchange=Exchange.BINANCE,
+        timestamp=now_timestamp(),
+        last_price=price,
+    )
+
+
+def read_in_child(name: str, count: int, results: multiprocessing.Queue) -> None:
+    """Read count records from ring in a child process."""
+    reader = ShmRingReader(name)
+    results.put("ready")
+
+    received = []
+    deadline = time.time() + 5
+    while len(received) < count and time.time() < deadline:
+        received.extend(decode_event(record).data.last_price for record in reader.read())
+        time.sleep(0.001)
+
+    reader.close()
+    results.put(received)
+
+
+class TestShmRing:
+    """Test shared memory ring writer and reader."""
+
+    def setup_method(self):
+        """Setup fresh ring for each test."""
+        self.writer = ShmRingWriter(capacity=8, slot_size=64)
+        self.reader = ShmRingReader(self.writer.name)
+
+    def teardown_method(self):
+        """Cleanup ring after each test."""
+        self.reader.close()
+        self.writer.close()
+
+    @pytest.mark.timeout(10)
+    def test_read_in_order(self):
+        """Test records are read once in write order."""
+        for i in range(5):
+            self.writer.write(bytes([i]))
+
+        assert self.reader.read() == [bytes([i]) for i in range(5)]
+        assert self.reader.read() == []
+
+    @pytest.mark.timeout(10)
+    def test_read_limit(self):
+        """Test read returns at most limit records."""
+        for i in range(5):
+            self.writer.write(bytes([i]))
+
+        assert len(self.reader.read(limit=3)) == 3
+        assert len(self.reader.read()) == 2
+
+    @pytest.mark.timeout(10)
+    def test_overrun_counted_as_lost(self):
+        """Test records overwritten before being read are counted as lost."""
+        for i in range(20):
+            self.writer.write(bytes([i]))
+
+        assert self.reader.read() == [bytes([i]) for i in range(12, 20)]
+        assert self.reader.lost == 12
+
+    @pytest.mark.timeout(10)
+    def test_record_too_large(self):
+        """Test records larger than a slot are rejected."""
+        with pytest.raises(ValueError):
+            self.writer.write(bytes(64))
+
+    @pytest.mark.timeout(10)
+    def test_event_record_round_trip(self):
+        """Test event type and data survive encoding."""
+        event = decode_event(encode_event(Event(EVENT_TICK, create_tick("BTCUSDT", 2.0))))
+        assert event.type == EVENT_TICK
+        assert event.data.last_price == 2.0
+
+        event = decode_event(encode_event(Event(EVENT_LOG)))
+        assert event.type == EVENT_LOG
+        assert event.data is None
+
+    @pytest.mark.timeout(20)
+    def test_read_from_other_process(self):
+        """Test records written are read by a reader in another process."""
+        writer = ShmRingWriter(capacity=1024, slot_size=512)
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        process = context.Process(target=read_in_child, args=(writer.name, 100, results))
+        process.start()
+
+        try:
+            assert results.get(timeout=15) == "ready"
+            for i in range(100):
+                writer.write(encode_event(Event(EVENT_TICK, create_tick("BTCUSDT", float(i)))))
+
+            assert results.get(timeout=10) == [float(i) for i in range(100)]
+        finally:
+            process.join(timeout=5)
+            writer.close()
+
+
+class TestShmEventBus:
+    """Test publishing events between engines over shared memory."""
+
+    def setup_method(self):
+        """Setup publishing and subscribing engines for each test."""
+        self.engine = EventEngine()
+        self.remote_engine = EventEngine()
+        self.publisher = ShmEventPublisher(self.engine)
+        self.subscriber = ShmEventSubscriber(self.remote_engine, self.publisher.name)
+        self.received = []
+
+    def teardown_method(self):
+        """Cleanup engines and bus after each test."""
+        self.subscriber.close()
+        self.publisher.close()
+        for engine in (self.engine, self.remote_engine):
+            if engine._active:
+                engine.stop()
+
+    @pytest.mark.timeout(10)
+    def test_events_delivered_to_subscriber_engine(self):
+        """Test published ticks reach handlers of the subscribing engine."""
+        self.remote_engine.register(EVENT_TICK, self.received.append, key="BTCUSDT.BINANCE")
+        self.remote_engine.start()
+        self.subscriber.start()
+        self.engine.start()
+
+        self.engine.put(Event(EVENT_TICK, create_tick("ETHUSDT")))
+        self.engine.put(Event(EVENT_TICK, create_tick("BTCUSDT", 3.0)))
+        self.engine.put(Event(EVENT_LOG))
+
+        deadline = time.time() + 2
+        while not self.received and time.time() < deadline:
+            time.sleep(0.005)
+
+        assert [event.data.last_price for event in self.received] == [3.0]
+        assert self.subscriber.get_lost() == 0
@@ -0,0 +1,169 @@
+"""
+Unit tests for TimerWheel and EventEngine scheduled callbacks.
+
+Tests expiry of timers on every wheel level, cancellation, repeating
+timers and delivery of callbacks through the event queue.
+"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import EVENT_SCHEDULE, Event, EventEngine
+from foxtrot.core.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+    """Test TimerWheel expiry driven by explicit ticks."""
+
+    def setup_method(self):
+        """Setup fresh TimerWheel for each test."""
+        self.delivered = []
+        self.wheel = TimerWheel(self.delivered.append)
+
+    @pytest.mark.timeout(10)
+    def test_expire_on_every_level(self):
+        """Test timers expire exactly at their tick across all levels."""
+        random.seed(0)
+        expires = [random.randint(1, 1 << 34) for _ in range(2000)] + [1, 255, 256, 65536, 1 << 24]
+        handles = {self.wheel._schedule(e, 0, print, ()): e for e in expires}
+
+        for target in sorted(set(expires)):
+            for handle in self.wheel._expire(target):
+                assert handles[handle] == target
+
+        assert len(self.wheel) == 0
+
+    @pytest.mark.timeout(10)
+    def test_cancel(self):
+        """Test cancelled timer is removed from its slot."""
+        handle = self.wheel._schedule(100, 0, print, ())
+        other = self.wheel._schedule(100_000, 0, print, ())
+
+        handle.cancel()
+        assert handle.cancelled
+        assert len(self.wheel) == 1
+
+        assert self.wheel._expire(100_000) == [other]
+
+    @pytest.mark.timeout(10)
+    def test_repeating_timer(self):
+        """Test repeating timer is rescheduled every interval."""
+        self.wheel._schedule(5, 5, print, ())
+
+        fired = [tick for tick in range(1, 31) if self.wheel._expire(tick)]
+        assert fired == [5, 10, 15, 20, 25, 30]
+
+    @pytest.mark.timeout(10)
+    def test_past_timer_expires_next_tick(self):
+        """Test timer scheduled in the past expires at the next tick."""
+        self.wheel._expire(1000)
+        handle = self.wheel._schedule(10, 0, print, ())
+
+        assert self.wheel._expire(1001) == [handle]
+
+    @pytest.mark.timeout(10)
+    def test_advance_delivers_due_timers(self):
+        """Test advance delivers timers due by now only."""
+        due = self.wheel.call_later(0, print)
+        self.wheel.call_later(60, print)
+        cancelled = self.wheel.call_later(0, print)
+        cancelled.cancel()
+
+        time.sleep(0.01)
+        self.wheel.advance()
+
+        assert self.delivered == [due]
+
+    @pytest.mark.timeout(10)
+    def test_wait_woken_by_earlier_timer(self):
+        """Test thread waiting on the wheel is woken by a new earlier timer."""
+        self.wheel.call_later(60, print)
+
+        def schedule():
+            time.sleep(0.05)
+            self.wheel.call_later(0.01, print)
+
+        thread = threading.Thread(target=schedule)
+        thread.start()
+
+        start = time.monotonic()
+        self.wheel.wait(5)
+        thread.join()
+
+        assert time.monotonic() - start < 1
+
+
+class TestEventEngineScheduling:
+    """Test scheduled callbacks of EventEngine."""
+
+    def setup_method(self):
+        """Setup fresh EventEngine for each test."""
+        self.engine = EventEngine()
+        self.calls = []
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if self.engine._active:
+            self.engine.stop()
+
+    def wait_for(self, count: int, timeout: float = 2) -> None:
+        """Wait until callbacks were called count times."""
+        deadline = time.time() + timeout
+        while len(self.calls) < count and time.time() < deadline:
+            time.sleep(0.005)
+
+    @pytest.mark.timeout(10)
+    def test_call_later_runs_on_worker(self):
+        """Test callback is run by the worker thread with its args."""
+        self.engine.start()
+        self.engine.call_later(0.02, lambda value: self.calls.append((value, threading.current_thread())), 1)
+
+        self.wait_for(1)
+        assert self.calls == [(1, self.engine._thread)]
+
+    @pytest.mark.timeout(10)
+    def test_call_every_and_cancel(self):
+        """Test repeating callback runs until cancelled."""
+        self.engine.start()
+        handle = self.engine.call_every(0.01, lambda: self.calls.append(1))
+
+        self.wait_for(3)
+        handle.cancel()
+        count = len(self.calls)
+        time.sleep(0.05)
+
+        assert count >= 3
+        assert len(self.calls) <= count + 1
+
+    @pytest.mark.timeout(10)
+    def test_call_at(self):
+        """Test callback scheduled at absolute monotonic time."""
+        self.engine.start()
+        self.engine.call_at(time.monotonic() + 0.02, self.calls.append, "at")
+
+        self.wait_for(1)
+        assert self.calls == ["at"]
+
+    @pytest.mark.timeout(10)
+    def test_cancelled_after_delivery_skipped(self):
+        """Test callback cancelled while pending in queue is not run."""
+        handle = self.engine.call_later(0, self.calls.append, 1)
+        handle.cancel()
+
+        self.engine._process(Event(EVENT_SCHEDULE, handle))
+        assert self.calls == []
+
+    @pytest.mark.timeout(10)
+    def test_scheduled_events_hidden_from_general_handlers(self):
+        """Test general handlers do not receive scheduled callback events."""
+        received = []
+        self.engine.register_general(received.append)
+
+        handle = self.engine.call_later(0, self.calls.append, 1)
+        self.engine._process(Event(EVENT_SCHEDULE, handle))
+
+        assert self.calls == [1]
+        assert received == []
@@ -0,0 +1,215 @@
+"""
+Unit tests for event bridge.
+
+Tests framing, address parsing and publishing events between event
+engines over localhost TCP and Unix domain sockets, including reconnect
+and per-subscriber backpressure.
+"""
+
+from datetime import datetime
+import socket
+import time
+
+import pytest
+
+from foxtrot.core.event_codec import encode_event
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.server.bridge import (
+    EventBridgeClient,
+    EventBridgeServer,
+    decode_frames,
+    encode_frames,
+    parse_address,
+)
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_CONTRACT, EVENT_TICK
+from foxtrot.util.object import TickData
+
+
+def create_tick(price: float) -> TickData:
+    """Create tick data for testing."""
+    return TickData(
+        adapter_name="TEST",
+        symbol="BTCUSDT",
+        exchange=Exchange.BINANCE,
+        datetime=datetime(2024, 1, 1),
+        last_price=price,
+    )
+
+
+def wait_for(condition, timeout: float = 5) -> None:
+    """Wait until condition is true."""
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+class TestFraming:
+    """Test frame encoding and address parsing."""
+
+    @pytest.mark.timeout(10)
+    def test_partial_frame_kept(self):
+        """Test complete frames are decoded and a partial frame is kept."""
+        data = encode_frames([encode_event(Event(EVENT_TICK, create_tick(float(i)))) for i in range(3)])
+        buffer = bytearray(data[:-5])
+
+        events = decode_frames(buffer)
+        assert [event.data.last_price for event in events] == [0.0, 1.0]
+
+        buffer += data[-5:]
+        assert [event.data.last_price for event in decode_frames(buffer)] == [2.0]
+        assert buffer == bytearray()
+
+    @pytest.mark.timeout(10)
+    def test_invalid_frame(self):
+        """Test frame of unknown codec raises ValueError and leaves buffer resizable."""
+        record = encode_event(Event(EVENT_TICK, create_tick(1.0)))
+        bad = record[:2 + len(EVENT_TICK)] + bytes([200, 1]) + record[4 + len(EVENT_TICK):]
+        buffer = bytearray(encode_frames([record, bad, record]))
+
+        with pytest.raises(ValueError):
+            decode_frames(buffer)
+
+        assert buffer == bytearray(encode_frames([bad, record]))
+        buffer.clear()
+
+    @pytest.mark.timeout(10)
+    def test_parse_address(self):
+        """Test TCP and Unix addresses are parsed and others rejected."""
+        assert parse_address("tcp://127.0.0.1:20250") == (socket.AF_INET, ("127.0.0.1", 20250))
+        assert parse_address("unix:///tmp/bridge.sock") == (socket.AF_UNIX, "/tmp/bridge.sock")
+
+        for address in ("tcp://127.0.0.1", "udp://127.0.0.1:1", "127.0.0.1:1"):
+            with pytest.raises(ValueError):
+                parse_address(address)
+
+
+class TestEventBridge:
+    """Test publishing events between event engines."""
+
+    def setup_method(self):
+        """Setup publishing and subscribing event engines."""
+        self.source = EventEngine()
+        self.target = EventEngine()
+        self.received = []
+        self.target.register(EVENT_TICK, self.received.append)
+        self.target.start()
+
+        self.servers = []
+        self.clients = []
+
+    def teardown_method(self):
+        """Close bridges and event engines."""
+        for client in self.clients:
+            client.close()
+        for server in self.servers:
+            server.close()
+        self.target.stop()
+
+    def start_server(self, address: str, **kwargs) -> EventBridgeServer:
+        """Start bridge server on source engine."""
+        server = EventBridgeServer(self.source, address, **kwargs)
+        server.start()
+        self.servers.append(server)
+        return server
+
+    def start_client(self, address: str) -> EventBridgeClient:
+        """Start bridge client connected to target engine."""
+        client = EventBridgeClient(self.target, address, reconnect_interval=0.05)
+        client.start()
+        self.clients.append(client)
+        return client
+
+    def publish(self, count: int) -> None:
+        """Publish ticks through handlers of source engine."""
+        for i in range(count):
+            self.source._process(Event(EVENT_TICK, create_tick(float(i))))
+
+    @pytest.mark.timeout(10)
+    def test_tcp_bridge(self):
+        """Test events are received in order over TCP."""
+        server = self.start_server("tcp://127.0.0.1:0")
+        address = f"tcp://127.0.0.1:{server.port}"
+        client = self.start_client(address)
+        wait_for(lambda: client.connected and server.get_stats())
+
+        self.publish(1000)
+        self.source._process(Event(EVENT_CONTRACT, object()))
+
+        wait_for(lambda: len(self.received) >= 1000)
+        assert [event.data.last_price for event in self.received] == [float(i) for i in range(1000)]
+        assert self.received[0].data == create_tick(0.0)
+
+    @pytest.mark.timeout(10)
+    def test_unix_bridge(self, tmp_path):
+        """Test events are received over a Unix domain socket."""
+        address = f"unix://{tmp_path / 'bridge.sock'}"
+        server = self.start_server(address)
+        client = self.start_client(address)
+        wait_for(lambda: client.connected and server.get_stats())
+
+        self.publish(10)
+
+        wait_for(lambda: len(self.received) >= 10)
+        assert len(self.received) == 10
+
+    @pytest.mark.timeout(10)
+    def test_client_reconnects(self):
+        """Test client reconnects after the server was restarted."""
+        server = self.start_server("tcp://127.0.0.1:0")
+        address = f"tcp://127.0.0.1:{server.port}"
+        client = self.start_client(address)
+        wait_for(lambda: client.connected and server.get_stats())
+
+        server.close()
+        wait_for(lambda: not client.connected)
+        assert not client.connected
+
+        server = self.start_server(address)
+        wait_for(lambda: client.connected and server.get_stats())
+        self.publish(5)
+
+        wait_for(lambda: len(self.received) >= 5)
+        assert len(self.received) == 5
+
+    @pytest.mark.timeout(10)
+    def test_client_reconnects_after_invalid_frame(self):
+        """Test client drops a connection sending an invalid frame and reconnects."""
+        listener = socket.create_server(("127.0.0.1", 0))
+        address = f"tcp://127.0.0.1:{listener.getsockname()[1]}"
+        client = self.start_client(address)
+
+        try:
+            sock, _ = listener.accept()
+            sock.sendall(encode_frames([b"\x05\x00eTick.\xc8\x01"]))
+            wait_for(lambda: sock.recv(1) == b"")
+            sock.close()
+
+            sock, _ = listener.accept()
+            sock.sendall(encode_frames([encode_event(Event(EVENT_TICK, create_tick(1.0)))]))
+            wait_for(lambda: self.received)
+            assert [event.data.last_price for event in self.received] == [1.0]
+            assert client.connected
+            sock.close()
+        finally:
+            listener.close()
+
+    @pytest.mark.timeout(60)
+    def test_slow_subscriber_drops_oldest(self):
+        """Test events for a subscriber not reading are dropped instead of blocking."""
+        server = self.start_server("tcp://127.0.0.1:0", capacity=100)
+
+        # Raw socket never reading, so the kernel buffers fill up
+        sock = socket.create_connection(("127.0.0.1", server.port))
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        wait_for(lambda: server.get_stats())
+
+        # Publishing must not block on the subscriber, only encoding takes time
+        start = time.monotonic()
+        self.publish(50_000)
+        assert time.monotonic() - start < 30
+
+        stats = next(iter(server.get_stats().values()))
+        assert stats["dropped"][EVENT_TICK] > 0
+        assert stats["pending"] <= 100
+        sock.close()
@@ -0,0 +1,204 @@
+"""
+Unit tests for event journal.
+
+Tests writing and memory mapped reading of journal files, replay into an
+event engine and recording by JournalEngine.
+"""
+
+from datetime import datetime
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from foxtrot.core.event_engine import EVENT_TIMER, Event, EventEngine
+from foxtrot.server import engine as engine_module
+from foxtrot.server.engine import JournalEngine
+from foxtrot.server.journal import JournalReader, JournalWriter, replay_journal
+from foxtrot.util.constants import Direction, Exchange, Status
+from foxtrot.util.event_type import EVENT_CONTRACT, EVENT_LOG, EVENT_ORDER, EVENT_POSITION, EVENT_TICK
+from foxtrot.util.object import LogData, OrderData, PositionData, TickData
+
+
+def create_tick(price: float) -> TickData:
+    """Create tick data for testing."""
+    return TickData(
+        adapter_name="TEST",
+        symbol="BTCUSDT",
+        exchange=Exchange.BINANCE,
+        datetime=datetime(2024, 1, 1),
+        last_price=price,
+    )
+
+
+class TestJournalFile:
+    """Test journal writer and reader."""
+
+    @pytest.mark.timeout(10)
+    def test_round_trip(self, tmp_path):
+        """Test events and timestamps are read back in order."""
+        path = tmp_path / "test.fxj"
+        writer = JournalWriter(path)
+        position = PositionData(
+            adapter_name="TEST",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            direction=Direction.NET,
+            volume=2,
+        )
+
+        writer.write(Event(EVENT_TICK, create_tick(1.0)), 100)
+        writer.write(Event(EVENT_POSITION, position), 200)
+        writer.write(Event(EVENT_LOG, LogData(adapter_name="TEST", msg="hello")), 300)
+        writer.close()
+
+        with JournalReader(path) as reader:
+            records = list(reader)
+
+        assert [timestamp for timestamp, _ in records] == [100, 200, 300]
+        assert records[0][1].data == create_tick(1.0)
+        assert records[1][1].data == position
+        assert records[2][1].type == EVENT_LOG
+        assert records[2][1].data.msg == "hello"
+
+    @pytest.mark.timeout(10)
+    def test_truncated_record_ignored(self, tmp_path):
+        """Test record cut off at the end of file ends the journal."""
+        path = tmp_path / "test.fxj"
+        writer = JournalWriter(path)
+        writer.write(Event(EVENT_TICK, create_tick(1.0)))
+        writer.write(Event(EVENT_TICK, create_tick(2.0)))
+        writer.close()
+
+        path.write_bytes(path.read_bytes()[:-5])
+
+        with JournalReader(path) as reader:
+            assert [event.data.last_price for _, event in reader] == [1.0]
+
+    @pytest.mark.timeout(10)
+    def test_invalid_file(self, tmp_path):
+        """Test files without journal header are rejected."""
+        path = tmp_path / "test.fxj"
+        path.write_bytes(b"not a journal")
+
+        with pytest.raises(ValueError):
+            JournalReader(path)
+
+
+class TestReplay:
+    """Test replaying journals into an event engine."""
+
+    def setup_method(self):
+        """Setup fresh EventEngine for each test."""
+        self.engine = EventEngine()
+        self.received = []
+        self.engine.register(EVENT_TICK, self.received.append)
+
+    def teardown_method(self):
+        """Cleanup EventEngine after each test."""
+        if self.engine._active:
+            self.engine.stop()
+
+    def write_journal(self, path, count: int, gap: int) -> None:
+        """Write count ticks gap nanoseconds apart."""
+        writer = JournalWriter(path)
+        for i in range(count):
+            writer.write(Event(EVENT_TICK, create_tick(float(i))), i * gap)
+        writer.close()
+
+    def wait_for(self, count: int) -> None:
+        """Wait until count events were received."""
+        deadline = time.time() + 5
+        while len(self.received) < count and time.time() < deadline:
+            time.sleep(0.005)
+
+    @pytest.mark.timeout(10)
+    def test_replay_as_fast_as_possible(self, tmp_path):
+        """Test all events are replayed in order."""
+        path = tmp_path / "test.fxj"
+        self.write_journal(path, 2500, 1_000_000_000)
+        self.engine.start()
+
+        start = time.monotonic()
+        assert replay_journal(path, self.engine) == 2500
+        assert time.monotonic() - start < 2
+
+        self.wait_for(2500)
+        assert [event.data.last_price for event in self.received] == [float(i) for i in range(2500)]
+
+    @pytest.mark.timeout(10)
+    def test_replay_time_scaled(self, tmp_path):
+        """Test recorded gaps are kept scaled down by speed."""
+        path = tmp_path / "test.fxj"
+        self.write_journal(path, 3, 100_000_000)
+        self.engine.start()
+
+        start = time.monotonic()
+        replay_journal(path, self.engine, speed=2)
+        elapsed = time.monotonic() - start
+
+        assert 0.09 <= elapsed < 0.5
+        self.wait_for(3)
+        assert len(self.received) == 3
+
+
+class TestJournalEngine:
+    """Test recording events with JournalEngine."""
+
+    @pytest.mark.timeout(10)
+    def test_records_data_events(self, tmp_path, monkeypatch):
+        """Test data events are recorded while timer and unsupported events are skipped."""
+        monkeypatch.setattr(engine_module, "get_folder_path", lambda name: tmp_path)
+        event_engine = EventEngine()
+        journal_engine = JournalEngine(MagicMock(), event_engine)
+
+        for event in (
+            Event(EVENT_TICK, create_tick(1.0)),
+            Event(EVENT_TIMER),
+            Event(EVENT_CONTRACT, object()),
+            Event(EVENT_TICK, create_tick(2.0)),
+        ):
+            event_engine._process(event)
+
+        journal_engine.close()
+
+        with JournalReader(journal_engine.writer.path) as reader:
+            assert [event.data.last_price for _, event in reader] == [1.0, 2.0]
+
+    @pytest.mark.timeout(10)
+    def test_order_recorded_as_dispatched(self, tmp_path, monkeypatch):
+        """Test order updated in place after dispatch is recorded with its state at dispatch."""
+        monkeypatch.setattr(engine_module, "get_folder_path", lambda name: tmp_path)
+        event_engine = EventEngine()
+        journal_engine = JournalEngine(MagicMock(), event_engine)
+        order = OrderData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, orderid="1")
+
+        event_engine._process(Event(EVENT_ORDER, order))
+        order.status = Status.CANCELLED
+        event_engine._process(Event(EVENT_ORDER, order))
+        journal_engine.close()
+
+        assert not journal_engine.thread.is_alive()
+        with JournalReader(journal_engine.writer.path) as reader:
+            assert [event.data.status for _, event in reader] == [Status.SUBMITTING, Status.CANCELLED]
+
+    @pytest.mark.timeout(10)
+    def test_disabled_after_failure(self, tmp_path, monkeypatch):
+        """Test write failure is logged once without log events and further events are dropped."""
+        monkeypatch.setattr(engine_module, "get_folder_path", lambda name: tmp_path)
+        main_engine = MagicMock()
+        event_engine = EventEngine()
+        journal_engine = JournalEngine(main_engine, event_engine)
+        journal_engine._logger = MagicMock()
+        journal_engine.writer.write = MagicMock(side_effect=OSError("disk full"))
+
+        event_engine._process(Event(EVENT_TICK, create_tick(1.0)))
+        event_engine._process(Event(EVENT_TICK, create_tick(2.0)))
+        while not journal_engine.failed:
+            time.sleep(0.01)
+        event_engine._process(Event(EVENT_TICK, create_tick(3.0)))
+        journal_engine.close()
+
+        assert journal_engine.writer.write.call_count == 1
+        assert journal_engine._logger.error.call_count == 1
+        main_engine.write_log.assert_not_called()
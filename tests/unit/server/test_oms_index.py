@@ -0,0 +1,197 @@
+"""
+Unit tests for order management indexes.
+
+Tests the DataIndex buckets and OmsEngine queries by symbol, adapter,
+reference and status as orders, trades and positions are updated.
+"""
+
+from threading import Barrier, BrokenBarrierError, Event as ThreadEvent, Thread
+from unittest.mock import MagicMock
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.server.engine import OmsEngine
+from foxtrot.server.index import DataIndex
+from foxtrot.util.constants import Direction, Exchange, Status
+from foxtrot.util.event_type import EVENT_ACCOUNT, EVENT_ORDER, EVENT_POSITION, EVENT_TRADE
+from foxtrot.util.object import AccountData, OrderData, PositionData, TradeData
+
+
+def create_order(orderid: str, symbol: str = "BTCUSDT", adapter_name: str = "BINANCE", **kwargs) -> OrderData:
+    """Create order data for testing."""
+    return OrderData(
+        adapter_name=adapter_name, symbol=symbol, exchange=Exchange.BINANCE, orderid=orderid, **kwargs
+    )
+
+
+def create_trade(tradeid: str, orderid: str, symbol: str = "BTCUSDT") -> TradeData:
+    """Create trade data for testing."""
+    return TradeData(
+        adapter_name="BINANCE", symbol=symbol, exchange=Exchange.BINANCE, orderid=orderid, tradeid=tradeid
+    )
+
+
+def vt_orderids(orders: list[OrderData]) -> list[str]:
+    """Get vt_orderids of orders."""
+    return [order.vt_orderid for order in orders]
+
+
+class PausingIndex(DataIndex):
+    """Index waiting in the middle of moving data until another thread moves it too."""
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+        self.barrier: Barrier = Barrier(2)
+        self.paused: ThreadEvent = ThreadEvent()
+
+    def _discard(self, key, vt_id) -> None:
+        """"""
+        self.paused.set()
+        try:
+            self.barrier.wait(timeout=0.2)
+        except BrokenBarrierError:
+            pass
+        super()._discard(key, vt_id)
+
+
+@pytest.fixture
+def oms_engine() -> OmsEngine:
+    """Create OmsEngine without running its event engine."""
+    return OmsEngine(MagicMock(), EventEngine())
+
+
+class TestDataIndex:
+    """Test DataIndex buckets."""
+
+    @pytest.mark.timeout(10)
+    def test_update_moves_key(self):
+        """Test data changing key is moved and empty buckets dropped."""
+        index: DataIndex[str] = DataIndex()
+        index.update("a", 1, "a1")
+        index.update("b", 1, "b1")
+        index.update("a", 2, "a2")
+
+        assert index.get(1) == ["b1"]
+        assert index.get(2) == ["a2"]
+
+        index.remove("b")
+        assert 1 not in index.buckets
+        assert index.get(1) == []
+        assert len(index) == 1
+
+    @pytest.mark.timeout(10)
+    def test_remove_missing(self):
+        """Test removing data not in index is ignored."""
+        index: DataIndex[str] = DataIndex()
+        index.remove("a")
+
+        assert len(index) == 0
+
+    @pytest.mark.timeout(10)
+    def test_concurrent_updates(self):
+        """Test data moved by two handler threads at once ends up in one bucket."""
+        index: DataIndex[str] = PausingIndex()
+        index.update("BINANCE.1", "old", "old")
+
+        threads = [Thread(target=index.update, args=("BINANCE.1", key, key)) for key in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        filed = [(vt_id, key) for key, bucket in index.buckets.items() for vt_id in bucket]
+        assert filed == list(index.keys.items())
+        assert index.get(index.get_key("BINANCE.1")) == [index.get_key("BINANCE.1")]
+
+    @pytest.mark.timeout(10)
+    def test_get_key_waits_for_update(self):
+        """Test key looked up while data is being moved is the one it is moved to."""
+        index: DataIndex[str] = PausingIndex()
+        index.update("BINANCE.1", "old", "old")
+
+        thread = Thread(target=index.update, args=("BINANCE.1", "new", "new"))
+        thread.start()
+        index.paused.wait(timeout=1)
+
+        assert index.get_key("BINANCE.1") == "new"
+        thread.join()
+
+
+class TestOmsIndex:
+    """Test OmsEngine queries from indexes."""
+
+    @pytest.mark.timeout(10)
+    def test_orders_by_symbol_and_status(self, oms_engine):
+        """Test orders move between status buckets and leave active ones."""
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("1", status=Status.NOTTRADED)))
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("2", status=Status.NOTTRADED)))
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("3", symbol="ETHUSDT")))
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("1", status=Status.ALLTRADED)))
+
+        assert vt_orderids(oms_engine.get_orders_by_symbol("BTCUSDT.BINANCE")) == ["BINANCE.1", "BINANCE.2"]
+        assert vt_orderids(oms_engine.get_active_orders_by_symbol("BTCUSDT.BINANCE")) == ["BINANCE.2"]
+        assert vt_orderids(oms_engine.get_orders_by_status(Status.NOTTRADED)) == ["BINANCE.2"]
+        assert vt_orderids(oms_engine.get_orders_by_status(Status.ALLTRADED)) == ["BINANCE.1"]
+        assert oms_engine.get_orders_by_symbol("SOLUSDT.BINANCE") == []
+
+    @pytest.mark.timeout(10)
+    def test_order_updated_in_place(self, oms_engine):
+        """Test order mutated by adapter and sent again is moved out of old buckets."""
+        order = create_order("1", status=Status.NOTTRADED)
+        oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+        order.status = Status.CANCELLED
+        oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+        assert oms_engine.get_orders_by_status(Status.NOTTRADED) == []
+        assert oms_engine.get_orders_by_status(Status.CANCELLED) == [order]
+        assert oms_engine.get_active_orders_by_symbol(order.vt_symbol) == []
+
+    @pytest.mark.timeout(10)
+    def test_by_adapter(self, oms_engine):
+        """Test data of each adapter is found by adapter name."""
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("1")))
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("1", adapter_name="FUTU")))
+        account = AccountData(adapter_name="FUTU", accountid="main", balance=100)
+        oms_engine.process_account_event(Event(EVENT_ACCOUNT, account))
+
+        assert vt_orderids(oms_engine.get_orders_by_adapter("FUTU")) == ["FUTU.1"]
+        assert oms_engine.get_accounts_by_adapter("FUTU") == [account]
+        assert oms_engine.get_accounts_by_adapter("BINANCE") == []
+
+    @pytest.mark.timeout(10)
+    def test_trades_by_reference(self, oms_engine):
+        """Test trades follow reference of their order, also when it arrives later."""
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("1", reference="alpha")))
+        oms_engine.process_trade_event(Event(EVENT_TRADE, create_trade("t1", "1")))
+        oms_engine.process_trade_event(Event(EVENT_TRADE, create_trade("t2", "2")))
+
+        assert [trade.tradeid for trade in oms_engine.get_trades_by_reference("alpha")] == ["t1"]
+        assert [trade.tradeid for trade in oms_engine.get_trades_by_order("BINANCE.2")] == ["t2"]
+
+        oms_engine.process_order_event(Event(EVENT_ORDER, create_order("2", reference="alpha")))
+
+        assert [trade.tradeid for trade in oms_engine.get_trades_by_reference("alpha")] == ["t1", "t2"]
+        assert vt_orderids(oms_engine.get_orders_by_reference("alpha")) == ["BINANCE.1", "BINANCE.2"]
+        assert len(oms_engine.get_trades_by_symbol("BTCUSDT.BINANCE")) == 2
+
+    @pytest.mark.timeout(10)
+    def test_positions_by_symbol(self, oms_engine):
+        """Test positions of both directions are found by symbol with latest data."""
+        for direction in (Direction.LONG, Direction.SHORT, Direction.LONG):
+            position = PositionData(
+                adapter_name="BINANCE",
+                symbol="BTCUSDT",
+                exchange=Exchange.BINANCE,
+                direction=direction,
+                volume=1,
+            )
+            oms_engine.process_position_event(Event(EVENT_POSITION, position))
+
+        positions = oms_engine.get_positions_by_symbol("BTCUSDT.BINANCE")
+
+        assert [position.direction for position in positions] == [Direction.LONG, Direction.SHORT]
+        assert positions[0] is position
+        assert oms_engine.get_positions_by_adapter("BINANCE") == positions
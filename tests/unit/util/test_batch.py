@@ -0,0 +1,200 @@
+"""
+Unit tests for columnar batches.
+
+Tests round trip of bars and ticks through batches, zero-copy column
+views and slicing, timezone handling, joining batches and updating
+ArrayManager from a batch.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from foxtrot.adapter.binance.historical_data import BinanceHistoricalData
+from foxtrot.util.batch import BarBatch, TickBatch
+from foxtrot.util.constants import Exchange, Interval
+from foxtrot.util.object import BarData, HistoryRequest, TickData
+from foxtrot.util.utility import ArrayManager
+
+
+def create_bars(count: int, tz: ZoneInfo | None = None) -> list[BarData]:
+    """Create minute bars for testing."""
+    start = datetime(2024, 1, 1, 9, 30, tzinfo=tz)
+    return [
+        BarData(
+            adapter_name="TEST",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            datetime=start + timedelta(minutes=i),
+            interval=Interval.MINUTE,
+            volume=10.0 + i,
+            turnover=1000.0 * i,
+            open_price=100.0 + i,
+            high_price=101.0 + i,
+            low_price=99.0 + i,
+            close_price=100.5 + i,
+        )
+        for i in range(count)
+    ]
+
+
+class TestBarBatch:
+    """Test BarBatch conversion and views."""
+
+    @pytest.mark.timeout(10)
+    def test_round_trip(self):
+        """Test bars are equal after conversion to batch and back."""
+        bars = create_bars(100)
+        batch = BarBatch.from_bars(bars)
+
+        assert len(batch) == 100
+        assert batch.symbol == "BTCUSDT"
+        assert batch.interval == Interval.MINUTE
+        assert batch.to_bars() == bars
+
+    @pytest.mark.timeout(10)
+    def test_aware_datetimes(self):
+        """Test aware datetimes are restored in the timezone of the batch."""
+        tz = ZoneInfo("Asia/Shanghai")
+        bars = create_bars(3, tz)
+        batch = BarBatch.from_bars(bars)
+
+        assert batch.datetime[0] == np.datetime64("2024-01-01T01:30:00", "ns")
+        assert batch.to_bars() == bars
+        assert batch[0].datetime.tzinfo == tz
+
+    @pytest.mark.timeout(10)
+    def test_column_views(self):
+        """Test columns and slices view the same array without copying."""
+        batch = BarBatch.from_bars(create_bars(10))
+
+        close = batch.close_price
+        assert np.shares_memory(close, batch.data)
+        assert close.tolist() == [100.5 + i for i in range(10)]
+
+        tail = batch[5:]
+        assert np.shares_memory(tail.data, batch.data)
+        assert tail.close_price[0] == 105.5
+        assert tail.symbol == "BTCUSDT"
+
+        assert batch[-1] == create_bars(10)[-1]
+        assert len(batch[batch.volume > 15]) == 4
+
+    @pytest.mark.timeout(10)
+    def test_empty_batch(self):
+        """Test empty batch takes meta fields from arguments."""
+        batch = BarBatch.from_bars([], symbol="ETHUSDT", exchange=Exchange.BINANCE)
+
+        assert len(batch) == 0
+        assert batch.symbol == "ETHUSDT"
+        assert batch.to_bars() == []
+
+    @pytest.mark.timeout(10)
+    def test_mixed_instruments_rejected(self):
+        """Test bars of different instruments can not form one batch."""
+        bars = create_bars(2)
+        bars[1].symbol = "ETHUSDT"
+
+        with pytest.raises(ValueError):
+            BarBatch.from_bars(bars)
+
+    @pytest.mark.timeout(10)
+    def test_concat(self):
+        """Test batches of one instrument are joined in order."""
+        bars = create_bars(10)
+        batch = BarBatch.concat([BarBatch.from_bars(bars[:4]), BarBatch.from_bars(bars[4:])])
+
+        assert batch.to_bars() == bars
+
+        other = BarBatch.from_bars([], symbol="ETHUSDT")
+        with pytest.raises(ValueError):
+            BarBatch.concat([batch, other])
+
+
+class TestTickBatch:
+    """Test TickBatch conversion."""
+
+    @pytest.mark.timeout(10)
+    def test_round_trip(self):
+        """Test ticks with optional localtime are equal after round trip."""
+        ticks = [
+            TickData(
+                adapter_name="TEST",
+                symbol="BTCUSDT",
+                exchange=Exchange.BINANCE,
+                datetime=datetime(2024, 1, 1, 9, 30, i),
+                last_price=42000.0 + i,
+                bid_price_1=41999.5,
+                ask_volume_5=3.0,
+                localtime=datetime(2024, 1, 1, 9, 30, i) if i % 2 else None,
+            )
+            for i in range(10)
+        ]
+        batch = TickBatch.from_ticks(ticks)
+
+        assert batch.to_ticks() == ticks
+        assert batch.last_price.tolist() == [42000.0 + i for i in range(10)]
+        assert np.isnat(batch.localtime[0])
+
+
+class TestArrayManagerBatch:
+    """Test updating ArrayManager from a batch."""
+
+    @pytest.mark.timeout(10)
+    def test_update_batch_matches_update_bar(self):
+        """Test batch update gives the same arrays as updating bar by bar."""
+        bars = create_bars(30)
+
+        by_bar = ArrayManager(size=20)
+        for bar in bars:
+            by_bar.update_bar(bar)
+
+        by_batch = ArrayManager(size=20)
+        by_batch.update_batch(BarBatch.from_bars(bars[:5]))
+        by_batch.update_batch(BarBatch.from_bars(bars[5:]))
+
+        assert by_batch.count == by_bar.count
+        assert by_batch.inited
+        for name in ("open", "high", "low", "close", "volume", "turnover", "open_interest"):
+            assert getattr(by_batch, name).tolist() == getattr(by_bar, name).tolist()
+
+    @pytest.mark.timeout(10)
+    def test_update_partial_batch(self):
+        """Test batch smaller than size shifts existing values."""
+        bars = create_bars(3)
+        manager = ArrayManager(size=5)
+        manager.update_batch(BarBatch.from_bars(bars))
+
+        assert manager.count == 3
+        assert not manager.inited
+        assert manager.close.tolist() == [0, 0, 100.5, 101.5, 102.5]
+
+
+class TestBinanceHistoryBatch:
+    """Test batch variant of Binance history query."""
+
+    @pytest.mark.timeout(10)
+    def test_batch_matches_bars(self):
+        """Test history batch holds the same bars as the list query."""
+        start = int(datetime(2024, 1, 1).timestamp() * 1000)
+        ohlcv = [[start + i * 60_000, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 2.0] for i in range(10)]
+
+        api_client = Mock()
+        api_client.adapter_name = "BINANCE"
+        api_client.exchange.fetch_ohlcv.return_value = ohlcv
+        historical_data = BinanceHistoricalData(api_client)
+
+        req = HistoryRequest(
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            start=datetime(2024, 1, 1),
+            end=datetime(2024, 1, 1, 0, 7),
+            interval=Interval.MINUTE,
+        )
+        batch = historical_data.query_history_batch(req)
+
+        assert len(batch) == 8
+        assert batch.to_bars() == historical_data.query_history(req)
@@ -0,0 +1,288 @@
+"""
+Unit tests for binary codec of data objects.
+
+Tests round trip of all data objects including enums, strings, state
+not passed to __init__ and naive or timezone aware datetimes, batches
+and older schema versions.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from foxtrot.util.codec import (
+    DATA_CODECS,
+    TAG_CODECS,
+    decode_batch,
+    decode_data,
+    encode_batch,
+    encode_data,
+    get_init_schema,
+    get_schema,
+    parse_annotation,
+    register_codec,
+    register_schema,
+)
+from foxtrot.util.constants import Direction, Exchange, Interval, Offset, OptionType, OrderType, Product, Status
+from foxtrot.util.object import (
+    BarData,
+    CancelRequest,
+    ContractData,
+    HistoryRequest,
+    LogData,
+    OrderData,
+    OrderRequest,
+    QuoteData,
+    SubscribeRequest,
+    TickData,
+    TradeData,
+)
+
+
+class TestCodec:
+    """Test encoding and decoding of data objects."""
+
+    @pytest.mark.timeout(10)
+    def test_tick_round_trip(self):
+        """Test tick with aware datetime and unicode name survives round trip."""
+        tick = TickData(
+            adapter_name="BINANCE",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            datetime=datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=ZoneInfo("Asia/Shanghai")),
+            name="比特币",
+            last_price=42000.5,
+            bid_price_1=41999.5,
+            ask_volume_5=3.25,
+        )
+
+        decoded = decode_data(encode_data(tick))
+
+        assert decoded == tick
+        assert decoded.vt_symbol == "BTCUSDT.BINANCE"
+        assert decoded.datetime.utcoffset() == tick.datetime.utcoffset()
+
+    @pytest.mark.timeout(10)
+    def test_order_round_trip(self):
+        """Test order with naive datetime and enums survives round trip."""
+        order = OrderData(
+            adapter_name="BINANCE",
+            symbol="ETHUSDT",
+            exchange=Exchange.BINANCE,
+            orderid="123",
+            direction=Direction.SHORT,
+            offset=Offset.CLOSE,
+            price=2500.0,
+            volume=2,
+            status=Status.PARTTRADED,
+            datetime=datetime(2024, 5, 6, 7, 8, 9),
+            reference="strategy",
+        )
+
+        decoded = decode_data(encode_data(order))
+
+        assert decoded == order
+        assert decoded.vt_orderid == "BINANCE.123"
+
+    @pytest.mark.timeout(10)
+    def test_none_values(self):
+        """Test None enums and datetimes are kept."""
+        trade = TradeData(
+            adapter_name="BINANCE",
+            symbol="ETHUSDT",
+            exchange=Exchange.BINANCE,
+            orderid="1",
+            tradeid="2",
+        )
+
+        decoded = decode_data(encode_data(trade))
+
+        assert decoded.direction is None
+        assert decoded.datetime is None
+        assert decoded == trade
+
+    @pytest.mark.timeout(10)
+    def test_long_strings(self):
+        """Test strings at and beyond 16-bit length survive round trip."""
+        for length in (65535, 65536):
+            log = LogData(adapter_name="BINANCE", msg="x" * length)
+            assert decode_data(encode_data(log)).msg == log.msg
+
+        request = CancelRequest(orderid="1" * 70000, symbol="", exchange=Exchange.BINANCE)
+        assert decode_data(encode_data(request)) == request
+
+    @pytest.mark.timeout(10)
+    def test_state_round_trip(self):
+        """Test log time and extra, which are not passed to __init__, are kept."""
+        log = LogData(adapter_name="BINANCE", msg="connected")
+        log.time = datetime(2024, 1, 2, 3, 4, 5, 678901)
+        log.extra = {"code": 1, "detail": "中文", "nested": [1.5, None]}
+
+        decoded = decode_data(encode_data(log))
+
+        assert decoded.time == log.time
+        assert decoded.extra == log.extra
+        assert decode_data(encode_data(LogData(adapter_name="BINANCE", msg=""))).extra is None
+
+        order = OrderData(adapter_name="BINANCE", symbol="ETHUSDT", exchange=Exchange.BINANCE, orderid="1")
+        order.extra = {"time": datetime(2024, 1, 1)}
+        assert decode_data(encode_data(order)).extra == {"time": "2024-01-01 00:00:00"}
+
+    @pytest.mark.timeout(10)
+    def test_short_string_records(self):
+        """Test records of the previous version with 16-bit string lengths are decoded."""
+        record = bytes.fromhex(
+            "02010000000000429f40000000000000f03f00000000000000002f00ff000000000000000000000000000000"
+            "070042494e414e434507004554485553445401003108007374726174656779"
+        )
+        order = OrderData(
+            adapter_name="BINANCE",
+            symbol="ETHUSDT",
+            exchange=Exchange.BINANCE,
+            orderid="1",
+            price=2000.5,
+            volume=1.0,
+            reference="strategy",
+        )
+
+        assert decode_data(record) == order
+        assert TAG_CODECS[(2, 1)].encode(order) == record
+
+    @pytest.mark.timeout(10)
+    def test_first_version_records(self):
+        """Test records written by the first schema of bars are decoded."""
+        record = bytes.fromhex(
+            "0701000000000000244000000000000000000000000000000000000000000000f03f0000000000000040"
+            "000000000000e03f000000000000f83f2f0100f03ed0312fa6170000000000070042494e414e4345070045544855534454"
+        )
+        bar = decode_data(record)
+
+        assert bar.datetime == datetime(2024, 1, 1, 9, 30)
+        assert bar.interval == Interval.MINUTE
+        assert (bar.open_price, bar.high_price, bar.low_price, bar.close_price) == (1.0, 2.0, 0.5, 1.5)
+        assert bar.volume == 10.0
+
+    @pytest.mark.timeout(10)
+    def test_unregistered_class(self):
+        """Test encoding unsupported objects raises TypeError."""
+        with pytest.raises(TypeError):
+            encode_data(object())
+
+        with pytest.raises(ValueError):
+            register_codec(1, TickData)
+
+    @pytest.mark.timeout(10)
+    def test_parse_annotation(self):
+        """Test field annotations are mapped to kinds."""
+        assert parse_annotation("float")[1] is False
+        assert parse_annotation("Direction | None")[1:] == (True, Direction)
+
+        with pytest.raises(TypeError):
+            parse_annotation("list[str]")
+
+    @pytest.mark.timeout(10)
+    def test_all_data_classes_round_trip(self):
+        """Test bars, contracts, quotes and requests survive round trip."""
+        objects = [
+            BarData(
+                adapter_name="BINANCE",
+                symbol="BTCUSDT",
+                exchange=Exchange.BINANCE,
+                datetime=datetime(2024, 1, 1, 9, 30),
+                interval=Interval.MINUTE,
+                volume=12.5,
+                close_price=42000.0,
+            ),
+            ContractData(
+                adapter_name="BINANCE",
+                symbol="BTC-240628-70000-C",
+                exchange=Exchange.BINANCE,
+                name="BTC call",
+                product=Product.OPTION,
+                size=1,
+                pricetick=0.1,
+                max_volume=100,
+                option_strike=70000,
+                option_type=OptionType.CALL,
+                option_expiry=datetime(2024, 6, 28, 8),
+            ),
+            QuoteData(adapter_name="BINANCE", symbol="BTCUSDT", exchange=Exchange.BINANCE, quoteid="1", bid_volume=3),
+            SubscribeRequest(symbol="BTCUSDT", exchange=Exchange.BINANCE),
+            OrderRequest(
+                symbol="BTCUSDT",
+                exchange=Exchange.BINANCE,
+                direction=Direction.LONG,
+                type=OrderType.LIMIT,
+                volume=1,
+                price=42000,
+            ),
+            CancelRequest(orderid="1", symbol="BTCUSDT", exchange=Exchange.BINANCE),
+            HistoryRequest(symbol="BTCUSDT", exchange=Exchange.BINANCE, start=datetime(2024, 1, 1)),
+        ]
+
+        for data in objects:
+            assert decode_data(encode_data(data)) == data
+
+    @pytest.mark.timeout(10)
+    def test_batch_round_trip(self):
+        """Test mixed objects are decoded from a batch in order."""
+        objects = [
+            TickData(adapter_name="BINANCE", symbol=f"S{i}", exchange=Exchange.BINANCE, datetime=datetime(2024, 1, 1))
+            for i in range(100)
+        ]
+        objects.append(
+            TradeData(adapter_name="BINANCE", symbol="S0", exchange=Exchange.BINANCE, orderid="1", tradeid="2")
+        )
+
+        buffer = encode_batch(objects)
+
+        assert decode_batch(buffer) == objects
+        assert decode_batch(memoryview(buffer)) == objects
+        assert decode_batch(encode_batch([])) == []
+
+    @pytest.mark.timeout(10)
+    def test_older_schema_version(self):
+        """Test records of an older schema are decoded into the current class."""
+        codec = DATA_CODECS[SubscribeRequest]
+        # Version 0 had a field which was removed since
+        old_schema = [("symbol", "str"), ("exchange", "Exchange"), ("removed", "float | None")]
+        register_schema(codec.tag, SubscribeRequest, 0, old_schema)
+
+        try:
+            old_codec = TAG_CODECS[(codec.tag, 0)]
+
+            class OldRequest:
+                symbol = "BTCUSDT"
+                exchange = Exchange.BINANCE
+                removed = 1.5
+
+            decoded = decode_data(old_codec.encode(OldRequest()))
+            assert decoded == SubscribeRequest(symbol="BTCUSDT", exchange=Exchange.BINANCE)
+
+            with pytest.raises(ValueError):
+                register_schema(codec.tag, SubscribeRequest, 0, old_schema)
+        finally:
+            TAG_CODECS.pop((codec.tag, 0))
+
+    @pytest.mark.timeout(10)
+    def test_unknown_version(self):
+        """Test records of unregistered versions are rejected."""
+        record = bytearray(encode_data(SubscribeRequest(symbol="BTCUSDT", exchange=Exchange.BINANCE)))
+        record[1] = 200
+
+        with pytest.raises(ValueError):
+            decode_data(record)
+
+    @pytest.mark.timeout(10)
+    def test_schema_of_class(self):
+        """Test schema lists fields with their annotations, without derived ones."""
+        assert get_schema(CancelRequest) == [("orderid", "str"), ("symbol", "str"), ("exchange", "Exchange")]
+        assert get_schema(LogData) == [
+            ("adapter_name", "str"),
+            ("extra", "dict[str, Any] | None"),
+            ("msg", "str"),
+            ("level", "int"),
+            ("time", "datetime"),
+        ]
+        assert get_init_schema(LogData) == [("adapter_name", "str"), ("msg", "str"), ("level", "int")]
@@ -0,0 +1,58 @@
+"""
+Unit tests for slotted data objects.
+
+Tests derived attributes have slots but are not dataclass fields, so
+fields(), asdict() and replace() only see the data itself.
+"""
+
+import copy
+from dataclasses import asdict, fields, replace
+
+import pytest
+
+from foxtrot.util.constants import Exchange
+from foxtrot.util.object import AccountData, OrderData
+
+
+def create_order() -> OrderData:
+    """Create order data for testing."""
+    return OrderData(adapter_name="BINANCE", symbol="BTCUSDT", exchange=Exchange.BINANCE, orderid="1")
+
+
+class TestDerivedAttributes:
+    """Test attributes declared with derived()."""
+
+    @pytest.mark.timeout(10)
+    def test_not_fields(self):
+        """Test derived attributes are left out of fields and asdict."""
+        order = create_order()
+        names = [f.name for f in fields(order)]
+
+        assert "vt_symbol" not in names
+        assert "symbol_id" not in names
+        assert "vt_orderid" not in names
+        assert "extra" in names
+        assert "vt_orderid" not in asdict(order)
+        assert "available" not in asdict(AccountData(adapter_name="BINANCE", accountid="main"))
+
+    @pytest.mark.timeout(10)
+    def test_slots_kept(self):
+        """Test derived attributes are stored in slots without instance dict."""
+        order = create_order()
+
+        assert "vt_orderid" in OrderData.__slots__
+        assert not hasattr(order, "__dict__")
+        assert order.vt_orderid == "BINANCE.1"
+
+    @pytest.mark.timeout(10)
+    def test_replace_and_copy(self):
+        """Test replace recomputes derived attributes and copy keeps them."""
+        order = create_order()
+
+        replaced = replace(order, orderid="2")
+        assert replaced.vt_orderid == "BINANCE.2"
+        assert replaced.vt_symbol == order.vt_symbol
+
+        copied = copy.copy(order)
+        assert copied.vt_orderid == "BINANCE.1"
+        assert copied.symbol_id == order.symbol_id
@@ -0,0 +1,172 @@
+"""
+Unit tests for order book.
+
+Tests snapshots and incremental updates of both sides against a plain
+dict reference, depth limits, stale deltas, conversion into tick level
+fields and keyed delivery of depth events.
+"""
+
+from datetime import datetime
+import random
+import time
+
+import pytest
+
+from foxtrot.core.event_engine import Event, EventEngine
+from foxtrot.util.constants import Exchange
+from foxtrot.util.event_type import EVENT_DEPTH
+from foxtrot.util.object import TickData
+from foxtrot.util.order_book import OrderBook
+
+
+def create_book(depth: int = 10) -> OrderBook:
+    """Create order book for testing."""
+    return OrderBook("TEST", "BTCUSDT", Exchange.BINANCE, depth)
+
+
+class TestOrderBook:
+    """Test OrderBook updates."""
+
+    @pytest.mark.timeout(10)
+    def test_snapshot(self):
+        """Test snapshot replaces levels, truncated to depth."""
+        book = create_book(depth=3)
+        book.apply_snapshot(
+            [[100.0, 1.0], [99.0, 2.0], [98.0, 3.0], [97.0, 4.0]],
+            [[101.0, 1.5, 7], [102.0, 2.5, 3]],
+            sequence=5,
+        )
+
+        assert book.bids.prices.tolist() == [100.0, 99.0, 98.0]
+        assert book.bids.volumes.tolist() == [1.0, 2.0, 3.0]
+        assert book.asks.prices.tolist() == [101.0, 102.0]
+        assert book.best_bid == 100.0
+        assert book.best_ask == 101.0
+        assert book.sequence == 5
+
+    @pytest.mark.timeout(10)
+    def test_delta(self):
+        """Test delta inserts, updates and removes levels in order."""
+        book = create_book()
+        book.apply_snapshot([[100.0, 1.0], [98.0, 3.0]], [[101.0, 1.0], [103.0, 1.0]])
+
+        book.apply_delta(
+            [[99.0, 2.0], [100.0, 0], [98.0, 5.0], [101.5, 0]],
+            [[102.0, 4.0], [100.5, 1.0], [103.0, 0]],
+        )
+
+        assert book.bids.prices.tolist() == [99.0, 98.0]
+        assert book.bids.volumes.tolist() == [2.0, 5.0]
+        assert book.asks.prices.tolist() == [100.5, 101.0, 102.0]
+
+    @pytest.mark.timeout(10)
+    def test_full_side_keeps_best_levels(self):
+        """Test full side drops its worst level for a better one and ignores worse ones."""
+        book = create_book(depth=3)
+        book.apply_snapshot([[100.0, 1.0], [99.0, 1.0], [98.0, 1.0]], [])
+
+        book.apply_delta([[97.0, 1.0], [101.0, 1.0]], [])
+        assert book.bids.prices.tolist() == [101.0, 100.0, 99.0]
+
+    @pytest.mark.timeout(10)
+    def test_stale_delta(self):
+        """Test delta with sequence not after the book is not applied."""
+        book = create_book()
+        book.apply_snapshot([[100.0, 1.0]], [], sequence=10)
+
+        assert not book.apply_delta([[100.0, 0]], [], sequence=10)
+        assert book.best_bid == 100.0
+        assert book.apply_delta([[100.0, 0]], [], sequence=11)
+        assert book.best_bid == 0
+
+    @pytest.mark.timeout(10)
+    def test_random_deltas_match_reference(self):
+        """Test random updates give the best levels of a dict reference."""
+        rng = random.Random(0)
+        book = create_book(depth=1000)
+        bids: dict[float, float] = {}
+        asks: dict[float, float] = {}
+
+        for _ in range(5000):
+            levels = bids if rng.random() < 0.5 else asks
+            price = float(rng.randint(1, 200))
+            volume = 0.0 if rng.random() < 0.3 else float(rng.randint(1, 10))
+            if volume:
+                levels[price] = volume
+            else:
+                levels.pop(price, None)
+
+            if levels is bids:
+                book.apply_delta([[price, volume]], [])
+            else:
+                book.apply_delta([], [[price, volume]])
+
+        assert book.bids.prices.tolist() == sorted(bids, reverse=True)
+        assert book.bids.volumes.tolist() == [bids[p] for p in sorted(bids, reverse=True)]
+        assert book.asks.prices.tolist() == sorted(asks)
+        assert book.asks.volumes.tolist() == [asks[p] for p in sorted(asks)]
+
+    @pytest.mark.timeout(10)
+    def test_fill_tick(self):
+        """Test five best levels are set on tick, missing levels cleared."""
+        book = create_book()
+        book.apply_snapshot(
+            [[100.0 - i, 1.0 + i] for i in range(7)],
+            [[101.0, 2.0]],
+            datetime=datetime(2024, 1, 1),
+        )
+
+        tick = book.to_tick()
+        assert tick.vt_symbol == "BTCUSDT.BINANCE"
+        assert tick.datetime == datetime(2024, 1, 1)
+        assert [tick.bid_price_1, tick.bid_price_5] == [100.0, 96.0]
+        assert [tick.bid_volume_1, tick.bid_volume_5] == [1.0, 5.0]
+        assert [tick.ask_price_1, tick.ask_volume_1, tick.ask_price_2] == [101.0, 2.0, 0]
+
+        existing = TickData(
+            adapter_name="TEST",
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            datetime=datetime(2024, 1, 1),
+            ask_price_3=105.0,
+        )
+        book.fill_tick(existing)
+        assert existing.ask_price_3 == 0
+
+    @pytest.mark.timeout(10)
+    def test_copy_is_independent(self):
+        """Test copy is not changed by later updates of the book."""
+        book = create_book()
+        book.apply_snapshot([[100.0, 1.0]], [[101.0, 1.0]])
+
+        copy = book.copy()
+        book.apply_delta([[100.0, 0]], [[100.5, 1.0]])
+
+        assert copy.best_bid == 100.0
+        assert copy.best_ask == 101.0
+        assert copy.vt_symbol == book.vt_symbol
+
+
+class TestDepthEvent:
+    """Test keyed delivery of depth events."""
+
+    @pytest.mark.timeout(10)
+    def test_keyed_depth_handler(self):
+        """Test depth handlers registered by vt_symbol only receive their book."""
+        engine = EventEngine()
+        received = []
+        engine.register(EVENT_DEPTH, received.append, key="ETHUSDT.BINANCE")
+        engine.start()
+
+        try:
+            engine.put(Event(EVENT_DEPTH, create_book()))
+            engine.put(Event(EVENT_DEPTH, OrderBook("TEST", "ETHUSDT", Exchange.BINANCE)))
+
+            deadline = time.time() + 5
+            while not received and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+        finally:
+            engine.stop()
+
+        assert [event.data.vt_symbol for event in received] == ["ETHUSDT.BINANCE"]
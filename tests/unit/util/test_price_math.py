@@ -0,0 +1,116 @@
+"""
+Unit tests for price math.
+
+Tests integer tick conversion and rounding, scalar and vectorized,
+against the decimal values of the prices.
+"""
+
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN, Decimal
+import random
+
+import numpy as np
+import pytest
+
+from foxtrot.util.price_math import EXTRA_DIGITS, MAX_PRICE_SCALED, PriceTick, get_price_tick
+
+
+def decimal_ticks(price: float, pricetick: float, rounding: str) -> int:
+    """Get number of ticks computed on decimal values."""
+    ticks = Decimal(str(price)) / Decimal(str(pricetick))
+    return int(ticks.quantize(Decimal(1), rounding=rounding))
+
+
+def random_prices(rng: random.Random, pricetick: float, count: int, high: float = 10000) -> list[float]:
+    """Create prices of up to six decimals, on ticks and on exact halves."""
+    prices: list[float] = []
+    tick = Decimal(str(pricetick))
+    for _ in range(count):
+        price = round(rng.uniform(-high, high), rng.randint(0, 6))
+        n = rng.randint(-10000, 10000)
+        prices.extend([price, float(n * tick), float((n + Decimal("0.5")) * tick)])
+    return prices
+
+
+class TestPriceTick:
+    """Test PriceTick conversions."""
+
+    @pytest.mark.timeout(10)
+    def test_ticks(self):
+        """Test conversion to ticks and back."""
+        price_tick = PriceTick(0.01)
+
+        assert price_tick.to_ticks(101.23) == 10123
+        assert price_tick.floor_ticks(0.3) == 30
+        assert price_tick.ceil_ticks(0.3) == 30
+        assert price_tick.from_ticks(10123) == 101.23
+        assert price_tick.from_ticks(-7) == -0.07
+
+    @pytest.mark.timeout(10)
+    def test_ties_to_even(self):
+        """Test exact halves round to even tick."""
+        price_tick = PriceTick(0.1)
+
+        assert price_tick.round(12.35) == 12.4
+        assert price_tick.round(12.25) == 12.2
+        assert price_tick.round(0.05) == 0.0
+        assert price_tick.round(-0.15) == -0.2
+
+    @pytest.mark.timeout(10)
+    @pytest.mark.parametrize("pricetick", [0.1, 0.01, 0.25, 0.0005, 1.5e-4, 2.5e-05, 1.5e-08, 5, 1])
+    def test_matches_decimal(self, pricetick):
+        """Test scalar and array results match rounding of decimal values."""
+        price_tick = PriceTick(pricetick)
+        # Array versions need prices small enough to scale exactly
+        high = min(10000, MAX_PRICE_SCALED / 10 ** (price_tick.digits + EXTRA_DIGITS))
+        prices = random_prices(random.Random(0), pricetick, 500, high)
+        array = np.array(prices)
+
+        for rounding, scalar, vector in (
+            (ROUND_HALF_EVEN, price_tick.to_ticks, price_tick.to_ticks_array),
+            (ROUND_FLOOR, price_tick.floor_ticks, price_tick.floor_ticks_array),
+            (ROUND_CEILING, price_tick.ceil_ticks, price_tick.ceil_ticks_array),
+        ):
+            expected = [decimal_ticks(price, pricetick, rounding) for price in prices]
+            assert [scalar(price) for price in prices] == expected
+            assert vector(array).tolist() == expected
+
+        ticks = price_tick.to_ticks_array(array).tolist()
+        expected_prices = [float(n * Decimal(str(pricetick))) for n in ticks]
+        assert price_tick.round_array(array).tolist() == expected_prices
+        assert [price_tick.round(price) for price in prices] == expected_prices
+
+    @pytest.mark.timeout(10)
+    def test_scientific_notation_tick(self):
+        """Test ticks with mantissa decimals in their repr get all their digits."""
+        assert PriceTick(2.5e-05).digits == 6
+        assert PriceTick(1.5e-08).digits == 9
+        assert PriceTick(1e-05).digits == 5
+
+        assert PriceTick(2.5e-05).round(1.0) == 1.0
+        assert PriceTick(0.000025).round(0.0001) == 0.0001
+        assert PriceTick(1.5e-08).floor(0.00000004) == 0.00000003
+        assert PriceTick(1.5e-08).ceil(0.00000004) == 0.000000045
+
+    @pytest.mark.timeout(10)
+    def test_float_error_absorbed(self):
+        """Test float error of computed prices does not move them off their tick."""
+        price_tick = PriceTick(0.1)
+
+        assert price_tick.ceil(0.1 * 3) == 0.3
+        assert price_tick.floor(0.7 + 0.1) == 0.8
+        assert price_tick.round_array(np.array([0.1 * 3, 0.7 + 0.1])).tolist() == [0.3, 0.8]
+
+    @pytest.mark.timeout(10)
+    def test_large_price_falls_back(self):
+        """Test prices too large to scale exactly still round exactly."""
+        price_tick = PriceTick(0.01)
+
+        assert price_tick.to_ticks(1e15 + 0.125) == decimal_ticks(1e15 + 0.125, 0.01, ROUND_HALF_EVEN)
+        assert price_tick.round(123456789012.345) == 123456789012.34
+        assert price_tick.from_ticks(10**20) == 1e18
+
+    @pytest.mark.timeout(10)
+    def test_cached(self):
+        """Test converter is shared per tick value."""
+        assert get_price_tick(0.01) is get_price_tick(0.01)
+        assert get_price_tick(0.01) is not get_price_tick(0.1)
@@ -0,0 +1,108 @@
+"""
+Unit tests for symbol registry.
+
+Tests dense symbol id assignment, interned vt_symbol, lookups in both
+directions, concurrent registration and symbol ids of data objects.
+"""
+
+from datetime import datetime
+from threading import Thread
+
+import pytest
+
+from foxtrot.util.constants import Direction, Exchange, Offset, OrderType
+from foxtrot.util.object import OrderRequest, TickData
+from foxtrot.util.symbol_registry import SYMBOL_REGISTRY, SymbolRegistry
+from foxtrot.util.utility import extract_vt_symbol, generate_vt_symbol
+
+
+class TestSymbolRegistry:
+    """Test SymbolRegistry lookups."""
+
+    def setup_method(self):
+        """Setup empty registry for each test."""
+        self.registry = SymbolRegistry()
+
+    @pytest.mark.timeout(10)
+    def test_dense_ids(self):
+        """Test ids are assigned in order of first registration."""
+        assert self.registry.register("BTCUSDT", Exchange.BINANCE) == (0, "BTCUSDT.BINANCE")
+        assert self.registry.register("ETHUSDT", Exchange.BINANCE) == (1, "ETHUSDT.BINANCE")
+        assert self.registry.register("BTCUSDT", Exchange.OKX) == (2, "BTCUSDT.OKX")
+        assert self.registry.register("BTCUSDT", Exchange.BINANCE) == (0, "BTCUSDT.BINANCE")
+        assert len(self.registry) == 3
+
+    @pytest.mark.timeout(10)
+    def test_vt_symbol_interned(self):
+        """Test the same vt_symbol string is returned for every registration."""
+        _, first = self.registry.register("BTC" + "USDT", Exchange.BINANCE)
+        _, second = self.registry.register("".join(["BTC", "USDT"]), Exchange.BINANCE)
+        assert first is second
+
+    @pytest.mark.timeout(10)
+    def test_lookups(self):
+        """Test lookups by symbol id and by vt_symbol."""
+        symbol_id, vt_symbol = self.registry.register("BRK.B", Exchange.NYSE)
+
+        assert self.registry.get_vt_symbol(symbol_id) == "BRK.B.NYSE"
+        assert self.registry.get_symbol(symbol_id) == ("BRK.B", Exchange.NYSE)
+        assert self.registry.get_id(vt_symbol) == symbol_id
+        assert self.registry.get_id("AAPL.NYSE") is None
+
+    @pytest.mark.timeout(10)
+    def test_extract_registers(self):
+        """Test extract parses and registers unseen vt_symbol."""
+        assert self.registry.extract("ES2023-12.GLOBEX") == ("ES2023-12", Exchange.GLOBEX)
+        assert self.registry.get_id("ES2023-12.GLOBEX") == 0
+        assert self.registry.extract("ES2023-12.GLOBEX") == ("ES2023-12", Exchange.GLOBEX)
+        assert len(self.registry) == 1
+
+    @pytest.mark.timeout(10)
+    def test_extract_invalid(self):
+        """Test invalid vt_symbol raises and is not registered."""
+        for vt_symbol in ("INVALID_SYMBOL", "AAPL.UNKNOWN"):
+            with pytest.raises(ValueError):
+                self.registry.extract(vt_symbol)
+        assert len(self.registry) == 0
+
+    @pytest.mark.timeout(10)
+    def test_concurrent_registration(self):
+        """Test instruments registered from several threads get one id each."""
+        symbols = [f"SYM{i}" for i in range(500)]
+        results = []
+
+        def register() -> None:
+            results.append([self.registry.register(symbol, Exchange.BINANCE) for symbol in symbols])
+
+        threads = [Thread(target=register) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(result == results[0] for result in results)
+        assert sorted(symbol_id for symbol_id, _ in results[0]) == list(range(500))
+
+
+class TestDataSymbolId:
+    """Test symbol ids of data objects."""
+
+    @pytest.mark.timeout(10)
+    def test_objects_share_symbol_id(self):
+        """Test data objects of one instrument carry the registry id and vt_symbol."""
+        tick = TickData(adapter_name="TEST", symbol="BTCUSDT", exchange=Exchange.BINANCE, datetime=datetime(2024, 1, 1))
+        req = OrderRequest(
+            symbol="BTCUSDT",
+            exchange=Exchange.BINANCE,
+            direction=Direction.LONG,
+            type=OrderType.LIMIT,
+            volume=1,
+            price=42000,
+            offset=Offset.OPEN,
+        )
+
+        assert tick.symbol_id == req.symbol_id
+        assert tick.vt_symbol is req.vt_symbol
+        assert SYMBOL_REGISTRY.get_vt_symbol(tick.symbol_id) == "BTCUSDT.BINANCE"
+        assert generate_vt_symbol("BTCUSDT", Exchange.BINANCE) is tick.vt_symbol
+        assert extract_vt_symbol(tick.vt_symbol) == ("BTCUSDT", Exchange.BINANCE)
@@ -0,0 +1,257 @@
+"""
+Unit tests for epoch nanosecond timestamps.
+
+Tests conversion between timestamps and datetimes, lazy datetime and
+timestamp fields of tick and bar data, their codec round trip and bar
+boundaries found from timestamps by BarGenerator.
+"""
+
+from datetime import datetime, timedelta, timezone
+import pickle
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from foxtrot.util import object as data_object
+from foxtrot.util.codec import DATA_CODECS, TAG_CODECS, decode_data, encode_data
+from foxtrot.util.constants import Exchange
+from foxtrot.util.object import BarData, TickData
+from foxtrot.util.timestamp import (
+    NS_PER_MINUTE,
+    NS_PER_MS,
+    datetime_to_timestamp,
+    now_timestamp,
+    timestamp_to_datetime,
+)
+from foxtrot.util.utility import BarGenerator
+
+TIMESTAMP = 1_700_000_000_123_456_000
+
+
+def create_tick(**kwargs) -> TickData:
+    """Create tick for testing."""
+    return TickData(adapter_name="BINANCE", symbol="BTCUSDT", exchange=Exchange.BINANCE, **kwargs)
+
+
+class TestTimestamp:
+    """Test timestamp conversion."""
+
+    @pytest.mark.timeout(10)
+    def test_round_trip(self):
+        """Test timestamp converts to local datetime and back."""
+        dt = timestamp_to_datetime(TIMESTAMP)
+
+        assert dt == datetime.fromtimestamp(TIMESTAMP / 1e9)
+        assert dt.microsecond == 123456
+        assert datetime_to_timestamp(dt) == TIMESTAMP
+        assert timestamp_to_datetime(TIMESTAMP, timezone.utc) == datetime(
+            2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.timeout(10)
+    def test_aware_datetime(self):
+        """Test aware datetime converts by its utc offset."""
+        dt = datetime(2024, 1, 1, 8, tzinfo=timezone(timedelta(hours=8)))
+
+        assert datetime_to_timestamp(dt) == 1_704_067_200 * 10**9
+
+    @pytest.mark.timeout(10)
+    def test_now(self):
+        """Test current timestamp is exact in microseconds."""
+        timestamp = now_timestamp()
+
+        assert timestamp % 1000 == 0
+        assert datetime_to_timestamp(timestamp_to_datetime(timestamp)) == timestamp
+
+
+class TestLazyDatetime:
+    """Test datetime and timestamp fields of data objects."""
+
+    @pytest.mark.timeout(10)
+    def test_datetime_from_timestamp(self):
+        """Test datetime is computed from timestamp and cached."""
+        tick = create_tick(timestamp=TIMESTAMP)
+
+        assert tick.datetime == timestamp_to_datetime(TIMESTAMP)
+        assert tick.datetime is tick.datetime
+
+    @pytest.mark.timeout(10)
+    def test_timestamp_from_datetime(self):
+        """Test timestamp is computed from datetime, which is kept as given."""
+        dt = datetime(2024, 1, 1, 8, tzinfo=timezone(timedelta(hours=8)))
+        bar = BarData(adapter_name="BINANCE", symbol="BTCUSDT", exchange=Exchange.BINANCE, datetime=dt)
+
+        assert bar.timestamp == 1_704_067_200 * 10**9
+        assert bar.datetime is dt
+
+    @pytest.mark.timeout(10)
+    def test_no_time(self):
+        """Test tick or bar without timestamp and datetime is rejected."""
+        with pytest.raises(ValueError):
+            create_tick()
+
+        with pytest.raises(ValueError):
+            create_tick(timestamp=0, datetime=None)
+
+        with pytest.raises(ValueError):
+            BarData(adapter_name="BINANCE", symbol="BTCUSDT", exchange=Exchange.BINANCE)
+
+    @pytest.mark.timeout(10)
+    def test_assignment_resets_other(self):
+        """Test assigning one of datetime and timestamp replaces the other."""
+        tick = create_tick(timestamp=TIMESTAMP)
+        assert tick.datetime
+
+        tick.timestamp = TIMESTAMP + NS_PER_MINUTE
+        assert tick.datetime == timestamp_to_datetime(TIMESTAMP) + timedelta(minutes=1)
+
+        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        tick.datetime = dt
+        assert tick.timestamp == 1_704_067_200 * 10**9
+
+    @pytest.mark.timeout(10)
+    def test_both_given(self):
+        """Test datetime is kept if both passed, as by copies and the codec."""
+        dt = datetime(2024, 1, 1, 8, tzinfo=timezone(timedelta(hours=8)))
+        tick = create_tick(datetime=dt, timestamp=1)
+
+        assert tick.datetime is dt
+        assert tick.timestamp == datetime_to_timestamp(dt)
+        assert pickle.loads(pickle.dumps(tick)).datetime == dt
+
+    @pytest.mark.timeout(10)
+    def test_timezone(self):
+        """Test timezone follows datetime and is used for datetime built from timestamp."""
+        shanghai = ZoneInfo("Asia/Shanghai")
+        tick = create_tick(datetime=datetime(2024, 1, 1, 8, tzinfo=shanghai))
+        assert tick.tz is shanghai
+
+        tick.timestamp += NS_PER_MINUTE
+        assert tick.datetime == datetime(2024, 1, 1, 8, 1, tzinfo=shanghai)
+        assert tick.datetime.tzinfo is shanghai
+
+        tick.tz = timezone.utc
+        assert tick.datetime.tzinfo is timezone.utc
+        assert tick.timestamp == 1_704_067_260 * 10**9
+
+        tick = create_tick(timestamp=TIMESTAMP)
+        assert tick.tz is None
+        tick.tz = timezone.utc
+        assert tick.datetime == timestamp_to_datetime(TIMESTAMP, timezone.utc)
+
+    @pytest.mark.timeout(10)
+    def test_codec_round_trip(self):
+        """Test tick with timestamp only survives codec round trip."""
+        tick = create_tick(timestamp=TIMESTAMP, last_price=42000.0)
+
+        decoded = decode_data(encode_data(tick))
+
+        assert decoded == tick
+        assert decoded.timestamp == TIMESTAMP
+
+    @pytest.mark.timeout(10)
+    def test_codec_keeps_datetime_lazy(self, monkeypatch):
+        """Test codec encodes timestamp and timezone without building datetimes."""
+        built = []
+
+        def count_built(timestamp, tz=None):
+            built.append(timestamp)
+            return timestamp_to_datetime(timestamp, tz)
+
+        monkeypatch.setattr(data_object, "timestamp_to_datetime", count_built)
+        tz = timezone(timedelta(hours=-5))
+        for data in (
+            create_tick(timestamp=TIMESTAMP),
+            BarData(adapter_name="BINANCE", symbol="BTCUSDT", exchange=Exchange.BINANCE, timestamp=TIMESTAMP),
+        ):
+            data.tz = tz
+            decoded = decode_data(encode_data(data))
+
+            assert not built
+            assert decoded.tz == tz
+            assert decoded.datetime == timestamp_to_datetime(TIMESTAMP, tz)
+            assert len(built) == 1
+            built.clear()
+
+        aware = create_tick(datetime=datetime(2024, 1, 1, tzinfo=ZoneInfo("Asia/Shanghai")))
+        assert decode_data(encode_data(aware)).datetime == aware.datetime
+
+    @pytest.mark.timeout(10)
+    def test_codec_previous_version(self):
+        """Test records of the schema before timestamps still decode."""
+        tick = create_tick(datetime=datetime(2024, 1, 1, 9, 30))
+        record = TAG_CODECS[(1, 1)].encode(tick)
+
+        assert record[1] == 1
+        assert DATA_CODECS[TickData].version == 4
+        assert decode_data(record) == tick
+
+        aware = create_tick(datetime=datetime(2024, 1, 1, tzinfo=ZoneInfo("Asia/Shanghai")))
+        decoded = decode_data(TAG_CODECS[(1, 3)].encode(aware))
+        assert decoded.datetime == aware.datetime
+        assert decoded.datetime.utcoffset() == aware.datetime.utcoffset()
+
+        # Bar written by version 3, before the timezone was encoded by name
+        record = bytes.fromhex(
+            "070300f0794a0015a617000000000000244000000000000000000000000000000000000000000000f03f0000000000000040"
+            "000000000000e03f000000000000f83f2f0200f0794a0015a61780700000000700000042494e414e4345ffffffff070000"
+            "0045544855534454"
+        )
+        bar = decode_data(record)
+        assert bar.datetime == datetime(2024, 1, 1, 9, 30, tzinfo=ZoneInfo("Asia/Shanghai"))
+        assert bar.datetime.utcoffset() == timedelta(hours=8)
+        assert bar.close_price == 1.5
+
+
+class TestBarGeneratorTimestamp:
+    """Test BarGenerator bar boundaries from timestamps."""
+
+    @pytest.mark.timeout(10)
+    def test_minute_boundaries(self):
+        """Test minute bars are closed by timestamp and start at their minute."""
+        bars: list[BarData] = []
+        generator = BarGenerator(bars.append)
+        start = 1_700_000_040_000 * NS_PER_MS
+
+        for i in range(25):
+            tick = create_tick(timestamp=start + i * 10_000 * NS_PER_MS, last_price=100.0 + i)
+            generator.update_tick(tick)
+
+        assert [bar.timestamp for bar in bars] == [start + n * NS_PER_MINUTE for n in range(4)]
+        assert [bar.open_price for bar in bars] == [100.0, 106.0, 112.0, 118.0]
+        assert bars[0].datetime == timestamp_to_datetime(start)
+        assert generator.bar.close_price == 124.0
+
+    @pytest.mark.timeout(10)
+    def test_aware_ticks(self):
+        """Test bars and window bars of aware ticks keep their timezone."""
+        shanghai = ZoneInfo("Asia/Shanghai")
+        bars: list[BarData] = []
+        window_bars: list[BarData] = []
+        generator = BarGenerator(bars.append, 2, window_bars.append)
+        start = datetime(2024, 1, 2, 9, 30, tzinfo=shanghai)
+
+        for i in range(7):
+            dt = start + timedelta(seconds=30 * i)
+            tick = create_tick(timestamp=datetime_to_timestamp(dt), tz=shanghai, last_price=100.0 + i)
+            generator.update_tick(tick)
+        for bar in bars:
+            generator.update_bar(bar)
+
+        assert [bar.datetime for bar in bars] == [start + timedelta(minutes=n) for n in range(3)]
+        assert all(bar.datetime.tzinfo is shanghai for bar in bars)
+        assert generator.bar.datetime.tzinfo is shanghai
+        assert window_bars[0].datetime == start
+        assert window_bars[0].datetime.tzinfo is shanghai
+
+    @pytest.mark.timeout(10)
+    def test_same_minute_of_other_day(self):
+        """Test ticks of the same minute and hour a day apart close the bar."""
+        bars: list[BarData] = []
+        generator = BarGenerator(bars.append)
+        start = 1_700_000_040_000 * NS_PER_MS
+
+        generator.update_tick(create_tick(timestamp=start, last_price=100.0))
+        generator.update_tick(create_tick(timestamp=start + 24 * 60 * NS_PER_MINUTE, last_price=101.0))
+
+        assert len(bars) == 1